@@ -0,0 +1,176 @@
+"""Partition ndvi_readings by month for bulk satellite ingestion.
+
+Satellite-derived NDVI arrives for every parcel every 5-10 days, so the
+table is rebuilt as a RANGE-partitioned table on reading_date with one
+partition per calendar month. Old months can then be detached/archived
+cheaply and COPY-based ingestion only touches the month it writes to.
+
+PostgreSQL requires the partition key in every unique constraint, so the
+primary key becomes (reading_id, reading_date). reading_id already embeds
+the reading date (NDVI-ARN-1234-20260115), so uniqueness is unchanged.
+
+Revision ID: partition_ndvi_monthly
+Revises: make_fullname_nullable
+Create Date: 2026-10-18 09:00:00.000000
+"""
+
+from datetime import date
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "partition_ndvi_monthly"
+down_revision = "make_fullname_nullable"
+branch_labels = None
+depends_on = None
+
+# How many months ahead of today to pre-create partitions for
+FUTURE_MONTHS = 12
+
+NDVI_COLUMNS = (
+    "reading_id, parcel_id, reading_date, ndvi_value, health_status, evi_value, "
+    "soil_moisture_index, cloud_cover_percent, data_source, created_at"
+)
+
+
+def _add_months(month_start: date, months: int) -> date:
+    """Shift a first-of-month date by a number of months."""
+    index = month_start.year * 12 + (month_start.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_month_partition(month_start: date) -> None:
+    """Create the partition holding [month_start, next month)."""
+    name = f"ndvi_readings_y{month_start.year:04d}m{month_start.month:02d}"
+    op.execute(
+        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF ndvi_readings "
+        f"FOR VALUES FROM ('{month_start.isoformat()}') "
+        f"TO ('{_add_months(month_start, 1).isoformat()}')"
+    )
+
+
+def upgrade() -> None:
+    """Rebuild ndvi_readings as a monthly RANGE-partitioned table."""
+    conn = op.get_bind()
+    if conn.dialect.name != "postgresql":
+        # SQLite dev databases keep the plain table
+        return
+
+    op.execute("ALTER TABLE ndvi_readings RENAME TO ndvi_readings_legacy")
+    op.execute(
+        "ALTER TABLE ndvi_readings_legacy RENAME CONSTRAINT ndvi_readings_pkey TO ndvi_readings_legacy_pkey"
+    )
+    op.execute("ALTER INDEX ix_ndvi_readings_parcel_id RENAME TO ix_ndvi_readings_legacy_parcel_id")
+    op.execute(
+        "ALTER INDEX ix_ndvi_readings_reading_date RENAME TO ix_ndvi_readings_legacy_reading_date"
+    )
+
+    op.execute(
+        """
+        CREATE TABLE ndvi_readings (
+            reading_id VARCHAR(30) NOT NULL,
+            parcel_id VARCHAR(20) NOT NULL
+                REFERENCES parcels (parcel_id) ON DELETE CASCADE,
+            reading_date DATE NOT NULL,
+            ndvi_value DOUBLE PRECISION NOT NULL,
+            health_status VARCHAR(20) NOT NULL,
+            evi_value DOUBLE PRECISION,
+            soil_moisture_index DOUBLE PRECISION,
+            cloud_cover_percent DOUBLE PRECISION,
+            data_source VARCHAR(50) NOT NULL,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            CONSTRAINT ndvi_readings_pkey PRIMARY KEY (reading_id, reading_date)
+        ) PARTITION BY RANGE (reading_date)
+        """
+    )
+    op.execute("CREATE INDEX ix_ndvi_readings_parcel_id ON ndvi_readings (parcel_id)")
+    op.execute("CREATE INDEX ix_ndvi_readings_reading_date ON ndvi_readings (reading_date)")
+
+    # Cover all existing data plus a rolling window into the future
+    oldest = conn.execute(sa.text("SELECT MIN(reading_date) FROM ndvi_readings_legacy")).scalar()
+    today = date.today()
+    current_month = date(today.year, today.month, 1)
+    month = date(oldest.year, oldest.month, 1) if oldest else current_month
+    month = min(month, current_month)
+    last_month = _add_months(current_month, FUTURE_MONTHS)
+    while month <= last_month:
+        _create_month_partition(month)
+        month = _add_months(month, 1)
+
+    op.execute(
+        f"INSERT INTO ndvi_readings ({NDVI_COLUMNS}) "
+        f"SELECT {NDVI_COLUMNS} FROM ndvi_readings_legacy"
+    )
+    op.execute("DROP TABLE ndvi_readings_legacy")
+
+
+def downgrade() -> None:
+    """Collapse the partitioned table back into a single heap table."""
+    conn = op.get_bind()
+    if conn.dialect.name != "postgresql":
+        return
+
+    op.execute("ALTER TABLE ndvi_readings RENAME TO ndvi_readings_partitioned")
+    op.execute(
+        "ALTER TABLE ndvi_readings_partitioned RENAME CONSTRAINT ndvi_readings_pkey TO ndvi_readings_partitioned_pkey"
+    )
+    op.execute(
+        "ALTER INDEX ix_ndvi_readings_parcel_id RENAME TO ix_ndvi_readings_partitioned_parcel_id"
+    )
+    op.execute(
+        "ALTER INDEX ix_ndvi_readings_reading_date RENAME TO ix_ndvi_readings_partitioned_reading_date"
+    )
+
+    op.create_table(
+        "ndvi_readings",
+        sa.Column("reading_id", sa.String(length=30), nullable=False, comment="Unique reading ID"),
+        sa.Column("parcel_id", sa.String(length=20), nullable=False),
+        sa.Column("reading_date", sa.Date(), nullable=False, comment="Date of satellite reading"),
+        sa.Column("ndvi_value", sa.Float(), nullable=False, comment="NDVI value (-1.0 to 1.0)"),
+        sa.Column(
+            "health_status",
+            sa.String(length=20),
+            nullable=False,
+            comment="Derived health classification",
+        ),
+        sa.Column("evi_value", sa.Float(), nullable=True, comment="Enhanced Vegetation Index"),
+        sa.Column(
+            "soil_moisture_index", sa.Float(), nullable=True, comment="Soil moisture index (0-1)"
+        ),
+        sa.Column(
+            "cloud_cover_percent",
+            sa.Float(),
+            nullable=True,
+            comment="Cloud cover percentage (0-100)",
+        ),
+        sa.Column(
+            "data_source",
+            sa.String(length=50),
+            nullable=False,
+            comment="Data source (synthetic, Sentinel-2, etc.)",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["parcel_id"], ["parcels.parcel_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("reading_id"),
+    )
+    op.create_index(
+        op.f("ix_ndvi_readings_parcel_id"), "ndvi_readings", ["parcel_id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_ndvi_readings_reading_date"), "ndvi_readings", ["reading_date"], unique=False
+    )
+
+    op.execute(
+        f"INSERT INTO ndvi_readings ({NDVI_COLUMNS}) "
+        f"SELECT {NDVI_COLUMNS} FROM ndvi_readings_partitioned "
+        "ON CONFLICT (reading_id) DO NOTHING"
+    )
+    # Dropping the parent drops every monthly partition with it
+    op.execute("DROP TABLE ndvi_readings_partitioned")
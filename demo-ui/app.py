@@ -2565,6 +2565,7 @@ async def _handle_message_http(
             input=serialized_state,
             config=config,
             stream_mode=["updates", "messages"],
+            durability=alim_settings.checkpoint_durability,
         ):
             # --------------------------------------------------------
             # Rule #3: The "Hanging Curtain" UI (Step Logic)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+"""🌾 ALİM - LangGraph Checkpoint Compaction Script.
+
+Runs one pass of the checkpoint compaction job the API runs in the
+background (alim.data.checkpoint_gc): threads idle longer than the TTL are
+deleted, and the rest keep only their latest checkpoints.
+
+Usage:
+    python scripts/compact_checkpoints.py --dry-run
+    python scripts/compact_checkpoints.py --keep 3 --ttl-days 14
+
+Defaults come from ALIM_CHECKPOINT_KEEP_LATEST, ALIM_CHECKPOINT_TTL_DAYS
+and ALIM_CHECKPOINT_GC_BATCH_SIZE.
+"""
+# ruff: noqa: E402 - imports must come after sys.path manipulation
+
+import argparse
+import asyncio
+import os
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from alim.config import settings
+from alim.data.checkpoint_gc import CheckpointCompactor
+
+
+async def compact(args: argparse.Namespace) -> bool:
+    print("═" * 60)
+    print("🌾 ALİM - LangGraph Checkpoint Compaction")
+    print("═" * 60)
+    print(f"\n📍 Target Database: {settings.database_url[:50]}...")
+    print(f"   • Keep latest: {args.keep} per thread")
+    print(f"   • Expire after: {args.ttl_days} days idle")
+    if args.dry_run:
+        print("   • Dry run: nothing will be deleted")
+
+    engine = create_async_engine(settings.database_url)
+    compactor = CheckpointCompactor(
+        engine,
+        keep_latest=args.keep,
+        ttl_days=args.ttl_days,
+        batch_size=args.batch_size,
+        pause_seconds=settings.checkpoint_gc_pause_seconds,
+        dry_run=args.dry_run,
+    )
+    try:
+        report = await compactor.run_once()
+    except Exception as e:
+        print(f"\n❌ Compaction failed: {e}")
+        return False
+    finally:
+        await engine.dispose()
+
+    if report.skip_reason == "no_checkpoint_tables":
+        print("\n⚠️  No LangGraph checkpoint tables in this database. Nothing to compact.")
+        return False
+    if report.skipped:
+        print("\n⚠️  Another process is compacting right now. Try again later.")
+        return False
+
+    verb = "Would delete" if report.dry_run else "Deleted"
+    print(f"\n✅ {verb} {report.rows_reclaimed} rows in {report.duration_ms:.0f} ms")
+    print(f"   • Threads scanned: {report.threads_scanned}")
+    print(f"   • Threads expired: {report.threads_expired}")
+    print(f"   • Threads compacted: {report.threads_compacted}")
+    for table, rows in report.rows.items():
+        print(f"   • {table}: {rows} rows")
+
+    print("\n📊 Table sizes:")
+    for table, size in compactor.metrics.table_sizes.items():
+        print(f"   • {table}: {size['bytes'] / 1024 / 1024:.1f} MB, ~{size['estimated_rows']} rows")
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compact LangGraph checkpoint tables")
+    parser.add_argument("--dry-run", action="store_true", help="Count rows, delete nothing")
+    parser.add_argument("--keep", type=int, default=settings.checkpoint_keep_latest)
+    parser.add_argument("--ttl-days", type=float, default=settings.checkpoint_ttl_days)
+    parser.add_argument("--batch-size", type=int, default=settings.checkpoint_gc_batch_size)
+    args = parser.parse_args()
+
+    if not asyncio.run(compact(args)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# scripts/ingest_ndvi.py
+"""Bulk-load NDVI readings from CSV/Parquet files.
+
+Streams each file through asyncpg COPY into the monthly-partitioned
+ndvi_readings table. Re-running on the same file is idempotent.
+
+Expected columns (CSV header / Parquet schema):
+    parcel_id, reading_date (or date), ndvi_value (or ndvi)
+    optional: reading_id, health_status, evi_value, soil_moisture_index,
+              cloud_cover_percent, data_source
+
+Usage:
+    python scripts/ingest_ndvi.py readings.csv
+    python scripts/ingest_ndvi.py shards/*.parquet --batch-size 100000
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from alim.data.database import close_db  # noqa: E402
+from alim.data.ndvi_ingestion import (  # noqa: E402
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_DATA_SOURCE,
+    IngestionStats,
+    NDVIIngestor,
+)
+
+
+async def ingest(paths: list[Path], batch_size: int, data_source: str) -> IngestionStats:
+    """Ingest all files sequentially, reusing partition metadata."""
+    ingestor = NDVIIngestor(batch_size=batch_size, data_source=data_source)
+    total = IngestionStats()
+
+    try:
+        for path in paths:
+            print(f"🛰️  Ingesting {path}...")
+            stats = await ingestor.ingest_file(path)
+            print(
+                f"   ✅ {stats.rows_written:,} rows in {stats.elapsed_seconds:.1f}s "
+                f"({stats.rows_per_second:,.0f} rows/s, {stats.rows_rejected} rejected)"
+            )
+            total.rows_read += stats.rows_read
+            total.rows_written += stats.rows_written
+            total.rows_rejected += stats.rows_rejected
+            total.batches += stats.batches
+            total.partitions_created += stats.partitions_created
+            total.elapsed_seconds += stats.elapsed_seconds
+    finally:
+        await close_db()
+
+    return total
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Bulk-load NDVI readings via COPY")
+    parser.add_argument("paths", nargs="+", type=Path, help="CSV or Parquet files")
+    parser.add_argument(
+        "--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Rows per COPY batch"
+    )
+    parser.add_argument(
+        "--data-source",
+        default=DEFAULT_DATA_SOURCE,
+        help="data_source value for rows that don't specify one",
+    )
+    args = parser.parse_args()
+
+    total = asyncio.run(ingest(args.paths, args.batch_size, args.data_source))
+    print(
+        f"\n📊 Total: {total.rows_written:,} rows, {total.partitions_created} new partitions, "
+        f"{total.rows_per_second:,.0f} rows/s"
+    )
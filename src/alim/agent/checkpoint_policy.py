@@ -0,0 +1,233 @@
+# src/ALİM/agent/checkpoint_policy.py
+"""Checkpoint write policy: when to persist state, and what to persist.
+
+By default LangGraph writes a checkpoint after every node. A turn runs
+setup → pii_masking → supervisor → context_loader → specialist → validator,
+so one message produces about six checkpoints. Each one holds the
+conversation, the MCP traces with full tool outputs and the farm's
+parcel list.
+
+When to persist is LangGraph's own ``durability`` run option, set by
+``settings.checkpoint_durability``:
+
+- ``"exit"``: persist once, when the turn finishes (default)
+- ``"async"`` / ``"sync"``: persist after every node
+
+The API passes it to the LangGraph server with each run. In-process graphs
+(``compile_agent_graph``, ``get_agent``) get it bound by
+:func:`bind_durability`, and a ``durability=`` passed to a single call still
+wins. ``make_graph`` stays unbound: the server loads compiled graphs only.
+
+What to persist is set by :data:`SLIM_FIELDS`: per-turn fields are dropped
+and bulky ones trimmed before a checkpoint is stored. The running turn keeps its full
+in-memory state. In-process graphs wrap their checkpointer in
+:class:`SlimCheckpointSaver` when ``settings.checkpoint_slim`` is set; the
+LangGraph server owns its checkpointer, so there nothing is slimmed.
+
+Example:
+    ```python
+    saver = apply_checkpoint_policy(AsyncPostgresSaver(pool))
+    graph = bind_durability(create_agent_graph().compile(checkpointer=saver))
+    ```
+"""
+
+from collections.abc import AsyncIterator, Callable, Iterator, Sequence
+from typing import Any
+
+import structlog
+from langchain_core.runnables import Runnable, RunnableConfig
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
+
+from alim.agent.state import FarmContext
+from alim.config import settings
+
+logger = structlog.get_logger(__name__)
+
+DURABILITY_MODES = ("exit", "async", "sync")
+
+
+def _drop_trace_outputs(traces: list[dict]) -> list[dict]:
+    return [{key: value for key, value in trace.items() if key != "output"} for trace in traces]
+
+
+def _drop_parcels(farm_context: FarmContext | None) -> FarmContext | None:
+    if farm_context is None or not farm_context.parcels:
+        return farm_context
+    return farm_context.model_copy(update={"parcels": []})
+
+
+# Channel -> transform applied before persisting (None drops the channel)
+SLIM_FIELDS: dict[str, Callable[[Any], Any] | None] = {
+    "mcp_context": None,  # Per-turn prefetch, reset by context_loader
+    "mcp_traces": _drop_trace_outputs,  # Keep the audit trail, not the tool payloads
+    "farm_context": _drop_parcels,  # context_loader reloads parcels when needed
+}
+
+
+def slim_channel_values(values: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of checkpoint ``values`` with :data:`SLIM_FIELDS` applied."""
+    slim = dict(values)
+    for channel, transform in SLIM_FIELDS.items():
+        if channel not in slim:
+            continue
+        if transform is None:
+            del slim[channel]
+        else:
+            slim[channel] = transform(slim[channel])
+    return slim
+
+
+def _slim(checkpoint: Checkpoint) -> Checkpoint:
+    return {**checkpoint, "channel_values": slim_channel_values(checkpoint["channel_values"])}
+
+
+class SlimCheckpointSaver(BaseCheckpointSaver):
+    """Checkpointer wrapper that applies :data:`SLIM_FIELDS` before storing.
+
+    Only the stored checkpoint is slimmed. Pending writes, reads and
+    maintenance are passed to the wrapped saver unchanged.
+    """
+
+    def __init__(self, saver: BaseCheckpointSaver):
+        """Wrap a checkpointer.
+
+        Args:
+            saver: Checkpointer that stores the slimmed checkpoints
+        """
+        super().__init__(serde=saver.serde)
+        self.saver = saver
+
+    @property
+    def config_specs(self) -> list:
+        return self.saver.config_specs
+
+    def get_next_version(self, current: Any, channel: None) -> Any:
+        return self.saver.get_next_version(current, channel)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return self.saver.put(config, _slim(checkpoint), metadata, new_versions)
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await self.saver.aput(config, _slim(checkpoint), metadata, new_versions)
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        self.saver.put_writes(config, writes, task_id, task_path)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await self.saver.aput_writes(config, writes, task_id, task_path)
+
+    # ------------------------------------------------------------------
+    # Reads and maintenance (delegated)
+    # ------------------------------------------------------------------
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        return self.saver.get_tuple(config)
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        return await self.saver.aget_tuple(config)
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        return self.saver.list(config, filter=filter, before=before, limit=limit)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        async for item in self.saver.alist(config, filter=filter, before=before, limit=limit):
+            yield item
+
+    def delete_thread(self, thread_id: str) -> None:
+        self.saver.delete_thread(thread_id)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await self.saver.adelete_thread(thread_id)
+
+    def delete_for_runs(self, run_ids: Sequence[str]) -> None:
+        self.saver.delete_for_runs(run_ids)
+
+    async def adelete_for_runs(self, run_ids: Sequence[str]) -> None:
+        await self.saver.adelete_for_runs(run_ids)
+
+    def copy_thread(self, source_thread_id: str, target_thread_id: str) -> None:
+        self.saver.copy_thread(source_thread_id, target_thread_id)
+
+    async def acopy_thread(self, source_thread_id: str, target_thread_id: str) -> None:
+        await self.saver.acopy_thread(source_thread_id, target_thread_id)
+
+    def prune(self, thread_ids: Sequence[str], *, strategy: str = "keep_latest") -> None:
+        self.saver.prune(thread_ids, strategy=strategy)
+
+    async def aprune(self, thread_ids: Sequence[str], *, strategy: str = "keep_latest") -> None:
+        await self.saver.aprune(thread_ids, strategy=strategy)
+
+
+def checkpoint_durability() -> str:
+    """Return ``settings.checkpoint_durability``, checked against DURABILITY_MODES."""
+    mode = settings.checkpoint_durability
+    if mode not in DURABILITY_MODES:
+        raise ValueError(
+            f"Unknown checkpoint durability {mode!r}; expected one of {DURABILITY_MODES}"
+        )
+    return mode
+
+
+def bind_durability(graph: Runnable) -> Runnable:
+    """Bind the configured durability to every run of a compiled graph."""
+    return graph.bind(durability=checkpoint_durability())
+
+
+def apply_checkpoint_policy(saver: BaseCheckpointSaver | None) -> BaseCheckpointSaver | None:
+    """Wrap ``saver`` in :class:`SlimCheckpointSaver` if ``settings.checkpoint_slim``.
+
+    None and already-wrapped savers are returned as is.
+    """
+    if saver is None or isinstance(saver, SlimCheckpointSaver) or not settings.checkpoint_slim:
+        return saver
+
+    logger.info("checkpoint_policy_applied", durability=checkpoint_durability(), slim=True)
+    return SlimCheckpointSaver(saver)
@@ -10,10 +10,13 @@ Supports two modes:
 2. MCP-enabled graph (create_agent_graph_with_mcp) - with MCP tool integration
 
 Graph Flow (Flattened):
-    setup → pii_masking → supervisor → context_loader
+    setup → [pii_masking, unless the API screened the input] → supervisor → context_loader
     → [Agronomist/Weather/Vision/SQL]
     → [Validator (conditional)]
     → END
+
+Every node runs inside the turn's deadline scope and logs its budget use
+(see alim.deadline).
 """
 
 
@@ -24,6 +27,7 @@ from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import END, StateGraph
 from langgraph.prebuilt import ToolNode
 
+from alim.agent.checkpoint_policy import apply_checkpoint_policy, bind_durability
 from alim.agent.memory import get_checkpointer_async
 
 # Specialist Nodes
@@ -37,6 +41,8 @@ from alim.agent.nodes.validator import validator_node
 from alim.agent.nodes.vision_to_action import vision_to_action_node
 from alim.agent.nodes.weather import weather_node
 from alim.agent.state import AgentState, UserIntent
+from alim.config import settings
+from alim.deadline import budgeted, has_budget
 from alim.observability.langfuse import create_langfuse_handler
 
 logger = structlog.get_logger(__name__)
@@ -55,6 +61,16 @@ except ImportError:
 # ============================================================
 
 
+def route_setup(state: AgentState) -> Literal["pii_masking", "supervisor"]:
+    """Skip PII masking when the API already screened this turn's input.
+
+    Uploaded documents are only masked by the node, so it still runs for them.
+    """
+    if state.get("input_screened") and not state.get("file_paths"):
+        return "supervisor"
+    return "pii_masking"
+
+
 def route_supervisor(state: AgentState) -> Literal["context_loader", "__end__"]:
     """Route from supervisor based on routing decision."""
     routing = state.get("routing")
@@ -96,9 +112,11 @@ def route_context_loader(
 
 def route_specialist(state: AgentState) -> Literal["validator", "python_viz_tools", "__end__"]:
     """Route from specialist: validate sensitive actions, else end."""
-    # Check for visualization first
+    # Check for visualization first (optional: skipped when the turn is short on time)
     if state.get("visualization_request"):
-        return "python_viz_tools"
+        if has_budget(settings.turn_budget_optional_min_seconds, state.get("turn_deadline")):
+            return "python_viz_tools"
+        logger.info("visualization_skipped_low_budget")
 
     # Check for sensitive intents requiring validation
     intent = state.get("intent")
@@ -124,23 +142,23 @@ def create_agent_graph() -> StateGraph:
     graph = StateGraph(AgentState)
 
     # 1. Add Top-Level Nodes
-    graph.add_node("setup", setup_node)
-    graph.add_node("pii_masking", pii_masking_node)
-    graph.add_node("supervisor", supervisor_node)
-    graph.add_node("context_loader", context_loader_node)
+    graph.add_node("setup", budgeted("setup", setup_node))
+    graph.add_node("pii_masking", budgeted("pii_masking", pii_masking_node))
+    graph.add_node("supervisor", budgeted("supervisor", supervisor_node))
+    graph.add_node("context_loader", budgeted("context_loader", context_loader_node))
 
     # 2. Add Specialist Nodes
-    graph.add_node("agronomist", agronomist_node)
-    graph.add_node("weather", weather_node)
-    graph.add_node("nl_to_sql", nl_to_sql_node)
-    graph.add_node("vision_to_action", vision_to_action_node)
+    graph.add_node("agronomist", budgeted("agronomist", agronomist_node))
+    graph.add_node("weather", budgeted("weather", weather_node))
+    graph.add_node("nl_to_sql", budgeted("nl_to_sql", nl_to_sql_node))
+    graph.add_node("vision_to_action", budgeted("vision_to_action", vision_to_action_node))
 
     # 3. Add Support Nodes
-    graph.add_node("validator", validator_node)
+    graph.add_node("validator", budgeted("validator", validator_node))
 
     # 4. Entry Flow
     graph.set_entry_point("setup")
-    graph.add_edge("setup", "pii_masking")
+    graph.add_conditional_edges("setup", route_setup)
     graph.add_edge("pii_masking", "supervisor")
 
     # 5. Routing
@@ -189,19 +207,19 @@ async def create_agent_graph_with_mcp() -> StateGraph:
     graph = StateGraph(AgentState)
 
     # 1. Add Top-Level Nodes
-    graph.add_node("setup", setup_node)
-    graph.add_node("pii_masking", pii_masking_node)
-    graph.add_node("supervisor", supervisor_node)
-    graph.add_node("context_loader", context_loader_node)
+    graph.add_node("setup", budgeted("setup", setup_node))
+    graph.add_node("pii_masking", budgeted("pii_masking", pii_masking_node))
+    graph.add_node("supervisor", budgeted("supervisor", supervisor_node))
+    graph.add_node("context_loader", budgeted("context_loader", context_loader_node))
 
     # 2. Add Specialist Nodes
-    graph.add_node("agronomist", agronomist_node)
-    graph.add_node("weather", weather_node)
-    graph.add_node("nl_to_sql", nl_to_sql_node)
-    graph.add_node("vision_to_action", vision_to_action_node)
+    graph.add_node("agronomist", budgeted("agronomist", agronomist_node))
+    graph.add_node("weather", budgeted("weather", weather_node))
+    graph.add_node("nl_to_sql", budgeted("nl_to_sql", nl_to_sql_node))
+    graph.add_node("vision_to_action", budgeted("vision_to_action", vision_to_action_node))
 
     # 3. Add Support Nodes
-    graph.add_node("validator", validator_node)
+    graph.add_node("validator", budgeted("validator", validator_node))
 
     # 4. Add Tool Nodes
     if mcp_tools:
@@ -221,7 +239,7 @@ async def create_agent_graph_with_mcp() -> StateGraph:
 
     # 5. Entry Flow
     graph.set_entry_point("setup")
-    graph.add_edge("setup", "pii_masking")
+    graph.add_conditional_edges("setup", route_setup)
     graph.add_edge("pii_masking", "supervisor")
 
     # 6. Routing
@@ -305,7 +323,7 @@ async def compile_agent_graph_async(
 
     # Compile with debug mode for state inspection
     compiled = graph.compile(
-        checkpointer=checkpointer,
+        checkpointer=apply_checkpoint_policy(checkpointer),
         debug=verbose,
     )
 
@@ -340,11 +358,14 @@ def compile_agent_graph(checkpointer: BaseCheckpointSaver | None = None, verbose
     graph = create_agent_graph()
 
     # Compile with debug mode for state inspection
-    compiled = graph.compile(checkpointer=checkpointer, debug=verbose)
+    compiled = graph.compile(checkpointer=apply_checkpoint_policy(checkpointer), debug=verbose)
 
     # Add recursion limit to prevent infinite loops
     compiled = compiled.with_config(recursion_limit=50)
 
+    # Persist at the configured durability unless a call passes its own
+    compiled = bind_durability(compiled)
+
     # Wrap with Langfuse tracing for observability
     langfuse_handler = create_langfuse_handler()
     if langfuse_handler:
@@ -388,14 +409,16 @@ async def get_agent():
     """Get a compiled agent instance with MCP tools.
 
     Convenience function for API routes that need a ready-to-use agent.
-    Creates a fresh agent with async checkpointer and MCP tools.
+    Creates a fresh agent with async checkpointer and MCP tools, bound to
+    the configured checkpoint durability.
 
     Returns:
         Compiled agent graph ready for execution
     """
     checkpointer = await get_checkpointer_async()
-    return await compile_agent_graph_async(
+    graph = await compile_agent_graph_async(
         checkpointer=checkpointer,
         verbose=True,
         use_mcp=True,
     )
+    return bind_durability(graph)
@@ -9,6 +9,9 @@ Supports multiple backends (NO automatic fallback - explicit selection):
 Best Practice: Let LangGraph handle checkpointing internally.
 Don't reinvent the wheel - use the official checkpointers.
 
+How often and how much gets written is set by alim.agent.checkpoint_policy
+(LangGraph's durability option, plus slimming of stored state).
+
 Windows Note: psycopg requires SelectorEventLoop, not ProactorEventLoop.
 Call configure_windows_event_loop() before using PostgreSQL checkpointer.
 """
@@ -211,7 +214,14 @@ async def get_checkpointer_async(
     if backend == "redis" or (backend == "auto" and redis):
         if redis and REDIS_CHECKPOINTER_AVAILABLE and AsyncRedisSaver is not None:
             try:
-                checkpointer = AsyncRedisSaver(redis_url=redis)
+                # Idle threads expire natively; reads keep active threads alive
+                checkpointer = AsyncRedisSaver(
+                    redis_url=redis,
+                    ttl={
+                        "default_ttl": settings.checkpoint_ttl_days * 24 * 60,
+                        "refresh_on_read": True,
+                    },
+                )
                 await checkpointer.asetup()
                 log.info(f"{EMOJI_ALİM} {EMOJI_REDIS} Using Redis checkpointer (fast, ephemeral)")
                 if use_singleton:
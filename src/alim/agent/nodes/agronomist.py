@@ -16,8 +16,13 @@ from langgraph.graph.message import add_messages
 from typing_extensions import TypedDict
 
 from alim.agent.state import AgentState, UserIntent, add_assistant_message
+from alim.config import settings
+from alim.deadline import has_budget
 from alim.llm.factory import get_llm_from_config
 from alim.llm.providers.base import LLMMessage
+from alim.security.output_stream import guard_stream
+from alim.security.output_validator import get_output_validator
+from alim.security.pii_stream import mask_stream
 
 if TYPE_CHECKING:
     pass
@@ -148,6 +153,93 @@ def build_intent_prompt(intent: UserIntent | None) -> str:
     return prompts.get(intent, "")
 
 
+# ============================================================
+# ZekaLab Rule Invocation
+# ============================================================
+
+ZEKALAB_TITLES = {
+    UserIntent.IRRIGATION: "Suvarma",
+    UserIntent.FERTILIZATION: "Gübrələmə",
+    UserIntent.PEST_CONTROL: "Zərərverici nəzarəti",
+    UserIntent.HARVEST: "Məhsul yığımı",
+}
+
+
+def zekalab_invocation(
+    intent: UserIntent | None, farm_ctx: Any, weather: Any
+) -> tuple[str, dict[str, Any]] | None:
+    """Pick the ZekaLab handler method and arguments for an intent.
+
+    Shared with context_loader, which prefetches the call in the same
+    batch as the rules resource; identical arguments let this node reuse
+    that result instead of calling again.
+
+    Returns:
+        (handler method name, keyword arguments), or None when the intent
+        has no rule tool or there is no farm
+    """
+    farm_id = getattr(farm_ctx, "farm_id", None)
+    if intent not in ZEKALAB_TITLES or not farm_id:
+        return None
+
+    active_crop = None
+    if getattr(farm_ctx, "active_crops", None):
+        active_crop = farm_ctx.active_crops[0]
+
+    # Prepare common fields
+    crop_type = (active_crop.get("crop") if isinstance(active_crop, dict) else None) or "wheat"
+    soil_type = "loamy"
+    temperature_c = getattr(weather, "temperature_c", 25.0)
+    humidity_percent = getattr(weather, "humidity_percent", 60.0)
+    rainfall_mm = getattr(weather, "precipitation_mm", 0.0)
+    growth_days = (
+        active_crop.get("days_since_sowing") if isinstance(active_crop, dict) else 0
+    ) or 0
+
+    if intent == UserIntent.IRRIGATION:
+        return "evaluate_irrigation_rules", {
+            "farm_id": farm_id,
+            "crop_type": crop_type,
+            "soil_type": soil_type,
+            "current_soil_moisture_percent": 45.0,
+            "temperature_c": temperature_c,
+            "rainfall_mm_last_7_days": rainfall_mm,
+            "growth_stage_days": growth_days,
+        }
+
+    if intent == UserIntent.FERTILIZATION:
+        return "evaluate_fertilization_rules", {
+            "farm_id": farm_id,
+            "crop_type": crop_type,
+            "soil_type": soil_type,
+            "soil_nitrogen_ppm": None,
+            "soil_phosphorus_ppm": None,
+            "soil_potassium_ppm": None,
+            "growth_stage_days": growth_days,
+        }
+
+    if intent == UserIntent.PEST_CONTROL:
+        return "evaluate_pest_control_rules", {
+            "farm_id": farm_id,
+            "crop_type": crop_type,
+            "temperature_c": temperature_c,
+            "humidity_percent": humidity_percent,
+            "observed_pests": [],
+            "growth_stage_days": growth_days,
+            "rainfall_mm_last_3_days": rainfall_mm,
+        }
+
+    from datetime import datetime, timedelta
+
+    planting_date = (datetime.now(UTC) - timedelta(days=growth_days)).date().isoformat()
+    return "predict_harvest_date", {
+        "farm_id": farm_id,
+        "crop_type": crop_type,
+        "planting_date": planting_date,
+        "region": getattr(farm_ctx, "region", None),
+    }
+
+
 class AgronomistInput(TypedDict):
     """Input schema for agronomist node."""
 
@@ -156,6 +248,7 @@ class AgronomistInput(TypedDict):
     messages: Annotated[list[BaseMessage], add_messages]
     farm_context: Any
     weather: Any
+    mcp_context: dict
     matched_rules: Annotated[list[dict], "merge"]
     nodes_visited: list[str]
 
@@ -228,77 +321,24 @@ async def agronomist_node(
 
         handler = await get_zekalab_handler()
 
-        farm_ctx = state.get("farm_context")
-        weather = state.get("weather")
-        active_crop = None
-        if farm_ctx and getattr(farm_ctx, "active_crops", None):
-            active_crop = farm_ctx.active_crops[0] if farm_ctx.active_crops else None
-
-        # Prepare common fields
-        farm_id = getattr(farm_ctx, "farm_id", None)
-        crop_type = (active_crop.get("crop") if isinstance(active_crop, dict) else None) or "wheat"
-        soil_type = "loamy"
-        temperature_c = getattr(weather, "temperature_c", 25.0)
-        humidity_percent = getattr(weather, "humidity_percent", 60.0)
-        rainfall_mm = getattr(weather, "precipitation_mm", 0.0)
-        growth_days = (
-            active_crop.get("days_since_sowing") if isinstance(active_crop, dict) else 0
-        ) or 0
-
         mcp_results: list[tuple[str, dict]] = []
 
-        if intent == UserIntent.IRRIGATION and farm_id:
-            result, trace = await handler.evaluate_irrigation_rules(
-                farm_id=farm_id,
-                crop_type=crop_type,
-                soil_type=soil_type,
-                current_soil_moisture_percent=45.0,
-                temperature_c=temperature_c,
-                rainfall_mm_last_7_days=rainfall_mm,
-                growth_stage_days=growth_days,
-            )
-            mcp_traces.append(trace.model_dump())
-            mcp_results.append(("Suvarma", result))
-
-        elif intent == UserIntent.FERTILIZATION and farm_id:
-            result, trace = await handler.evaluate_fertilization_rules(
-                farm_id=farm_id,
-                crop_type=crop_type,
-                soil_type=soil_type,
-                soil_nitrogen_ppm=None,
-                soil_phosphorus_ppm=None,
-                soil_potassium_ppm=None,
-                growth_stage_days=growth_days,
-            )
-            mcp_traces.append(trace.model_dump())
-            mcp_results.append(("Gübrələmə", result))
-
-        elif intent == UserIntent.PEST_CONTROL and farm_id:
-            result, trace = await handler.evaluate_pest_control_rules(
-                farm_id=farm_id,
-                crop_type=crop_type,
-                temperature_c=temperature_c,
-                humidity_percent=humidity_percent,
-                observed_pests=[],
-                growth_stage_days=growth_days,
-                rainfall_mm_last_3_days=rainfall_mm,
-            )
-            mcp_traces.append(trace.model_dump())
-            mcp_results.append(("Zərərverici nəzarəti", result))
-
-        elif intent == UserIntent.HARVEST and farm_id:
-            from datetime import datetime, timedelta
-
-            planting_date = (datetime.now(UTC) - timedelta(days=growth_days)).date().isoformat()
-
-            result, trace = await handler.predict_harvest_date(
-                farm_id=farm_id,
-                crop_type=crop_type,
-                planting_date=planting_date,
-                current_gdd_accumulated=0,
-            )
-            mcp_traces.append(trace.model_dump())
-            mcp_results.append(("Məhsul yığımı", result))
+        invocation = zekalab_invocation(intent, state.get("farm_context"), state.get("weather"))
+        if invocation:
+            method, kwargs = invocation
+            prefetched = (state.get("mcp_context") or {}).get("zekalab_tool")
+            if prefetched and prefetched["method"] == method and prefetched["kwargs"] == kwargs:
+                # Already fetched (and traced) by context_loader in the rules batch
+                result = prefetched["result"]
+            elif has_budget(settings.turn_budget_optional_min_seconds):
+                result, trace = await getattr(handler, method)(**kwargs)
+                mcp_traces.append(trace.model_dump())
+            else:
+                # Rules are an enrichment; keep what is left for the answer
+                result = None
+                logger.info("zekalab_skipped_low_budget", node="agronomist", tool=method)
+            if result is not None:
+                mcp_results.append((ZEKALAB_TITLES[intent], result))
 
         # Build MCP rule summary section
         if mcp_results:
@@ -431,7 +471,11 @@ async def agronomist_node_streaming(state: AgentState, config: RunnableConfig |
     provider = get_llm_from_config(config)
 
     full_response = ""
-    async for chunk in provider.stream(messages, temperature=0.7, max_tokens=800):
+    # Tokens are validated and masked incrementally; an unsafe response stops
+    # generation and is replaced by the fallback
+    tokens = provider.stream(messages, temperature=0.7, max_tokens=800)
+    fallback = get_output_validator().get_safe_fallback()
+    async for chunk in mask_stream(guard_stream(tokens, fallback=fallback)):
         full_response += chunk
         yield {"type": "token", "content": chunk}
 
@@ -6,6 +6,12 @@ This keeps context loading separate from business logic nodes.
 
 Phase 2: Integrates real weather data via WeatherMCPHandler
 Phase 4.3: Orchestrates parallel Weather + ZekaLab MCP calls with fallbacks
+
+The ZekaLab rules resource and the intent's rule tool go out as one
+coalesced batch; the agronomist reuses the prefetched tool result.
+
+MCP waits are capped by the turn's remaining budget (minus a reserve for
+the answer), and ZekaLab rules are skipped when the budget is low.
 """
 
 import asyncio
@@ -14,6 +20,7 @@ from typing import Any
 
 import structlog
 
+from alim.agent.nodes.agronomist import zekalab_invocation
 from alim.agent.state import (
     AgentState,
     FarmContext,
@@ -21,10 +28,12 @@ from alim.agent.state import (
     UserContext,
     WeatherContext,
 )
+from alim.config import settings
 from alim.data.cache import CachedFarmRepository, CachedUserRepository
-from alim.data.database import get_db_session
+from alim.data.database import get_db_read_session
 from alim.data.repositories.farm_repo import FarmRepository
 from alim.data.repositories.user_repo import UserRepository
+from alim.deadline import has_budget, remaining, timeout_for
 from alim.mcp.handlers.weather_handler import WeatherMCPHandler
 from alim.mcp.handlers.zekalab_handler import get_zekalab_handler
 
@@ -69,7 +78,10 @@ async def context_loader_node(state: AgentState) -> dict:
         # but if it does, the graph edge will handle it (or error out).
         return updates
 
-    async with get_db_session() as session:
+    # Per-turn: never let a previous turn's prefetch reach the specialists
+    updates["mcp_context"] = {}
+
+    async with get_db_read_session() as session:
         # Load user context
         if "user" in requires_context and user_id:
             # OPTIMIZATION: Check if already loaded in state (persistence)
@@ -94,7 +106,9 @@ async def context_loader_node(state: AgentState) -> dict:
         # Load farm context
         if "farm" in requires_context and user_id:
             # OPTIMIZATION: Check if already loaded in state
-            if state.get("farm_context"):
+            # (checkpoints keep the farm summary but not its parcels)
+            cached_farm = state.get("farm_context")
+            if cached_farm and (cached_farm.parcels or not cached_farm.parcel_count):
                 logger.info("context_loader_farm_cached_in_state")
             else:
                 base_farm_repo = FarmRepository(session)
@@ -192,20 +206,28 @@ async def _orchestrate_parallel_mcp(
             mcp_servers=["openweather", "zekalab"],
         )
 
-        mcp_tasks = []
-        mcp_tasks.append(_fetch_weather_mcp(farm_id))
+        weather_task = asyncio.ensure_future(_fetch_weather_mcp(farm_id))
+        mcp_tasks = [weather_task]
 
         active_crops = farm_context_obj.active_crops if farm_context_obj else []
-        if active_crops:
+        if active_crops and has_budget(settings.turn_budget_optional_min_seconds):
             crop_type = active_crops[0] if isinstance(active_crops, list) else active_crops
-            mcp_tasks.append(_fetch_zekalab_rules_mcp(farm_id, str(crop_type)))
+            mcp_tasks.append(
+                _fetch_zekalab_after_weather(state, farm_id, str(crop_type), weather_task)
+            )
         else:
+            if active_crops:
+                logger.info("zekalab_skipped_low_budget", farm_id=farm_id, remaining_s=remaining())
             mcp_tasks.append(_noop_task("zekalab_rules"))
 
+        mcp_timeout = timeout_for(
+            state.get("mcp_config", {}).get("mcp_timeout_seconds", 5.0),
+            reserve=settings.turn_budget_llm_reserve_seconds,
+        )
         try:
             results = await asyncio.wait_for(
                 asyncio.gather(*mcp_tasks, return_exceptions=True),
-                timeout=5.0,
+                timeout=mcp_timeout,
             )
 
             # Process Weather
@@ -213,18 +235,7 @@ async def _orchestrate_parallel_mcp(
             if isinstance(weather_result, tuple) and len(weather_result) == 2:
                 forecast_data, weather_trace = weather_result
                 mcp_traces.append(weather_trace.model_dump())
-
-                from datetime import datetime
-
-                current = forecast_data.get("current", {})
-                weather = WeatherContext(
-                    temperature_c=current.get("temperature", 25.0),
-                    humidity_percent=current.get("humidity", 60.0),
-                    precipitation_mm=current.get("rainfall_mm", 0.0),
-                    wind_speed_kmh=current.get("wind_speed", 0.0),
-                    forecast_summary=forecast_data.get("forecast_summary"),
-                    last_updated=datetime.now(UTC),
-                )
+                weather = _weather_from_forecast(forecast_data)
             elif isinstance(weather_result, Exception):
                 logger.warning("weather_mcp_exception", error=str(weather_result))
                 mcp_traces.append(
@@ -242,10 +253,15 @@ async def _orchestrate_parallel_mcp(
             # Process ZekaLab
             if len(results) > 1:
                 zekalab_result = results[1]
-                if isinstance(zekalab_result, tuple) and len(zekalab_result) == 2:
-                    rules_data, rules_trace = zekalab_result
+                if isinstance(zekalab_result, tuple) and len(zekalab_result) in (2, 3):
+                    rules_data, rules_trace = zekalab_result[:2]
                     mcp_traces.append(rules_trace.model_dump())
                     mcp_context["zekalab_rules"] = rules_data
+                    if len(zekalab_result) == 3 and zekalab_result[2]:
+                        tool_call = zekalab_result[2]
+                        mcp_traces.append(tool_call.pop("trace").model_dump())
+                        if tool_call["success"]:
+                            mcp_context["zekalab_tool"] = tool_call
                 elif isinstance(zekalab_result, Exception):
                     logger.warning("zekalab_mcp_exception", error=str(zekalab_result))
                     mcp_traces.append(
@@ -330,15 +346,59 @@ async def _fetch_weather_mcp(farm_id: str) -> tuple[dict[str, Any], MCPTrace]:
         return {}, trace
 
 
-async def _fetch_zekalab_rules_mcp(farm_id: str, crop_type: str):
+def _weather_from_forecast(forecast_data: dict[str, Any]) -> WeatherContext:
+    """Build the weather context from a Weather MCP forecast."""
+    from datetime import datetime
+
+    current = forecast_data.get("current", {})
+    return WeatherContext(
+        temperature_c=current.get("temperature", 25.0),
+        humidity_percent=current.get("humidity", 60.0),
+        precipitation_mm=current.get("rainfall_mm", 0.0),
+        wind_speed_kmh=current.get("wind_speed", 0.0),
+        forecast_summary=forecast_data.get("forecast_summary"),
+        last_updated=datetime.now(UTC),
+    )
+
+
+async def _fetch_zekalab_after_weather(
+    state: AgentState, farm_id: str, crop_type: str, weather_task: asyncio.Future
+):
+    """Fetch ZekaLab rules, batched with the intent's rule tool.
+
+    The tool arguments depend on the weather, so this waits for the
+    weather call first; rules and tool then cost one ZekaLab round-trip
+    instead of one here and another in the agronomist. Without usable
+    weather only the rules are fetched (the agronomist will call the
+    tool itself, with whatever weather it ends up with).
+    """
+    await asyncio.wait([weather_task])
+    weather = None
+    if not weather_task.cancelled() and weather_task.exception() is None:
+        forecast_data, _ = weather_task.result()
+        if forecast_data:
+            weather = _weather_from_forecast(forecast_data)
+
+    invocation = None
+    if weather:
+        invocation = zekalab_invocation(state.get("intent"), state.get("farm_context"), weather)
+    return await _fetch_zekalab_rules_mcp(farm_id, crop_type, invocation)
+
+
+async def _fetch_zekalab_rules_mcp(
+    farm_id: str, crop_type: str, invocation: tuple[str, dict[str, Any]] | None = None
+):
     """Fetch agricultural rules via ZekaLab MCP (async task).
 
     Args:
         farm_id: Farm identifier
         crop_type: Crop type for rules
+        invocation: Optional (handler method, kwargs) to run in the same
+            batch as the rules resource (see ``zekalab_invocation``)
 
     Returns:
-        (rules_data, trace) tuple
+        (rules_data, trace) tuple; with an invocation, a third item
+        ``{"method", "kwargs", "result", "success", "trace"}``
 
     Raises:
         Exception on failure (caught by orchestrator)
@@ -346,9 +406,29 @@ async def _fetch_zekalab_rules_mcp(farm_id: str, crop_type: str):
     logger.info("zekalab_mcp_start")
     # Ensure handler is correctly instantiated
     handler = await get_zekalab_handler()
-    rules_data, trace = await handler.get_rules_resource()  # Ensure correct parameters are passed
-    logger.info("zekalab_mcp_success", farm_id=farm_id, crop_type=crop_type)
-    return rules_data, trace
+    if invocation is None:
+        rules_data, trace = await handler.get_rules_resource()
+        logger.info("zekalab_mcp_success", farm_id=farm_id, crop_type=crop_type)
+        return rules_data, trace
+
+    method, kwargs = invocation
+    async with handler.coalescing():
+        (rules_data, trace), (result, tool_trace) = await asyncio.gather(
+            handler.get_rules_resource(),
+            getattr(handler, method)(**kwargs),
+        )
+    logger.info("zekalab_mcp_success", farm_id=farm_id, crop_type=crop_type, prefetched=method)
+    return (
+        rules_data,
+        trace,
+        {
+            "method": method,
+            "kwargs": kwargs,
+            "result": result,
+            "success": tool_trace.success,
+            "trace": tool_trace,
+        },
+    )
 
 
 async def _noop_task(task_name: str) -> None:
@@ -1,7 +1,17 @@
+import asyncio
+from pathlib import Path
 from typing import Any
 
+import structlog
+
 from alim.agent.state import AgentState
 from alim.security.pii_gateway import get_pii_gateway
+from alim.security.pii_stream import PIIStreamMasker, mask_document_chunks
+
+logger = structlog.get_logger(__name__)
+
+# Uploads masked as text; other files (images, PDFs) pass through unchanged
+TEXT_DOCUMENT_SUFFIXES = frozenset({".txt", ".md", ".csv", ".json"})
 
 
 async def pii_masking_node(state: AgentState) -> dict[str, Any]:
@@ -11,27 +21,81 @@ async def pii_masking_node(state: AgentState) -> dict[str, Any]:
     1. Sensitive data (FIN, Phone, etc.) is replaced with placeholders.
     2. clean input is passed to the LLM agent.
     3. Langreuse traces contain only the masked input for the start of the trace.
+    4. Uploaded text documents are replaced by masked copies, streamed
+       chunk by chunk so large files are never held in memory.
     """
     user_input = state.get("user_input", "")
-    gateway = get_pii_gateway()
-
-    # Check if we need to mask
-    if not user_input:
-        return {}
+    file_paths = state.get("file_paths") or []
+    updates: dict[str, Any] = {}
+    alerts: list[dict[str, str]] = []
 
-    result = gateway.strip_pii(user_input)
-
-    if result.has_pii:
-        # Return updated user_input used by downstream nodes
-        return {
-            "user_input": result.cleaned_text,
-            "alerts": state.get("alerts", [])
-            + [
+    if user_input:
+        result = get_pii_gateway().strip_pii(user_input)
+        if result.has_pii:
+            # Return updated user_input used by downstream nodes
+            updates["user_input"] = result.cleaned_text
+            alerts.append(
                 {
                     "type": "info",
                     "message": f"PII detected and masked: {', '.join(result.pii_types_found)}",
                 }
-            ],
-        }
+            )
+
+    if file_paths:
+        masked_paths, pii_types = await asyncio.to_thread(mask_documents, file_paths)
+        if masked_paths != file_paths:
+            updates["file_paths"] = masked_paths
+            alerts.append(
+                {
+                    "type": "info",
+                    "message": f"PII masked in uploaded documents: {', '.join(pii_types)}",
+                }
+            )
+
+    if alerts:
+        updates["alerts"] = state.get("alerts", []) + alerts
+    return updates
+
+
+def mask_documents(file_paths: list[str]) -> tuple[list[str], list[str]]:
+    """Write masked copies of text documents that contain PII.
+
+    Each document ``name.txt`` with PII gets a sibling ``name.masked.txt``
+    that replaces it in the returned paths.
+
+    Returns:
+        (paths to use downstream, PII types found across documents)
+    """
+    paths: list[str] = []
+    pii_types: list[str] = []
+    for file_path in file_paths:
+        source = Path(file_path)
+        if source.suffix.lower() not in TEXT_DOCUMENT_SUFFIXES or not source.is_file():
+            paths.append(file_path)
+            continue
+
+        target = source.with_name(f"{source.stem}.masked{source.suffix}")
+        masker = PIIStreamMasker()
+        try:
+            with open(target, "w", encoding="utf-8") as out:
+                for chunk in mask_document_chunks(source, masker):
+                    out.write(chunk)
+        except OSError as e:
+            logger.warning("document_pii_masking_failed", path=file_path, error=str(e))
+            target.unlink(missing_ok=True)
+            paths.append(file_path)
+            continue
 
-    return {}
+        if masker.detection_count:
+            logger.info(
+                "document_pii_masked",
+                path=file_path,
+                detections=masker.detection_count,
+                pii_types=masker.pii_types_found,
+            )
+            paths.append(str(target))
+            pii_types.extend(t for t in masker.pii_types_found if t not in pii_types)
+        else:
+            target.unlink()
+            paths.append(file_path)
+    return paths, pii_types
@@ -1,17 +1,22 @@
 # src/alim/agent/nodes/setup.py
 """Setup node for hydrating agent state."""
 
+import time
 from datetime import UTC, datetime
 
 import structlog
 from langchain_core.messages import HumanMessage
+from langchain_core.runnables import RunnableConfig
 
 from alim.agent.state import AgentState
+from alim.config import settings
+from alim.deadline import deadline_from_config
+from alim.security.pipeline import SCREENED_KEY
 
 logger = structlog.get_logger(__name__)
 
 
-def setup_node(state: AgentState) -> dict:
+def setup_node(state: AgentState, config: RunnableConfig | None = None) -> dict:
     """Entry node to hydrate state from simple inputs.
 
     Inspects input state (potentially partial) and ensures all
@@ -20,6 +25,8 @@ def setup_node(state: AgentState) -> dict:
 
     Args:
         state: Input state (potentially partial)
+        config: RunnableConfig; ``metadata["deadline"]`` sets the turn deadline,
+            ``metadata["input_screened"]`` skips PII masking in the graph
 
     Returns:
         State updates (will be merged by LangGraph)
@@ -33,6 +40,15 @@ def setup_node(state: AgentState) -> dict:
     if "nodes_visited" not in state:
         updates["nodes_visited"] = []
 
+    # Every turn gets a deadline, from the caller or the default budget
+    updates["turn_deadline"] = (
+        deadline_from_config(config) or time.time() + settings.turn_budget_seconds
+    )
+
+    # Set every turn, so a screened turn never lets the next one skip masking
+    metadata = (config or {}).get("metadata") or {}
+    updates["input_screened"] = bool(metadata.get(SCREENED_KEY))
+
     # 2. Handle Message Creation from current_input
     # Ensure current_input is added as a message if it's new
     current_input = state.get("current_input")
@@ -10,7 +10,7 @@ from typing import Any
 import structlog
 
 from alim.agent.state import AgentState, UserIntent, add_assistant_message
-from alim.data.database import get_db_session
+from alim.data.database import get_db_read_session
 
 logger = structlog.get_logger(__name__)
 
@@ -38,7 +38,7 @@ async def sql_executor_node(state: AgentState) -> dict[str, Any]:
         }
 
     try:
-        async with get_db_session() as session:
+        async with get_db_read_session() as session:
             result = await session.execute(sql_text)
             rows = result.fetchall()
 
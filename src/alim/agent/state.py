@@ -254,6 +254,17 @@ def _merge_rules(
     return existing + unique_new
 
 
+def _merge_budget(
+    existing: list[dict],
+    new: list[dict],
+) -> list[dict]:
+    """Reducer for budget_log: append, dropping entries from earlier turns."""
+    if not new:
+        return existing
+    turn = new[-1].get("deadline")
+    return [e for e in existing if e.get("deadline") == turn] + new
+
+
 class AgentState(TypedDict, total=False):
     """Main state that flows through the LangGraph agent.
 
@@ -305,6 +316,9 @@ class AgentState(TypedDict, total=False):
     # ===== Processing Metadata =====
     processing_start: datetime | None  # When processing started
     nodes_visited: list[str]  # Audit trail of nodes
+    turn_deadline: float | None  # Unix time this turn must finish by (see alim.deadline)
+    input_screened: bool  # Input already validated and PII-masked by the API this turn
+    budget_log: Annotated[list[dict], _merge_budget]  # Per-node time used / left this turn
 
     # ===== Error Handling =====
     error: str | None  # Error message if any
@@ -320,6 +334,7 @@ class AgentState(TypedDict, total=False):
     mcp_traces: Annotated[list[dict], _merge_rules]  # All MCP calls made during this turn
     mcp_server_health: dict[str, bool]  # Health status of each MCP server
     mcp_config: dict  # Session-level MCP configuration
+    mcp_context: dict  # MCP data loaded this turn (rules, prefetched ZekaLab tool result)
 
     # ===== Document Processing (Phase 3) =====
     file_paths: list[str]  # Uploaded file paths for document processing
@@ -395,6 +410,8 @@ def create_initial_state(
         alerts=[],
         processing_start=datetime.now(UTC),
         nodes_visited=[],
+        turn_deadline=None,
+        budget_log=[],
         # Error Handling
         error=None,
         error_node=None,
@@ -414,6 +431,7 @@ def create_initial_state(
             "max_mcp_calls_per_turn": 10,
             "mcp_timeout_seconds": 5,
         },
+        mcp_context={},
         # Document Processing (Phase 3)
         file_paths=file_paths or [],
         # Versioning (Phase 4)
@@ -11,8 +11,11 @@ from alim.agent.memory import configure_windows_event_loop
 from alim.api.middleware.rate_limit import RateLimiter, RateLimitExceeded, RateLimitMiddleware
 from alim.api.routes import auth, chat, graph, health, models, vision
 from alim.config import settings
+from alim.data.checkpoint_gc import start_checkpoint_gc, stop_checkpoint_gc
+from alim.data.database import close_db, start_db_monitoring
 from alim.data.redis_client import RedisClient
 from alim.llm.http_pool import HTTPClientPool
+from alim.mcp.client import close_all_mcp_clients, open_mcp_clients
 from alim.observability import (
     print_endpoints,
     print_flash_warning,  # New import
@@ -28,6 +31,7 @@ from alim.observability import (
     print_startup_complete,
     print_status_line,
 )
+from alim.rules.registry import get_rule_registry
 
 # Configure Windows event loop for psycopg/PostgreSQL compatibility
 configure_windows_event_loop()
@@ -227,6 +231,18 @@ async def lifespan(app: FastAPI):
         ]
     )
 
+    # Background DB liveness check (replaces per-checkout pre-ping)
+    start_db_monitoring()
+
+    # Keep checkpoint tables bounded (latest N per thread, idle threads expire)
+    start_checkpoint_gc()
+
+    # Hot-reload agronomy rules without restarting workers
+    get_rule_registry().start()
+
+    # Persistent MCP connection pools (keep-alive, per-server concurrency)
+    await open_mcp_clients()
+
     print_startup_complete("ALİM API")
 
     yield
@@ -241,10 +257,20 @@ async def lifespan(app: FastAPI):
     await HTTPClientPool.close_all()
     print_status_line("HTTP Pools", "Closed", "success")
 
+    await close_all_mcp_clients()
+    print_status_line("MCP Pools", "Closed", "success")
+
     # Close Redis connections
     await RedisClient.close()
     print_status_line("Redis", "Closed", "success")
 
+    await get_rule_registry().stop()
+    await stop_checkpoint_gc()
+
+    # Stop liveness checks and dispose DB pools
+    await close_db()
+    print_status_line("Database", "Closed", "success")
+
     print()
     print_status_line("ALİM", "Shutdown complete", "success")
     print()
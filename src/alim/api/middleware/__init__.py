@@ -2,7 +2,7 @@
 """FastAPI middleware for multi-user scalability.
 
 Provides:
-- Rate limiting with Redis-backed sliding window
+- Rate limiting with Redis-backed token buckets
 - Request throttling for expensive LLM operations
 - Client identification for per-user limits
 - JWT authentication with mock mode for development
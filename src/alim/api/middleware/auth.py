@@ -6,19 +6,41 @@ Provides:
 - User extraction from tokens
 - Mock auth mode for development/testing
 - Request state injection (user_id, user_tier)
+- Validated-token caching: an in-process LRU keyed by token hash, and an
+  optional Redis tier shared by replicas
+- Key caching for asymmetric algorithms (parsed PEM key or JWKS set)
 
 In production, integrates with mygov ID or similar OAuth provider.
 """
 
+import asyncio
+import hashlib
 import time
+from collections import OrderedDict
 from typing import Annotated
 
 import jwt
+import structlog
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import APIKeyHeader, HTTPAuthorizationCredentials, HTTPBearer
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 from alim.config import settings
+from alim.data.redis_client import get_redis
+
+logger = structlog.get_logger(__name__)
+
+# Validated tokens kept per process (least recently used dropped first)
+TOKEN_CACHE_SIZE = 1000
+
+# Seconds a validated token is trusted without checking its signature again
+TOKEN_CACHE_TTL = 300
+
+# Seconds to skip Redis after a connection/command failure
+REDIS_RETRY_SECONDS = 30.0
+
+# Algorithm prefixes that verify with a public key (PEM or JWKS)
+ASYMMETRIC_PREFIXES = ("RS", "PS", "ES", "EdDSA")
 
 
 class TokenPayload(BaseModel):
@@ -66,6 +88,12 @@ class JWTAuthenticator:
 
     Also supports a mock mode for development where any token is accepted.
 
+    Validated payloads are cached by SHA-256 of the token, until the
+    earlier of the cache TTL and the token's expiry. With ``shared_cache``
+    they are also stored in Redis, so a token validated by one replica is
+    not re-verified by the others. Only enable it when Redis is as trusted
+    as the signing key: anyone who can write those keys can log in.
+
     Example:
         ```python
         auth = JWTAuthenticator()
@@ -80,6 +108,9 @@ class JWTAuthenticator:
     # Required scopes for ALİM API access
     REQUIRED_SCOPES = {"alim:read", "alim:chat"}
 
+    # Key prefix for validated claims shared through Redis
+    SHARED_CACHE_PREFIX = "alim:jwt:"
+
     def __init__(
         self,
         secret: str | None = None,
@@ -87,15 +118,24 @@ class JWTAuthenticator:
         issuer: str | None = None,
         audience: str | None = None,
         mock_mode: bool | None = None,
+        jwks_url: str | None = None,
+        shared_cache: bool | None = None,
+        cache_namespace: str | None = None,
+        cache_size: int = TOKEN_CACHE_SIZE,
     ):
         """Initialize authenticator.
 
         Args:
-            secret: JWT secret for HS256 mode.
+            secret: JWT secret for HS256 mode (PEM public key for RS256 without JWKS).
             algorithm: JWT algorithm (HS256 or RS256).
             issuer: Expected token issuer.
             audience: Expected token audience.
             mock_mode: If True, accept any token for development. If None, uses env setting.
+            jwks_url: JWKS endpoint for asymmetric algorithms (uses config default).
+            shared_cache: Share validated claims through Redis (uses config default).
+            cache_namespace: Shared-cache namespace, changed on key rotation
+                (uses config default).
+            cache_size: Validated tokens kept in process.
         """
         self.secret = secret or settings.jwt_secret
         self.algorithm = algorithm or settings.jwt_algorithm
@@ -109,30 +149,75 @@ class JWTAuthenticator:
         else:
             self.mock_mode = settings.environment == "development"
 
-        # Token cache to avoid repeated validation
-        self._token_cache: dict[str, tuple[TokenPayload, float]] = {}
-        self._cache_ttl = 300  # 5 minutes
-
-    def _get_cached(self, token: str) -> TokenPayload | None:
+        # Token cache to avoid repeated validation: hash -> (expires_at, payload)
+        self._token_cache: OrderedDict[str, tuple[float, TokenPayload]] = OrderedDict()
+        self._cache_ttl = TOKEN_CACHE_TTL
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        # Verification key, prepared once instead of parsed on every decode
+        self.jwks_url = jwks_url or settings.jwt_jwks_url
+        self._jwks_client: jwt.PyJWKClient | None = None
+        self._key = self.secret
+        if self.algorithm.startswith(ASYMMETRIC_PREFIXES):
+            if self.jwks_url:
+                self._jwks_client = jwt.PyJWKClient(
+                    self.jwks_url,
+                    cache_keys=True,
+                    lifespan=settings.jwt_jwks_cache_seconds,
+                )
+            else:
+                try:
+                    self._key = jwt.get_algorithm_by_name(self.algorithm).prepare_key(self.secret)
+                except (ValueError, jwt.InvalidKeyError):
+                    pass  # Reported per token by jwt.decode
+
+        self.shared_cache = settings.jwt_shared_cache if shared_cache is None else shared_cache
+        self._redis_retry_at = 0.0
+        # Replicas share entries only if they validate tokens the same way.
+        # Key names are visible to anyone who can list Redis keys, so the
+        # secret stays out; rotating it means changing the namespace.
+        namespace = cache_namespace or settings.jwt_shared_cache_namespace
+        self._cache_namespace = hashlib.sha256(
+            f"{self.algorithm}|{self.issuer}|{self.audience}|{self.jwks_url}|{namespace}".encode()
+        ).hexdigest()[:16]
+
+    @staticmethod
+    def _token_key(token: str) -> str:
+        """Cache key for a token (its SHA-256; raw tokens are never stored)."""
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def _get_cached(self, key: str) -> TokenPayload | None:
         """Get cached token payload if still valid."""
-        if token in self._token_cache:
-            payload, cached_at = self._token_cache[token]
-            if time.time() - cached_at < self._cache_ttl and not payload.is_expired:
+        entry = self._token_cache.get(key)
+        if entry is not None:
+            expires_at, payload = entry
+            if expires_at > time.time():
+                self._token_cache.move_to_end(key)
+                self.cache_hits += 1
                 return payload
             # Remove expired cache entry
-            del self._token_cache[token]
+            del self._token_cache[key]
+        self.cache_misses += 1
         return None
 
-    def _cache_payload(self, token: str, payload: TokenPayload) -> None:
-        """Cache validated token payload."""
-        # Limit cache size
-        if len(self._token_cache) > 1000:
-            # Remove oldest entries
-            sorted_entries = sorted(self._token_cache.items(), key=lambda x: x[1][1])
-            for old_token, _ in sorted_entries[:500]:
-                del self._token_cache[old_token]
-
-        self._token_cache[token] = (payload, time.time())
+    def _cache_payload(self, key: str, payload: TokenPayload) -> None:
+        """Cache validated token payload, evicting the least recently used."""
+        expires_at = min(time.time() + self._cache_ttl, payload.exp)
+        self._token_cache[key] = (expires_at, payload)
+        self._token_cache.move_to_end(key)
+        while len(self._token_cache) > self.cache_size:
+            self._token_cache.popitem(last=False)
+
+    def cache_info(self) -> dict[str, int]:
+        """Hit/miss counters and size of the token cache, for metrics."""
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "size": len(self._token_cache),
+            "maxsize": self.cache_size,
+        }
 
     def validate_token(self, token: str) -> TokenPayload:
         """Validate JWT token and extract payload.
@@ -147,15 +232,56 @@ class JWTAuthenticator:
             HTTPException: If token is invalid.
         """
         # Check cache first
-        cached = self._get_cached(token)
+        key = self._token_key(token)
+        cached = self._get_cached(key)
+        if cached:
+            return cached
+
+        payload = self._decode(token)
+        self._cache_payload(key, payload)
+        return payload
+
+    async def validate_token_async(self, token: str) -> TokenPayload:
+        """Validate JWT token, also consulting the shared Redis cache.
+
+        Args:
+            token: JWT token string.
+
+        Returns:
+            TokenPayload with validated claims.
+
+        Raises:
+            HTTPException: If token is invalid.
+        """
+        key = self._token_key(token)
+        cached = self._get_cached(key)
         if cached:
             return cached
 
+        payload = await self._get_shared(key)
+        if payload is None:
+            if self._jwks_client is not None:
+                # May fetch the JWKS set over HTTP; keep it off the event loop
+                payload = await asyncio.to_thread(self._decode, token)
+            else:
+                payload = self._decode(token)
+            await self._set_shared(key, payload)
+
+        self._cache_payload(key, payload)
+        return payload
+
+    def _decode(self, token: str) -> TokenPayload:
+        """Verify the signature and claims of a token (no caching)."""
         try:
+            if self._jwks_client is not None:
+                key = self._jwks_client.get_signing_key_from_jwt(token).key
+            else:
+                key = self._key
+
             # Decode and validate
             decoded = jwt.decode(
                 token,
-                self.secret,
+                key,
                 algorithms=[self.algorithm],
                 options={
                     "require": ["exp", "iat", "sub"],
@@ -186,8 +312,6 @@ class JWTAuthenticator:
                     detail="Token issued in future",
                 )
 
-            # Cache and return
-            self._cache_payload(token, payload)
             return payload
 
         except jwt.ExpiredSignatureError:
@@ -196,13 +320,60 @@ class JWTAuthenticator:
                 detail="Token has expired",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-        except jwt.InvalidTokenError as e:
+        except (jwt.InvalidTokenError, jwt.PyJWKClientError) as e:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail=f"Invalid token: {str(e)}",
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
+    def _shared_key(self, key: str) -> str:
+        """Redis key for a token hash."""
+        return f"{self.SHARED_CACHE_PREFIX}{self._cache_namespace}:{key}"
+
+    def _redis_available(self) -> bool:
+        return self.shared_cache and time.monotonic() >= self._redis_retry_at
+
+    def _redis_failed(self, error: Exception) -> None:
+        self._redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+        logger.warning("jwt_cache_redis_unavailable", error=str(error))
+
+    async def _get_shared(self, key: str) -> TokenPayload | None:
+        """Claims another replica validated, if any."""
+        if not self._redis_available():
+            return None
+        try:
+            async with get_redis() as redis:
+                data = await redis.get(self._shared_key(key))
+        except Exception as e:
+            self._redis_failed(e)
+            return None
+        if not data:
+            return None
+        try:
+            payload = TokenPayload.model_validate_json(data)
+        except ValidationError:
+            # Corrupt or written by an older schema: treat as a miss
+            logger.warning("jwt_cache_entry_invalid", key=key[:12])
+            try:
+                async with get_redis() as redis:
+                    await redis.delete(self._shared_key(key))
+            except Exception as e:
+                self._redis_failed(e)
+            return None
+        return None if payload.is_expired else payload
+
+    async def _set_shared(self, key: str, payload: TokenPayload) -> None:
+        """Share validated claims until the cache TTL or token expiry."""
+        ttl = int(min(self._cache_ttl, payload.exp - time.time()))
+        if ttl <= 0 or not self._redis_available():
+            return
+        try:
+            async with get_redis() as redis:
+                await redis.set(self._shared_key(key), payload.model_dump_json(), ex=ttl)
+        except Exception as e:
+            self._redis_failed(e)
+
     def create_mock_user(self, user_id: str = "mock_user_001") -> AuthenticatedUser:
         """Create a mock user for development.
 
@@ -267,7 +438,7 @@ class JWTAuthenticator:
         # Production mode - require valid authentication
         if credentials and credentials.credentials:
             # Bearer token authentication
-            payload = self.validate_token(credentials.credentials)
+            payload = await self.validate_token_async(credentials.credentials)
 
             # Check required scopes
             token_scopes = set(payload.scopes)
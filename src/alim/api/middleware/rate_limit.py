@@ -1,19 +1,101 @@
 # src/ALİM/api/middleware/rate_limit.py
-"""Rate limiting middleware using Redis sliding window.
+"""Rate limiting middleware using Redis token buckets.
 
 Provides distributed rate limiting for multi-user scalability.
 Uses Redis for state storage to work across multiple API instances.
+
+Each check is one EVALSHA of a Lua script that reads, refills and
+updates the client's state atomically on the Redis server, so there is
+one round-trip per request and O(1) memory per client. Two algorithms
+are available:
+
+- ``token_bucket``: a hash of (tokens, timestamp); up to ``burst_limit``
+  requests at once, refilled at ``requests_per_minute``
+- ``gcra``: a single "theoretical arrival time" value; same limits, one
+  string key instead of a hash
+
+Clients whose bucket Redis reported as empty are also remembered in
+process until their next token is due, so repeated requests from them
+are rejected without a Redis call.
 """
 
+import math
 import time
-from collections.abc import Callable
+from collections import OrderedDict
 
-from fastapi import HTTPException, Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+import structlog
+from fastapi import HTTPException, Request
+from fastapi.responses import JSONResponse
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from alim.config import settings
 from alim.data.redis_client import get_redis
 
+logger = structlog.get_logger(__name__)
+
+# KEYS[1] = bucket; ARGV = rate (tokens/s), capacity, cost
+# Returns {allowed, remaining tokens, seconds until the next request fits}
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local allowed = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+end
+
+-- Once refilled to capacity the key is indistinguishable from a new one
+local ttl = math.ceil((capacity - tokens) / rate * 1000)
+if ttl > 0 then
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+    redis.call('PEXPIRE', KEYS[1], ttl)
+else
+    redis.call('DEL', KEYS[1])
+end
+
+local wait = math.max(0, (1 - tokens) / rate)
+return {allowed, tostring(tokens), tostring(wait)}
+"""
+
+# KEYS[1] = theoretical arrival time; ARGV = rate (requests/s), burst, cost
+# Returns {allowed, remaining requests, seconds until the next request fits}
+GCRA_SCRIPT = """
+local emission = 1 / tonumber(ARGV[1])
+local tolerance = emission * tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local tat = math.max(tonumber(redis.call('GET', KEYS[1])) or now, now)
+local new_tat = tat + emission * cost
+
+local allowed = 0
+if new_tat - tolerance <= now + 1e-6 then
+    allowed = 1
+    if cost > 0 then
+        redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil((new_tat - now) * 1000))
+    end
+else
+    new_tat = tat
+end
+
+local remaining = math.floor((now + tolerance - new_tat) / emission + 1e-6)
+local wait = math.max(0, new_tat + emission - tolerance - now)
+return {allowed, tostring(remaining), tostring(wait)}
+"""
+
+ALGORITHMS = {"token_bucket": TOKEN_BUCKET_SCRIPT, "gcra": GCRA_SCRIPT}
+
 
 class RateLimitExceeded(HTTPException):
     """Exception raised when rate limit is exceeded."""
@@ -31,48 +113,108 @@ class RateLimitExceeded(HTTPException):
 
 
 class RateLimiter:
-    """Redis-based sliding window rate limiter.
+    """Redis-based token bucket rate limiter.
 
-    Uses sorted sets for accurate sliding window counting.
-    Supports different limits for different endpoints/users.
+    Allows bursts of up to ``burst_limit`` requests, refilled at
+    ``requests_per_minute``. Supports different limits for different
+    endpoints/users.
 
-    Algorithm:
-        1. Remove expired entries (outside window)
-        2. Count remaining entries in window
-        3. If under limit, add new entry and allow
-        4. If at/over limit, reject request
+    Algorithm (one atomic Lua script per request):
+        1. Refill the client's bucket for the time since its last request
+        2. If a token is available, take it and allow
+        3. Otherwise reject, with the time until the next token
+        4. Remember clients with an empty bucket locally until then
 
     Example:
         ```python
         limiter = RateLimiter(requests_per_minute=30)
-        if not await limiter.is_allowed("user:123"):
-            raise RateLimitExceeded()
+        allowed, info = await limiter.is_allowed("user:123")
+        if not allowed:
+            raise RateLimitExceeded(retry_after=info["retry_after"])
         ```
     """
 
     # Key prefix for rate limit data
     RATE_LIMIT_PREFIX = "alim:ratelimit:"
 
+    # Rejected clients remembered in process (oldest dropped first)
+    LOCAL_BLOCK_SIZE = 10_000
+
     def __init__(
         self,
         requests_per_minute: int | None = None,
         burst_limit: int | None = None,
         window_seconds: int = 60,
+        algorithm: str | None = None,
+        name: str = "standard",
     ):
         """Initialize rate limiter.
 
         Args:
             requests_per_minute: Max requests per minute (uses config default).
             burst_limit: Max burst size (uses config default).
-            window_seconds: Sliding window size in seconds.
+            window_seconds: Period requests_per_minute refers to, in seconds.
+            algorithm: "token_bucket" or "gcra" (uses config default).
+            name: Bucket namespace, so limiters never share a client's budget.
         """
+        self.name = name
         self.requests_per_minute = requests_per_minute or settings.rate_limit_requests_per_minute
-        self.burst_limit = burst_limit or settings.rate_limit_burst
+        self.burst_limit = max(1, burst_limit or settings.rate_limit_burst)
         self.window_seconds = window_seconds
+        self.algorithm = algorithm or settings.rate_limit_algorithm
+        if self.algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown rate limit algorithm: {self.algorithm}")
+        self.rate = self.requests_per_minute / self.window_seconds
+        self._script = None
+        # identifier -> monotonic time before which Redis would reject it
+        self._blocked_until: OrderedDict[str, float] = OrderedDict()
+        self.local_rejections = 0
 
     def _key(self, identifier: str) -> str:
         """Generate Redis key for rate limit tracking."""
-        return f"{self.RATE_LIMIT_PREFIX}{identifier}"
+        return f"{self.RATE_LIMIT_PREFIX}{self.name}:{self.algorithm}:{identifier}"
+
+    async def _run(self, identifier: str, cost: int) -> tuple[bool, float, float]:
+        """Run the limiter script; return (allowed, remaining, seconds to next token)."""
+        async with get_redis() as client:
+            if self._script is None:
+                self._script = client.register_script(ALGORITHMS[self.algorithm])
+            allowed, remaining, wait = await self._script(
+                keys=[self._key(identifier)],
+                args=[self.rate, self.burst_limit, cost],
+                client=client,
+            )
+        return bool(int(allowed)), float(remaining), float(wait)
+
+    def _local_wait(self, identifier: str) -> float:
+        """Seconds this client is still known to be over the limit (0 if not)."""
+        blocked_until = self._blocked_until.get(identifier)
+        if blocked_until is None:
+            return 0.0
+        wait = blocked_until - time.monotonic()
+        if wait <= 0:
+            del self._blocked_until[identifier]
+            return 0.0
+        return wait
+
+    def _block_locally(self, identifier: str, wait: float) -> None:
+        """Remember that ``identifier`` cannot be allowed for ``wait`` seconds."""
+        self._blocked_until[identifier] = time.monotonic() + wait
+        self._blocked_until.move_to_end(identifier)
+        while len(self._blocked_until) > self.LOCAL_BLOCK_SIZE:
+            self._blocked_until.popitem(last=False)
+
+    def _info(self, remaining: float, retry_after: float) -> dict:
+        """Limit details for response headers."""
+        now = time.time()
+        missing = self.burst_limit - remaining
+        return {
+            "limit": self.requests_per_minute,
+            "burst": self.burst_limit,
+            "remaining": max(0, math.floor(remaining)),
+            "reset": int(now + math.ceil(missing / self.rate)),
+            "retry_after": math.ceil(retry_after),
+        }
 
     async def is_allowed(self, identifier: str) -> tuple[bool, dict]:
         """Check if request is allowed under rate limit.
@@ -83,49 +225,18 @@ class RateLimiter:
         Returns:
             Tuple of (allowed: bool, info: dict with limit details).
         """
-        now = time.time()
-        window_start = now - self.window_seconds
-        key = self._key(identifier)
-
-        async with get_redis() as client:
-            pipe = client.pipeline()
-
-            # Remove entries outside the window
-            pipe.zremrangebyscore(key, 0, window_start)
-
-            # Count entries in current window
-            pipe.zcard(key)
+        # Tokens only refill with time, so Redis would reject this too
+        wait = self._local_wait(identifier)
+        if wait > 0:
+            self.local_rejections += 1
+            return False, self._info(0, wait)
 
-            # Add current request timestamp
-            pipe.zadd(key, {str(now): now})
+        allowed, remaining, wait = await self._run(identifier, cost=1)
 
-            # Set key expiration (cleanup)
-            pipe.expire(key, self.window_seconds + 1)
-
-            results = await pipe.execute()
-            current_count = results[1]  # zcard result
-
-        allowed = current_count < self.requests_per_minute
-        remaining = max(0, self.requests_per_minute - current_count - 1)
-
-        # Calculate retry-after if limited
-        retry_after = 0
-        if not allowed:
-            async with get_redis() as client:
-                # Get oldest entry in window
-                oldest = await client.zrange(key, 0, 0, withscores=True)
-                if oldest:
-                    oldest_time = oldest[0][1]
-                    retry_after = int(oldest_time + self.window_seconds - now) + 1
-
-        info = {
-            "limit": self.requests_per_minute,
-            "remaining": remaining,
-            "reset": int(now + self.window_seconds),
-            "retry_after": retry_after,
-        }
-
-        return allowed, info
+        # Also covers a client that just took the last token
+        if wait > 0:
+            self._block_locally(identifier, wait)
+        return allowed, self._info(remaining, 0 if allowed else wait)
 
     async def get_usage(self, identifier: str) -> dict:
         """Get current rate limit usage for an identifier.
@@ -136,21 +247,16 @@ class RateLimiter:
         Returns:
             Dict with usage statistics.
         """
-        now = time.time()
-        window_start = now - self.window_seconds
-        key = self._key(identifier)
-
-        async with get_redis() as client:
-            # Clean and count
-            await client.zremrangebyscore(key, 0, window_start)
-            count = await client.zcard(key)
+        _, remaining, _ = await self._run(identifier, cost=0)
+        info = self._info(remaining, 0)
 
         return {
-            "requests_used": count,
+            "requests_used": self.burst_limit - info["remaining"],
             "requests_limit": self.requests_per_minute,
-            "requests_remaining": max(0, self.requests_per_minute - count),
+            "requests_remaining": info["remaining"],
+            "burst_limit": self.burst_limit,
             "window_seconds": self.window_seconds,
-            "reset_at": int(now + self.window_seconds),
+            "reset_at": info["reset"],
         }
 
 
@@ -190,16 +296,23 @@ def get_client_identifier(request: Request) -> str:
     return f"ip:{client_ip}"
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """FastAPI middleware for rate limiting.
+class RateLimitMiddleware:
+    """Pure ASGI middleware for rate limiting.
+
+    Picks one limiter per request from its method and path and checks it
+    once, before the app runs. Unlike ``BaseHTTPMiddleware`` it does not
+    wrap the app in a task or re-stream the response body, so streaming
+    endpoints pass through untouched.
 
-    Applies sliding window rate limiting to all requests.
-    Adds rate limit headers to responses.
+    Limiter selection:
+        - GET/HEAD: read limiter
+        - LLM endpoints (CHAT_PATHS): chat limiter
+        - Everything else: standard limiter
 
     Headers added:
-        - X-RateLimit-Limit: Max requests per window
-        - X-RateLimit-Remaining: Requests remaining
-        - X-RateLimit-Reset: Unix timestamp when limit resets
+        - X-RateLimit-Limit: Max requests per minute
+        - X-RateLimit-Remaining: Requests remaining in the burst
+        - X-RateLimit-Reset: Unix timestamp when the burst is refilled
         - Retry-After: Seconds to wait (when limited)
     """
 
@@ -212,47 +325,88 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         "/openapi.json",
     }
 
-    def __init__(self, app, limiter: RateLimiter | None = None):
-        super().__init__(app)
-        self.limiter = limiter or RateLimiter()
-
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Process request with rate limiting."""
-        # Skip rate limiting for exempt paths
-        if request.url.path in self.EXEMPT_PATHS:
-            return await call_next(request)
+    # Path prefixes whose requests run the LLM
+    CHAT_PATHS = (
+        "/api/v1/chat",
+        "/api/v1/graph/invoke",
+        "/api/v1/graph/stream",
+        "/api/v1/analyze",
+    )
 
-        # Skip rate limiting for OPTIONS (CORS preflight)
-        if request.method == "OPTIONS":
-            return await call_next(request)
+    READ_METHODS = {"GET", "HEAD"}
 
-        # Get client identifier
-        identifier = get_client_identifier(request)
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: RateLimiter | None = None,
+        chat: RateLimiter | None = None,
+        read: RateLimiter | None = None,
+    ):
+        """Initialize the middleware.
 
-        try:
-            # Check rate limit
-            allowed, info = await self.limiter.is_allowed(identifier)
+        Args:
+            app: The wrapped ASGI app.
+            limiter: Standard limiter (default: standard_limiter).
+            chat: Limiter for LLM endpoints (default: chat_limiter).
+            read: Limiter for read-only requests (default: read_limiter).
+        """
+        self.app = app
+        self.limiter = limiter or standard_limiter
+        self.chat_limiter = chat or chat_limiter
+        self.read_limiter = read or read_limiter
+
+    def select_limiter(self, method: str, path: str) -> RateLimiter:
+        """Limiter that applies to a request."""
+        if method in self.READ_METHODS:
+            return self.read_limiter
+        if path.startswith(self.CHAT_PATHS):
+            return self.chat_limiter
+        return self.limiter
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process request with rate limiting."""
+        # Skip non-HTTP traffic, CORS preflight and exempt paths
+        if (
+            scope["type"] != "http"
+            or scope["method"] == "OPTIONS"
+            or scope["path"] in self.EXEMPT_PATHS
+        ):
+            await self.app(scope, receive, send)
+            return
 
-            if not allowed:
-                # Rate limited - return 429
-                raise RateLimitExceeded(retry_after=info["retry_after"])
+        limiter = self.select_limiter(scope["method"], scope["path"])
+        identifier = get_client_identifier(Request(scope))
 
-            # Process request
-            response = await call_next(request)
+        try:
+            allowed, info = await limiter.is_allowed(identifier)
+        except Exception as e:
+            # If Redis is down, allow request (fail open)
+            logger.warning("rate_limit_check_failed", limiter=limiter.name, error=str(e))
+            await self.app(scope, receive, send)
+            return
+
+        headers = {
+            "X-RateLimit-Limit": str(info["limit"]),
+            "X-RateLimit-Remaining": str(info["remaining"]),
+            "X-RateLimit-Reset": str(info["reset"]),
+        }
 
-            # Add rate limit headers
-            response.headers["X-RateLimit-Limit"] = str(info["limit"])
-            response.headers["X-RateLimit-Remaining"] = str(info["remaining"])
-            response.headers["X-RateLimit-Reset"] = str(info["reset"])
+        if not allowed:
+            exc = RateLimitExceeded(retry_after=info["retry_after"])
+            response = JSONResponse(
+                status_code=exc.status_code,
+                content=exc.detail,
+                headers={**headers, **exc.headers},
+            )
+            await response(scope, receive, send)
+            return
 
-            return response
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).update(headers)
+            await send(message)
 
-        except RateLimitExceeded:
-            raise
-        except Exception:
-            # If Redis is down, allow request (fail open)
-            # Log this in production
-            return await call_next(request)
+        await self.app(scope, receive, send_with_headers)
 
 
 # ============================================================
@@ -266,12 +420,14 @@ standard_limiter = RateLimiter()
 chat_limiter = RateLimiter(
     requests_per_minute=20,  # Lower limit for expensive LLM calls
     burst_limit=30,
+    name="chat",
 )
 
 # More lenient limiter for read-only endpoints
 read_limiter = RateLimiter(
     requests_per_minute=100,
     burst_limit=150,
+    name="read",
 )
 
 
@@ -282,6 +438,8 @@ async def check_rate_limit(
     """Dependency for checking rate limits in route handlers.
 
     Use this for fine-grained control over rate limiting per endpoint.
+    Requests that pass through RateLimitMiddleware are already checked
+    there; checking again would count them twice.
 
     Example:
         ```python
@@ -9,10 +9,12 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
-from alim.api.middleware.rate_limit import chat_limiter, check_rate_limit
 from alim.config import Settings, get_settings
 from alim.data.redis_client import RedisClient, SessionStorage
 from alim.llm import LLMMessage, check_llm_health, get_llm_provider
+from alim.security.output_stream import guard_stream
+from alim.security.output_validator import get_output_validator
+from alim.security.pii_stream import mask_stream
 
 router = APIRouter()
 
@@ -137,7 +139,6 @@ async def _build_messages_with_history(
 @router.post("/chat", response_model=ChatResponse)
 async def chat(
     request: ChatMessage,
-    http_request: Request,
     settings: Annotated[Settings, Depends(get_settings)],
 ):
     """
@@ -147,13 +148,6 @@ async def chat(
     Maintains conversation history in Redis for multi-turn interactions.
     Supports 100+ concurrent users with session isolation.
     """
-    # Apply chat-specific rate limiting
-    try:
-        await check_rate_limit(http_request, chat_limiter)
-    except Exception:
-        # Rate limiter may fail if Redis is down - fail open for availability
-        pass
-
     # Generate session ID if not provided
     session_id = request.session_id or str(uuid.uuid4())
 
@@ -206,7 +200,6 @@ async def chat(
 @router.post("/chat/stream")
 async def chat_stream(
     request: ChatMessage,
-    http_request: Request,
     settings: Annotated[Settings, Depends(get_settings)],
 ):
     """
@@ -215,12 +208,6 @@ async def chat_stream(
     Returns a streaming response with incremental text chunks.
     Maintains conversation history in Redis.
     """
-    # Apply chat-specific rate limiting
-    try:
-        await check_rate_limit(http_request, chat_limiter)
-    except Exception:
-        pass  # Fail open
-
     session_id = request.session_id or str(uuid.uuid4())
     llm = get_llm_provider()
 
@@ -241,11 +228,15 @@ async def chat_stream(
     async def generate():
         full_response = []
         try:
-            async for chunk in llm.stream(
+            # Validate the model output as it streams (stopping generation if it
+            # turns unsafe), then mask PII in what is shown
+            tokens = llm.stream(
                 messages=messages,
                 temperature=0.7,
                 max_tokens=1000,
-            ):
+            )
+            fallback = get_output_validator().get_safe_fallback(request.language)
+            async for chunk in mask_stream(guard_stream(tokens, fallback=fallback)):
                 full_response.append(chunk)
                 yield chunk
 
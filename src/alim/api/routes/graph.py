@@ -12,6 +12,8 @@ from pydantic import BaseModel, Field
 
 from alim.api.dependencies.api_key import get_api_key
 from alim.config import settings
+from alim.deadline import with_deadline
+from alim.security.pipeline import SCREENED_KEY, SecurityResult, get_security_pipeline
 
 router = APIRouter(dependencies=[Depends(get_api_key)])
 
@@ -31,6 +33,9 @@ class GraphInvokeRequest(BaseModel):
     language: str = Field(default="az", description="User language (az, en, ru)")
     system_prompt_override: str | None = Field(None, description="Custom system prompt")
     scenario_context: dict[str, Any] | None = Field(None, description="Farm scenario metadata")
+    timeout_seconds: float | None = Field(
+        None, gt=0, le=120, description="Turn budget (default: settings.turn_budget_seconds)"
+    )
 
 
 class GraphInvokeResponse(BaseModel):
@@ -75,6 +80,18 @@ def _get_sdk_client():
     return get_client(url=settings.langgraph_base_url)
 
 
+def _screen_message(message: str) -> SecurityResult:
+    """Validate and PII-mask a message before it enters the graph.
+
+    Raises:
+        HTTPException: 400 if the message is rejected.
+    """
+    result = get_security_pipeline().screen(message)
+    if not result.is_valid:
+        raise HTTPException(status_code=400, detail=result.rejection_reason)
+    return result
+
+
 # ============================================================
 # Routes
 # ============================================================
@@ -86,6 +103,7 @@ async def invoke_graph(request: GraphInvokeRequest):
 
     Returns the complete response after graph execution completes.
     """
+    screened = _screen_message(request.message)
     client = _get_sdk_client()
 
     # 1. Ensure Thread
@@ -101,7 +119,7 @@ async def invoke_graph(request: GraphInvokeRequest):
 
     # 2. Prepare Input
     serialized_state = {
-        "current_input": request.message,
+        "current_input": screened.text,
         "user_id": request.user_id,
         "language": request.language,
         "thread_id": thread_id,
@@ -109,14 +127,19 @@ async def invoke_graph(request: GraphInvokeRequest):
     if request.scenario_context:
         serialized_state["scenario_context"] = request.scenario_context
 
-    config = {
-        "metadata": {
-            "model": settings.active_llm_model,
-            "provider": settings.llm_provider.value,
-            "user_id": request.user_id,
-            "farm_id": request.farm_id,
-        }
-    }
+    # Deadline is stamped here, before graph execution, so queueing counts against it
+    config = with_deadline(
+        {
+            "metadata": {
+                "model": settings.active_llm_model,
+                "provider": settings.llm_provider.value,
+                "user_id": request.user_id,
+                "farm_id": request.farm_id,
+                SCREENED_KEY: True,
+            }
+        },
+        budget_seconds=request.timeout_seconds,
+    )
 
     try:
         # 3. Invoke using stream(stream_mode="values") to get final state
@@ -127,6 +150,7 @@ async def invoke_graph(request: GraphInvokeRequest):
             input=serialized_state,
             config=config,
             stream_mode="values",
+            durability=settings.checkpoint_durability,
         ):
             if event.get("event") == "values":
                 final_state = event.get("data", {})
@@ -150,6 +174,12 @@ async def invoke_graph(request: GraphInvokeRequest):
             metadata={
                 "nodes_visited": final_state.get("nodes_visited", []),
                 "intent": final_state.get("intent"),
+                "budget": final_state.get("budget_log", []),
+                "security": {
+                    "risk_level": screened.risk_level.value,
+                    "pii_types_found": screened.pii_types_found,
+                    "timings_us": screened.timings_us,
+                },
             },
         )
 
@@ -160,7 +190,11 @@ async def invoke_graph(request: GraphInvokeRequest):
 @router.post("/graph/stream", tags=["Graph"])
 async def stream_graph(request: GraphInvokeRequest):
     """Stream graph execution events in real-time."""
+    screened = _screen_message(request.message)
     client = _get_sdk_client()
+    config = with_deadline(
+        {"metadata": {SCREENED_KEY: True}}, budget_seconds=request.timeout_seconds
+    )
 
     async def event_generator():
         nonlocal request
@@ -170,7 +204,7 @@ async def stream_graph(request: GraphInvokeRequest):
             thread_id = thread["thread_id"]
 
         serialized_state = {
-            "current_input": request.message,
+            "current_input": screened.text,
             "user_id": request.user_id,
             "language": request.language,
         }
@@ -180,7 +214,9 @@ async def stream_graph(request: GraphInvokeRequest):
                 thread_id=thread_id,
                 assistant_id=settings.langgraph_graph_id,
                 input=serialized_state,
+                config=config,
                 stream_mode=["messages", "updates"],
+                durability=settings.checkpoint_durability,
             ):
                 # Map LangGraph SDK events to Frontend SSE format
                 if event["event"] == "messages/partial":
@@ -7,6 +7,8 @@ from fastapi import APIRouter
 from pydantic import BaseModel
 
 from alim.config import settings
+from alim.data.checkpoint_gc import get_checkpoint_gc_status
+from alim.data.database import get_pool_status
 from alim.data.redis_client import RedisClient
 from alim.llm.http_pool import HTTPClientPool
 
@@ -22,6 +24,7 @@ class HealthResponse(BaseModel):
     llm_model: str
     version: str
     timestamp: str
+    database: dict | None = None
 
 
 class ReadinessResponse(BaseModel):
@@ -36,7 +39,8 @@ async def health_check():
     """
     Health check endpoint.
 
-    Returns basic application health status and configuration.
+    Returns basic application health status and configuration, plus
+    database pool, slow-query and liveness metrics.
     """
     return HealthResponse(
         status="healthy",
@@ -45,6 +49,7 @@ async def health_check():
         llm_model=settings.active_llm_model,
         version=settings.app_version,
         timestamp=datetime.now(UTC).isoformat(),
+        database=get_pool_status(),
     )
 
 
@@ -134,6 +139,8 @@ async def scalability_status():
             "max_connections": settings.redis_max_connections,
         },
         "http_pools": pool_stats,
+        "database_pools": get_pool_status(),
+        "checkpoints": get_checkpoint_gc_status(),
         "rate_limiting": {
             "enabled": True,
             "requests_per_minute": settings.rate_limit_requests_per_minute,
@@ -218,6 +218,44 @@ class Settings(BaseSettings):
     )  # pragma: allowlist secret
     database_pool_size: int = 10
     database_max_overflow: int = 20
+    database_pool_timeout_seconds: float = 30.0
+    # Recycle connections before server/proxy idle timeouts close them
+    database_pool_recycle_seconds: int = 1800
+    # Background SELECT 1 interval (replaces per-checkout pool_pre_ping)
+    database_liveness_interval_seconds: float = 30.0
+    database_slow_query_ms: float = 200.0
+    # SQLAlchemy compiled-statement cache (entries per engine)
+    database_query_cache_size: int = 1200
+    # asyncpg prepared statements kept per connection (0 disables, e.g. behind
+    # PgBouncer in transaction pooling mode)
+    database_prepared_statement_cache_size: int = 500
+    # Optional read replica for read-only sessions (falls back to primary)
+    database_read_replica_url: str | None = None
+
+    # ===== Agronomy Rules =====
+    # How often the rule-set registry checks the rules directory for changes
+    rules_reload_interval_seconds: float = 5.0
+    # Compiled rule-set versions kept for A/B evaluation and rollback
+    rules_keep_versions: int = 5
+    # Quantized-context LRU in front of rule matching (ZekaLab MCP tools)
+    rules_memo_size: int = 4096
+
+    # ===== Weather Cache =====
+    # Forecasts are shared per lat/lon tile (0.1° ≈ 11 km) and horizon
+    weather_tile_degrees: float = 0.1
+    weather_cache_ttl_current_seconds: int = 600  # current conditions (days_ahead=0)
+    weather_cache_ttl_forecast_seconds: int = 1800  # multi-day forecasts
+    weather_farm_coordinates_ttl_seconds: int = 86400
+    # In-process entries per worker (Redis holds the shared copy)
+    weather_cache_size: int = 2048
+
+    # ===== Turn Budget =====
+    # End-to-end deadline per agent turn; MCP/LLM timeouts shrink to fit it
+    turn_budget_seconds: float = 20.0
+    # Left for the final answer when sizing MCP waits in context loading
+    turn_budget_llm_reserve_seconds: float = 5.0
+    # Below this, optional enrichments (ZekaLab rules, visualization) are skipped
+    turn_budget_optional_min_seconds: float = 8.0
 
     # ===== Redis =====
     redis_url: str = "redis://localhost:6379/0"
@@ -229,16 +267,33 @@ class Settings(BaseSettings):
     langgraph_base_url: str = "http://127.0.0.1:2024"
     langgraph_graph_id: str = "alim_agent"  # From langgraph.json
 
+    # ===== Checkpointing (see alim.agent.checkpoint_policy) =====
+    checkpoint_durability: str = "exit"  # LangGraph durability: "exit", "async" or "sync"
+    checkpoint_slim: bool = True  # Drop per-turn fields and tool outputs from checkpoints
+    # Background compaction (see alim.data.checkpoint_gc); Redis uses the TTL natively
+    checkpoint_gc_enabled: bool = True
+    checkpoint_gc_interval_seconds: float = 3600.0
+    checkpoint_gc_batch_size: int = 200  # Threads per delete transaction
+    checkpoint_gc_pause_seconds: float = 0.5  # Pause between delete batches
+    checkpoint_gc_dry_run: bool = False  # Count what would be deleted, change nothing
+    checkpoint_keep_latest: int = 5  # Checkpoints kept per thread
+    checkpoint_ttl_days: float = 30.0  # Threads idle for longer are deleted
+
     # ===== Security =====
     jwt_secret: str = "dev-secret-change-in-production"
     jwt_algorithm: str = "HS256"
     jwt_expiry_hours: int = 24
+    jwt_jwks_url: str | None = None  # JWKS endpoint for RS256/ES256 tokens
+    jwt_jwks_cache_seconds: int = 300
+    jwt_shared_cache: bool = False  # Share validated claims through Redis
+    jwt_shared_cache_namespace: str = "v1"  # Change when rotating the JWT secret or keys
     api_key_header: str = "X-API-Key"
     api_key_secret: str = "dev-api-key-change-in-production"  # For 3rd party access
 
     # ===== Rate Limiting =====
     rate_limit_requests_per_minute: int = 30
     rate_limit_burst: int = 50
+    rate_limit_algorithm: str = "token_bucket"  # or "gcra" (one key per client)
 
     # ===== Observability =====
     log_level: str = "INFO"
@@ -2,11 +2,15 @@
 """Data layer with database, Redis, and caching.
 
 Provides:
-- Async SQLAlchemy database with connection pooling
+- Async SQLAlchemy database with instrumented connection pooling
+- Read-only sessions routed to an optional read replica
 - Redis client with session storage
 - Repository pattern for clean data access
 - Caching layer for frequently-used data
 - Azerbaijani Faker providers for synthetic data
+- Bulk NDVI ingestion via asyncpg COPY
+- Vectorized NDVI time-series analytics
+- Bulk synthetic dataset generation (sharded Parquet/CSV + COPY load)
 """
 
 from alim.data.cache import (
@@ -17,15 +21,34 @@ from alim.data.cache import (
 from alim.data.database import (
     Base,
     close_db,
+    get_db_read_session,
     get_db_session,
+    get_pool_status,
     get_session,
     init_db,
+    start_db_monitoring,
+)
+from alim.data.ndvi_analytics import (
+    NDVIAnalysis,
+    NDVISeriesBatch,
+    analyze_ndvi,
+)
+from alim.data.ndvi_ingestion import (
+    IngestionStats,
+    NDVIIngestor,
+    ingest_ndvi_file,
 )
 from alim.data.redis_client import (
     RedisClient,
     SessionStorage,
     get_redis,
 )
+from alim.data.synthetic import (
+    GenerationStats,
+    SyntheticConfig,
+    generate_dataset,
+    load_dataset,
+)
 
 __all__ = [
     # Database
@@ -33,7 +56,10 @@ __all__ = [
     "init_db",
     "close_db",
     "get_db_session",
+    "get_db_read_session",
     "get_session",
+    "get_pool_status",
+    "start_db_monitoring",
     # Redis
     "RedisClient",
     "SessionStorage",
@@ -42,4 +68,17 @@ __all__ = [
     "RepositoryCache",
     "CachedUserRepository",
     "CachedFarmRepository",
+    # Ingestion
+    "NDVIIngestor",
+    "IngestionStats",
+    "ingest_ndvi_file",
+    # Analytics
+    "NDVISeriesBatch",
+    "NDVIAnalysis",
+    "analyze_ndvi",
+    # Synthetic data
+    "SyntheticConfig",
+    "GenerationStats",
+    "generate_dataset",
+    "load_dataset",
 ]
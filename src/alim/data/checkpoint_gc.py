@@ -0,0 +1,487 @@
+# src/ALİM/data/checkpoint_gc.py
+"""Compaction and TTL garbage collection for LangGraph checkpoint tables.
+
+LangGraph's Postgres checkpointer never deletes anything. Every thread
+keeps every checkpoint, pending write and channel blob it has written.
+:class:`CheckpointCompactor` runs in the background and:
+
+- Expires threads idle for longer than ``checkpoint_ttl_days``, with all
+  their rows
+- Compacts other threads down to the latest ``checkpoint_keep_latest``
+  checkpoints per namespace, then drops writes and blobs that nothing
+  references any more
+- Works through threads in keyset-paged batches, one short transaction
+  per batch, pausing between batches so deletes never hold locks for long
+- Skips threads written in the last ``ACTIVE_GRACE_SECONDS``, so a turn
+  in flight is never compacted
+- Takes an advisory lock, so only one API worker runs it at a time
+- Skips runs while the checkpoint tables do not exist (the checkpointer is
+  Redis or memory), logging that once instead of failing every interval
+
+Dry-run mode runs the same statements and rolls each batch back, so the
+row counts are exact and nothing changes. Table sizes and rows reclaimed
+are exposed through ``/scalability`` by :func:`get_checkpoint_gc_status`.
+
+Redis checkpoints need none of this. They expire on their own through the
+TTL set in ``alim.agent.memory``.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import structlog
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from alim.config import settings
+
+logger = structlog.get_logger(__name__)
+
+TABLES = ("checkpoints", "checkpoint_writes", "checkpoint_blobs")
+
+# Threads written to more recently than this are left alone
+ACTIVE_GRACE_SECONDS = 600
+
+# pg_try_advisory_lock key ("alimgc")
+ADVISORY_LOCK_KEY = 0x616C696D6763
+
+
+# ============================================================
+# SQL
+# ============================================================
+
+TABLE_SIZES_SQL = text(
+    """
+    SELECT relname AS table_name,
+           pg_total_relation_size(oid) AS bytes,
+           GREATEST(reltuples, 0)::bigint AS estimated_rows
+    FROM pg_class
+    WHERE relname = ANY(:tables) AND relkind = 'r'
+    """
+)
+
+# Whether the checkpointer's tables exist (not when it uses Redis or memory)
+TABLES_EXIST_SQL = text(
+    "SELECT bool_and(to_regclass(t) IS NOT NULL) FROM unnest(CAST(:tables AS text[])) AS t"
+)
+
+# One page of threads, with their last write and checkpoint count
+THREADS_SQL = text(
+    """
+    SELECT thread_id,
+           max((checkpoint ->> 'ts')::timestamptz) AS last_write,
+           count(*) AS checkpoints
+    FROM checkpoints
+    WHERE thread_id > :after
+    GROUP BY thread_id
+    ORDER BY thread_id
+    LIMIT :limit
+    """
+)
+
+EXPIRE_SQL = [
+    ("checkpoint_writes", text("DELETE FROM checkpoint_writes WHERE thread_id = ANY(:thread_ids)")),
+    ("checkpoint_blobs", text("DELETE FROM checkpoint_blobs WHERE thread_id = ANY(:thread_ids)")),
+    ("checkpoints", text("DELETE FROM checkpoints WHERE thread_id = ANY(:thread_ids)")),
+]
+
+COMPACT_SQL = [
+    (
+        "checkpoints",
+        text(
+            """
+            DELETE FROM checkpoints c
+            USING (
+                SELECT thread_id, checkpoint_ns, checkpoint_id,
+                       row_number() OVER (
+                           PARTITION BY thread_id, checkpoint_ns ORDER BY checkpoint_id DESC
+                       ) AS recency
+                FROM checkpoints
+                WHERE thread_id = ANY(:thread_ids)
+            ) ranked
+            WHERE ranked.recency > :keep
+              AND c.thread_id = ranked.thread_id
+              AND c.checkpoint_ns = ranked.checkpoint_ns
+              AND c.checkpoint_id = ranked.checkpoint_id
+            """
+        ),
+    ),
+    (
+        "checkpoint_writes",
+        text(
+            """
+            DELETE FROM checkpoint_writes w
+            WHERE w.thread_id = ANY(:thread_ids)
+              AND NOT EXISTS (
+                  SELECT 1 FROM checkpoints c
+                  WHERE c.thread_id = w.thread_id
+                    AND c.checkpoint_ns = w.checkpoint_ns
+                    AND c.checkpoint_id = w.checkpoint_id
+              )
+            """
+        ),
+    ),
+    (
+        "checkpoint_blobs",
+        text(
+            """
+            DELETE FROM checkpoint_blobs b
+            WHERE b.thread_id = ANY(:thread_ids)
+              AND NOT EXISTS (
+                  SELECT 1 FROM checkpoints c
+                  WHERE c.thread_id = b.thread_id
+                    AND c.checkpoint_ns = b.checkpoint_ns
+                    AND c.checkpoint -> 'channel_versions' ->> b.channel = b.version
+              )
+            """
+        ),
+    ),
+    (
+        None,  # The oldest kept checkpoint no longer has a parent
+        text(
+            """
+            UPDATE checkpoints c SET parent_checkpoint_id = NULL
+            WHERE c.thread_id = ANY(:thread_ids)
+              AND c.parent_checkpoint_id IS NOT NULL
+              AND NOT EXISTS (
+                  SELECT 1 FROM checkpoints p
+                  WHERE p.thread_id = c.thread_id
+                    AND p.checkpoint_ns = c.checkpoint_ns
+                    AND p.checkpoint_id = c.parent_checkpoint_id
+              )
+            """
+        ),
+    ),
+]
+
+
+# ============================================================
+# Reports & Metrics
+# ============================================================
+
+
+@dataclass
+class CompactionReport:
+    """What one compaction run deleted (or would have, in dry-run mode)."""
+
+    dry_run: bool
+    skipped: bool = False
+    skip_reason: str | None = None  # "locked_by_another_worker" or "no_checkpoint_tables"
+    threads_scanned: int = 0
+    threads_expired: int = 0
+    threads_compacted: int = 0
+    batches: int = 0
+    rows: dict[str, int] = field(default_factory=lambda: dict.fromkeys(TABLES, 0))
+    duration_ms: float = 0.0
+
+    @property
+    def rows_reclaimed(self) -> int:
+        return sum(self.rows.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "dry_run": self.dry_run,
+            "skipped": self.skipped,
+            "skip_reason": self.skip_reason,
+            "threads_scanned": self.threads_scanned,
+            "threads_expired": self.threads_expired,
+            "threads_compacted": self.threads_compacted,
+            "batches": self.batches,
+            "rows": dict(self.rows),
+            "rows_reclaimed": self.rows_reclaimed,
+            "duration_ms": round(self.duration_ms, 1),
+        }
+
+
+class CheckpointGCMetrics:
+    """Run history and checkpoint table sizes for health endpoints."""
+
+    def __init__(self):
+        self.runs = 0
+        self.failures = 0
+        self.rows_reclaimed = dict.fromkeys(TABLES, 0)
+        self.last_report: CompactionReport | None = None
+        self.last_run_at: datetime | None = None
+        self.last_error: str | None = None
+        self.table_sizes: dict[str, dict[str, int]] = {}
+
+    def record(self, report: CompactionReport) -> None:
+        self.runs += 1
+        self.last_report = report
+        self.last_run_at = datetime.now(UTC)
+        self.last_error = None
+        if not report.dry_run:
+            for table, rows in report.rows.items():
+                self.rows_reclaimed[table] += rows
+
+    def record_failure(self, error: str) -> None:
+        self.failures += 1
+        self.last_error = error
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "failures": self.failures,
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+            "last_error": self.last_error,
+            "last_run": self.last_report.to_dict() if self.last_report else None,
+            "rows_reclaimed": dict(self.rows_reclaimed),
+            "tables": self.table_sizes,
+        }
+
+
+# ============================================================
+# Compactor
+# ============================================================
+
+
+class CheckpointCompactor:
+    """Background job that keeps checkpoint tables bounded."""
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        keep_latest: int = 5,
+        ttl_days: float = 30.0,
+        batch_size: int = 200,
+        pause_seconds: float = 0.5,
+        interval_seconds: float = 3600.0,
+        dry_run: bool = False,
+        metrics: CheckpointGCMetrics | None = None,
+    ):
+        """Initialize the compactor.
+
+        Args:
+            engine: Engine for the database holding the checkpoint tables
+            keep_latest: Checkpoints kept per thread and namespace
+            ttl_days: Threads idle for longer are deleted entirely
+            batch_size: Threads handled per transaction
+            pause_seconds: Pause between batches that deleted something
+            interval_seconds: Time between background runs
+            dry_run: Count what would be deleted, but roll back
+            metrics: Where to record runs (a new instance by default)
+        """
+        if keep_latest < 1:
+            raise ValueError("keep_latest must be at least 1")
+        self.engine = engine
+        self.keep_latest = keep_latest
+        self.ttl_days = ttl_days
+        self.batch_size = batch_size
+        self.pause_seconds = pause_seconds
+        self.interval_seconds = interval_seconds
+        self.dry_run = dry_run
+        self.metrics = metrics or CheckpointGCMetrics()
+        self._task: asyncio.Task | None = None
+        self._tables_missing = False
+
+    async def run_once(self, dry_run: bool | None = None) -> CompactionReport:
+        """Run one full pass over the checkpoint tables.
+
+        Args:
+            dry_run: Override the compactor's dry-run setting for this pass.
+
+        Returns:
+            CompactionReport with rows deleted per table.
+        """
+        report = CompactionReport(dry_run=self.dry_run if dry_run is None else dry_run)
+        started = time.perf_counter()
+        now = datetime.now(UTC)
+        expire_before = now - timedelta(days=self.ttl_days)
+        active_after = now - timedelta(seconds=ACTIVE_GRACE_SECONDS)
+
+        async with self.engine.connect() as conn:
+            async with conn.begin():
+                if not await conn.scalar(TABLES_EXIST_SQL, {"tables": list(TABLES)}):
+                    return self._skip(report, "no_checkpoint_tables")
+                self._tables_missing = False
+                locked = await conn.scalar(
+                    text("SELECT pg_try_advisory_lock(:key)"), {"key": ADVISORY_LOCK_KEY}
+                )
+            if not locked:
+                return self._skip(report, "locked_by_another_worker")
+
+            try:
+                after = ""
+                while True:
+                    threads, after = await self._run_batch(
+                        conn, after, expire_before, active_after, report
+                    )
+                    if threads < self.batch_size:
+                        break
+                await self._refresh_table_sizes(conn)
+            finally:
+                async with conn.begin():
+                    await conn.execute(
+                        text("SELECT pg_advisory_unlock(:key)"), {"key": ADVISORY_LOCK_KEY}
+                    )
+
+        report.duration_ms = (time.perf_counter() - started) * 1000
+        self.metrics.record(report)
+        logger.info("checkpoint_gc_completed", **report.to_dict())
+        return report
+
+    def _skip(self, report: CompactionReport, reason: str) -> CompactionReport:
+        report.skipped = True
+        report.skip_reason = reason
+        if reason == "no_checkpoint_tables":
+            # Expected while the checkpointer is Redis or memory: say so once
+            if self._tables_missing:
+                return report
+            self._tables_missing = True
+        logger.info("checkpoint_gc_skipped", reason=reason)
+        return report
+
+    async def _run_batch(
+        self,
+        conn: AsyncConnection,
+        after: str,
+        expire_before: datetime,
+        active_after: datetime,
+        report: CompactionReport,
+    ) -> tuple[int, str]:
+        """Handle one page of threads in one transaction.
+
+        Returns:
+            (threads on this page, last thread_id for the next page)
+        """
+        transaction = await conn.begin()
+        try:
+            result = await conn.execute(THREADS_SQL, {"after": after, "limit": self.batch_size})
+            page = result.all()
+            expired = [row.thread_id for row in page if row.last_write < expire_before]
+            compact = [
+                row.thread_id
+                for row in page
+                if expire_before <= row.last_write < active_after
+                and row.checkpoints > self.keep_latest
+            ]
+            if expired:
+                await self._execute(conn, EXPIRE_SQL, {"thread_ids": expired}, report)
+            if compact:
+                params = {"thread_ids": compact, "keep": self.keep_latest}
+                await self._execute(conn, COMPACT_SQL, params, report)
+        except Exception:
+            await transaction.rollback()
+            raise
+
+        if report.dry_run:
+            await transaction.rollback()
+        else:
+            await transaction.commit()
+
+        report.threads_scanned += len(page)
+        report.threads_expired += len(expired)
+        report.threads_compacted += len(compact)
+        if expired or compact:
+            report.batches += 1
+            await asyncio.sleep(self.pause_seconds)
+        return len(page), page[-1].thread_id if page else after
+
+    @staticmethod
+    async def _execute(
+        conn: AsyncConnection,
+        statements: list[tuple[str | None, Any]],
+        params: dict[str, Any],
+        report: CompactionReport,
+    ) -> None:
+        for table, statement in statements:
+            result = await conn.execute(statement, params)
+            if table is not None:
+                report.rows[table] += max(result.rowcount, 0)
+
+    async def _refresh_table_sizes(self, conn: AsyncConnection) -> None:
+        async with conn.begin():
+            result = await conn.execute(TABLE_SIZES_SQL, {"tables": list(TABLES)})
+            self.metrics.table_sizes = {
+                row.table_name: {"bytes": row.bytes, "estimated_rows": row.estimated_rows}
+                for row in result
+            }
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await self.run_once()
+            except Exception as e:
+                self.metrics.record_failure(str(e))
+                logger.warning("checkpoint_gc_failed", error=str(e))
+
+    def start(self) -> None:
+        """Start the background compaction loop (idempotent)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="checkpoint-gc")
+
+    async def stop(self) -> None:
+        """Stop the background compaction loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# ============================================================
+# Application Wiring
+# ============================================================
+
+_compactor: CheckpointCompactor | None = None
+
+
+def get_checkpoint_compactor() -> CheckpointCompactor:
+    """Get the compactor for the primary database, configured from settings."""
+    global _compactor
+    if _compactor is None:
+        from alim.data.database import engine
+
+        _compactor = CheckpointCompactor(
+            engine,
+            keep_latest=settings.checkpoint_keep_latest,
+            ttl_days=settings.checkpoint_ttl_days,
+            batch_size=settings.checkpoint_gc_batch_size,
+            pause_seconds=settings.checkpoint_gc_pause_seconds,
+            interval_seconds=settings.checkpoint_gc_interval_seconds,
+            dry_run=settings.checkpoint_gc_dry_run,
+        )
+    return _compactor
+
+
+def start_checkpoint_gc() -> bool:
+    """Start background checkpoint compaction when enabled and on Postgres.
+
+    Call this during application startup (requires a running event loop).
+
+    Returns:
+        True if the job was started.
+    """
+    if not settings.checkpoint_gc_enabled:
+        return False
+    compactor = get_checkpoint_compactor()
+    if compactor.engine.dialect.name != "postgresql":
+        logger.info("checkpoint_gc_disabled", reason="not_postgres")
+        return False
+    compactor.start()
+    return True
+
+
+async def stop_checkpoint_gc() -> None:
+    """Stop background checkpoint compaction."""
+    if _compactor is not None:
+        await _compactor.stop()
+
+
+def get_checkpoint_gc_status() -> dict[str, Any]:
+    """Compaction runs, rows reclaimed and table sizes for /scalability."""
+    if _compactor is None:
+        return {"enabled": False}
+    return {
+        "enabled": _compactor._task is not None,
+        "dry_run": _compactor.dry_run,
+        "keep_latest": _compactor.keep_latest,
+        "ttl_days": _compactor.ttl_days,
+        **_compactor.metrics.snapshot(),
+    }
@@ -1,10 +1,19 @@
 # src/ALİM/data/database.py
-"""Async SQLAlchemy database setup with connection pooling."""
+"""Async SQLAlchemy database setup with connection pooling.
+
+Pools are instrumented (checkout wait, overflow, slow-query fingerprints)
+and connection liveness is checked by a background task instead of
+``pool_pre_ping``. Read-only sessions can be routed to a replica via
+``DATABASE_READ_REPLICA_URL``.
+"""
 
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import Any
 
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
@@ -13,6 +22,12 @@ from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.pool import NullPool
 
 from alim.config import settings
+from alim.data.pool_monitor import (
+    InstrumentedAsyncAdaptedQueuePool,
+    LivenessMonitor,
+    PoolMetrics,
+    instrument_engine,
+)
 
 
 class Base(DeclarativeBase):
@@ -21,24 +36,53 @@ class Base(DeclarativeBase):
     pass
 
 
-# Create async engine with connection pooling
-# Use NullPool for SQLite (doesn't support pooling)
-if settings.database_url.startswith("sqlite"):
-    engine = create_async_engine(
-        settings.database_url,
-        echo=settings.debug,
-        poolclass=NullPool,
-    )
-else:
-    engine = create_async_engine(
-        settings.database_url,
+def _create_engine(url: str) -> AsyncEngine:
+    """Create an async engine with the configured pool and statement caches."""
+    # Use NullPool for SQLite (doesn't support pooling)
+    if url.startswith("sqlite"):
+        return create_async_engine(url, echo=settings.debug, poolclass=NullPool)
+
+    connect_args: dict[str, Any] = {}
+    if make_url(url).get_driver_name() == "asyncpg":
+        # Server-side prepared statements, LRU-cached per connection
+        connect_args["prepared_statement_cache_size"] = (
+            settings.database_prepared_statement_cache_size
+        )
+
+    return create_async_engine(
+        url,
         echo=settings.debug,
+        query_cache_size=settings.database_query_cache_size,
+        connect_args=connect_args,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
         pool_size=settings.database_pool_size,
         max_overflow=settings.database_max_overflow,
-        pool_pre_ping=True,  # Verify connections are alive
+        pool_timeout=settings.database_pool_timeout_seconds,
+        pool_recycle=settings.database_pool_recycle_seconds,
     )
 
-# Session factory for creating async sessions
+
+# Primary (read/write) engine
+engine = _create_engine(settings.database_url)
+pool_metrics = PoolMetrics("primary", slow_query_ms=settings.database_slow_query_ms)
+instrument_engine(engine, pool_metrics)
+
+# Read engine: replica when configured, otherwise the primary pool
+if settings.database_read_replica_url:
+    read_engine = _create_engine(settings.database_read_replica_url)
+    read_pool_metrics: PoolMetrics | None = PoolMetrics(
+        "replica", slow_query_ms=settings.database_slow_query_ms
+    )
+    instrument_engine(read_engine, read_pool_metrics)
+else:
+    read_engine = engine
+    read_pool_metrics = None
+
+if read_engine.dialect.name == "postgresql":
+    # BEGIN READ ONLY - rejects writes server-side, no extra round-trip
+    read_engine = read_engine.execution_options(postgresql_readonly=True)
+
+# Session factories for creating async sessions
 async_session_maker = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -46,6 +90,15 @@ async_session_maker = async_sessionmaker(
     autoflush=False,
 )
 
+async_read_session_maker = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
+_liveness_monitors: list[LivenessMonitor] = []
+
 
 async def init_db() -> None:
     """Initialize database and create all tables.
@@ -56,12 +109,47 @@ async def init_db() -> None:
         await conn.run_sync(Base.metadata.create_all)
 
 
+def start_db_monitoring() -> None:
+    """Start background liveness checks for pooled engines.
+
+    Call this during application startup (requires a running event loop).
+    """
+    if not _liveness_monitors:
+        targets = [(engine, pool_metrics)]
+        if read_pool_metrics is not None:
+            targets.append((read_engine, read_pool_metrics))
+        for target_engine, metrics in targets:
+            if isinstance(target_engine.pool, NullPool):
+                continue
+            _liveness_monitors.append(
+                LivenessMonitor(
+                    target_engine,
+                    metrics,
+                    interval_seconds=settings.database_liveness_interval_seconds,
+                )
+            )
+    for monitor in _liveness_monitors:
+        monitor.start()
+
+
+def get_pool_status() -> dict[str, Any]:
+    """Pool, slow-query and liveness metrics for /health."""
+    status = {"primary": pool_metrics.snapshot(engine.pool)}
+    if read_pool_metrics is not None:
+        status["replica"] = read_pool_metrics.snapshot(read_engine.pool)
+    return status
+
+
 async def close_db() -> None:
     """Close database connections.
 
     Call this during application shutdown.
     """
+    for monitor in _liveness_monitors:
+        await monitor.stop()
     await engine.dispose()
+    if read_pool_metrics is not None:
+        await read_engine.dispose()
 
 
 @asynccontextmanager
@@ -83,6 +171,25 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
         await session.close()
 
 
+@asynccontextmanager
+async def get_db_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """Context manager for read-only database sessions.
+
+    Never commits; the transaction is rolled back when the connection is
+    returned to the pool. Routed to the read replica when configured, and
+    opened as READ ONLY on PostgreSQL.
+
+    Example:
+        async with get_db_read_session() as session:
+            result = await session.execute(select(Farm))
+    """
+    session = async_read_session_maker()
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """FastAPI dependency for database sessions.
 
@@ -0,0 +1,483 @@
+# src/ALİM/data/ndvi_analytics.py
+"""Vectorized NDVI time-series analytics.
+
+Loads per-parcel NDVI series into padded NumPy arrays and computes, for
+thousands of parcels at once:
+
+- Rolling anomalies against the crop's expected growth curve
+  (same model as ``AzerbaijaniAgrarianProvider.ndvi_series``)
+- Slope-based stress detection (NDVI falling while it should be rising)
+- Regional percentile rank of each parcel's latest NDVI
+
+Results are turned into alert dicts in the ``FarmContext.alerts`` format.
+
+Example:
+    ```python
+    batch = NDVISeriesBatch.from_readings(readings, parcels)
+    analysis = analyze_ndvi(batch)
+    alerts = analysis.to_alerts()
+    ```
+"""
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import date
+from typing import Any
+
+import numpy as np
+
+from alim.data.providers.azerbaijani import AzerbaijaniAgrarianProvider
+
+# Season length assumed by the synthetic growth model (days)
+SEASON_DAYS = 270
+
+# Rolling window (number of readings) for anomaly and slope detection
+DEFAULT_WINDOW = 3
+
+# Rolling residual below expected curve that counts as an anomaly
+ANOMALY_THRESHOLD = 0.12
+ANOMALY_CRITICAL_THRESHOLD = 0.25
+
+# Observed minus expected slope (NDVI/day) that counts as stress
+SLOPE_STRESS_THRESHOLD = -0.005
+
+# Parcels below this regional percentile are flagged as lagging
+REGIONAL_LOW_PERCENTILE = 10.0
+
+# Percentiles are only meaningful with enough peers
+MIN_REGION_SIZE = 20
+
+
+def _to_date(value: Any) -> date:
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+# ============================================================
+# Expected Growth Curve
+# ============================================================
+
+
+def expected_ndvi(
+    days_since_sowing: np.ndarray,
+    peak_day: np.ndarray | float,
+    peak_ndvi: np.ndarray | float,
+    season_days: int = SEASON_DAYS,
+) -> np.ndarray:
+    """Expected NDVI for days since sowing (vectorized).
+
+    Mirrors the noise-free part of ``AzerbaijaniAgrarianProvider.ndvi_series``:
+    exponential saturation up to the peak day, exponential decay after it.
+
+    Args:
+        days_since_sowing: Array of day offsets (any shape)
+        peak_day: Peak day, scalar or broadcastable array
+        peak_ndvi: Peak NDVI, scalar or broadcastable array
+        season_days: Season length used for the senescence phase
+
+    Returns:
+        Array of expected NDVI values, same shape as ``days_since_sowing``
+    """
+    days = np.asarray(days_since_sowing, dtype=np.float64)
+    peak_day = np.asarray(peak_day, dtype=np.float64)
+    peak_ndvi = np.asarray(peak_ndvi, dtype=np.float64)
+
+    growth_progress = days / peak_day
+    senescence_progress = 1 + (days - peak_day) / np.maximum(season_days - peak_day, 1.0)
+
+    growth = peak_ndvi * (1 - np.exp(-3 * growth_progress))
+    senescence = peak_ndvi * np.exp(-(senescence_progress - 1) * 2)
+    return np.where(days <= peak_day, growth, senescence)
+
+
+def growth_params(crops: Iterable[str]) -> tuple[np.ndarray, np.ndarray]:
+    """Look up (peak_day, peak_ndvi) arrays for a sequence of crops."""
+    crops = np.asarray(list(crops), dtype=object)
+    if not len(crops):
+        return np.zeros(0), np.zeros(0)
+
+    # One dictionary lookup per distinct crop, then broadcast back
+    unique, inverse = np.unique(crops, return_inverse=True)
+    params = np.array(
+        [AzerbaijaniAgrarianProvider.ndvi_growth_params(c) for c in unique], dtype=np.float64
+    )
+    return params[inverse, 0], params[inverse, 1]
+
+
+# ============================================================
+# Series Batch
+# ============================================================
+
+
+@dataclass
+class NDVISeriesBatch:
+    """NDVI series for many parcels as padded 2D arrays.
+
+    Row ``i`` holds parcel ``parcel_ids[i]``; columns are readings in date
+    order, right-padded with NaN so every row has length ``max_readings``.
+    """
+
+    parcel_ids: np.ndarray  # (n,) str
+    crops: np.ndarray  # (n,) str
+    regions: np.ndarray  # (n,) str
+    ndvi: np.ndarray  # (n, t) float, NaN padded
+    days_since_sowing: np.ndarray  # (n, t) float, NaN padded
+    reading_dates: np.ndarray  # (n, t) datetime64[D], NaT padded
+
+    @property
+    def size(self) -> int:
+        """Number of parcels."""
+        return len(self.parcel_ids)
+
+    @property
+    def valid(self) -> np.ndarray:
+        """Mask of real (non-padding) readings."""
+        return ~np.isnan(self.ndvi)
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Number of readings per parcel."""
+        return self.valid.sum(axis=1)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        parcel_ids: Iterable[str],
+        crops: Iterable[str],
+        regions: Iterable[str],
+        sowing_dates: np.ndarray,
+        row_index: np.ndarray,
+        reading_dates: np.ndarray,
+        ndvi: np.ndarray,
+    ) -> "NDVISeriesBatch":
+        """Build a batch from flat (long-format) reading arrays.
+
+        Args:
+            parcel_ids: Per-parcel IDs, length n
+            crops: Per-parcel crop names, length n
+            regions: Per-parcel region names, length n
+            sowing_dates: Per-parcel sowing dates, datetime64[D], length n
+            row_index: Parcel row for each reading, length m
+            reading_dates: Reading dates, datetime64[D], length m
+            ndvi: NDVI values, length m
+
+        Returns:
+            Padded series batch
+        """
+        parcel_ids = np.asarray(list(parcel_ids), dtype=object)
+        n = len(parcel_ids)
+        row_index = np.asarray(row_index, dtype=np.int64)
+        reading_dates = np.asarray(reading_dates, dtype="datetime64[D]")
+        ndvi = np.asarray(ndvi, dtype=np.float64)
+        sowing_dates = np.asarray(sowing_dates, dtype="datetime64[D]")
+
+        # Sort by (parcel, date) and compute each reading's column position
+        order = np.lexsort((reading_dates, row_index))
+        row_index = row_index[order]
+        reading_dates = reading_dates[order]
+        ndvi = ndvi[order]
+
+        counts = np.bincount(row_index, minlength=n)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        column = np.arange(len(row_index)) - starts[row_index]
+        width = int(counts.max()) if len(counts) and counts.max() > 0 else 0
+
+        ndvi_2d = np.full((n, width), np.nan)
+        dates_2d = np.full((n, width), np.datetime64("NaT"), dtype="datetime64[D]")
+        ndvi_2d[row_index, column] = ndvi
+        dates_2d[row_index, column] = reading_dates
+
+        days = (dates_2d - sowing_dates[:, None]).astype(np.float64)
+        days[np.isnan(ndvi_2d)] = np.nan
+
+        return cls(
+            parcel_ids=parcel_ids,
+            crops=np.asarray(list(crops), dtype=object),
+            regions=np.asarray(list(regions), dtype=object),
+            ndvi=ndvi_2d,
+            days_since_sowing=days,
+            reading_dates=dates_2d,
+        )
+
+    @classmethod
+    def from_readings(
+        cls,
+        readings: Iterable[Mapping[str, Any]],
+        parcels: Iterable[Mapping[str, Any]],
+    ) -> "NDVISeriesBatch":
+        """Build a batch from reading dicts (``get_recent_ndvi`` format).
+
+        Args:
+            readings: Dicts with ``parcel_id``, ``date`` (or ``reading_date``)
+                and ``ndvi`` (or ``ndvi_value``)
+            parcels: Dicts with ``parcel_id``, ``crop``, ``region`` and
+                ``sowing_date``; readings for unknown parcels are ignored
+
+        Returns:
+            Padded series batch
+        """
+        parcel_ids: list[str] = []
+        crops: list[str] = []
+        regions: list[str] = []
+        sowing: list[date] = []
+        index: dict[str, int] = {}
+        for parcel in parcels:
+            index[parcel["parcel_id"]] = len(parcel_ids)
+            parcel_ids.append(parcel["parcel_id"])
+            crops.append(parcel.get("crop") or "")
+            regions.append(parcel.get("region") or "")
+            sowing.append(_to_date(parcel["sowing_date"]))
+
+        rows: list[int] = []
+        dates: list[date] = []
+        values: list[float] = []
+        for reading in readings:
+            row = index.get(reading["parcel_id"])
+            if row is None:
+                continue
+            rows.append(row)
+            dates.append(_to_date(reading.get("date") or reading.get("reading_date")))
+            values.append(float(reading.get("ndvi", reading.get("ndvi_value"))))
+
+        return cls.from_arrays(
+            parcel_ids,
+            crops,
+            regions,
+            np.array(sowing, dtype="datetime64[D]"),
+            np.array(rows, dtype=np.int64),
+            np.array(dates, dtype="datetime64[D]"),
+            np.array(values, dtype=np.float64),
+        )
+
+
+# ============================================================
+# Vectorized Kernels
+# ============================================================
+
+
+def _last_k_mask(valid: np.ndarray, k: int) -> np.ndarray:
+    """Mask selecting each row's last ``k`` valid readings."""
+    # Readings are left-aligned, so "last k" is a column range per row
+    counts = valid.sum(axis=1, keepdims=True)
+    columns = np.arange(valid.shape[1])[None, :]
+    return valid & (columns >= counts - k)
+
+
+def _latest(values: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    """Last valid value per row (NaN for empty rows)."""
+    counts = valid.sum(axis=1)
+    last = np.maximum(counts - 1, 0)
+    result = (
+        values[np.arange(len(values)), last] if values.shape[1] else np.full(len(values), np.nan)
+    )
+    return np.where(counts > 0, result, np.nan)
+
+
+def rolling_residual(
+    batch: NDVISeriesBatch,
+    expected: np.ndarray,
+    window: int = DEFAULT_WINDOW,
+) -> np.ndarray:
+    """Mean (observed - expected) over each parcel's last ``window`` readings."""
+    mask = _last_k_mask(batch.valid, window)
+    residual = np.where(mask, batch.ndvi - expected, 0.0)
+    n = mask.sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(n > 0, residual.sum(axis=1) / n, np.nan)
+
+
+def window_slope(
+    x: np.ndarray,
+    y: np.ndarray,
+    mask: np.ndarray,
+) -> np.ndarray:
+    """Least-squares slope of y over x per row, restricted to ``mask``.
+
+    Rows with fewer than two points (or zero x-variance) get NaN.
+    """
+    n = mask.sum(axis=1)
+    xs = np.where(mask, x, 0.0)
+    ys = np.where(mask, y, 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        x_mean = xs.sum(axis=1) / n
+        y_mean = ys.sum(axis=1) / n
+        dx = np.where(mask, x - x_mean[:, None], 0.0)
+        dy = np.where(mask, y - y_mean[:, None], 0.0)
+        sxx = (dx * dx).sum(axis=1)
+        sxy = (dx * dy).sum(axis=1)
+        slope = sxy / sxx
+    return np.where((n >= 2) & (sxx > 0), slope, np.nan)
+
+
+def regional_percentiles(values: np.ndarray, regions: np.ndarray) -> np.ndarray:
+    """Percentile rank (0-100) of each value within its region.
+
+    NaN values get NaN. Ties share the lowest rank. Regions with fewer
+    than two values get NaN.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    result = np.full(len(values), np.nan)
+    valid = ~np.isnan(values)
+    if not valid.any():
+        return result
+
+    region_codes, inverse = np.unique(regions[valid], return_inverse=True)
+    v = values[valid]
+
+    # Sort by (region, value) then rank within each region block
+    order = np.lexsort((v, inverse))
+    sorted_codes = inverse[order]
+    sorted_values = v[order]
+    counts = np.bincount(inverse, minlength=len(region_codes))
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    # Ties: rank is the first position of the (region, value) run
+    new_run = np.ones(len(order), dtype=bool)
+    new_run[1:] = (sorted_codes[1:] != sorted_codes[:-1]) | (
+        sorted_values[1:] != sorted_values[:-1]
+    )
+    run_start = np.maximum.accumulate(np.where(new_run, np.arange(len(order)), 0))
+    rank = run_start - starts[sorted_codes]
+
+    denom = counts[sorted_codes] - 1
+    with np.errstate(invalid="ignore", divide="ignore"):
+        pct = np.where(denom > 0, rank / denom * 100.0, np.nan)
+
+    ranks = np.empty(len(order))
+    ranks[order] = pct
+    result[valid] = ranks
+    return result
+
+
+# ============================================================
+# Analysis
+# ============================================================
+
+
+@dataclass
+class NDVIAnalysis:
+    """Per-parcel analytics results (all arrays aligned with the batch)."""
+
+    parcel_ids: np.ndarray
+    regions: np.ndarray
+    latest_ndvi: np.ndarray
+    expected_latest: np.ndarray
+    residual: np.ndarray  # rolling mean of observed - expected
+    slope: np.ndarray  # observed NDVI/day over window
+    expected_slope: np.ndarray  # expected NDVI/day over window
+    regional_percentile: np.ndarray
+    region_size: np.ndarray
+
+    @property
+    def anomaly(self) -> np.ndarray:
+        """Parcels running well below their expected curve."""
+        return self.residual < -ANOMALY_THRESHOLD
+
+    @property
+    def slope_stress(self) -> np.ndarray:
+        """Parcels whose NDVI trend lags the expected trend."""
+        return (self.slope - self.expected_slope) < SLOPE_STRESS_THRESHOLD
+
+    @property
+    def regional_low(self) -> np.ndarray:
+        """Parcels in the bottom percentile band of their region."""
+        return (self.region_size >= MIN_REGION_SIZE) & (
+            self.regional_percentile < REGIONAL_LOW_PERCENTILE
+        )
+
+    def to_alerts(self, regional: bool = True) -> list[dict[str, Any]]:
+        """Build ``FarmContext.alerts`` entries for flagged parcels.
+
+        Args:
+            regional: Include ``ndvi_regional_low`` alerts. Pass False when
+                the batch is not region-wide (e.g. one farm's parcels), since
+                the percentiles then only rank parcels within the batch.
+        """
+        alerts: list[dict[str, Any]] = []
+
+        for i in np.flatnonzero(self.anomaly):
+            parcel_id = self.parcel_ids[i]
+            alerts.append(
+                {
+                    "type": "ndvi_anomaly",
+                    "parcel_id": parcel_id,
+                    "severity": "high"
+                    if self.residual[i] < -ANOMALY_CRITICAL_THRESHOLD
+                    else "medium",
+                    "deviation": round(float(self.residual[i]), 3),
+                    "message_az": (
+                        f"{parcel_id} sahəsində NDVI gözlənilən səviyyədən "
+                        f"{abs(float(self.residual[i])):.2f} aşağıdır"
+                    ),
+                }
+            )
+
+        for i in np.flatnonzero(self.slope_stress):
+            parcel_id = self.parcel_ids[i]
+            alerts.append(
+                {
+                    "type": "ndvi_decline",
+                    "parcel_id": parcel_id,
+                    "severity": "high"
+                    if self.slope[i] < 0 and self.expected_slope[i] > 0
+                    else "medium",
+                    "slope_per_day": round(float(self.slope[i]), 4),
+                    "message_az": f"{parcel_id} sahəsində bitki inkişafı gözləniləndən zəifdir",
+                }
+            )
+
+        if regional:
+            for i in np.flatnonzero(self.regional_low):
+                parcel_id = self.parcel_ids[i]
+                alerts.append(
+                    {
+                        "type": "ndvi_regional_low",
+                        "parcel_id": parcel_id,
+                        "severity": "low",
+                        "percentile": round(float(self.regional_percentile[i]), 1),
+                        "message_az": (
+                            f"{parcel_id} sahəsinin NDVI göstəricisi {self.regions[i]} "
+                            f"regionunda ən aşağı {REGIONAL_LOW_PERCENTILE:g}%-dədir"
+                        ),
+                    }
+                )
+
+        return alerts
+
+
+def analyze_ndvi(batch: NDVISeriesBatch, window: int = DEFAULT_WINDOW) -> NDVIAnalysis:
+    """Run all NDVI analytics on a batch.
+
+    Args:
+        batch: Padded NDVI series for many parcels
+        window: Number of most recent readings for residual/slope
+
+    Returns:
+        Aligned per-parcel analysis arrays
+    """
+    peak_day, peak_ndvi = growth_params(batch.crops)
+    days = batch.days_since_sowing
+    expected = expected_ndvi(np.nan_to_num(days), peak_day[:, None], peak_ndvi[:, None])
+    expected = np.where(batch.valid, expected, np.nan)
+
+    valid = batch.valid
+    window_mask = _last_k_mask(valid, window)
+    latest = _latest(batch.ndvi, valid)
+
+    _, region_inverse = np.unique(batch.regions, return_inverse=True)
+    region_counts = np.bincount(
+        region_inverse[~np.isnan(latest)], minlength=region_inverse.max(initial=-1) + 1
+    )
+
+    return NDVIAnalysis(
+        parcel_ids=batch.parcel_ids,
+        regions=batch.regions,
+        latest_ndvi=latest,
+        expected_latest=_latest(expected, valid),
+        residual=rolling_residual(batch, expected, window),
+        slope=window_slope(days, batch.ndvi, window_mask),
+        expected_slope=window_slope(days, expected, window_mask),
+        regional_percentile=regional_percentiles(latest, batch.regions),
+        region_size=region_counts[region_inverse] if batch.size else np.zeros(0, dtype=np.int64),
+    )
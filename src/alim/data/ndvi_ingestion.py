@@ -0,0 +1,479 @@
+# src/ALİM/data/ndvi_ingestion.py
+"""Bulk NDVI ingestion via asyncpg COPY.
+
+Streams satellite NDVI readings from CSV or Parquet files into the
+monthly-partitioned ``ndvi_readings`` table:
+
+1. Read the file in fixed-size batches (constant memory)
+2. Normalize rows (derive reading_id / health_status when missing)
+3. Create any missing monthly partitions
+4. COPY the batch into a session-local staging table
+5. Upsert staging → ndvi_readings with ON CONFLICT on reading_id
+
+Re-ingesting the same file is idempotent: existing readings are updated
+in place instead of duplicated.
+
+Example:
+    ```python
+    ingestor = NDVIIngestor(batch_size=50_000)
+    stats = await ingestor.ingest_file("sentinel_2026_05.parquet")
+    print(f"{stats.rows_written} rows @ {stats.rows_per_second:,.0f} rows/s")
+    ```
+"""
+
+import asyncio
+import csv
+import time
+from collections.abc import AsyncIterable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = structlog.get_logger(__name__)
+
+NDVI_TABLE = "ndvi_readings"
+STAGING_TABLE = "ndvi_readings_staging"
+
+# COPY column order (created_at is filled by the server default)
+NDVI_COLUMNS = (
+    "reading_id",
+    "parcel_id",
+    "reading_date",
+    "ndvi_value",
+    "health_status",
+    "evi_value",
+    "soil_moisture_index",
+    "cloud_cover_percent",
+    "data_source",
+)
+
+# Columns refreshed when a reading is re-ingested
+_UPDATE_COLUMNS = tuple(c for c in NDVI_COLUMNS if c not in ("reading_id", "reading_date"))
+
+DEFAULT_BATCH_SIZE = 50_000
+DEFAULT_DATA_SOURCE = "Sentinel-2"
+
+
+# ============================================================
+# Row Normalization
+# ============================================================
+
+
+def classify_health(ndvi: float) -> str:
+    """Map an NDVI value to a health status.
+
+    Uses the same thresholds as ``AzerbaijaniAgrarianProvider.ndvi_series``.
+    """
+    if ndvi < 0.2:
+        return "kritik"
+    if ndvi < 0.4:
+        return "stress"
+    if ndvi < 0.6:
+        return "orta"
+    if ndvi < 0.8:
+        return "sağlam"
+    return "əla"
+
+
+def make_reading_id(parcel_id: str, reading_date: date) -> str:
+    """Build an NDVI reading ID (NDVI-ARN-1234-20260115)."""
+    return f"NDVI-{parcel_id.replace('AZ-', '')}-{reading_date.strftime('%Y%m%d')}"
+
+
+def month_partition(reading_date: date) -> tuple[str, date, date]:
+    """Get (partition_name, range_start, range_end) for a reading date."""
+    start = date(reading_date.year, reading_date.month, 1)
+    if start.month == 12:
+        end = date(start.year + 1, 1, 1)
+    else:
+        end = date(start.year, start.month + 1, 1)
+    return f"{NDVI_TABLE}_y{start.year:04d}m{start.month:02d}", start, end
+
+
+def _parse_date(value: Any) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value).strip()[:10])
+
+
+def _parse_float(value: Any) -> float | None:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.strip()
+        if not value:
+            return None
+    return float(value)
+
+
+def normalize_record(
+    row: Mapping[str, Any],
+    data_source: str = DEFAULT_DATA_SOURCE,
+) -> tuple[Any, ...]:
+    """Convert a raw CSV/Parquet row into a COPY record.
+
+    Accepts either ``ndvi_value`` or ``ndvi`` and ``reading_date`` or ``date``
+    column names, matching both the DB schema and the synthetic data provider.
+
+    Args:
+        row: Raw row mapping
+        data_source: Fallback data source when the row has none
+
+    Returns:
+        Tuple in NDVI_COLUMNS order
+
+    Raises:
+        ValueError: If required fields are missing or out of range
+    """
+    parcel_id = row.get("parcel_id")
+    if not parcel_id:
+        raise ValueError("parcel_id is required")
+
+    raw_date = row.get("reading_date") or row.get("date")
+    if not raw_date:
+        raise ValueError("reading_date is required")
+    reading_date = _parse_date(raw_date)
+
+    raw_ndvi = row.get("ndvi_value", row.get("ndvi"))
+    ndvi = _parse_float(raw_ndvi)
+    if ndvi is None:
+        raise ValueError("ndvi_value is required")
+    if not -1.0 <= ndvi <= 1.0:
+        raise ValueError(f"ndvi_value out of range: {ndvi}")
+
+    return (
+        row.get("reading_id") or make_reading_id(str(parcel_id), reading_date),
+        str(parcel_id),
+        reading_date,
+        ndvi,
+        row.get("health_status") or classify_health(ndvi),
+        _parse_float(row.get("evi_value")),
+        _parse_float(row.get("soil_moisture_index")),
+        _parse_float(row.get("cloud_cover_percent")),
+        row.get("data_source") or data_source,
+    )
+
+
+# ============================================================
+# File Readers
+# ============================================================
+
+
+def iter_csv_batches(path: str | Path, batch_size: int) -> Iterator[list[dict[str, Any]]]:
+    """Yield CSV rows in batches of ``batch_size`` dicts."""
+    with open(path, newline="", encoding="utf-8") as f:
+        batch: list[dict[str, Any]] = []
+        for row in csv.DictReader(f):
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+def iter_parquet_batches(path: str | Path, batch_size: int) -> Iterator[list[dict[str, Any]]]:
+    """Yield Parquet rows in batches of ``batch_size`` dicts.
+
+    Requires ``pyarrow`` (optional dependency).
+    """
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "Parquet ingestion requires pyarrow. Install with: pip install pyarrow"
+        ) from e
+
+    parquet_file = pq.ParquetFile(path)
+    for record_batch in parquet_file.iter_batches(batch_size=batch_size):
+        yield record_batch.to_pylist()
+
+
+def iter_file_batches(path: str | Path, batch_size: int) -> Iterator[list[dict[str, Any]]]:
+    """Dispatch to the CSV or Parquet reader based on file extension."""
+    suffix = Path(path).suffix.lower()
+    if suffix in (".parquet", ".pq"):
+        return iter_parquet_batches(path, batch_size)
+    if suffix in (".csv", ".txt"):
+        return iter_csv_batches(path, batch_size)
+    raise ValueError(f"Unsupported NDVI file format: {suffix}")
+
+
+# ============================================================
+# Ingestion
+# ============================================================
+
+
+@dataclass
+class IngestionStats:
+    """Throughput statistics for one ingestion run."""
+
+    rows_read: int = 0
+    rows_written: int = 0
+    rows_rejected: int = 0
+    batches: int = 0
+    partitions_created: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Rows written per second of wall time."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.rows_written / self.elapsed_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for logging / API responses."""
+        return {
+            "rows_read": self.rows_read,
+            "rows_written": self.rows_written,
+            "rows_rejected": self.rows_rejected,
+            "batches": self.batches,
+            "partitions_created": self.partitions_created,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
+
+class NDVIIngestor:
+    """Streams NDVI readings into PostgreSQL using asyncpg COPY.
+
+    Works against both the partitioned table (after the
+    ``partition_ndvi_monthly`` migration) and the legacy plain table.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        data_source: str = DEFAULT_DATA_SOURCE,
+    ):
+        """Initialize the ingestor.
+
+        Args:
+            engine: Async SQLAlchemy engine (defaults to the app engine)
+            batch_size: Rows per COPY batch
+            data_source: Fallback data_source for rows without one
+        """
+        if engine is None:
+            from alim.data.database import engine as default_engine
+
+            engine = default_engine
+
+        if engine.dialect.name != "postgresql":
+            raise ValueError("NDVI bulk ingestion requires PostgreSQL (asyncpg COPY)")
+
+        self.engine = engine
+        self.batch_size = batch_size
+        self.data_source = data_source
+        self._partitioned: bool | None = None
+        self._known_partitions: set[str] = set()
+
+    async def ingest_file(self, path: str | Path) -> IngestionStats:
+        """Ingest a CSV or Parquet file.
+
+        Args:
+            path: Path to .csv or .parquet file
+
+        Returns:
+            Ingestion statistics
+        """
+        batches = iter_file_batches(path, self.batch_size)
+        logger.info("ndvi_ingestion_started", path=str(path), batch_size=self.batch_size)
+        return await self.ingest_batches(_iter_in_thread(batches))
+
+    async def ingest_batches(
+        self,
+        batches: Iterable[list[Mapping[str, Any]]] | AsyncIterable[list[Mapping[str, Any]]],
+    ) -> IngestionStats:
+        """Ingest pre-batched raw rows.
+
+        Args:
+            batches: Sync or async iterable of row batches
+
+        Returns:
+            Ingestion statistics
+        """
+        stats = IngestionStats()
+        started = time.perf_counter()
+
+        async with self.engine.connect() as conn:
+            raw = await conn.get_raw_connection()
+            pg = raw.driver_connection
+            await self._prepare(pg)
+
+            async for batch in _aiter(batches):
+                records = self._normalize_batch(batch, stats)
+                if not records:
+                    continue
+
+                batch_started = time.perf_counter()
+                async with pg.transaction():
+                    stats.partitions_created += await self._ensure_partitions(pg, records)
+                    written = await self._write_batch(pg, records)
+
+                stats.rows_written += written
+                stats.batches += 1
+                batch_seconds = time.perf_counter() - batch_started
+                logger.info(
+                    "ndvi_batch_ingested",
+                    batch=stats.batches,
+                    rows=written,
+                    rows_per_sec=round(written / batch_seconds, 1) if batch_seconds > 0 else None,
+                )
+
+        stats.elapsed_seconds = time.perf_counter() - started
+        logger.info("ndvi_ingestion_complete", **stats.to_dict())
+        return stats
+
+    def _normalize_batch(
+        self,
+        batch: list[Mapping[str, Any]],
+        stats: IngestionStats,
+    ) -> list[tuple[Any, ...]]:
+        """Normalize a batch, dropping invalid rows and in-batch duplicates.
+
+        The last occurrence of a reading_id wins, matching upsert semantics.
+        """
+        by_id: dict[str, tuple[Any, ...]] = {}
+        for row in batch:
+            stats.rows_read += 1
+            try:
+                record = normalize_record(row, self.data_source)
+            except (ValueError, TypeError) as e:
+                stats.rows_rejected += 1
+                logger.debug("ndvi_row_rejected", error=str(e))
+                continue
+            by_id[record[0]] = record
+        return list(by_id.values())
+
+    async def _prepare(self, pg: Any) -> None:
+        """Detect table layout and create the session staging table."""
+        if self._partitioned is None:
+            relkind = await pg.fetchval(
+                "SELECT relkind FROM pg_class WHERE relname = $1 AND relkind IN ('r', 'p')",
+                NDVI_TABLE,
+            )
+            if relkind is None:
+                raise ValueError(f"Table {NDVI_TABLE} does not exist - run migrations first")
+            self._partitioned = relkind == "p"
+
+        if self._partitioned:
+            rows = await pg.fetch(
+                """
+                SELECT child.relname
+                FROM pg_inherits
+                JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE parent.relname = $1
+                """,
+                NDVI_TABLE,
+            )
+            self._known_partitions = {r["relname"] for r in rows}
+
+        # Temp tables are per-connection; ON COMMIT DELETE ROWS empties it per batch
+        await pg.execute(
+            f"CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE} "
+            f"(LIKE {NDVI_TABLE} INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+        )
+
+    async def ensure_partitions(self, start: date, end: date) -> int:
+        """Pre-create monthly partitions covering [start, end].
+
+        Useful before loading many files concurrently, so parallel
+        ingestors never race to create the same month.
+
+        Returns:
+            Number of partitions created
+        """
+        months = []
+        month = start.replace(day=1)
+        while month <= end:
+            months.append(month)
+            month = month_partition(month)[2]
+
+        async with self.engine.connect() as conn:
+            raw = await conn.get_raw_connection()
+            pg = raw.driver_connection
+            await self._prepare(pg)
+            async with pg.transaction():
+                return await self._ensure_months(pg, months)
+
+    async def _ensure_partitions(self, pg: Any, records: list[tuple[Any, ...]]) -> int:
+        """Create monthly partitions that the batch needs but don't exist yet."""
+        return await self._ensure_months(pg, {r[2].replace(day=1) for r in records})
+
+    async def _ensure_months(self, pg: Any, months: Iterable[date]) -> int:
+        """Create the partitions for the given first-of-month dates."""
+        if not self._partitioned:
+            return 0
+
+        created = 0
+        for reading_date in months:
+            name, start, end = month_partition(reading_date)
+            if name in self._known_partitions:
+                continue
+            await pg.execute(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {NDVI_TABLE} "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            )
+            self._known_partitions.add(name)
+            created += 1
+            logger.info("ndvi_partition_created", partition=name)
+        return created
+
+    async def _write_batch(self, pg: Any, records: list[tuple[Any, ...]]) -> int:
+        """COPY records into staging and upsert them into ndvi_readings."""
+        await pg.copy_records_to_table(STAGING_TABLE, records=records, columns=NDVI_COLUMNS)
+
+        # Partitioned tables need the partition key in the conflict target
+        conflict = "reading_id, reading_date" if self._partitioned else "reading_id"
+        columns = ", ".join(NDVI_COLUMNS)
+        updates = ", ".join(f"{c} = EXCLUDED.{c}" for c in _UPDATE_COLUMNS)
+        status = await pg.execute(
+            f"INSERT INTO {NDVI_TABLE} ({columns}) "
+            f"SELECT {columns} FROM {STAGING_TABLE} "
+            f"ON CONFLICT ({conflict}) DO UPDATE SET {updates}"
+        )
+        # asyncpg returns the command tag, e.g. "INSERT 0 50000"
+        return int(status.rsplit(" ", 1)[-1])
+
+
+async def _iter_in_thread(
+    batches: Iterator[list[dict[str, Any]]],
+) -> AsyncIterable[list[dict[str, Any]]]:
+    """Pull batches from a blocking file reader without stalling the event loop."""
+    sentinel: list[dict[str, Any]] = []
+    while True:
+        batch = await asyncio.to_thread(next, batches, sentinel)
+        if batch is sentinel:
+            return
+        yield batch
+
+
+async def _aiter(
+    batches: Iterable[list[Mapping[str, Any]]] | AsyncIterable[list[Mapping[str, Any]]],
+) -> AsyncIterable[list[Mapping[str, Any]]]:
+    """Normalize a sync or async iterable into an async iterator."""
+    if isinstance(batches, AsyncIterable):
+        async for batch in batches:
+            yield batch
+    else:
+        for batch in batches:
+            yield batch
+
+
+async def ingest_ndvi_file(
+    path: str | Path,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    data_source: str = DEFAULT_DATA_SOURCE,
+) -> IngestionStats:
+    """Convenience wrapper: ingest one file with the default engine."""
+    ingestor = NDVIIngestor(batch_size=batch_size, data_source=data_source)
+    return await ingestor.ingest_file(path)
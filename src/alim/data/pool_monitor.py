@@ -0,0 +1,394 @@
+# src/ALİM/data/pool_monitor.py
+"""Connection-pool instrumentation for the async SQLAlchemy engine.
+
+Provides:
+- InstrumentedAsyncAdaptedQueuePool: records checkout wait time, overflow
+  connections and checkout timeouts
+- Slow-query log with statement fingerprinting (literals and bind
+  parameters collapsed so identical query shapes aggregate together)
+- LivenessMonitor: background ``SELECT 1`` replacing per-checkout
+  ``pool_pre_ping`` round-trips
+
+Metrics are exposed through ``/health`` via ``PoolMetrics.snapshot()``.
+"""
+
+import asyncio
+import functools
+import hashlib
+import re
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+import structlog
+from sqlalchemy import event, text
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+logger = structlog.get_logger(__name__)
+
+# Recent checkout waits kept for percentile calculation
+WAIT_SAMPLE_SIZE = 1000
+
+# Distinct query fingerprints tracked before the least used are evicted
+MAX_FINGERPRINTS = 500
+
+# Raw statements whose fingerprints are memoized
+FINGERPRINT_CACHE_SIZE = 2048
+
+
+# ============================================================
+# Statement Fingerprinting
+# ============================================================
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w$])-?\d+(?:\.\d+)?\b")
+_BIND_PARAM = re.compile(r"\$\d+|%\(\w+\)s|%s|\?")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """Collapse literals, bind parameters and whitespace in a SQL statement.
+
+    ``WHERE id IN ($1, $2, $3)`` and ``WHERE id IN ($1)`` normalize to the
+    same shape so they aggregate under one fingerprint.
+    """
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _BIND_PARAM.sub("?", normalized)
+    normalized = _NUMBER.sub("?", normalized)
+    normalized = _VALUE_LIST.sub("(?)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+@functools.lru_cache(maxsize=FINGERPRINT_CACHE_SIZE)
+def fingerprint_statement(statement: str) -> tuple[str, str]:
+    """Get (fingerprint, normalized_statement) for a SQL statement.
+
+    Memoized on the raw statement: once a slow shape is tracked, every
+    execution of it is looked up, and the ORM reuses statement strings.
+    """
+    normalized = normalize_statement(statement)
+    digest = hashlib.sha1(normalized.encode("utf-8"), usedforsecurity=False).hexdigest()
+    return digest[:12], normalized
+
+
+# ============================================================
+# Metrics
+# ============================================================
+
+
+@dataclass
+class QueryStats:
+    """Aggregated timings for one statement fingerprint."""
+
+    fingerprint: str
+    statement: str
+    count: int = 0
+    slow_count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "statement": self.statement[:200],
+            "count": self.count,
+            "slow_count": self.slow_count,
+            "avg_ms": round(self.total_ms / self.count, 2) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 2),
+        }
+
+
+class PoolMetrics:
+    """Counters for one engine's pool and query traffic."""
+
+    def __init__(self, name: str, slow_query_ms: float = 200.0):
+        """Initialize metrics.
+
+        Args:
+            name: Engine label (e.g. "primary", "replica")
+            slow_query_ms: Queries slower than this are logged
+        """
+        self.name = name
+        self.slow_query_ms = slow_query_ms
+
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.overflow_events = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+        self._wait_samples: deque[float] = deque(maxlen=WAIT_SAMPLE_SIZE)
+
+        self.queries = 0
+        self.slow_queries = 0
+        self._query_stats: dict[str, QueryStats] = {}
+
+        self.liveness_ok: bool | None = None
+        self.liveness_last_check: datetime | None = None
+        self.liveness_latency_ms: float | None = None
+        self.liveness_failures = 0
+
+    # ----- Pool -----
+
+    def record_checkout(self, wait_seconds: float, overflow_created: bool) -> None:
+        """Record a successful connection checkout."""
+        wait_ms = wait_seconds * 1000
+        self.checkouts += 1
+        self.wait_total_ms += wait_ms
+        self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+        self._wait_samples.append(wait_ms)
+        if overflow_created:
+            self.overflow_events += 1
+            logger.info("db_pool_overflow_connection", engine=self.name)
+
+    def record_timeout(self, wait_seconds: float) -> None:
+        """Record a checkout that timed out waiting for a connection."""
+        self.checkout_timeouts += 1
+        logger.warning(
+            "db_pool_checkout_timeout", engine=self.name, waited_ms=round(wait_seconds * 1000, 1)
+        )
+
+    # ----- Queries -----
+
+    def record_query(self, statement: str, duration_ms: float) -> None:
+        """Record a statement execution, logging it if slow."""
+        self.queries += 1
+        is_slow = duration_ms >= self.slow_query_ms
+        if not is_slow and not self._query_stats:
+            return
+
+        fingerprint, normalized = fingerprint_statement(statement)
+        stats = self._query_stats.get(fingerprint)
+        if stats is None:
+            if not is_slow:
+                # Only slow shapes are tracked; fast ones are counted in `queries`
+                return
+            if len(self._query_stats) >= MAX_FINGERPRINTS:
+                evict = min(self._query_stats.values(), key=lambda s: s.slow_count)
+                del self._query_stats[evict.fingerprint]
+            stats = self._query_stats[fingerprint] = QueryStats(fingerprint, normalized)
+
+        stats.count += 1
+        stats.total_ms += duration_ms
+        stats.max_ms = max(stats.max_ms, duration_ms)
+        if is_slow:
+            stats.slow_count += 1
+            self.slow_queries += 1
+            logger.warning(
+                "db_slow_query",
+                engine=self.name,
+                fingerprint=fingerprint,
+                duration_ms=round(duration_ms, 1),
+                statement=normalized[:500],
+            )
+
+    # ----- Liveness -----
+
+    def record_liveness(self, ok: bool, latency_ms: float | None) -> None:
+        """Record a background liveness probe result."""
+        self.liveness_ok = ok
+        self.liveness_last_check = datetime.now(UTC)
+        self.liveness_latency_ms = latency_ms
+        self.liveness_failures = 0 if ok else self.liveness_failures + 1
+
+    # ----- Export -----
+
+    def top_slow_queries(self, limit: int = 5) -> list[dict[str, Any]]:
+        """Slow query fingerprints ordered by worst latency."""
+        ranked = sorted(self._query_stats.values(), key=lambda s: s.max_ms, reverse=True)
+        return [s.to_dict() for s in ranked[:limit]]
+
+    def snapshot(self, pool: Pool | None = None) -> dict[str, Any]:
+        """Export metrics (plus live pool gauges when a pool is given)."""
+        samples = sorted(self._wait_samples)
+        p95 = samples[int(len(samples) * 0.95) - 1] if len(samples) >= 20 else self.wait_max_ms
+
+        result: dict[str, Any] = {
+            "checkouts": self.checkouts,
+            "checkout_wait_ms": {
+                "avg": round(self.wait_total_ms / self.checkouts, 3) if self.checkouts else 0.0,
+                "p95": round(p95, 3),
+                "max": round(self.wait_max_ms, 3),
+            },
+            "overflow_events": self.overflow_events,
+            "checkout_timeouts": self.checkout_timeouts,
+            "queries": self.queries,
+            "slow_queries": self.slow_queries,
+            "slow_query_threshold_ms": self.slow_query_ms,
+            "top_slow_queries": self.top_slow_queries(),
+            "liveness": {
+                "healthy": self.liveness_ok,
+                "last_check": self.liveness_last_check.isoformat()
+                if self.liveness_last_check
+                else None,
+                "latency_ms": round(self.liveness_latency_ms, 2)
+                if self.liveness_latency_ms is not None
+                else None,
+                "consecutive_failures": self.liveness_failures,
+            },
+        }
+
+        if pool is not None and hasattr(pool, "checkedout"):
+            result["pool"] = {
+                "size": pool.size(),
+                "in_use": pool.checkedout(),
+                "idle": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+            }
+        return result
+
+
+# ============================================================
+# Instrumented Pool
+# ============================================================
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that reports checkout wait and overflow.
+
+    Assign ``pool.metrics`` after engine creation (see ``instrument_engine``).
+    """
+
+    metrics: PoolMetrics | None = None
+
+    def _do_get(self) -> Any:
+        started = time.perf_counter()
+        overflow_before = self._overflow
+        try:
+            conn = super()._do_get()
+        except sa_exc.TimeoutError:
+            if self.metrics is not None:
+                self.metrics.record_timeout(time.perf_counter() - started)
+            raise
+
+        if self.metrics is not None:
+            overflow_created = self._overflow > overflow_before and self._overflow > 0
+            self.metrics.record_checkout(time.perf_counter() - started, overflow_created)
+        return conn
+
+    def recreate(self) -> "InstrumentedAsyncAdaptedQueuePool":
+        # engine.dispose() swaps in a fresh pool; keep the same metrics
+        new_pool = super().recreate()
+        new_pool.metrics = self.metrics
+        return new_pool
+
+
+def instrument_engine(engine: AsyncEngine, metrics: PoolMetrics) -> None:
+    """Attach pool metrics and slow-query timing to an engine."""
+    if isinstance(engine.pool, InstrumentedAsyncAdaptedQueuePool):
+        engine.pool.metrics = metrics
+
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # noqa: ARG001
+        conn.info.setdefault("alim_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # noqa: ARG001
+        starts = conn.info.get("alim_query_start")
+        if starts:
+            metrics.record_query(statement, (time.perf_counter() - starts.pop()) * 1000)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _handle_error(context):
+        # after_cursor_execute never fires for a failed statement
+        conn = context.connection
+        starts = conn.info.get("alim_query_start") if conn is not None else None
+        if starts:
+            starts.pop()
+
+
+# ============================================================
+# Background Liveness Check
+# ============================================================
+
+
+class LivenessMonitor:
+    """Periodically verifies database connectivity off the request path.
+
+    Replaces ``pool_pre_ping`` (one extra round-trip per checkout). When a
+    probe fails with a connection error, the pool is disposed so stale
+    connections are not handed out once the database recovers. A probe
+    that times out waiting for a checkout means the pool is busy, not that
+    the database is down, so it is neither recorded nor acted on.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        metrics: PoolMetrics,
+        interval_seconds: float = 30.0,
+        timeout_seconds: float = 5.0,
+    ):
+        self.engine = engine
+        self.metrics = metrics
+        self.interval_seconds = interval_seconds
+        self.timeout_seconds = timeout_seconds
+        self._task: asyncio.Task | None = None
+
+    async def check(self) -> bool:
+        """Run one liveness probe.
+
+        Returns:
+            False if the database could not be reached or did not answer.
+        """
+        started = time.perf_counter()
+        checked_out = False
+        try:
+            async with asyncio.timeout(self.timeout_seconds):
+                async with self.engine.connect() as conn:
+                    checked_out = True
+                    await conn.execute(text("SELECT 1"))
+        except TimeoutError:
+            if not checked_out:
+                logger.info(
+                    "db_liveness_check_skipped", engine=self.metrics.name, reason="pool_busy"
+                )
+                return True
+            self._record_failure("query timed out")
+            return False
+        except (sa_exc.OperationalError, sa_exc.InterfaceError, OSError) as e:
+            self._record_failure(str(e))
+            # Drop pooled connections; they are likely dead too
+            await self.engine.dispose()
+            return False
+        except Exception as e:
+            self._record_failure(str(e))
+            return False
+
+        self.metrics.record_liveness(True, (time.perf_counter() - started) * 1000)
+        return True
+
+    def _record_failure(self, error: str) -> None:
+        self.metrics.record_liveness(False, None)
+        logger.warning(
+            "db_liveness_check_failed",
+            engine=self.metrics.name,
+            error=error,
+            consecutive_failures=self.metrics.liveness_failures,
+        )
+
+    async def _run(self) -> None:
+        while True:
+            await self.check()
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        """Start the background probe loop (idempotent)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name=f"db-liveness-{self.metrics.name}")
+
+    async def stop(self) -> None:
+        """Stop the background probe loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
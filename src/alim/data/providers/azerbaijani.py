@@ -480,6 +480,23 @@ class AzerbaijaniAgrarianProvider(BaseProvider):
         suffix = self.random_element(self.FARM_NAME_SUFFIXES)
         return f"{prefix} {suffix}"
 
+    # Base area ranges (ha) by farm type, adjusted by persona
+    FARM_AREA_RANGES = {
+        "crop": (3.0, 50.0),
+        "livestock": (1.0, 20.0),
+        "orchard": (0.5, 10.0),
+        "mixed": (2.0, 25.0),
+    }
+    DEFAULT_FARM_AREA_RANGE = (2.0, 20.0)
+
+    PERSONA_AREA_MULTIPLIERS = {
+        "novice": 0.5,
+        "experienced": 1.0,
+        "commercial": 2.0,
+        "traditional": 0.8,
+        "diversified": 1.2,
+    }
+
     def area_hectares(
         self,
         farm_type: str | None = None,
@@ -489,31 +506,32 @@ class AzerbaijaniAgrarianProvider(BaseProvider):
 
         Ranges vary by farm type and farmer persona.
         """
-        # Base ranges by farm type
-        ranges = {
-            "crop": (3.0, 50.0),
-            "livestock": (1.0, 20.0),
-            "orchard": (0.5, 10.0),
-            "mixed": (2.0, 25.0),
-        }
-
-        # Adjust by persona
-        multipliers = {
-            "novice": 0.5,
-            "experienced": 1.0,
-            "commercial": 2.0,
-            "traditional": 0.8,
-            "diversified": 1.2,
-        }
-
-        farm_range = ranges.get(farm_type, (2.0, 20.0))
-        multiplier = multipliers.get(persona, 1.0)
+        farm_range = self.FARM_AREA_RANGES.get(farm_type, self.DEFAULT_FARM_AREA_RANGE)
+        multiplier = self.PERSONA_AREA_MULTIPLIERS.get(persona, 1.0)
 
         area = random.uniform(farm_range[0], farm_range[1]) * multiplier
         return round(area, 2)
 
     # ===== NDVI Time Series =====
 
+    # (peak_day, peak_ndvi) of the growth curve per crop
+    NDVI_GROWTH_CURVES = {
+        "Buğda": (180, 0.85),  # Winter grains: late spring peak
+        "Arpa": (180, 0.85),
+        "Pambıq": (120, 0.80),  # Summer crops
+        "Qarğıdalı": (120, 0.80),
+        "Pomidor": (90, 0.75),  # Vegetables
+        "Xıyar": (90, 0.75),
+        "Üzüm": (150, 0.82),  # Perennials
+        "Alma": (150, 0.82),
+    }
+    DEFAULT_NDVI_GROWTH_CURVE = (120, 0.78)
+
+    @classmethod
+    def ndvi_growth_params(cls, crop: str) -> tuple[int, float]:
+        """Get (peak_day, peak_ndvi) of the NDVI growth curve for a crop."""
+        return cls.NDVI_GROWTH_CURVES.get(crop, cls.DEFAULT_NDVI_GROWTH_CURVE)
+
     def ndvi_series(
         self,
         crop: str,
@@ -534,21 +552,7 @@ class AzerbaijaniAgrarianProvider(BaseProvider):
 
         # Determine growth pattern based on crop
         # Peak NDVI varies by crop type
-        if crop in ["Buğda", "Arpa"]:  # Winter grains
-            peak_day = 180  # Late spring peak
-            peak_ndvi = 0.85
-        elif crop in ["Pambıq", "Qarğıdalı"]:  # Summer crops
-            peak_day = 120
-            peak_ndvi = 0.80
-        elif crop in ["Pomidor", "Xıyar"]:  # Vegetables
-            peak_day = 90
-            peak_ndvi = 0.75
-        elif crop in ["Üzüm", "Alma"]:  # Perennials
-            peak_day = 150
-            peak_ndvi = 0.82
-        else:
-            peak_day = 120
-            peak_ndvi = 0.78
+        peak_day, peak_ndvi = self.ndvi_growth_params(crop)
 
         # Generate readings at regular intervals
         current_date = start_date
@@ -703,26 +707,27 @@ class AzerbaijaniAgrarianProvider(BaseProvider):
             "preferred_units": self.random_element(["metric", "local"]),
         }
 
+    # Average yields by crop (tons/ha)
+    CROP_YIELDS = {
+        "Buğda": (2.0, 4.5),
+        "Arpa": (1.8, 4.0),
+        "Qarğıdalı": (4.0, 8.0),
+        "Düyü": (3.0, 6.0),
+        "Pambıq": (1.5, 3.5),
+        "Tütün": (1.0, 2.5),
+        "Pomidor": (25.0, 50.0),
+        "Xıyar": (20.0, 40.0),
+        "Kartof": (15.0, 30.0),
+        "Üzüm": (6.0, 12.0),
+        "Alma": (8.0, 20.0),
+        "Fındıq": (0.8, 2.0),
+    }
+    DEFAULT_CROP_YIELD = (2.0, 5.0)
+
     def yield_tons_per_ha(self, crop: str) -> float:
         """Generate realistic yield in tons per hectare.
 
         Based on Azerbaijani agricultural statistics.
         """
-        # Average yields by crop (tons/ha)
-        yields = {
-            "Buğda": (2.0, 4.5),
-            "Arpa": (1.8, 4.0),
-            "Qarğıdalı": (4.0, 8.0),
-            "Düyü": (3.0, 6.0),
-            "Pambıq": (1.5, 3.5),
-            "Tütün": (1.0, 2.5),
-            "Pomidor": (25.0, 50.0),
-            "Xıyar": (20.0, 40.0),
-            "Kartof": (15.0, 30.0),
-            "Üzüm": (6.0, 12.0),
-            "Alma": (8.0, 20.0),
-            "Fındıq": (0.8, 2.0),
-        }
-
-        crop_range = yields.get(crop, (2.0, 5.0))
+        crop_range = self.CROP_YIELDS.get(crop, self.DEFAULT_CROP_YIELD)
         return round(random.uniform(*crop_range), 2)
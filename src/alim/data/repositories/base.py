@@ -49,11 +49,19 @@ class BaseRepository(Generic[ModelType]):
         await self.session.refresh(instance)
         return instance
 
-    async def create_many(self, items: list[dict[str, Any]]) -> list[ModelType]:
+    async def create_many(
+        self,
+        items: list[dict[str, Any]],
+        refresh: bool = True,
+    ) -> list[ModelType]:
         """Create multiple records.
 
+        For large volumes (e.g. NDVI readings) use ``NDVIIngestor`` instead;
+        this path issues one SELECT per instance when ``refresh`` is True.
+
         Args:
             items: List of dicts with model field values
+            refresh: Reload server-generated columns (one query per instance)
 
         Returns:
             List of created model instances
@@ -61,8 +69,9 @@ class BaseRepository(Generic[ModelType]):
         instances = [self.model(**item) for item in items]
         self.session.add_all(instances)
         await self.session.flush()
-        for instance in instances:
-            await self.session.refresh(instance)
+        if refresh:
+            for instance in instances:
+                await self.session.refresh(instance)
         return instances
 
     async def get_by_id(self, id_: str) -> ModelType | None:
@@ -5,7 +5,7 @@ from collections.abc import Sequence
 from datetime import date
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -13,6 +13,7 @@ from alim.data.models.farm import FarmProfile, FarmType, Region
 from alim.data.models.ndvi import HealthStatus, NDVIReading
 from alim.data.models.parcel import Parcel
 from alim.data.models.sowing import DeclarationStatus, SowingDeclaration
+from alim.data.ndvi_analytics import NDVISeriesBatch, analyze_ndvi
 from alim.data.repositories.base import BaseRepository
 
 
@@ -25,6 +26,11 @@ class FarmRepository(BaseRepository[FarmProfile]):
     - get_context_for_ai: Get complete farm context for AI
     - get_active_crops: Get currently planted crops
     - get_recent_ndvi: Get latest NDVI readings
+
+    Hot per-turn queries (get_primary_farm, get_with_parcels,
+    get_recent_ndvi) are lambda statements: the statement is built once
+    per call site and its compiled form is reused from the engine's
+    compiled cache, with arguments extracted as bound parameters.
     """
 
     def __init__(self, session: AsyncSession):
@@ -40,13 +46,15 @@ class FarmRepository(BaseRepository[FarmProfile]):
         Returns:
             Farm with parcels loaded, or None if not found
         """
-        query = (
-            select(FarmProfile)
-            .options(
-                selectinload(FarmProfile.parcels).selectinload(Parcel.sowing_declarations),
-                selectinload(FarmProfile.parcels).selectinload(Parcel.ndvi_readings),
+        query = lambda_stmt(
+            lambda: (
+                select(FarmProfile)
+                .options(
+                    selectinload(FarmProfile.parcels).selectinload(Parcel.sowing_declarations),
+                    selectinload(FarmProfile.parcels).selectinload(Parcel.ndvi_readings),
+                )
+                .where(FarmProfile.farm_id == farm_id)
             )
-            .where(FarmProfile.farm_id == farm_id)
         )
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
@@ -90,13 +98,15 @@ class FarmRepository(BaseRepository[FarmProfile]):
         Returns:
             Primary farm or None
         """
-        query = (
-            select(FarmProfile)
-            .where(
-                FarmProfile.user_id == user_id,
-                FarmProfile.is_primary == True,  # noqa: E712
+        query = lambda_stmt(
+            lambda: (
+                select(FarmProfile)
+                .where(
+                    FarmProfile.user_id == user_id,
+                    FarmProfile.is_primary == True,  # noqa: E712
+                )
+                .limit(1)
             )
-            .limit(1)
         )
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
@@ -108,6 +118,7 @@ class FarmRepository(BaseRepository[FarmProfile]):
         - Farm basic info (type, region, area)
         - Active crops with growth stages
         - Recent NDVI readings with health status
+        - NDVI analytics alerts (curve anomalies, declining trend)
         - Weather-relevant coordinates
 
         Args:
@@ -124,6 +135,8 @@ class FarmRepository(BaseRepository[FarmProfile]):
         parcels_context = []
         active_crops = []
         alerts = []
+        series_parcels = []
+        series_readings = []
 
         for parcel in farm.parcels:
             parcel_info = {
@@ -161,6 +174,25 @@ class FarmRepository(BaseRepository[FarmProfile]):
                         "days_since_sowing": (date.today() - active_declaration.sowing_date).days,
                     }
                 )
+                series_parcels.append(
+                    {
+                        "parcel_id": parcel.parcel_id,
+                        "crop": crop_type_value,
+                        "region": farm.region.value
+                        if hasattr(farm.region, "value")
+                        else farm.region,
+                        "sowing_date": active_declaration.sowing_date,
+                    }
+                )
+                series_readings.extend(
+                    {
+                        "parcel_id": parcel.parcel_id,
+                        "date": r.reading_date,
+                        "ndvi": r.ndvi_value,
+                    }
+                    for r in parcel.ndvi_readings
+                    if r.reading_date >= active_declaration.sowing_date
+                )
 
             # Get latest NDVI
             if parcel.ndvi_readings:
@@ -191,6 +223,12 @@ class FarmRepository(BaseRepository[FarmProfile]):
 
             parcels_context.append(parcel_info)
 
+        # Curve anomalies and trend stress across all parcels in one pass.
+        # Only this farm's parcels are in the batch, so no regional ranking.
+        if series_readings:
+            batch = NDVISeriesBatch.from_readings(series_readings, series_parcels)
+            alerts.extend(analyze_ndvi(batch).to_alerts(regional=False))
+
         return {
             "farm_id": farm.farm_id,
             "farm_name": farm.farm_name,
@@ -265,14 +303,16 @@ class FarmRepository(BaseRepository[FarmProfile]):
 
         cutoff_date = date.today() - timedelta(days=days)
 
-        query = (
-            select(NDVIReading)
-            .join(Parcel)
-            .where(
-                Parcel.farm_id == farm_id,
-                NDVIReading.reading_date >= cutoff_date,
+        query = lambda_stmt(
+            lambda: (
+                select(NDVIReading)
+                .join(Parcel)
+                .where(
+                    Parcel.farm_id == farm_id,
+                    NDVIReading.reading_date >= cutoff_date,
+                )
+                .order_by(NDVIReading.reading_date.desc())
             )
-            .order_by(NDVIReading.reading_date.desc())
         )
         result = await self.session.execute(query)
         readings = result.scalars().all()
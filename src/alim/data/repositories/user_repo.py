@@ -3,7 +3,7 @@
 
 from collections.abc import Sequence
 
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -34,10 +34,13 @@ class UserRepository(BaseRepository[UserProfile]):
         Returns:
             User with farms loaded, or None if not found
         """
-        query = (
-            select(UserProfile)
-            .options(selectinload(UserProfile.farms))
-            .where(UserProfile.user_id == user_id)
+        # Lambda statement: built once, compiled form served from the cache
+        query = lambda_stmt(
+            lambda: (
+                select(UserProfile)
+                .options(selectinload(UserProfile.farms))
+                .where(UserProfile.user_id == user_id)
+            )
         )
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
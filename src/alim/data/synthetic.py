@@ -0,0 +1,785 @@
+# src/ALİM/data/synthetic.py
+"""Bulk synthetic dataset generator for load-scale benchmarks.
+
+Generates N users with farms, parcels, sowing declarations, crop rotation
+history and multi-year NDVI series using vectorized NumPy (no per-row
+Faker calls), then writes one Parquet/CSV file per table per shard:
+
+    output/
+        user_profiles/part-00000.parquet
+        farm_profiles/part-00000.parquet
+        ...
+        ndvi_readings/part-00000.parquet
+
+Shards are generated in parallel worker processes. Each shard draws from
+its own ``SeedSequence(seed, spawn_key=(shard,))`` stream, so the output
+depends only on (seed, users, users_per_shard) - never on worker count or
+scheduling order.
+
+Files are bulk-loaded with asyncpg COPY in foreign-key order;
+``ndvi_readings`` goes through ``NDVIIngestor`` so monthly partitions are
+created on demand.
+
+Vocabulary (regions, crops, soil/irrigation names, personas, yields)
+comes from ``AzerbaijaniAgrarianProvider`` so small Faker-seeded datasets
+and large generated ones look alike.
+
+Example:
+    ```python
+    config = SyntheticConfig(users=100_000, seed=7)
+    stats = generate_dataset(config, "data/synthetic", fmt="parquet", workers=8)
+    await load_dataset("data/synthetic")
+    ```
+"""
+
+import asyncio
+import csv
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import structlog
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from alim.data.ndvi_analytics import SEASON_DAYS, expected_ndvi, growth_params
+from alim.data.providers.azerbaijani import AzerbaijaniAgrarianProvider as Provider
+
+logger = structlog.get_logger(__name__)
+
+# Load order respects foreign keys
+TABLE_COLUMNS: dict[str, tuple[str, ...]] = {
+    "user_profiles": (
+        "user_id",
+        "full_name_masked",
+        "phone_hash",
+        "region_code",
+        "experience_level",
+        "farming_years",
+        "education_level",
+        "language_pref",
+        "preferred_units",
+        "receives_subsidies",
+        "notification_pref",
+    ),
+    "farm_profiles": (
+        "farm_id",
+        "user_id",
+        "farm_name",
+        "farm_type",
+        "region",
+        "total_area_ha",
+        "primary_activity",
+        "is_primary",
+        "is_active",
+    ),
+    "parcels": (
+        "parcel_id",
+        "farm_id",
+        "latitude",
+        "longitude",
+        "area_hectares",
+        "soil_type",
+        "irrigation_type",
+        "elevation_m",
+    ),
+    "sowing_declarations": (
+        "declaration_id",
+        "parcel_id",
+        "crop_type",
+        "sowing_date",
+        "expected_harvest_date",
+        "status",
+        "expected_yield_tons",
+        "season_year",
+    ),
+    "crop_rotation_logs": (
+        "log_id",
+        "parcel_id",
+        "year",
+        "crop",
+        "yield_tons_per_ha",
+        "total_yield_tons",
+        "quality_grade",
+    ),
+    "ndvi_readings": (
+        "reading_id",
+        "parcel_id",
+        "reading_date",
+        "ndvi_value",
+        "health_status",
+        "cloud_cover_percent",
+        "data_source",
+    ),
+}
+
+# Share of each persona in the generated population
+PERSONA_WEIGHTS = {
+    "novice": 0.25,
+    "experienced": 0.30,
+    "commercial": 0.10,
+    "traditional": 0.20,
+    "diversified": 0.15,
+}
+
+# Sowing month (and year offset) by crop group, as in scripts/seed_database.py
+WINTER_CROPS = ("Buğda", "Arpa")  # Sown October of the previous year
+SPRING_CROPS = ("Pambıq", "Qarğıdalı", "Günəbaxan")  # Sown in April
+
+# Upper bounds of the NDVI health classes (same as classify_health)
+HEALTH_THRESHOLDS = np.array([0.2, 0.4, 0.6, 0.8])
+HEALTH_LABELS = np.array(["kritik", "stress", "orta", "sağlam", "əla"], dtype=object)
+
+DATA_SOURCE = "synthetic"
+PARCEL_OFFSET_KM = 20.0
+MANIFEST_FILE = "manifest.json"
+
+
+@dataclass
+class SyntheticConfig:
+    """Dataset size and shape."""
+
+    users: int = 10_000
+    seed: int = 42
+    # Seasons per parcel: (seasons - 1) rotation years plus the current season
+    seasons: int = 4
+    end_year: int = field(default_factory=lambda: date.today().year)
+    interval_days: int = 10
+    users_per_shard: int = 2_000
+    # Readings after this date are not generated (current season in progress)
+    as_of: date = field(default_factory=date.today)
+
+    @property
+    def shard_count(self) -> int:
+        return max(1, -(-self.users // self.users_per_shard))
+
+    def shard_users(self, shard_index: int) -> range:
+        """Global user indices belonging to a shard."""
+        start = shard_index * self.users_per_shard
+        return range(start, min(start + self.users_per_shard, self.users))
+
+    @property
+    def ndvi_date_range(self) -> tuple[date, date]:
+        """Earliest possible and latest NDVI reading date."""
+        # Winter crops of the first season are sown in October of the year before
+        first_sowing = date(self.end_year - self.seasons, 10, 1)
+        return first_sowing, self.as_of
+
+
+@dataclass
+class GenerationStats:
+    """Row counts and timing for a generation run."""
+
+    rows: dict[str, int] = field(default_factory=lambda: dict.fromkeys(TABLE_COLUMNS, 0))
+    shards: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def total_rows(self) -> int:
+        return sum(self.rows.values())
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.total_rows / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "rows": dict(self.rows),
+            "total_rows": self.total_rows,
+            "shards": self.shards,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
+
+# ============================================================
+# Vectorized Sampling Helpers
+# ============================================================
+
+
+def _pick_within(
+    rng: np.random.Generator, group: np.ndarray, options: list[list[Any]]
+) -> np.ndarray:
+    """Pick uniformly from ``options[group[i]]`` for every row."""
+    sizes = np.array([len(o) for o in options])
+    width = sizes.max()
+    table = np.array([list(o) + [o[-1]] * (width - len(o)) for o in options], dtype=object)
+    pick = (rng.random(len(group)) * sizes[group]).astype(np.int64)
+    return table[group, pick]
+
+
+def _weighted_within(
+    rng: np.random.Generator, group: np.ndarray, weights: np.ndarray, labels: np.ndarray
+) -> np.ndarray:
+    """Weighted pick of ``labels`` with a per-group weight row."""
+    cumulative = np.cumsum(weights, axis=1)
+    cumulative /= cumulative[:, -1:]
+    draws = rng.random(len(group))[:, None]
+    index = (draws > cumulative[group]).sum(axis=1)
+    return labels[np.minimum(index, len(labels) - 1)]
+
+
+def _uniform_ranges(rng: np.random.Generator, ranges: np.ndarray) -> np.ndarray:
+    """Uniform draw per row from an (n, 2) array of [low, high) ranges."""
+    return ranges[:, 0] + rng.random(len(ranges)) * (ranges[:, 1] - ranges[:, 0])
+
+
+def _month_start(years: np.ndarray, month: int) -> np.ndarray:
+    """First day of ``month`` for each year, as datetime64[D]."""
+    months = (years - 1970) * 12 + (month - 1)
+    return months.astype("datetime64[M]").astype("datetime64[D]")
+
+
+def sowing_dates(rng: np.random.Generator, crops: np.ndarray, years: np.ndarray) -> np.ndarray:
+    """Sowing date per (crop, season year)."""
+    winter = np.isin(crops, WINTER_CROPS)
+    spring = np.isin(crops, SPRING_CROPS)
+    base = np.where(
+        winter,
+        _month_start(years - 1, 10),
+        np.where(spring, _month_start(years, 4), _month_start(years, 3)),
+    )
+    return base + rng.integers(0, np.where(spring, 30, 31))
+
+
+def crop_yields(rng: np.random.Generator, crops: np.ndarray) -> np.ndarray:
+    """Yield (t/ha) per crop, rounded to 2 decimals."""
+    unique, inverse = np.unique(crops, return_inverse=True)
+    ranges = np.array([Provider.CROP_YIELDS.get(c, Provider.DEFAULT_CROP_YIELD) for c in unique])
+    return np.round(_uniform_ranges(rng, ranges[inverse]), 2)
+
+
+def classify_health_array(ndvi: np.ndarray) -> np.ndarray:
+    """Vectorized ``classify_health``."""
+    return HEALTH_LABELS[np.searchsorted(HEALTH_THRESHOLDS, ndvi, side="right")]
+
+
+def ndvi_values(
+    rng: np.random.Generator,
+    days_since_sowing: np.ndarray,
+    peak_day: np.ndarray,
+    peak_ndvi: np.ndarray,
+) -> np.ndarray:
+    """Growth curve + weather noise + occasional stress (as ``ndvi_series``)."""
+    ndvi = expected_ndvi(days_since_sowing, peak_day, peak_ndvi)
+    ndvi += rng.uniform(-0.05, 0.05, size=ndvi.shape)
+    stressed = rng.random(ndvi.shape) < 0.1
+    ndvi[stressed] -= rng.uniform(0.1, 0.2, size=int(stressed.sum()))
+    return np.round(np.clip(ndvi, 0.05, 0.95), 3)
+
+
+# ============================================================
+# Shard Generation
+# ============================================================
+
+REGION_NAMES = list(Provider.REGIONS)
+REGION_CODES = np.array([Provider.REGIONS[r]["code"] for r in REGION_NAMES], dtype=object)
+REGION_CENTERS = np.array([Provider.REGIONS[r]["center"] for r in REGION_NAMES])
+PERSONA_NAMES = list(PERSONA_WEIGHTS)
+EDUCATION_LABELS = np.array(["primary", "secondary", "technical", "university"], dtype=object)
+FARM_TYPES = ["crop", "livestock", "orchard", "mixed"]
+HIGHLAND_REGIONS = ("Şəki-Zaqatala", "Quba-Qusar")
+
+IRRIGATION_BY_FARM_TYPE = {
+    "crop": ["pivot", "şırım", "sel"],
+    "livestock": ["yağışla"],
+    "orchard": ["damcı", "yağmurlama"],
+    "mixed": ["damcı", "yağmurlama"],
+}
+
+
+def generate_shard(config: SyntheticConfig, shard_index: int) -> dict[str, dict[str, np.ndarray]]:
+    """Generate all tables for one shard of users.
+
+    Returns:
+        {table: {column: array}} with columns in ``TABLE_COLUMNS`` order
+    """
+    rng = np.random.default_rng(np.random.SeedSequence(config.seed, spawn_key=(shard_index,)))
+    user_index = np.arange(
+        config.shard_users(shard_index).start, config.shard_users(shard_index).stop
+    )
+    n_users = len(user_index)
+
+    # ----- Users -----
+    user_region = rng.integers(0, len(REGION_NAMES), size=n_users)
+    persona = rng.choice(len(PERSONA_NAMES), size=n_users, p=list(PERSONA_WEIGHTS.values()))
+    persona_cfg = [Provider.PERSONAS[p] for p in PERSONA_NAMES]
+    years_range = np.array([c["farming_years_range"] for c in persona_cfg])
+    education_weights = np.array(
+        [[c["education_weights"][e] for e in EDUCATION_LABELS] for c in persona_cfg]
+    )
+    phones = rng.choice([50, 51, 55, 70, 77], size=n_users) * 10_000_000 + rng.integers(
+        1_000_000, 10_000_000, size=n_users
+    )
+
+    user_ids = np.array([f"syn_user_{i:07d}" for i in user_index], dtype=object)
+    users = {
+        "user_id": user_ids,
+        "full_name_masked": np.array([f"[ŞƏXS_{i:07d}]" for i in user_index], dtype=object),
+        "phone_hash": np.array(
+            [hashlib.sha256(f"+994{p}".encode()).hexdigest() for p in phones.tolist()],
+            dtype=object,
+        ),
+        "region_code": np.char.add("AZ-", REGION_CODES[user_region].astype(str)).astype(object),
+        "experience_level": np.array([c["experience_level"] for c in persona_cfg], dtype=object)[
+            persona
+        ],
+        "farming_years": rng.integers(years_range[persona, 0], years_range[persona, 1] + 1),
+        "education_level": _weighted_within(rng, persona, education_weights, EDUCATION_LABELS),
+        "language_pref": np.full(n_users, "az_AZ", dtype=object),
+        "preferred_units": rng.choice(np.array(["metric", "local"], dtype=object), size=n_users),
+        "receives_subsidies": rng.random(n_users) < 0.5,
+        "notification_pref": rng.choice(
+            np.array(["sms", "app", "both"], dtype=object), size=n_users
+        ),
+    }
+
+    # ----- Farms -----
+    farm_range = np.array([c["farm_count_range"] for c in persona_cfg])
+    farms_per_user = rng.integers(farm_range[persona, 0], farm_range[persona, 1] + 1)
+    farm_owner = np.repeat(np.arange(n_users), farms_per_user)
+    farm_ordinal = np.arange(len(farm_owner)) - np.repeat(
+        np.cumsum(farms_per_user) - farms_per_user, farms_per_user
+    )
+    n_farms = len(farm_owner)
+    farm_region = user_region[farm_owner]
+
+    farm_type = _pick_within(
+        rng, farm_region, [Provider.REGIONS[r]["farm_types"] for r in REGION_NAMES]
+    )
+    type_index = np.array([FARM_TYPES.index(t) for t in farm_type], dtype=np.int64)
+    area_ranges = np.array([Provider.FARM_AREA_RANGES[t] for t in FARM_TYPES])[type_index]
+    multipliers = np.array([Provider.PERSONA_AREA_MULTIPLIERS[p] for p in PERSONA_NAMES])
+    total_area = np.round(_uniform_ranges(rng, area_ranges) * multipliers[persona[farm_owner]], 2)
+    farm_ids = np.array(
+        [
+            f"syn_farm_{user_index[o]:07d}{chr(ord('a') + k)}"
+            for o, k in zip(farm_owner.tolist(), farm_ordinal.tolist(), strict=True)
+        ],
+        dtype=object,
+    )
+    farms = {
+        "farm_id": farm_ids,
+        "user_id": user_ids[farm_owner],
+        "farm_name": np.char.add(
+            np.char.add(rng.choice(Provider.FARM_NAME_PREFIXES, size=n_farms), " "),
+            rng.choice(Provider.FARM_NAME_SUFFIXES, size=n_farms),
+        ).astype(object),
+        "farm_type": farm_type,
+        "region": np.array(REGION_NAMES, dtype=object)[farm_region],
+        "total_area_ha": total_area,
+        "primary_activity": _pick_within(
+            rng, farm_region, [Provider.REGIONS[r]["primary_crops"] for r in REGION_NAMES]
+        ),
+        "is_primary": farm_ordinal == 0,
+        "is_active": np.ones(n_farms, dtype=bool),
+    }
+
+    # ----- Parcels (1-3 per farm, area split with jittered weights) -----
+    parcels_per_farm = np.clip((total_area // 5).astype(np.int64) + 1, 1, 3)
+    parcel_farm = np.repeat(np.arange(n_farms), parcels_per_farm)
+    parcel_ordinal = np.arange(len(parcel_farm)) - np.repeat(
+        np.cumsum(parcels_per_farm) - parcels_per_farm, parcels_per_farm
+    )
+    n_parcels = len(parcel_farm)
+    weights = rng.uniform(0.7, 1.3, size=n_parcels)
+    weights /= np.bincount(parcel_farm, weights=weights)[parcel_farm]
+    parcel_area = np.maximum(np.round(total_area[parcel_farm] * weights, 2), 0.01)
+    parcel_region = farm_region[parcel_farm]
+
+    offset_deg = PARCEL_OFFSET_KM / 111.0
+    center = REGION_CENTERS[parcel_region]
+    latitude = np.round(
+        np.clip(center[:, 0] + rng.uniform(-offset_deg, offset_deg, n_parcels), 38.0, 42.0), 6
+    )
+    longitude = np.round(
+        np.clip(center[:, 1] + rng.uniform(-offset_deg, offset_deg, n_parcels), 44.0, 51.0), 6
+    )
+    highland = np.isin(np.array(REGION_NAMES, dtype=object)[parcel_region], HIGHLAND_REGIONS)
+    elevation = np.where(highland, np.round(rng.uniform(50, 1500, n_parcels), 1), np.nan)
+
+    parcel_codes = REGION_CODES[parcel_region]
+    parcel_ids = np.array(
+        [
+            f"AZ-{code}-{fid[9:]}{k}"
+            for code, fid, k in zip(
+                parcel_codes.tolist(),
+                farm_ids[parcel_farm].tolist(),
+                parcel_ordinal.tolist(),
+                strict=True,
+            )
+        ],
+        dtype=object,
+    )
+    parcels = {
+        "parcel_id": parcel_ids,
+        "farm_id": farm_ids[parcel_farm],
+        "latitude": latitude,
+        "longitude": longitude,
+        "area_hectares": parcel_area,
+        "soil_type": rng.choice(np.array(list(Provider.SOIL_TYPES), dtype=object), n_parcels),
+        "irrigation_type": _pick_within(
+            rng,
+            type_index[parcel_farm],
+            [IRRIGATION_BY_FARM_TYPE[t] for t in FARM_TYPES],
+        ),
+        "elevation_m": elevation,
+    }
+
+    # ----- Seasons: (seasons - 1) rotation years + current declaration -----
+    n_seasons = config.seasons
+    season_parcel = np.repeat(np.arange(n_parcels), n_seasons)
+    season_year = np.tile(
+        np.arange(config.end_year - n_seasons + 1, config.end_year + 1), n_parcels
+    )
+    season_crop = _pick_within(
+        rng,
+        parcel_region[season_parcel],
+        [Provider.REGIONS[r]["primary_crops"] for r in REGION_NAMES],
+    )
+    season_sowing = sowing_dates(rng, season_crop, season_year)
+    season_yield = crop_yields(rng, season_crop)
+    current = season_year == config.end_year
+    parcel_suffix = np.array([p[3:] for p in parcel_ids.tolist()], dtype=object)
+
+    cur_parcel = season_parcel[current]
+    n_current = len(cur_parcel)
+    declarations = {
+        "declaration_id": np.array(
+            [f"DECL-{config.end_year}-{p[4:]}" for p in parcel_suffix[cur_parcel].tolist()],
+            dtype=object,
+        ),
+        "parcel_id": parcel_ids[cur_parcel],
+        "crop_type": season_crop[current],
+        "sowing_date": season_sowing[current],
+        "expected_harvest_date": season_sowing[current] + rng.integers(120, 201, size=n_current),
+        "status": np.full(n_current, "confirmed", dtype=object),
+        "expected_yield_tons": np.round(season_yield[current] * parcel_area[cur_parcel], 2),
+        "season_year": season_year[current],
+    }
+
+    hist_parcel = season_parcel[~current]
+    hist_year = season_year[~current]
+    n_hist = len(hist_parcel)
+    rotations = {
+        "log_id": np.array(
+            [
+                f"ROT-{s}-{y}"
+                for s, y in zip(
+                    parcel_suffix[hist_parcel].tolist(), hist_year.tolist(), strict=True
+                )
+            ],
+            dtype=object,
+        ),
+        "parcel_id": parcel_ids[hist_parcel],
+        "year": hist_year,
+        "crop": season_crop[~current],
+        "yield_tons_per_ha": season_yield[~current],
+        "total_yield_tons": np.round(season_yield[~current] * parcel_area[hist_parcel], 2),
+        "quality_grade": rng.choice(np.array(["A", "B", "B", "C"], dtype=object), n_hist),
+    }
+
+    # ----- NDVI: one reading every interval_days across each season -----
+    offsets = np.arange(0, SEASON_DAYS, config.interval_days)
+    reading_season = np.repeat(np.arange(len(season_parcel)), len(offsets))
+    reading_offset = np.tile(offsets, len(season_parcel))
+    reading_date = season_sowing[reading_season] + reading_offset
+
+    # A season ends when the parcel is sown again (seasons are contiguous per parcel)
+    next_sowing = np.roll(season_sowing, -1)
+    next_sowing[n_seasons - 1 :: n_seasons] = np.datetime64(config.as_of) + 1
+    keep = (reading_date <= np.datetime64(config.as_of)) & (
+        reading_date < next_sowing[reading_season]
+    )
+    reading_season, reading_offset, reading_date = (
+        reading_season[keep],
+        reading_offset[keep],
+        reading_date[keep],
+    )
+
+    peak_day, peak_ndvi = growth_params(season_crop)
+    ndvi = ndvi_values(rng, reading_offset, peak_day[reading_season], peak_ndvi[reading_season])
+    reading_parcel = season_parcel[reading_season]
+    date_keys = np.char.replace(reading_date.astype(str), "-", "")
+    n_readings = len(ndvi)
+    readings = {
+        "reading_id": np.array(
+            [
+                f"NDVI-{s}-{d}"
+                for s, d in zip(
+                    parcel_suffix[reading_parcel].tolist(), date_keys.tolist(), strict=True
+                )
+            ],
+            dtype=object,
+        ),
+        "parcel_id": parcel_ids[reading_parcel],
+        "reading_date": reading_date,
+        "ndvi_value": ndvi,
+        "health_status": classify_health_array(ndvi),
+        "cloud_cover_percent": np.round(rng.uniform(0, 30, n_readings), 1),
+        "data_source": np.full(n_readings, DATA_SOURCE, dtype=object),
+    }
+
+    return {
+        "user_profiles": users,
+        "farm_profiles": farms,
+        "parcels": parcels,
+        "sowing_declarations": declarations,
+        "crop_rotation_logs": rotations,
+        "ndvi_readings": readings,
+    }
+
+
+# ============================================================
+# Shard Writers
+# ============================================================
+
+
+def _python_column(values: np.ndarray) -> list[Any]:
+    """Convert a column to Python values (NaN → None, datetime64 → date)."""
+    if values.dtype.kind == "M":
+        return values.astype("datetime64[D]").astype(object).tolist()
+    if values.dtype.kind == "f":
+        return np.where(np.isnan(values), None, values).tolist()
+    return values.tolist()
+
+
+def shard_path(output_dir: str | Path, table: str, shard_index: int, fmt: str) -> Path:
+    """Path of one table's shard file."""
+    return Path(output_dir) / table / f"part-{shard_index:05d}.{fmt}"
+
+
+def write_table(path: Path, columns: dict[str, np.ndarray], fmt: str) -> None:
+    """Write one table shard as Parquet (pyarrow) or CSV."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if fmt == "parquet":
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError(
+                "Parquet output requires pyarrow. Install with: pip install pyarrow"
+            ) from e
+
+        table = pa.table(
+            {
+                name: pa.array(values, from_pandas=True)
+                if values.dtype != object
+                else pa.array(values.tolist())
+                for name, values in columns.items()
+            }
+        )
+        pq.write_table(table, path)
+        return
+
+    if fmt == "csv":
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(columns.keys())
+            writer.writerows(zip(*(_python_column(v) for v in columns.values()), strict=True))
+        return
+
+    raise ValueError(f"Unsupported output format: {fmt}")
+
+
+def write_shard(
+    config: SyntheticConfig,
+    shard_index: int,
+    output_dir: str | Path,
+    fmt: str = "parquet",
+) -> dict[str, int]:
+    """Generate and write one shard. Runs in a worker process.
+
+    Returns:
+        Row counts per table
+    """
+    tables = generate_shard(config, shard_index)
+    counts = {}
+    for table, columns in tables.items():
+        write_table(shard_path(output_dir, table, shard_index, fmt), columns, fmt)
+        counts[table] = len(next(iter(columns.values())))
+    return counts
+
+
+def write_manifest(
+    config: SyntheticConfig,
+    stats: GenerationStats,
+    output_dir: str | Path,
+    fmt: str,
+) -> Path:
+    """Record the config, row counts and NDVI date range next to the shards."""
+    start, end = config.ndvi_date_range
+    manifest = {
+        "config": {**asdict(config), "as_of": config.as_of.isoformat()},
+        "format": fmt,
+        "stats": stats.to_dict(),
+        "ndvi_date_range": [start.isoformat(), end.isoformat()],
+    }
+    path = Path(output_dir) / MANIFEST_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return path
+
+
+def generate_dataset(
+    config: SyntheticConfig,
+    output_dir: str | Path,
+    fmt: str = "parquet",
+    workers: int | None = None,
+) -> GenerationStats:
+    """Generate every shard in parallel worker processes.
+
+    Args:
+        config: Dataset size and shape
+        output_dir: Root directory for per-table shard files
+        fmt: "parquet" or "csv"
+        workers: Worker processes (defaults to CPU count, 1 = in-process)
+
+    Returns:
+        Generation statistics
+    """
+    stats = GenerationStats(shards=config.shard_count)
+    started = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+
+    logger.info(
+        "synthetic_generation_started",
+        users=config.users,
+        shards=config.shard_count,
+        workers=workers,
+        fmt=fmt,
+    )
+
+    if workers == 1 or config.shard_count == 1:
+        results = [write_shard(config, i, output_dir, fmt) for i in range(config.shard_count)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(write_shard, config, i, output_dir, fmt)
+                for i in range(config.shard_count)
+            ]
+            results = [f.result() for f in futures]
+
+    for counts in results:
+        for table, count in counts.items():
+            stats.rows[table] += count
+
+    stats.elapsed_seconds = time.perf_counter() - started
+    write_manifest(config, stats, output_dir, fmt)
+    logger.info("synthetic_generation_complete", **stats.to_dict())
+    return stats
+
+
+# ============================================================
+# COPY Loader
+# ============================================================
+
+
+def _iter_parquet_records(path: Path, batch_size: int):
+    import pyarrow.parquet as pq
+
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size):
+        columns = [column.to_pylist() for column in batch.columns]
+        yield list(zip(*columns, strict=True))
+
+
+async def _copy_file(pg: Any, table: str, path: Path, batch_size: int) -> int:
+    """COPY one shard file into a table."""
+    columns = list(TABLE_COLUMNS[table])
+    if path.suffix == ".csv":
+        # Server-side CSV parsing; empty unquoted fields load as NULL
+        status = await pg.copy_to_table(
+            table, source=path, columns=columns, format="csv", header=True
+        )
+        return int(status.rsplit(" ", 1)[-1])
+
+    rows = 0
+    for records in _iter_parquet_records(path, batch_size):
+        await pg.copy_records_to_table(table, records=records, columns=columns)
+        rows += len(records)
+    return rows
+
+
+async def load_dataset(
+    output_dir: str | Path,
+    engine: AsyncEngine | None = None,
+    concurrency: int = 4,
+    batch_size: int = 50_000,
+) -> dict[str, int]:
+    """Bulk-load generated shards with COPY, table by table in FK order.
+
+    Shards of the same table load concurrently on separate connections.
+    ``ndvi_readings`` goes through ``NDVIIngestor`` (partition-aware upsert).
+    The other tables are plain COPY, so load into an empty database.
+
+    Returns:
+        Rows loaded per table
+    """
+    from alim.data.ndvi_ingestion import NDVIIngestor
+
+    if engine is None:
+        from alim.data.database import engine as default_engine
+
+        engine = default_engine
+
+    if engine.dialect.name != "postgresql":
+        raise ValueError("Synthetic bulk load requires PostgreSQL (asyncpg COPY)")
+
+    semaphore = asyncio.Semaphore(concurrency)
+    loaded: dict[str, int] = {}
+
+    async def copy_shard(table: str, path: Path) -> int:
+        async with semaphore, engine.connect() as conn:
+            raw = await conn.get_raw_connection()
+            pg = raw.driver_connection
+            async with pg.transaction():
+                return await _copy_file(pg, table, path, batch_size)
+
+    async def ingest_ndvi(path: Path) -> int:
+        async with semaphore:
+            ingestor = NDVIIngestor(engine, batch_size=batch_size, data_source=DATA_SOURCE)
+            return (await ingestor.ingest_file(path)).rows_written
+
+    for table in TABLE_COLUMNS:
+        paths = sorted(
+            p for p in (Path(output_dir) / table).glob("part-*") if p.suffix in (".csv", ".parquet")
+        )
+        if not paths:
+            continue
+
+        started = time.perf_counter()
+        if table == "ndvi_readings":
+            # Create every month up front so concurrent shards never race
+            # to create the same partition
+            manifest_path = Path(output_dir) / MANIFEST_FILE
+            if manifest_path.exists():
+                first, last = json.loads(manifest_path.read_text(encoding="utf-8"))[
+                    "ndvi_date_range"
+                ]
+                await NDVIIngestor(engine).ensure_partitions(
+                    date.fromisoformat(first), date.fromisoformat(last)
+                )
+                counts = await asyncio.gather(*(ingest_ndvi(p) for p in paths))
+            else:
+                counts = [await ingest_ndvi(p) for p in paths]
+        else:
+            counts = await asyncio.gather(*(copy_shard(table, p) for p in paths))
+
+        loaded[table] = sum(counts)
+        elapsed = time.perf_counter() - started
+        logger.info(
+            "synthetic_table_loaded",
+            table=table,
+            rows=loaded[table],
+            files=len(paths),
+            rows_per_sec=round(loaded[table] / elapsed, 1) if elapsed > 0 else None,
+        )
+
+    return loaded
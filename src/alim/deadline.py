@@ -0,0 +1,201 @@
+# src/ALİM/deadline.py
+"""Per-turn deadline propagation.
+
+Each agent turn has one deadline, shared by every node, MCP call and LLM
+call in it:
+
+- The API route puts it in ``RunnableConfig["metadata"]["deadline"]``
+  (unix time, so it survives the hop to the LangGraph server)
+- ``setup_node`` stamps it into state as ``turn_deadline``, defaulting to
+  ``settings.turn_budget_seconds`` for callers that did not set one
+- While a node runs, :func:`budgeted` exposes it through a context
+  variable, so MCP and LLM clients size their timeouts with
+  :func:`timeout_for` without threading it through every signature
+
+Example:
+    ```python
+    config = with_deadline({"metadata": {"model": model}}, budget_seconds=15)
+    await graph.ainvoke(state, config=config)
+
+    # deep inside a node
+    response = await client.post(url, timeout=timeout_for(2.0))
+    ```
+"""
+
+import inspect
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, get_type_hints
+
+import structlog
+from langchain_core.runnables import RunnableConfig
+from typing_extensions import TypedDict, is_typeddict
+
+from alim.config import settings
+
+logger = structlog.get_logger(__name__)
+
+# Key in RunnableConfig["metadata"]
+DEADLINE_KEY = "deadline"
+
+# Timeouts never drop below this, so an exhausted budget fails fast
+# instead of passing zero/negative timeouts to httpx or asyncio
+MIN_TIMEOUT_SECONDS = 0.05
+
+_deadline: ContextVar[float | None] = ContextVar("turn_deadline", default=None)
+
+
+# ============================================================
+# Config & State
+# ============================================================
+
+
+def with_deadline(config: dict | None = None, budget_seconds: float | None = None) -> dict:
+    """Return a copy of ``config`` carrying a turn deadline.
+
+    An existing deadline is kept (the outermost caller's budget wins).
+
+    Args:
+        config: RunnableConfig dict (may be None)
+        budget_seconds: Budget from now (default: settings.turn_budget_seconds)
+    """
+    config = dict(config or {})
+    metadata = dict(config.get("metadata") or {})
+    if metadata.get(DEADLINE_KEY) is None:
+        budget = budget_seconds if budget_seconds is not None else settings.turn_budget_seconds
+        metadata[DEADLINE_KEY] = time.time() + budget
+    config["metadata"] = metadata
+    return config
+
+
+def deadline_from_config(config: RunnableConfig | dict | None) -> float | None:
+    """Deadline carried in a RunnableConfig, if any."""
+    metadata = (config or {}).get("metadata") or {}
+    deadline = metadata.get(DEADLINE_KEY) if isinstance(metadata, dict) else None
+    return float(deadline) if deadline is not None else None
+
+
+def turn_deadline(state: dict, config: RunnableConfig | dict | None = None) -> float | None:
+    """Deadline for the current turn: from config, else from state."""
+    return deadline_from_config(config) or state.get("turn_deadline")
+
+
+# ============================================================
+# Budget Queries
+# ============================================================
+
+
+@contextmanager
+def deadline_scope(deadline: float | None) -> Iterator[None]:
+    """Make ``deadline`` visible to :func:`timeout_for` inside the block."""
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def current_deadline() -> float | None:
+    """Deadline of the enclosing :func:`deadline_scope`, if any."""
+    return _deadline.get()
+
+
+def remaining(deadline: float | None = None) -> float | None:
+    """Seconds left before ``deadline`` (default: the current scope's).
+
+    Returns None when there is no deadline; negative once it has passed.
+    """
+    deadline = deadline if deadline is not None else _deadline.get()
+    return None if deadline is None else deadline - time.time()
+
+
+def timeout_for(default: float, reserve: float = 0.0) -> float:
+    """Timeout for a downstream call: ``default``, capped by the budget.
+
+    Args:
+        default: The call's own timeout in seconds
+        reserve: Seconds to leave for work after this call (e.g. the answer)
+    """
+    left = remaining()
+    if left is None:
+        return default
+    return min(default, max(left - reserve, MIN_TIMEOUT_SECONDS))
+
+
+def has_budget(seconds: float, deadline: float | None = None) -> bool:
+    """True if at least ``seconds`` are left (always True without a deadline)."""
+    left = remaining(deadline)
+    return left is None or left >= seconds
+
+
+# ============================================================
+# Node Instrumentation
+# ============================================================
+
+
+def _node_hints(node: Callable[..., Any]) -> dict[str, Any]:
+    """Type hints for the wrapper: the node's input schema plus turn_deadline.
+
+    LangGraph reads a node's input schema from its first parameter's
+    annotation and passes it only those keys. The wrapper keeps that
+    schema, adding ``turn_deadline`` so the state fallback still works.
+    """
+    try:
+        hints = get_type_hints(node, include_extras=True)
+        first = next(iter(inspect.signature(node).parameters), None)
+    except (NameError, TypeError, ValueError):
+        return {"state": dict}
+
+    schema = hints.get(first, dict)
+    if is_typeddict(schema) and "turn_deadline" not in get_type_hints(schema):
+        fields = {**get_type_hints(schema, include_extras=True), "turn_deadline": float | None}
+        schema = TypedDict(schema.__name__, fields, total=False)  # type: ignore[operator]
+
+    result = {"state": schema, "config": RunnableConfig}
+    if "return" in hints:
+        result["return"] = hints["return"]
+    return result
+
+
+def budgeted(name: str, node: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a graph node to run inside the turn's deadline scope.
+
+    The wrapper records how much of the budget the node used as one
+    ``budget_log`` entry in the node's state updates. It carries the node's
+    input and output annotations, so LangGraph still applies them.
+    """
+    accepts_config = "config" in inspect.signature(node).parameters
+
+    async def run(state: dict, config: RunnableConfig) -> Any:
+        deadline = turn_deadline(state, config)
+        start = time.monotonic()
+
+        with deadline_scope(deadline):
+            result = node(state, config) if accepts_config else node(state)
+            if inspect.isawaitable(result):
+                result = await result
+
+        if not isinstance(result, dict):
+            return result
+
+        # setup_node starts the turn, so its deadline replaces the old one
+        deadline = result.get("turn_deadline", deadline)
+        left = remaining(deadline) if deadline is not None else None
+        entry = {
+            "node": name,
+            "elapsed_ms": round((time.monotonic() - start) * 1000, 1),
+            "remaining_ms": round(left * 1000, 1) if left is not None else None,
+            "deadline": deadline,
+        }
+        if left is not None and left < 0:
+            logger.warning("turn_deadline_exceeded", **entry)
+        else:
+            logger.debug("node_budget", **entry)
+        return {**result, "budget_log": [entry]}
+
+    run.__name__ = getattr(node, "__name__", name)
+    run.__doc__ = node.__doc__
+    run.__annotations__ = _node_hints(node)
+    return run
@@ -13,6 +13,7 @@ from collections.abc import AsyncIterator
 
 import httpx
 
+from alim.deadline import timeout_for
 from alim.llm.http_pool import HTTPClientPool
 
 from .base import LLMMessage, LLMProvider, LLMResponse
@@ -155,7 +156,9 @@ class GroqProvider(LLMProvider):
             "max_tokens": max_tokens,
         }
 
-        response = await client.post("/chat/completions", json=payload)
+        response = await client.post(
+            "/chat/completions", json=payload, timeout=timeout_for(self.timeout)
+        )
         response.raise_for_status()
 
         data = response.json()
@@ -212,7 +215,9 @@ class GroqProvider(LLMProvider):
         in_thinking_block = False
         buffer = ""
 
-        async with client.stream("POST", "/chat/completions", json=payload) as response:
+        async with client.stream(
+            "POST", "/chat/completions", json=payload, timeout=timeout_for(self.timeout)
+        ) as response:
             response.raise_for_status()
             async for line in response.aiter_lines():
                 if line.startswith("data: "):
@@ -10,6 +10,7 @@ from collections.abc import AsyncIterator
 
 import httpx
 
+from alim.deadline import timeout_for
 from alim.llm.http_pool import HTTPClientPool
 from alim.observability.banner import print_connection_failure
 
@@ -111,7 +112,9 @@ class OllamaProvider(LLMProvider):
         }
 
         try:
-            response = await client.post("/api/chat", json=payload)
+            response = await client.post(
+                "/api/chat", json=payload, timeout=timeout_for(self.timeout)
+            )
             response.raise_for_status()
         except httpx.ConnectError as e:
             print_connection_failure("Ollama", str(e))
@@ -163,7 +166,9 @@ class OllamaProvider(LLMProvider):
         }
 
         try:
-            async with client.stream("POST", "/api/chat", json=payload) as response:
+            async with client.stream(
+                "POST", "/api/chat", json=payload, timeout=timeout_for(self.timeout)
+            ) as response:
                 response.raise_for_status()
                 async for line in response.aiter_lines():
                     if line:
@@ -9,6 +9,7 @@ from collections.abc import AsyncIterator
 import httpx
 
 from alim.config import settings
+from alim.deadline import timeout_for
 from alim.llm.http_pool import HTTPClientPool
 
 from .base import LLMMessage, LLMProvider, LLMResponse
@@ -68,6 +69,7 @@ class VLLMProvider(LLMProvider):
         resp = await client.post(
             "/chat/completions" if not self.base_url.endswith("/v1") else "/v1/chat/completions",
             json=payload,
+            timeout=timeout_for(self.timeout),
         )
         resp.raise_for_status()
         data = resp.json()
@@ -101,7 +103,7 @@ class VLLMProvider(LLMProvider):
             "stream": True,
         }
         url = "/chat/completions" if not self.base_url.endswith("/v1") else "/v1/chat/completions"
-        async with client.stream("POST", url, json=payload) as r:
+        async with client.stream("POST", url, json=payload, timeout=timeout_for(self.timeout)) as r:
             r.raise_for_status()
             async for line in r.aiter_lines():
                 if not line:
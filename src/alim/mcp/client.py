@@ -6,15 +6,16 @@ This is the main entry point for LangGraph nodes to call external MCP servers.
 Architecture:
 --------------
 MCPClient (singleton)
-    ├─► HTTPClient (httpx.AsyncClient for network calls)
-    ├─► Tool Cache (recent tool calls for deduplication)
-    └─► Metrics (latency, success rate for Langfuse)
+    ├─► HTTPClient (pooled keep-alive httpx.AsyncClient, see alim.mcp.pool)
+    ├─► Tool Cache (results of calls with cache_seconds > 0, see ToolResultCache)
+    └─► Metrics (latency, success rate, cache status for Langfuse)
 
 Design Patterns:
 1. Singleton Pattern: One MCPClient instance per server
 2. Factory Pattern: get_mcp_client() returns configured instance
 3. Decorator Pattern: Logging/metrics wrapped around actual calls
-4. Timeout Pattern: All calls have configurable timeouts
+4. Timeout Pattern: All calls have configurable timeouts, capped by the turn deadline
+5. Bulkhead Pattern: Per-server concurrency limit (MCPServerConfig.max_concurrency)
 
 Testing:
 -------
@@ -25,15 +26,23 @@ See: tests/unit/test_mcp_client.py
 See: tests/integration/test_mcp_integration.py (todo)
 """
 
+import asyncio
+import copy
 import inspect
-from dataclasses import dataclass
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
 from typing import Any
 
 import httpx
 import structlog
 
+from alim.deadline import timeout_for
 from alim.mcp.config import get_server_config
+from alim.mcp.pool import MCPConnectionPool
 
 logger = structlog.get_logger(__name__)
 
@@ -54,6 +63,10 @@ class MCPCallResult:
     server: str = ""
     tool_name: str = ""
     timestamp: datetime = None
+    # Set when the call went through the tool cache:
+    # "hit", "stale", "negative", "coalesced" or "miss"
+    cache_status: str | None = None
+    cache_age_ms: float | None = None
 
     def __post_init__(self):
         """Initialize timestamp if not provided."""
@@ -69,6 +82,11 @@ class MCPCallResult:
             "mcp_latency_ms": self.latency_ms,
             "mcp_timestamp": self.timestamp.isoformat(),
             **({"mcp_error": self.error} if self.error else {}),
+            **(
+                {"mcp_cache": self.cache_status, "mcp_cache_age_ms": self.cache_age_ms}
+                if self.cache_status
+                else {}
+            ),
         }
 
 
@@ -80,6 +98,147 @@ class MCPToolCall:
     tool: str  # Tool name on the server
     args: dict[str, Any]  # Arguments to pass
     cache_seconds: int = 0  # 0 = no caching
+    # Past cache_seconds, serve the old result for this long while one
+    # background call refreshes it (None = cache_seconds)
+    stale_seconds: int | None = None
+
+
+# ============================================================
+# Tool Result Cache
+# ============================================================
+
+
+ToolFetch = Callable[[], Awaitable[MCPCallResult]]
+
+
+@dataclass
+class _CacheEntry:
+    result: MCPCallResult
+    stored_at: float
+    fresh_until: float
+    stale_until: float
+
+
+class ToolResultCache:
+    """LRU of tool results keyed by (server, tool, canonical args).
+
+    - Fresh results are returned without a network call.
+    - Stale results (within ``stale_seconds``) are returned immediately
+      while a single background call revalidates them.
+    - Failures are cached for at most ``negative_seconds`` so a failing
+      server is not hammered; a failed revalidation keeps the stale result.
+    - Concurrent misses for one key share one in-flight call.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        negative_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Results kept (least recently used are evicted)
+            negative_seconds: Upper bound on how long failures are cached
+            clock: Monotonic time source (seconds)
+        """
+        self.maxsize = maxsize
+        self.negative_seconds = negative_seconds
+        self.clock = clock
+        self.stats = dict.fromkeys(("hit", "stale", "negative", "coalesced", "miss"), 0)
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    @staticmethod
+    def key(call: MCPToolCall) -> str:
+        """Canonical key: argument order does not matter."""
+        args = json.dumps(call.args, sort_keys=True, separators=(",", ":"), default=str)
+        return f"{call.server}:{call.tool}:{args}"
+
+    async def get_or_call(self, call: MCPToolCall, fetch: ToolFetch) -> MCPCallResult:
+        """Return a cached result for ``call`` or await ``fetch()`` once."""
+        key = self.key(call)
+        now = self.clock()
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            self._entries.move_to_end(key)
+            if now < entry.fresh_until:
+                status = "hit" if entry.result.success else "negative"
+                return self._served(entry, status, now)
+            if now < entry.stale_until:
+                self._start(key, call, fetch)
+                return self._served(entry, "stale", now)
+            del self._entries[key]
+
+        if key in self._inflight:
+            self.stats["coalesced"] += 1
+            result = await asyncio.shield(self._inflight[key])
+            return replace(result, data=copy.deepcopy(result.data), cache_status="coalesced")
+
+        result = await asyncio.shield(self._start(key, call, fetch))
+        self.stats["miss"] += 1
+        return replace(result, data=copy.deepcopy(result.data), cache_status="miss")
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
+
+    def info(self) -> dict[str, int]:
+        """Counters plus current size."""
+        return {**self.stats, "size": len(self._entries), "maxsize": self.maxsize}
+
+    def _served(self, entry: _CacheEntry, status: str, now: float) -> MCPCallResult:
+        self.stats[status] += 1
+        return replace(
+            entry.result,
+            data=copy.deepcopy(entry.result.data),
+            latency_ms=0.0,
+            cache_status=status,
+            cache_age_ms=(now - entry.stored_at) * 1000,
+        )
+
+    def _start(self, key: str, call: MCPToolCall, fetch: ToolFetch) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._refresh(key, call, fetch))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finished(key, done))
+        return task
+
+    def _finished(self, key: str, task: asyncio.Task) -> None:
+        self._inflight.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            # Background revalidations have no awaiting caller to report to
+            logger.error("mcp_cache_refresh_error", key=key, error=str(task.exception()))
+
+    async def _refresh(self, key: str, call: MCPToolCall, fetch: ToolFetch) -> MCPCallResult:
+        result = await fetch()
+        now = self.clock()
+        if result.success:
+            stale_seconds = call.cache_seconds if call.stale_seconds is None else call.stale_seconds
+            self._store(
+                key,
+                _CacheEntry(
+                    result=result,
+                    stored_at=now,
+                    fresh_until=now + call.cache_seconds,
+                    stale_until=now + call.cache_seconds + stale_seconds,
+                ),
+            )
+        else:
+            current = self._entries.get(key)
+            if current is None or not current.result.success or now >= current.stale_until:
+                ttl = min(self.negative_seconds, call.cache_seconds)
+                self._store(key, _CacheEntry(result, now, now + ttl, now + ttl))
+        return result
+
+    def _store(self, key: str, entry: _CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
 
 
 # ============================================================
@@ -119,17 +278,33 @@ class MCPClient:
             self.enabled = self.config.enabled
 
         self._http_client: httpx.AsyncClient | None = None
+        self.cache = ToolResultCache()
+
+    async def open(self) -> "MCPClient":
+        """Attach to the server's persistent connection pool.
+
+        Idempotent; ``call_tool`` also opens lazily on first use.
+        """
+        if self.config and self.config.enabled and self._http_client is None:
+            self._http_client = MCPConnectionPool.client(self.server_name, self.config)
+        return self
+
+    async def close(self) -> None:
+        """Close the server's connection pool."""
+        self._http_client = None
+        await MCPConnectionPool.close(self.server_name)
 
     async def __aenter__(self):
         """Context manager entry."""
-        if self.enabled and self.config:
-            self._http_client = httpx.AsyncClient(timeout=self.config.timeout_ms / 1000.0)
-        return self
+        return await self.open()
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
-        if self._http_client:
-            await self._http_client.aclose()
+        """Context manager exit.
+
+        Connections stay pooled for other users of the server; they are
+        closed by ``close_all_mcp_clients()`` at shutdown.
+        """
+        self._http_client = None
 
     async def call_tool(self, call: MCPToolCall) -> MCPCallResult:
         """Call a tool on the MCP server.
@@ -137,6 +312,9 @@ class MCPClient:
         Args:
             call: MCPToolCall with server, tool name, and args
 
+        Calls with ``cache_seconds > 0`` go through the client's
+        :class:`ToolResultCache` (see ``MCPCallResult.cache_status``).
+
         Returns:
             MCPCallResult with success/data/error/latency
 
@@ -153,6 +331,7 @@ class MCPClient:
                 tool_name=call.tool,
             )
 
+        await self.open()
         if not self._http_client:
             return MCPCallResult(
                 success=False,
@@ -161,6 +340,12 @@ class MCPClient:
                 tool_name=call.tool,
             )
 
+        if call.cache_seconds > 0:
+            return await self.cache.get_or_call(call, lambda: self._call_remote(call))
+        return await self._call_remote(call)
+
+    async def _call_remote(self, call: MCPToolCall) -> MCPCallResult:
+        """Make the HTTP call (no caching); errors become failed results."""
         start_time = datetime.now(UTC)
 
         try:
@@ -171,12 +356,17 @@ class MCPClient:
                 args_keys=list(call.args.keys()),
             )
 
-            # Make the request
-            response = await self._http_client.post(
-                f"{self.config.url}/tools/{call.tool}",
-                json={"args": call.args},
-                headers=self._build_headers(),
-            )
+            # Make the request (waits for a slot if the server is at its limit)
+            async with MCPConnectionPool.slot(
+                self.server_name, self.config, self._http_client
+            ) as http_client:
+                response = await http_client.post(
+                    f"{self.config.url}/tools/{call.tool}",
+                    json={"args": call.args},
+                    headers=self._build_headers(),
+                    # Shrinks to the turn's remaining budget (see alim.deadline)
+                    timeout=timeout_for(self.config.timeout_ms / 1000.0),
+                )
 
             latency_ms = (datetime.now(UTC) - start_time).total_seconds() * 1000
 
@@ -303,22 +493,42 @@ async def get_mcp_client(server_name: str = "zekalab") -> MCPClient:
     """
     if server_name not in _clients:
         _clients[server_name] = MCPClient(server_name)
-        await _clients[server_name].__aenter__()
+        await _clients[server_name].open()
         logger.info("mcp_client_created", server=server_name)
 
     return _clients[server_name]
 
 
+async def open_mcp_clients(
+    servers: tuple[str, ...] = ("openweather", "zekalab", "ektis", "cbar"),
+) -> list[str]:
+    """Create clients and connection pools for the enabled servers.
+
+    Call this during application startup so the first request does not
+    pay for pool creation.
+
+    Returns:
+        Names of the servers that were opened
+    """
+    opened = []
+    for server_name in servers:
+        if get_server_config(server_name) is not None:
+            await get_mcp_client(server_name)
+            opened.append(server_name)
+    return opened
+
+
 async def close_all_mcp_clients():
-    """Close all MCP clients.
+    """Close all MCP clients and their connection pools.
 
     Call this during application shutdown.
     """
     for server_name, client in _clients.items():
         try:
-            await client.__aexit__(None, None, None)
+            await client.close()
             logger.info("mcp_client_closed", server=server_name)
         except Exception as e:
             logger.error("mcp_client_close_error", server=server_name, error=str(e))
 
     _clients.clear()
+    await MCPConnectionPool.close_all()
@@ -46,6 +46,12 @@ class MCPServerConfig(BaseModel):
     timeout_ms: int = Field(default=2000, description="Request timeout in milliseconds")
     retries: int = Field(default=3, description="Number of retries on failure")
     retry_backoff_ms: int = Field(default=100, description="Backoff between retries")
+    max_connections: int = Field(default=20, description="Pooled connections to the server")
+    max_keepalive_connections: int = Field(
+        default=10, description="Idle connections kept open for reuse"
+    )
+    keepalive_expiry_s: float = Field(default=30.0, description="Idle connection lifetime")
+    max_concurrency: int = Field(default=10, description="Requests in flight at once")
 
 
 class MCPSettings(BaseSettings):
@@ -62,6 +68,14 @@ class MCPSettings(BaseSettings):
         default=True,
         description="Log all MCP calls to structlog",
     )
+    mcp_pool_max_connections: int = Field(
+        default=20,
+        description="Pooled HTTP connections per MCP server",
+    )
+    mcp_keepalive_expiry_seconds: float = Field(
+        default=30.0,
+        description="Seconds an idle pooled MCP connection is kept open",
+    )
 
     # Weather MCP
     openweather_mcp_enabled: bool = Field(
@@ -80,6 +94,10 @@ class MCPSettings(BaseSettings):
         default=500,
         description="OpenWeather timeout in milliseconds",
     )
+    openweather_max_concurrency: int = Field(
+        default=8,
+        description="Max concurrent requests to OpenWeather MCP",
+    )
 
     # ZekaLab Internal MCP (Rules Engine)
     zekalab_mcp_enabled: bool = Field(
@@ -98,6 +116,10 @@ class MCPSettings(BaseSettings):
         default=2000,
         description="ZekaLab timeout in milliseconds",
     )
+    zekalab_max_concurrency: int = Field(
+        default=16,
+        description="Max concurrent requests to ZekaLab MCP",
+    )
 
     # Python Visualization MCP
     python_viz_mcp_enabled: bool = Field(
@@ -201,6 +223,14 @@ def validate_mcp_config() -> dict[str, str]:
     return status
 
 
+def _pool_config() -> dict:
+    """Connection pool fields shared by every server config."""
+    return {
+        "max_connections": mcp_settings.mcp_pool_max_connections,
+        "keepalive_expiry_s": mcp_settings.mcp_keepalive_expiry_seconds,
+    }
+
+
 def get_server_config(server_name: str) -> MCPServerConfig | None:
     """Get configuration for a specific MCP server.
 
@@ -217,6 +247,8 @@ def get_server_config(server_name: str) -> MCPServerConfig | None:
                 url=mcp_settings.openweather_mcp_url,
                 api_key=mcp_settings.openweather_api_key,
                 timeout_ms=mcp_settings.openweather_timeout_ms,
+                max_concurrency=mcp_settings.openweather_max_concurrency,
+                **_pool_config(),
             )
         return None
 
@@ -227,6 +259,8 @@ def get_server_config(server_name: str) -> MCPServerConfig | None:
                 url=mcp_settings.zekalab_mcp_url,
                 secret=mcp_settings.zekalab_mcp_secret,
                 timeout_ms=mcp_settings.zekalab_timeout_ms,
+                max_concurrency=mcp_settings.zekalab_max_concurrency,
+                **_pool_config(),
             )
         return None
 
@@ -237,6 +271,7 @@ def get_server_config(server_name: str) -> MCPServerConfig | None:
                 url=mcp_settings.ektis_mcp_url,
                 api_key=mcp_settings.ektis_api_key,
                 timeout_ms=2000,
+                **_pool_config(),
             )
         return None
 
@@ -247,6 +282,7 @@ def get_server_config(server_name: str) -> MCPServerConfig | None:
                 url=mcp_settings.cbar_mcp_url,
                 api_key=mcp_settings.cbar_api_key,
                 timeout_ms=2000,
+                **_pool_config(),
             )
         return None
 
@@ -5,10 +5,18 @@ handling retries, caching, logging, and graceful degradation.
 
 Handlers:
 - WeatherMCPHandler: Weather forecasting (external API)
+- WeatherCache: Geo-tiled forecast cache shared by weather handlers
 - ZekaLabMCPHandler: Agricultural rules engine (internal service)
 """
 
+from alim.mcp.handlers.weather_cache import WeatherCache, get_weather_cache
 from alim.mcp.handlers.weather_handler import WeatherMCPHandler
 from alim.mcp.handlers.zekalab_handler import ZekaLabMCPHandler, get_zekalab_handler
 
-__all__ = ["WeatherMCPHandler", "ZekaLabMCPHandler", "get_zekalab_handler"]
+__all__ = [
+    "WeatherCache",
+    "WeatherMCPHandler",
+    "ZekaLabMCPHandler",
+    "get_weather_cache",
+    "get_zekalab_handler",
+]
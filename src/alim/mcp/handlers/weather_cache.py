@@ -0,0 +1,271 @@
+"""Geo-tiled weather forecast cache.
+
+Neighbouring farms get the same forecast, so forecasts are cached per
+lat/lon tile and horizon instead of per farm:
+
+- In-process LRU (per worker) in front of Redis (shared by workers)
+- TTL by horizon: current conditions refresh faster than daily forecasts
+- Single-flight: concurrent requests for one tile share one provider call
+- Farm coordinates are cached too, so a forecast does not need a DB session
+
+Redis is optional at runtime: when it is unreachable the cache keeps
+working in-process and retries Redis after a cooldown.
+"""
+
+import asyncio
+import copy
+import json
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import structlog
+
+from alim.config import settings
+
+logger = structlog.get_logger(__name__)
+
+# Seconds to skip Redis after a connection/command failure
+REDIS_RETRY_SECONDS = 30.0
+
+
+class WeatherCache:
+    """Two-tier (process + Redis) cache with per-key request coalescing.
+
+    Example:
+        ```python
+        cache = get_weather_cache()
+        forecast, status = await cache.forecast(40.41, 49.87, 7, fetch)
+        # fetch(lat, lon) is only awaited on a miss, with the tile centre
+        ```
+    """
+
+    FORECAST_KEY = "weather:forecast:{tile}:{lat_idx}:{lon_idx}:{days}"
+    COORDINATES_KEY = "weather:farm_coords:{farm_id}"
+
+    def __init__(
+        self,
+        tile_degrees: float | None = None,
+        maxsize: int | None = None,
+        redis_enabled: bool = True,
+    ):
+        """Initialize the cache.
+
+        Args:
+            tile_degrees: Tile edge in degrees (default from settings;
+                0.1° is roughly 11 km, finer than forecast grid cells)
+            maxsize: In-process entries kept (LRU)
+            redis_enabled: Also share entries through Redis
+        """
+        self.tile_degrees = tile_degrees or settings.weather_tile_degrees
+        self.maxsize = maxsize or settings.weather_cache_size
+        self.redis_enabled = redis_enabled
+        self._local: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._redis_retry_at = 0.0
+        self.stats = {"memory": 0, "redis": 0, "coalesced": 0, "miss": 0}
+
+    # ====================================================================
+    # Keys & TTLs
+    # ====================================================================
+
+    def tile(self, lat: float, lon: float) -> tuple[int, int]:
+        """Tile indices containing a coordinate."""
+        return math.floor(lat / self.tile_degrees), math.floor(lon / self.tile_degrees)
+
+    def tile_center(self, lat: float, lon: float) -> tuple[float, float]:
+        """Coordinate forecasts for a tile are fetched at."""
+        lat_idx, lon_idx = self.tile(lat, lon)
+        return (
+            round((lat_idx + 0.5) * self.tile_degrees, 4),
+            round((lon_idx + 0.5) * self.tile_degrees, 4),
+        )
+
+    def forecast_key(self, lat: float, lon: float, days_ahead: int) -> str:
+        lat_idx, lon_idx = self.tile(lat, lon)
+        return self.FORECAST_KEY.format(
+            tile=self.tile_degrees, lat_idx=lat_idx, lon_idx=lon_idx, days=days_ahead
+        )
+
+    @staticmethod
+    def forecast_ttl(days_ahead: int) -> int:
+        """Seconds a forecast stays fresh.
+
+        OpenWeather refreshes current conditions about every 10 minutes
+        but daily forecasts only with each model run, so longer horizons
+        can be cached longer.
+        """
+        if days_ahead <= 0:
+            return settings.weather_cache_ttl_current_seconds
+        return settings.weather_cache_ttl_forecast_seconds
+
+    # ====================================================================
+    # Public API
+    # ====================================================================
+
+    async def forecast(
+        self,
+        lat: float,
+        lon: float,
+        days_ahead: int,
+        fetch: Callable[[float, float], Awaitable[dict[str, Any]]],
+    ) -> tuple[dict[str, Any], str]:
+        """Get the forecast for the tile containing (lat, lon).
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+            days_ahead: Forecast horizon (part of the key)
+            fetch: Provider call, awaited on a miss with the tile centre
+
+        Returns:
+            (forecast copy, status) where status is "memory", "redis",
+            "coalesced" or "miss"
+
+        Raises:
+            Whatever ``fetch`` raises; failures are not cached
+        """
+        center = self.tile_center(lat, lon)
+        return await self._get_or_load(
+            self.forecast_key(lat, lon, days_ahead),
+            self.forecast_ttl(days_ahead),
+            lambda: fetch(*center),
+        )
+
+    async def farm_coordinates(
+        self,
+        farm_id: str,
+        lookup: Callable[[str], Awaitable[tuple[float, float] | None]],
+    ) -> tuple[float, float] | None:
+        """Get a farm's (lat, lon), calling ``lookup`` only on a miss.
+
+        Unknown farms (lookup returns None) are not cached.
+        """
+
+        async def load() -> list[float] | None:
+            coords = await lookup(farm_id)
+            return list(coords) if coords else None
+
+        coords, _ = await self._get_or_load(
+            self.COORDINATES_KEY.format(farm_id=farm_id),
+            settings.weather_farm_coordinates_ttl_seconds,
+            load,
+        )
+        return (coords[0], coords[1]) if coords else None
+
+    def clear(self) -> None:
+        """Drop all in-process entries (Redis entries expire by TTL)."""
+        self._local.clear()
+
+    def info(self) -> dict[str, int]:
+        """Hit/miss counters and in-process size."""
+        return {**self.stats, "size": len(self._local), "maxsize": self.maxsize}
+
+    # ====================================================================
+    # Internals
+    # ====================================================================
+
+    async def _get_or_load(
+        self, key: str, ttl: int, load: Callable[[], Awaitable[Any]]
+    ) -> tuple[Any, str]:
+        value = self._get_local(key)
+        if value is not None:
+            self.stats["memory"] += 1
+            return copy.deepcopy(value), "memory"
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats["coalesced"] += 1
+            value, _ = await asyncio.shield(task)
+            return copy.deepcopy(value), "coalesced"
+
+        task = asyncio.ensure_future(self._load(key, ttl, load))
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._finished(key, done))
+        # Shielded so one cancelled caller does not cancel the shared fetch
+        value, status = await asyncio.shield(task)
+        self.stats[status] += 1
+        return copy.deepcopy(value), status
+
+    async def _load(
+        self, key: str, ttl: int, load: Callable[[], Awaitable[Any]]
+    ) -> tuple[Any, str]:
+        value, remaining = await self._get_redis(key)
+        if value is not None:
+            # Only for as long as Redis still holds it, not a fresh full TTL
+            self._set_local(key, value, min(ttl, remaining) if remaining > 0 else ttl)
+            return value, "redis"
+
+        value = await load()
+        if value is not None:
+            self._set_local(key, value, ttl)
+            await self._set_redis(key, value, ttl)
+        return value, "miss"
+
+    def _finished(self, key: str, task: asyncio.Task) -> None:
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            task.exception()  # mark retrieved even if every waiter was cancelled
+
+    def _get_local(self, key: str) -> Any:
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._local[key]
+            return None
+        self._local.move_to_end(key)
+        return value
+
+    def _set_local(self, key: str, value: Any, ttl: float) -> None:
+        self._local[key] = (time.monotonic() + ttl, value)
+        self._local.move_to_end(key)
+        while len(self._local) > self.maxsize:
+            self._local.popitem(last=False)
+
+    def _redis_available(self) -> bool:
+        return self.redis_enabled and time.monotonic() >= self._redis_retry_at
+
+    def _redis_failed(self, error: Exception) -> None:
+        self._redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+        logger.warning("weather_cache_redis_unavailable", error=str(error))
+
+    async def _get_redis(self, key: str) -> tuple[Any, float]:
+        """Value and its remaining TTL in seconds (<= 0 if none), in one round-trip."""
+        if not self._redis_available():
+            return None, 0.0
+        try:
+            from alim.data.redis_client import get_redis
+
+            async with get_redis() as redis:
+                async with redis.pipeline(transaction=False) as pipe:
+                    data, ttl_ms = await pipe.get(key).pttl(key).execute()
+            return (json.loads(data) if data else None), ttl_ms / 1000
+        except Exception as e:
+            self._redis_failed(e)
+            return None, 0.0
+
+    async def _set_redis(self, key: str, value: Any, ttl: int) -> None:
+        if not self._redis_available():
+            return
+        try:
+            from alim.data.redis_client import get_redis
+
+            async with get_redis() as redis:
+                await redis.set(key, json.dumps(value), ex=ttl)
+        except Exception as e:
+            self._redis_failed(e)
+
+
+_weather_cache: WeatherCache | None = None
+
+
+def get_weather_cache() -> WeatherCache:
+    """Get the process-wide weather cache (singleton)."""
+    global _weather_cache
+    if _weather_cache is None:
+        _weather_cache = WeatherCache()
+    return _weather_cache
@@ -7,6 +7,10 @@ Provides:
 - Growing Degree Days (GDD) calculations
 
 Phase 2 Implementation: Real weather data for ALİM decisions
+
+Forecasts and farm coordinates go through the shared geo-tiled
+WeatherCache, so neighbouring farms and concurrent turns reuse one
+provider call.
 """
 
 from dataclasses import dataclass
@@ -15,10 +19,17 @@ from typing import Any
 
 import structlog
 
-from alim.mcp.client import MCPToolCall, get_mcp_client
+from alim.mcp.client import MCPClient, MCPToolCall, get_mcp_client
+from alim.mcp.handlers.weather_cache import WeatherCache, get_weather_cache
 
 logger = structlog.get_logger(__name__)
 
+# Used when a farm has no stored coordinates
+DEFAULT_COORDINATES = (40.4093, 49.8671)  # Baku
+
+# Alerts are fetched per farm coordinate; MCPClient caches them this long
+ALERTS_CACHE_SECONDS = 300
+
 
 @dataclass
 class WeatherForecast:
@@ -56,10 +67,29 @@ class WeatherMCPHandler:
     Phase 2 Implementation: Replaces synthetic weather with real MCP data
     """
 
-    def __init__(self):
-        """Initialize handler."""
-        self.mcp_client = get_mcp_client("openweather")
-        self.cache = {}  # Simple in-memory cache (5-min TTL in production)
+    def __init__(self, cache: WeatherCache | None = None):
+        """Initialize handler.
+
+        Args:
+            cache: Forecast cache (default: the process-wide one)
+        """
+        self.mcp_client: MCPClient | None = None
+        self.cache = cache or get_weather_cache()
+
+    async def _get_client(self) -> MCPClient:
+        """Get the (shared) OpenWeather MCP client."""
+        if self.mcp_client is None:
+            self.mcp_client = await get_mcp_client("openweather")
+        return self.mcp_client
+
+    async def _resolve_coordinates(
+        self, farm_id: str, lat: float | None, lon: float | None
+    ) -> tuple[float, float]:
+        """Use the given coordinates, else the farm's (cached), else Baku."""
+        if lat and lon:
+            return lat, lon
+        coords = await self.cache.farm_coordinates(farm_id, _lookup_farm_coordinates)
+        return coords or DEFAULT_COORDINATES
 
     async def get_forecast(
         self,
@@ -107,34 +137,16 @@ class WeatherMCPHandler:
 
         logger.info("weather_forecast_request", farm_id=farm_id, days=days_ahead)
 
-        start_time = datetime.now(UTC)
-
-        try:
-            # Fetch farm coordinates from DB (if not provided)
-            if not lat or not lon:
-                from alim.data.database import get_db_session
-                from alim.data.repositories.farm_repo import FarmRepository
-
-                async with get_db_session() as session:
-                    farm_repo = FarmRepository(session)
-                    farm = await farm_repo.get_by_id(farm_id)
-                    if farm and hasattr(farm, "center_coordinates"):
-                        coords = farm.center_coordinates
-                        if isinstance(coords, dict):
-                            lat = coords.get("latitude")
-                            lon = coords.get("longitude")
-
-            # Default to Baku if no coordinates found
-            if not lat or not lon:
-                lat, lon = 40.4093, 49.8671
+        async def fetch(tile_lat: float, tile_lon: float) -> dict[str, Any]:
+            start_time = datetime.now(UTC)
 
             # Prepare MCP tool call
             call = MCPToolCall(
                 server="openweather",
                 tool="get_forecast",
                 args={
-                    "latitude": lat,
-                    "longitude": lon,
+                    "latitude": tile_lat,
+                    "longitude": tile_lon,
                     "days_ahead": days_ahead,
                     "units": "metric",
                     "include_gdd": True,  # Growing Degree Days
@@ -143,7 +155,8 @@ class WeatherMCPHandler:
             )
 
             # Call OpenWeather MCP
-            result = await self.mcp_client.call_tool(call)
+            client = await self._get_client()
+            result = await client.call_tool(call)
 
             duration_ms = (datetime.now(UTC) - start_time).total_seconds() * 1000
 
@@ -156,15 +169,8 @@ class WeatherMCPHandler:
                 )
                 raise Exception(f"MCP call failed: {result.error_message}")
 
-            logger.info(
-                "weather_forecast_success",
-                farm_id=farm_id,
-                duration_ms=duration_ms,
-                days=days_ahead,
-            )
-
             # Enrich response with metadata
-            forecast_data = result.data if result.data else {}
+            forecast_data = dict(result.data) if result.data else {}
             forecast_data.update(
                 {
                     "mcp_duration_ms": duration_ms,
@@ -172,6 +178,21 @@ class WeatherMCPHandler:
                     "data_source": "openweather-mcp",
                 }
             )
+            return forecast_data
+
+        try:
+            lat, lon = await self._resolve_coordinates(farm_id, lat, lon)
+
+            # Neighbouring farms share the tile's forecast (fetched at its centre)
+            forecast_data, cache_status = await self.cache.forecast(lat, lon, days_ahead, fetch)
+            forecast_data["cache"] = cache_status
+
+            logger.info(
+                "weather_forecast_success",
+                farm_id=farm_id,
+                days=days_ahead,
+                cache=cache_status,
+            )
 
             return forecast_data
 
@@ -211,23 +232,7 @@ class WeatherMCPHandler:
         logger.info("weather_alerts_request", farm_id=farm_id)
 
         try:
-            # Fetch coordinates if needed
-            if not lat or not lon:
-                from alim.data.database import get_db_session
-                from alim.data.repositories.farm_repo import FarmRepository
-
-                async with get_db_session() as session:
-                    farm_repo = FarmRepository(session)
-                    farm = await farm_repo.get_by_id(farm_id)
-                    if farm and hasattr(farm, "center_coordinates"):
-                        coords = farm.center_coordinates
-                        if isinstance(coords, dict):
-                            lat = coords.get("latitude")
-                            lon = coords.get("longitude")
-
-            # Default to Baku if no coordinates found
-            if not lat or not lon:
-                lat, lon = 40.4093, 49.8671
+            lat, lon = await self._resolve_coordinates(farm_id, lat, lon)
 
             call = MCPToolCall(
                 server="openweather",
@@ -236,9 +241,11 @@ class WeatherMCPHandler:
                     "latitude": lat,
                     "longitude": lon,
                 },
+                cache_seconds=ALERTS_CACHE_SECONDS,
             )
 
-            result = await self.mcp_client.call_tool(call)
+            client = await self._get_client()
+            result = await client.call_tool(call)
 
             if not result.success:
                 logger.warning(
@@ -308,3 +315,21 @@ class WeatherMCPHandler:
             "gdd_accumulated_month": forecast.get("gdd_accumulated_month", 0),
             "gdd_accumulated_season": forecast.get("gdd_accumulated_season", 0),
         }
+
+
+async def _lookup_farm_coordinates(farm_id: str) -> tuple[float, float] | None:
+    """Read a farm's centre coordinates from the database."""
+    from alim.data.database import get_db_read_session
+    from alim.data.repositories.farm_repo import FarmRepository
+
+    async with get_db_read_session() as session:
+        farm_repo = FarmRepository(session)
+        farm = await farm_repo.get_by_id(farm_id)
+        if farm and hasattr(farm, "center_coordinates"):
+            coords = farm.center_coordinates
+            if isinstance(coords, dict):
+                lat = coords.get("latitude")
+                lon = coords.get("longitude")
+                if lat and lon:
+                    return lat, lon
+    return None
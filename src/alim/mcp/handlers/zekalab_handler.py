@@ -10,6 +10,9 @@ Phase 4: Orchestration layer for internal rules engine.
 import asyncio
 import os
 import time
+from collections.abc import AsyncIterator, Callable, Sequence
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from datetime import UTC, datetime
 from typing import Any
 
@@ -17,9 +20,55 @@ import httpx
 import structlog
 
 from alim.agent.state import MCPTrace
+from alim.deadline import timeout_for
+from alim.mcp.config import MCPServerConfig, mcp_settings
+from alim.mcp.pool import MCPConnectionPool
 
 logger = structlog.get_logger(__name__)
 
+# Resource outputs can be large; traces record a summary instead
+_TRACE_SUMMARIES: dict[str, Callable[[dict[str, Any]], dict[str, Any]]] = {
+    "get_rules": lambda output: {"rules_count": len(output.get("rules", {}))},
+    "get_crop_profiles": lambda output: {"crops_count": len(output)},
+    "get_subsidy_database": lambda output: {"programs_count": len(output.get("programs", {}))},
+}
+
+# Active coalescing scope (see ZekaLabMCPHandler.coalescing); a ContextVar so
+# that only calls made from within the scope - including tasks it spawns -
+# are batched, never another request's calls on the shared handler
+_coalescer: ContextVar["_Coalescer | None"] = ContextVar("zekalab_coalescer", default=None)
+
+
+class _Coalescer:
+    """Collects calls issued in the same event-loop tick into one batch."""
+
+    def __init__(self, handler: "ZekaLabMCPHandler"):
+        self.handler = handler
+        self._pending: list[tuple[str, dict[str, Any], asyncio.Future]] = []
+        self._flush: asyncio.Task | None = None
+
+    def submit(self, tool: str, input_args: dict[str, Any]) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((tool, input_args, future))
+        if self._flush is None:
+            self._flush = asyncio.create_task(self._flush_soon())
+        return future
+
+    async def _flush_soon(self) -> None:
+        # Yield once so sibling tasks (asyncio.gather) can enqueue their calls
+        await asyncio.sleep(0)
+        pending, self._pending, self._flush = self._pending, [], None
+        try:
+            results = await self.handler.call_tools([(tool, args) for tool, args, _ in pending])
+        except Exception as e:  # call_tools reports errors in traces; belt and braces
+            for _, _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, _, future), result in zip(pending, results, strict=True):
+            if not future.done():
+                future.set_result(result)
+
 
 class ZekaLabMCPHandler:
     """Handler for calling ZekaLab internal MCP server.
@@ -41,7 +90,16 @@ class ZekaLabMCPHandler:
         self.secret = os.getenv("ZEKALAB_MCP_SECRET", None)
         self.timeout_ms = int(os.getenv("ZEKALAB_TIMEOUT_MS", 2000))
         self.timeout_s = self.timeout_ms / 1000.0
+        # Override for the shared pooled client (tests inject a mock here)
         self.client: httpx.AsyncClient | None = None
+        self.pool_config = MCPServerConfig(
+            url=self.mcp_url,
+            secret=self.secret,
+            timeout_ms=self.timeout_ms,
+            max_connections=mcp_settings.mcp_pool_max_connections,
+            keepalive_expiry_s=mcp_settings.mcp_keepalive_expiry_seconds,
+            max_concurrency=mcp_settings.zekalab_max_concurrency,
+        )
 
         logger.info(
             "zekalab_handler_init",
@@ -50,14 +108,15 @@ class ZekaLabMCPHandler:
             timeout_ms=self.timeout_ms,
         )
 
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create async HTTP client."""
-        if not self.client:
-            self.client = httpx.AsyncClient(
-                timeout=httpx.Timeout(self.timeout_s),
-                limits=httpx.Limits(max_connections=10),
-            )
-        return self.client
+    @asynccontextmanager
+    async def _slot(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Hold a ZekaLab concurrency slot for one request.
+
+        Yields the "zekalab" connection pool shared with MCPClient (or the
+        injected ``self.client``).
+        """
+        async with MCPConnectionPool.slot("zekalab", self.pool_config, self.client) as client:
+            yield client
 
     async def _call_tool(
         self,
@@ -77,6 +136,10 @@ class ZekaLabMCPHandler:
             TimeoutError: If call exceeds timeout
             Exception: Any other HTTP/network error
         """
+        coalescer = _coalescer.get()
+        if coalescer is not None and coalescer.handler is self:
+            return await coalescer.submit(tool_name, input_args)
+
         start_time = time.time()
         success = False
         error_message = None
@@ -90,7 +153,6 @@ class ZekaLabMCPHandler:
                 )
                 raise RuntimeError("ZekaLab MCP is disabled")
 
-            client = await self._get_client()
             url = f"{self.mcp_url}/tools/{tool_name}"
 
             logger.debug(
@@ -100,11 +162,12 @@ class ZekaLabMCPHandler:
                 args=input_args,
             )
 
-            response = await client.post(
-                url,
-                json=input_args,
-                timeout=self.timeout_s,
-            )
+            async with self._slot() as client:
+                response = await client.post(
+                    url,
+                    json=input_args,
+                    timeout=timeout_for(self.timeout_s),
+                )
             response.raise_for_status()
 
             output = response.json()
@@ -383,8 +446,9 @@ class ZekaLabMCPHandler:
         farm_id: str,
         crop_type: str,
         planting_date: str,
-        current_gdd_accumulated: float = 0,
+        current_gdd_accumulated: float | None = None,
         base_temperature_c: float = 10,
+        region: str | None = None,
     ) -> tuple[dict[str, Any], MCPTrace]:
         """Predict crop harvest date.
 
@@ -393,7 +457,9 @@ class ZekaLabMCPHandler:
             crop_type: "cotton", "wheat", or "vegetables"
             planting_date: Date planted (YYYY-MM-DD format)
             current_gdd_accumulated: Growing Degree Days accumulated
+                (None: the server computes it from the region's weather history)
             base_temperature_c: Base temperature for GDD (default 10°C)
+            region: Farm region, selects the server's GDD timeline
 
         Returns:
             (result_dict, trace) where result contains:
@@ -409,6 +475,7 @@ class ZekaLabMCPHandler:
             "planting_date": planting_date,
             "current_gdd_accumulated": current_gdd_accumulated,
             "base_temperature_c": base_temperature_c,
+            "region": region,
         }
 
         logger.info(
@@ -420,6 +487,191 @@ class ZekaLabMCPHandler:
 
         return await self._call_tool("predict_harvest_date", input_args)
 
+    # ====================================================================
+    # Tool 6: Batch Evaluation
+    # ====================================================================
+
+    async def evaluate_farms(
+        self,
+        farms: list[dict[str, Any]],
+        tools: list[str] | None = None,
+    ) -> tuple[dict[str, Any], MCPTrace]:
+        """Evaluate rules for many farms in one MCP call.
+
+        Args:
+            farms: Farm condition dicts (fields as in the single-farm tools)
+            tools: Subset of "irrigation", "fertilization", "pest_control"
+                (default: all three)
+
+        Returns:
+            (result_dict, trace) where result contains:
+                - results: list of per-farm dicts keyed by tool name
+                - farm_count: int
+                - rule_set_version: str
+                - cache: dict with memo hits/misses for the batch
+        """
+        input_args: dict[str, Any] = {"farms": farms}
+        if tools is not None:
+            input_args["tools"] = tools
+
+        logger.info("evaluate_farms", farms=len(farms), tools=tools)
+
+        return await self._call_tool("evaluate_farms", input_args)
+
+    async def predict_harvest_batch(
+        self,
+        declarations: list[dict[str, Any]],
+        as_of: str | None = None,
+    ) -> tuple[dict[str, Any], MCPTrace]:
+        """Predict harvest dates for many sowing declarations in one MCP call.
+
+        Args:
+            declarations: Dicts with declaration_id, crop_type, sowing_date
+                (YYYY-MM-DD) and optionally region, latitude, longitude
+            as_of: Prediction date (YYYY-MM-DD, default: server's today)
+
+        Returns:
+            (result_dict, trace) where result contains:
+                - results: list of per-declaration predictions (or {"error"})
+                - declaration_count: int
+                - as_of: str
+                - rule_set_version: str
+        """
+        input_args: dict[str, Any] = {"declarations": declarations}
+        if as_of is not None:
+            input_args["as_of"] = as_of
+
+        logger.info("predict_harvest_batch", declarations=len(declarations))
+
+        return await self._call_tool("predict_harvest_batch", input_args)
+
+    # ====================================================================
+    # Batched Invocation
+    # ====================================================================
+
+    async def call_tools(
+        self,
+        calls: Sequence[tuple[str, dict[str, Any]]],
+    ) -> list[tuple[dict[str, Any], MCPTrace]]:
+        """Run several tools/resources in one round-trip (POST /tools/batch).
+
+        The server runs the invocations concurrently. Every sub-call gets
+        its own MCPTrace; its duration is the batch round-trip, which is
+        what the caller waited for. Resources are addressed by their
+        trace names ("get_rules", "get_crop_profiles", "get_subsidy_database").
+
+        Args:
+            calls: (tool_name, input_args) pairs
+
+        Returns:
+            One (output, trace) per call, in order; failed calls have an
+            empty output and success=False (this method does not raise)
+        """
+        if not calls:
+            return []
+
+        start_time = time.time()
+        error_message = None
+        results: list[dict[str, Any]] = []
+
+        try:
+            if not self.enabled:
+                raise RuntimeError("ZekaLab MCP is disabled")
+
+            async with self._slot() as client:
+                response = await client.post(
+                    f"{self.mcp_url}/tools/batch",
+                    json={"calls": [{"tool": tool, "arguments": args} for tool, args in calls]},
+                    timeout=timeout_for(self.timeout_s),
+                )
+            if response.status_code == 404:
+                # Server predates /tools/batch: fall back to one call each
+                logger.warning("zekalab_batch_unsupported", calls=len(calls))
+                return await asyncio.gather(
+                    *(self._call_single(tool, args) for tool, args in calls)
+                )
+            response.raise_for_status()
+            results = response.json()["results"]
+
+        except httpx.HTTPStatusError as e:
+            error_message = f"HTTP {e.response.status_code}: {e.response.text}"
+        except Exception as e:
+            error_message = str(e) or type(e).__name__
+
+        duration_ms = (time.time() - start_time) * 1000
+        if error_message:
+            logger.error("zekalab_mcp_batch_error", calls=len(calls), error=error_message)
+
+        outputs = []
+        for i, (tool, args) in enumerate(calls):
+            result = results[i] if i < len(results) else {}
+            success = bool(result.get("success"))
+            output = (result.get("output") or {}) if success else {}
+            sub_error = error_message or (None if success else result.get("error"))
+            summarize = _TRACE_SUMMARIES.get(tool)
+            outputs.append(
+                (
+                    output,
+                    MCPTrace(
+                        server="zekalab",
+                        tool=tool,
+                        input_args=args,
+                        output=summarize(output) if summarize else output,
+                        duration_ms=duration_ms,
+                        success=success,
+                        error_message=sub_error,
+                        timestamp=datetime.now(UTC),
+                    ),
+                )
+            )
+
+        logger.info(
+            "zekalab_mcp_batch_trace",
+            tools=[tool for tool, _ in calls],
+            succeeded=sum(trace.success for _, trace in outputs),
+            duration_ms=f"{duration_ms:.1f}",
+        )
+        return outputs
+
+    async def _call_single(
+        self, tool: str, input_args: dict[str, Any]
+    ) -> tuple[dict[str, Any], MCPTrace]:
+        """One call over the per-tool endpoints (batch fallback)."""
+        token = _coalescer.set(None)
+        try:
+            if tool == "get_rules":
+                return await self.get_rules_resource()
+            if tool == "get_crop_profiles":
+                return await self.get_crop_profiles_resource()
+            if tool == "get_subsidy_database":
+                return await self.get_subsidy_database_resource()
+            return await self._call_tool(tool, input_args)
+        finally:
+            _coalescer.reset(token)
+
+    @asynccontextmanager
+    async def coalescing(self) -> AsyncIterator["ZekaLabMCPHandler"]:
+        """Batch the calls made within this scope (e.g. one graph turn).
+
+        Calls issued concurrently inside the scope - for instance via
+        ``asyncio.gather`` - are sent as a single ``/tools/batch`` request.
+        Each still returns its own ``(output, MCPTrace)``.
+
+        Example:
+            ```python
+            async with handler.coalescing():
+                (rules, _), (irrigation, _) = await asyncio.gather(
+                    handler.get_rules_resource(),
+                    handler.evaluate_irrigation_rules(...),
+                )
+            ```
+        """
+        token = _coalescer.set(_Coalescer(self))
+        try:
+            yield self
+        finally:
+            _coalescer.reset(token)
+
     # ====================================================================
     # Resource Access
     # ====================================================================
@@ -432,13 +684,17 @@ class ZekaLabMCPHandler:
         """
         logger.info("fetch_rules_resource")
 
+        coalescer = _coalescer.get()
+        if coalescer is not None and coalescer.handler is self:
+            return await coalescer.submit("get_rules", {})
+
         start_time = time.time()
         try:
-            client = await self._get_client()
-            response = await client.get(
-                f"{self.mcp_url}/resources/rules",
-                timeout=self.timeout_s,
-            )
+            async with self._slot() as client:
+                response = await client.get(
+                    f"{self.mcp_url}/resources/rules",
+                    timeout=timeout_for(self.timeout_s),
+                )
             response.raise_for_status()
             output = response.json()
             success = True
@@ -473,13 +729,17 @@ class ZekaLabMCPHandler:
         """
         logger.info("fetch_crop_profiles_resource")
 
+        coalescer = _coalescer.get()
+        if coalescer is not None and coalescer.handler is self:
+            return await coalescer.submit("get_crop_profiles", {})
+
         start_time = time.time()
         try:
-            client = await self._get_client()
-            response = await client.get(
-                f"{self.mcp_url}/resources/crop_profiles",
-                timeout=self.timeout_s,
-            )
+            async with self._slot() as client:
+                response = await client.get(
+                    f"{self.mcp_url}/resources/crop_profiles",
+                    timeout=timeout_for(self.timeout_s),
+                )
             response.raise_for_status()
             output = response.json()
             success = True
@@ -514,13 +774,17 @@ class ZekaLabMCPHandler:
         """
         logger.info("fetch_subsidy_database_resource")
 
+        coalescer = _coalescer.get()
+        if coalescer is not None and coalescer.handler is self:
+            return await coalescer.submit("get_subsidy_database", {})
+
         start_time = time.time()
         try:
-            client = await self._get_client()
-            response = await client.get(
-                f"{self.mcp_url}/resources/subsidy_database",
-                timeout=self.timeout_s,
-            )
+            async with self._slot() as client:
+                response = await client.get(
+                    f"{self.mcp_url}/resources/subsidy_database",
+                    timeout=timeout_for(self.timeout_s),
+                )
             response.raise_for_status()
             output = response.json()
             success = True
@@ -548,10 +812,12 @@ class ZekaLabMCPHandler:
         return output, trace
 
     async def close(self):
-        """Close HTTP client connection."""
-        if self.client:
-            await self.client.aclose()
-            self.client = None
+        """Drop the injected client.
+
+        The pooled connections are shared with MCPClient and closed by
+        ``close_all_mcp_clients()`` at shutdown.
+        """
+        self.client = None
 
 
 # ========================================================================
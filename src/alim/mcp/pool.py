@@ -0,0 +1,155 @@
+# src/ALİM/mcp/pool.py
+"""Persistent HTTP connection pools for MCP servers.
+
+One long-lived ``httpx.AsyncClient`` per MCP server, shared by everything
+that talks to that server (``MCPClient`` and the ZekaLab handler), so calls
+reuse keep-alive connections instead of paying TCP/TLS setup each time.
+
+Each server also gets a concurrency limit: at most ``max_concurrency``
+requests are in flight, the rest wait for a slot instead of opening more
+sockets or overloading the server.
+
+Lifecycle:
+    - Pools are created lazily on first use (or warmed at startup)
+    - ``MCPConnectionPool.close_all()`` runs in the FastAPI lifespan shutdown
+
+Example:
+    ```python
+    async with MCPConnectionPool.slot("zekalab", config) as client:
+        response = await client.post(f"{config.url}/tools/batch", json=payload)
+    ```
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import ClassVar
+
+import httpx
+import structlog
+
+from alim.mcp.config import MCPServerConfig
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class _ServerPool:
+    """Pooled client, concurrency limit and counters for one server."""
+
+    client: httpx.AsyncClient
+    limiter: asyncio.Semaphore
+    max_concurrency: int
+    loop: asyncio.AbstractEventLoop
+    stats: dict[str, int] = field(
+        default_factory=lambda: {"requests": 0, "waited": 0, "in_flight": 0}
+    )
+
+
+class MCPConnectionPool:
+    """Per-server pooled HTTP clients with concurrency limits."""
+
+    _pools: ClassVar[dict[str, _ServerPool]] = {}
+
+    @staticmethod
+    def _create_client(config: MCPServerConfig) -> httpx.AsyncClient:
+        """Create a keep-alive client sized for one server."""
+        timeout_s = config.timeout_ms / 1000.0
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout_s, pool=timeout_s),
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry_s,
+            ),
+        )
+
+    @classmethod
+    def get(cls, server_name: str, config: MCPServerConfig) -> _ServerPool:
+        """Get or create the pool for a server.
+
+        The first caller's config sizes the pool; later callers share it.
+        Must be called from a running event loop. A pool created on another
+        loop (e.g. a previous test's) is replaced, since its connections
+        cannot be used from this one.
+        """
+        loop = asyncio.get_running_loop()
+        pool = cls._pools.get(server_name)
+        if pool is None or pool.client.is_closed or pool.loop is not loop:
+            pool = _ServerPool(
+                client=cls._create_client(config),
+                limiter=asyncio.Semaphore(config.max_concurrency),
+                max_concurrency=config.max_concurrency,
+                loop=loop,
+            )
+            cls._pools[server_name] = pool
+            logger.info(
+                "mcp_pool_created",
+                server=server_name,
+                max_connections=config.max_connections,
+                max_concurrency=config.max_concurrency,
+            )
+        return pool
+
+    @classmethod
+    def client(cls, server_name: str, config: MCPServerConfig) -> httpx.AsyncClient:
+        """Shared HTTP client for a server (no concurrency slot taken)."""
+        return cls.get(server_name, config).client
+
+    @classmethod
+    @asynccontextmanager
+    async def slot(
+        cls,
+        server_name: str,
+        config: MCPServerConfig,
+        client: httpx.AsyncClient | None = None,
+    ) -> AsyncIterator[httpx.AsyncClient]:
+        """Hold one of the server's concurrency slots for a request.
+
+        Args:
+            server_name: Server identifier (pool key)
+            config: Server config, used if the pool has to be created
+            client: Client to yield instead of the pooled one (tests/overrides)
+
+        Yields:
+            The pooled client (or ``client``)
+        """
+        pool = cls.get(server_name, config)
+        if pool.limiter.locked():
+            pool.stats["waited"] += 1
+        async with pool.limiter:
+            pool.stats["requests"] += 1
+            pool.stats["in_flight"] += 1
+            try:
+                yield client or pool.client
+            finally:
+                pool.stats["in_flight"] -= 1
+
+    @classmethod
+    async def close(cls, server_name: str) -> None:
+        """Close one server's pool."""
+        pool = cls._pools.pop(server_name, None)
+        if pool is not None and not pool.client.is_closed:
+            await pool.client.aclose()
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """Close all pools (for shutdown)."""
+        for server_name in list(cls._pools):
+            try:
+                await cls.close(server_name)
+            except Exception as e:
+                logger.error("mcp_pool_close_error", server=server_name, error=str(e))
+
+    @classmethod
+    def get_pool_stats(cls) -> dict[str, dict]:
+        """Per-server pool state and counters."""
+        return {
+            name: {
+                "active": not pool.client.is_closed,
+                "max_concurrency": pool.max_concurrency,
+                **pool.stats,
+            }
+            for name, pool in cls._pools.items()
+        }
@@ -15,18 +15,24 @@ Architecture:
     │   ├── evaluate_fertilization_rules(context)
     │   ├── evaluate_pest_control_rules(context)
     │   ├── calculate_subsidy(params)
-    │   └── predict_harvest_date(context)
+    │   ├── predict_harvest_date(context)
+    │   ├── evaluate_farms(farms)  - batch of the rule-based tools
+    │   └── batch(calls)  - several tool/resource calls in one round-trip
     │
     └── Resources (3 total):
         ├── rules_yaml (all rules as text)
         ├── crop_profiles (crop data)
         └── subsidy_database (subsidy info)
 
+Rules:
+    Tool decisions come from the YAML files in mcp_server/rules, evaluated
+    by the compiled rules engine (see mcp_server/tools).
+
 Usage:
     python -m ALİM.mcp_server.main
 
 Environment:
     ZEKALAB_PORT=7777
     ZEKALAB_LOG_LEVEL=INFO
-    ZEKALAB_RULES_PATH=src/ALİM/rules
+    ZEKALAB_RULES_PATH=src/alim/mcp_server/rules
 """
@@ -11,19 +11,37 @@ Run:
 
 Architecture:
     FastMCP (standard MCP server framework)
-        ├── 5 Tools (RPC operations)
+        ├── 5 Tools (RPC operations) + evaluate_farms, predict_harvest_batch (batch)
         ├── 3 Resources (Data retrieval)
+        ├── /tools/batch (many tool/resource calls in one round-trip)
         └── Error handling + structured logging
+
+Decisions come from the YAML rules in ``mcp_server/rules`` via the shared
+:class:`~alim.mcp_server.tools.ZekaLabEvaluator`; the rule set is
+hot-reloaded while the server runs.
 """
 
+import asyncio
 import os
-from datetime import datetime, timedelta
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import asynccontextmanager
+from datetime import datetime
 from enum import Enum
+from typing import Literal
 
 import structlog
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import StreamingResponse
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
+
+from alim.mcp_server.tools import (
+    BATCH_TOOLS,
+    CROP_PROFILES,
+    SUBSIDY_DATABASE,
+    ZEKALAB_RULES_DIR,
+    get_evaluator,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -33,7 +51,7 @@ logger = structlog.get_logger(__name__)
 
 PORT = int(os.getenv("ZEKALAB_PORT", 7777))
 LOG_LEVEL = os.getenv("ZEKALAB_LOG_LEVEL", "INFO")
-RULES_PATH = os.getenv("ZEKALAB_RULES_PATH", "src/ALİM/rules")
+RULES_PATH = str(ZEKALAB_RULES_DIR)
 
 # Configure logging
 structlog.configure(
@@ -124,8 +142,94 @@ class HarvestRequest(BaseModel):
     farm_id: str
     crop_type: CropType
     planting_date: str = Field(..., description="Date planted (YYYY-MM-DD)")
-    current_gdd_accumulated: float = Field(default=0, description="Growing Degree Days accumulated")
+    current_gdd_accumulated: float | None = Field(
+        default=None,
+        description="Growing Degree Days accumulated (default: from the GDD service)",
+    )
     base_temperature_c: float = Field(default=10)
+    region: str | None = Field(default=None, description="Farm region (GDD climate)")
+    latitude: float | None = Field(default=None, description="Farm latitude (GDD tile)")
+    longitude: float | None = Field(default=None, description="Farm longitude (GDD tile)")
+    as_of: str | None = Field(default=None, description="Prediction date (YYYY-MM-DD)")
+
+
+class SowingDeclaration(BaseModel):
+    """One active sowing declaration in a batch harvest prediction."""
+
+    declaration_id: str
+    crop_type: str = Field(..., description="Crop (unknown crops use the default GDD rule)")
+    sowing_date: str = Field(..., description="YYYY-MM-DD")
+    region: str | None = None
+    latitude: float | None = None
+    longitude: float | None = None
+    current_gdd_accumulated: float | None = None
+    base_temperature_c: float = Field(default=10)
+
+
+class HarvestBatchRequest(BaseModel):
+    """Predict harvest for many sowing declarations in one call."""
+
+    declarations: list[SowingDeclaration] = Field(..., max_length=20000)
+    as_of: str | None = Field(default=None, description="Prediction date (YYYY-MM-DD)")
+
+
+class WeatherObservation(BaseModel):
+    """Observed daily temperatures for GDD accumulation."""
+
+    date: str = Field(..., description="YYYY-MM-DD")
+    tmin_c: float
+    tmax_c: float
+
+
+class WeatherHistoryRequest(BaseModel):
+    """Daily weather history for one region or tile."""
+
+    region: str | None = None
+    latitude: float | None = None
+    longitude: float | None = None
+    observations: list[WeatherObservation] = Field(..., max_length=5000)
+
+
+class FarmConditions(BaseModel):
+    """One farm in a batch evaluation; fields as in the single-farm tools."""
+
+    farm_id: str
+    crop_type: CropType
+    soil_type: SoilType
+    current_soil_moisture_percent: float | None = Field(default=None, ge=0, le=100)
+    temperature_c: float | None = None
+    humidity_percent: float | None = Field(default=None, ge=0, le=100)
+    rainfall_mm_last_7_days: float = Field(default=0, ge=0)
+    rainfall_mm_last_3_days: float = Field(default=0, ge=0)
+    growth_stage_days: int = Field(default=0, ge=0)
+    soil_nitrogen_ppm: float | None = None
+    soil_phosphorus_ppm: float | None = None
+    soil_potassium_ppm: float | None = None
+    previous_fertilizer_days_ago: int | None = None
+    observed_pests: list[str] = Field(default_factory=list)
+
+
+class BatchEvaluationRequest(BaseModel):
+    """Evaluate many farms in one call."""
+
+    farms: list[FarmConditions] = Field(..., max_length=5000)
+    tools: list[Literal["irrigation", "fertilization", "pest_control"]] = Field(
+        default_factory=lambda: list(BATCH_TOOLS),
+        description="Tools to run for every farm",
+    )
+
+
+class ToolInvocation(BaseModel):
+    """One call inside a /tools/batch request."""
+
+    tool: str = Field(description="Tool name, or get_rules/get_crop_profiles/get_subsidy_database")
+    arguments: dict = Field(default_factory=dict)
+
+
+class BatchToolRequest(BaseModel):
+    """Several tool invocations to run concurrently."""
+
+    calls: list[ToolInvocation] = Field(max_length=50)
 
 
 # ============================================================
@@ -152,6 +256,7 @@ class IrrigationResponse(BaseModel):
     confidence: float = Field(ge=0, le=1)
     rule_id: str
     reasoning: str
+    rule_set_version: str | None = None
 
 
 class FertilizationResponse(BaseModel):
@@ -165,6 +270,7 @@ class FertilizationResponse(BaseModel):
     confidence: float = Field(ge=0, le=1)
     rule_id: str
     reasoning: str
+    rule_set_version: str | None = None
 
 
 class PestControlResponse(BaseModel):
@@ -177,6 +283,7 @@ class PestControlResponse(BaseModel):
     confidence: float = Field(ge=0, le=1)
     rule_id: str
     reasoning: str
+    rule_set_version: str | None = None
 
 
 class SubsidyResponse(BaseModel):
@@ -190,6 +297,32 @@ class SubsidyResponse(BaseModel):
     next_review_date: str | None = None
 
 
+class BatchEvaluationResponse(BaseModel):
+    """Batch evaluation response (one result per farm, in request order)."""
+
+    results: list[dict]
+    farm_count: int
+    rule_set_version: str
+    cache: dict[str, int] = Field(description="Rule-match memo hits/misses for this batch")
+
+
+class ToolResult(BaseModel):
+    """Outcome of one call inside a /tools/batch request."""
+
+    tool: str
+    success: bool
+    status_code: int = Field(description="What the single-call route would have returned")
+    output: dict = Field(default_factory=dict)
+    error: str | None = None
+    duration_ms: float
+
+
+class BatchToolResponse(BaseModel):
+    """Batch tool response (one result per call, in request order)."""
+
+    results: list[ToolResult]
+
+
 class HarvestResponse(BaseModel):
     """Harvest prediction response."""
 
@@ -198,16 +331,39 @@ class HarvestResponse(BaseModel):
     maturity_confidence: float = Field(ge=0, le=1)
     recommended_checks: list[str]
     rule_id: str
+    gdd_accumulated: float | None = None
+    gdd_required: float | None = None
+    rule_set_version: str | None = None
+
+
+class HarvestBatchResponse(BaseModel):
+    """Batch harvest response (one result per declaration, in request order)."""
+
+    results: list[dict]
+    declaration_count: int
+    as_of: str
+    rule_set_version: str
 
 
 # ============================================================
 # FastAPI App Setup
 # ============================================================
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Watch the rules directory for edits while the server runs."""
+    registry = get_evaluator().registry
+    registry.start()
+    yield
+    await registry.stop()
+
+
 app = FastAPI(
     title="ZekaLab Internal MCP Server",
     description="Agricultural rules engine as MCP services",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 
@@ -241,61 +397,15 @@ async def evaluate_irrigation_rules(request: IrrigationRequest) -> IrrigationRes
     )
 
     try:
-        # ========== IRRIGATION RULES LOGIC ==========
-        should_irrigate = False
-        recommended_water_mm = 0.0
-        timing = "anytime"
-        reasoning = ""
-
-        # Base threshold varies by crop and soil type
-        moisture_threshold = 60  # Default for loamy soil
-        if request.soil_type == SoilType.SANDY:
-            moisture_threshold = 50  # Sandy needs more frequent irrigation
-        elif request.soil_type == SoilType.CLAY:
-            moisture_threshold = 70  # Clay retains water better
-
-        # Check if irrigation is needed
-        if request.current_soil_moisture_percent < moisture_threshold:
-            should_irrigate = True
-            confidence = 0.85
-
-            # Calculate water amount based on deficit
-            water_deficit = moisture_threshold - request.current_soil_moisture_percent
-            recommended_water_mm = water_deficit * 2  # Simplified calculation
-
-            # Timing based on temperature
-            if request.temperature_c > 30:
-                timing = "6am"  # Early morning for high temp
-                rule_id = "RULE_IRR_001_HIGH_TEMP"
-            elif request.temperature_c < 10:
-                timing = "noon"  # Midday for low temp
-                rule_id = "RULE_IRR_002_LOW_TEMP"
-            else:
-                timing = "6am"  # Default to morning
-                rule_id = "RULE_IRR_003_NORMAL"
-
-            # Adjust for recent rainfall
-            if request.rainfall_mm_last_7_days > 30:
-                should_irrigate = False
-                confidence = 0.95
-                reasoning = f"Recent rainfall ({request.rainfall_mm_last_7_days}mm) sufficient"
-                recommended_water_mm = 0
-
-            if should_irrigate:
-                reasoning = f"Soil moisture {request.current_soil_moisture_percent}% below threshold {moisture_threshold}%. Recommend {recommended_water_mm:.0f}mm at {timing}."
-        else:
-            rule_id = "RULE_IRR_004_SUFFICIENT"
-            confidence = 0.90
-            reasoning = f"Soil moisture {request.current_soil_moisture_percent}% adequate. No irrigation needed."
-
-        return IrrigationResponse(
-            should_irrigate=should_irrigate,
-            recommended_water_mm=recommended_water_mm,
-            timing=timing,
-            confidence=confidence,
-            rule_id=rule_id,
-            reasoning=reasoning,
+        result = get_evaluator().irrigation(
+            crop_type=request.crop_type,
+            soil_type=request.soil_type,
+            current_soil_moisture_percent=request.current_soil_moisture_percent,
+            temperature_c=request.temperature_c,
+            rainfall_mm_last_7_days=request.rainfall_mm_last_7_days,
+            growth_stage_days=request.growth_stage_days,
         )
+        return IrrigationResponse(**result)
 
     except Exception as e:
         logger.error("irrigation_evaluation_error", error=str(e), farm_id=request.farm_id)
@@ -330,62 +440,16 @@ async def evaluate_fertilization_rules(request: FertilizationRequest) -> Fertili
     )
 
     try:
-        # ========== FERTILIZATION RULES LOGIC ==========
-
-        # Default NPK values for cotton (kg/ha)
-        if request.crop_type == CropType.COTTON:
-            base_nitrogen = 150
-            base_phosphorus = 80
-            base_potassium = 80
-            rule_id = "RULE_FERT_001_COTTON"
-        elif request.crop_type == CropType.WHEAT:
-            base_nitrogen = 120
-            base_phosphorus = 60
-            base_potassium = 60
-            rule_id = "RULE_FERT_002_WHEAT"
-        else:
-            base_nitrogen = 100
-            base_phosphorus = 50
-            base_potassium = 50
-            rule_id = "RULE_FERT_003_VEGETABLES"
-
-        # Adjust for soil nutrient levels
-        nitrogen_recommendation = base_nitrogen
-        phosphorus_recommendation = base_phosphorus
-        potassium_recommendation = base_potassium
-
-        if request.soil_nitrogen_ppm and request.soil_nitrogen_ppm > 30:
-            nitrogen_recommendation *= 0.7  # Reduce if soil has good nitrogen
-
-        if request.soil_phosphorus_ppm and request.soil_phosphorus_ppm > 20:
-            phosphorus_recommendation *= 0.8
-
-        if request.soil_potassium_ppm and request.soil_potassium_ppm > 200:
-            potassium_recommendation *= 0.8
-
-        # Adjust for growth stage
-        should_fertilize = True
-        timing = "Now"
-
-        if request.growth_stage_days < 10:
-            timing = "Post-planting (starter)"
-            nitrogen_recommendation *= 1.1
-        elif request.growth_stage_days > 100:
-            timing = "Late season (post-flowering)"
-            nitrogen_recommendation *= 0.5
-
-        reasoning = f"Recommended NPK: N={nitrogen_recommendation:.0f}, P={phosphorus_recommendation:.0f}, K={potassium_recommendation:.0f} kg/ha. {timing}."
-
-        return FertilizationResponse(
-            should_fertilize=should_fertilize,
-            nitrogen_kg_per_hectare=nitrogen_recommendation,
-            phosphorus_kg_per_hectare=phosphorus_recommendation,
-            potassium_kg_per_hectare=potassium_recommendation,
-            timing=timing,
-            confidence=0.85,
-            rule_id=rule_id,
-            reasoning=reasoning,
+        result = get_evaluator().fertilization(
+            crop_type=request.crop_type,
+            soil_type=request.soil_type,
+            soil_nitrogen_ppm=request.soil_nitrogen_ppm,
+            soil_phosphorus_ppm=request.soil_phosphorus_ppm,
+            soil_potassium_ppm=request.soil_potassium_ppm,
+            growth_stage_days=request.growth_stage_days,
+            previous_fertilizer_days_ago=request.previous_fertilizer_days_ago,
         )
+        return FertilizationResponse(**result)
 
     except Exception as e:
         logger.error("fertilization_evaluation_error", error=str(e), farm_id=request.farm_id)
@@ -421,59 +485,15 @@ async def evaluate_pest_control_rules(request: PestControlRequest) -> PestContro
     )
 
     try:
-        # ========== PEST CONTROL RULES LOGIC ==========
-
-        detected_pests = list(set(request.observed_pests))  # Remove duplicates
-        recommended_action = "Monitor closely"
-        method = "cultural"
-        severity = "low"
-        confidence = 0.7
-        rule_id = "RULE_PEST_001_BASELINE"
-
-        # Environmental risk assessment
-        high_risk_conditions = (
-            request.temperature_c > 25
-            and request.humidity_percent > 70
-            and request.rainfall_mm_last_3_days > 20
-        )
-
-        if high_risk_conditions:
-            severity = "high"
-            confidence = 0.85
-            recommended_action = "Preventive treatment recommended"
-            method = "biological"
-            rule_id = "RULE_PEST_002_HIGH_RISK"
-
-        # Specific pest handling
-        if "cotton_bollworm" in detected_pests:
-            severity = "critical"
-            confidence = 0.95
-            recommended_action = "Immediate treatment required"
-            method = "integrated"
-            rule_id = "RULE_PEST_003_BOLLWORM"
-
-        elif "spider_mites" in detected_pests:
-            recommended_action = "Monitor and treat if population >50 per leaf"
-            method = "chemical"
-            rule_id = "RULE_PEST_004_SPIDER_MITES"
-
-        elif "leaf_curl_virus" in detected_pests:
-            severity = "high"
-            recommended_action = "Remove affected plants, control whiteflies"
-            method = "cultural"
-            rule_id = "RULE_PEST_005_VIRUS"
-
-        reasoning = f"Pests detected: {', '.join(detected_pests) if detected_pests else 'None'}. Conditions: {request.temperature_c}°C, {request.humidity_percent}% RH. {recommended_action}"
-
-        return PestControlResponse(
-            pests_detected=detected_pests,
-            recommended_action=recommended_action,
-            method=method,
-            severity=severity,
-            confidence=confidence,
-            rule_id=rule_id,
-            reasoning=reasoning,
+        result = get_evaluator().pest_control(
+            crop_type=request.crop_type,
+            temperature_c=request.temperature_c,
+            humidity_percent=request.humidity_percent,
+            observed_pests=request.observed_pests,
+            growth_stage_days=request.growth_stage_days,
+            rainfall_mm_last_3_days=request.rainfall_mm_last_3_days,
         )
+        return PestControlResponse(**result)
 
     except Exception as e:
         logger.error("pest_control_evaluation_error", error=str(e), farm_id=request.farm_id)
@@ -510,61 +530,14 @@ async def calculate_subsidy(request: SubsidyRequest) -> SubsidyResponse:
     )
 
     try:
-        # ========== SUBSIDY RULES LOGIC ==========
-
-        eligible = True
-        conditions = []
-        rule_id = "RULE_SUBSIDY_001_BASE"
-
-        # Base subsidy rates (AZN per hectare) - varies by crop
-        subsidy_rates = {
-            CropType.COTTON: 500,
-            CropType.WHEAT: 300,
-            CropType.VEGETABLES: 400,
-        }
-
-        rate_per_hectare = subsidy_rates.get(request.crop_type, 300)
-
-        # Calculate base subsidy
-        subsidy_azn = rate_per_hectare * request.hectares
-
-        # Young farmer bonus (+25%)
-        if request.is_young_farmer or (request.farmer_age and request.farmer_age < 40):
-            subsidy_azn *= 1.25
-            conditions.append("Young farmer bonus applied (+25%)")
-            rule_id = "RULE_SUBSIDY_002_YOUNG_FARMER"
-
-        # Calcareous soil support (+15%)
-        if request.soil_type == SoilType.CALCAREOUS:
-            subsidy_azn *= 1.15
-            conditions.append("Calcareous soil support applied (+15%)")
-            rule_id = "RULE_SUBSIDY_003_SOIL_SUPPORT"
-
-        # Size limitations
-        if request.hectares > 50:
-            subsidy_azn *= 0.9  # 10% reduction for large farms
-            conditions.append("Large farm reduction (-10%)")
-
-        # Conditions
-        conditions.extend(
-            [
-                "Must maintain production records",
-                "Eco-friendly practices encouraged",
-                "Must report production outcomes",
-            ]
-        )
-
-        # Next review in 12 months
-        next_review = (datetime.now() + timedelta(days=365)).strftime("%Y-%m-%d")
-
-        return SubsidyResponse(
-            eligible=eligible,
-            subsidy_azn=subsidy_azn,
-            subsidy_per_hectare_azn=rate_per_hectare,
-            conditions=conditions,
-            rule_id=rule_id,
-            next_review_date=next_review,
+        result = get_evaluator().subsidy(
+            crop_type=request.crop_type,
+            hectares=request.hectares,
+            soil_type=request.soil_type,
+            farmer_age=request.farmer_age,
+            is_young_farmer=request.is_young_farmer,
         )
+        return SubsidyResponse(**result)
 
     except Exception as e:
         logger.error("subsidy_calculation_error", error=str(e), farm_id=request.farm_id)
@@ -589,6 +562,8 @@ async def predict_harvest_date(request: HarvestRequest) -> HarvestResponse:
     - Cotton: 2400-2800 GDD to maturity
     - Wheat: 1800-2200 GDD to maturity
     - Base temperature: 10°C (configurable)
+    - GDD accumulated since planting and projected to maturity from the
+      region's (or weather tile's) daily history and climate normals
 
     **Returns:** Predicted harvest date with confidence
     """
@@ -600,52 +575,115 @@ async def predict_harvest_date(request: HarvestRequest) -> HarvestResponse:
     )
 
     try:
-        # ========== HARVEST PREDICTION RULES ==========
+        result = get_evaluator().harvest(
+            crop_type=request.crop_type,
+            planting_date=request.planting_date,
+            current_gdd_accumulated=request.current_gdd_accumulated,
+            base_temperature_c=request.base_temperature_c,
+            region=request.region,
+            latitude=request.latitude,
+            longitude=request.longitude,
+            as_of=request.as_of,
+        )
+        return HarvestResponse(**result)
 
-        # GDD requirements by crop
-        gdd_requirements = {
-            CropType.COTTON: 2600,  # Mid-range
-            CropType.WHEAT: 2000,
-            CropType.VEGETABLES: 1500,
-        }
+    except Exception as e:
+        logger.error("harvest_prediction_error", error=str(e), farm_id=request.farm_id)
+        raise HTTPException(status_code=500, detail=f"Harvest prediction failed: {str(e)}")
 
-        target_gdd = gdd_requirements.get(request.crop_type, 2000)
-        gdd_remaining = max(0, target_gdd - request.current_gdd_accumulated)
 
-        # Average daily GDD accumulation (base temp 10°C)
-        avg_daily_gdd = 15  # Conservative estimate
+@app.post(
+    "/tools/predict_harvest_batch",
+    response_model=HarvestBatchResponse,
+    tags=["tools"],
+    summary="Predict harvest dates for many sowing declarations",
+)
+async def predict_harvest_batch(request: HarvestBatchRequest) -> HarvestBatchResponse:
+    """Predict harvest dates for a list of active sowing declarations.
 
-        days_to_harvest = int(gdd_remaining / avg_daily_gdd) if avg_daily_gdd > 0 else 60
+    Declarations sharing a region/tile and base temperature share one GDD
+    timeline, so the batch costs one vectorized lookup per timeline. A
+    declaration that cannot be predicted (e.g. bad date) yields
+    ``{"error": ...}`` for that declaration only.
 
-        # Calculate predicted harvest date
-        planting_date = datetime.strptime(request.planting_date, "%Y-%m-%d")
-        predicted_harvest_date = planting_date + timedelta(days=days_to_harvest)
+    **Returns:** One result per declaration, in request order
+    """
+    logger.info("harvest_batch_prediction", declarations=len(request.declarations))
 
-        maturity_confidence = min(
-            0.95, 0.60 + (request.current_gdd_accumulated / target_gdd) * 0.35
+    try:
+        result = get_evaluator().harvest_batch(
+            [declaration.model_dump() for declaration in request.declarations],
+            as_of=request.as_of,
         )
+        return HarvestBatchResponse(**result)
 
-        recommended_checks = [
-            "Monitor boll development",
-            "Check for boll lock (cotton) or grain moisture (wheat)",
-            "Plan harvesting logistics",
-        ]
+    except Exception as e:
+        logger.error("harvest_batch_prediction_error", error=str(e))
+        raise HTTPException(status_code=500, detail=f"Harvest batch prediction failed: {str(e)}")
+
+
+@app.post(
+    "/tools/ingest_weather_history",
+    tags=["tools"],
+    summary="Add observed daily temperatures to GDD accumulation",
+)
+async def ingest_weather_history(request: WeatherHistoryRequest) -> dict:
+    """Record observed daily min/max temperatures for a region or tile.
+
+    Observed days replace the climate normals used for GDD until then.
+
+    **Returns:** The GDD timeline key and the number of days written
+    """
+    gdd = get_evaluator().gdd
+    key = gdd.key_for(request.region, request.latitude, request.longitude)
+
+    try:
+        days = gdd.ingest(
+            key,
+            [
+                (datetime.strptime(o.date, "%Y-%m-%d").date(), o.tmin_c, o.tmax_c)
+                for o in request.observations
+            ],
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid observation: {str(e)}")
+
+    return {"key": key, "days": days}
 
-        rule_id = f"RULE_HARVEST_001_{request.crop_type.value.upper()}"
 
-        f"GDD accumulated: {request.current_gdd_accumulated:.0f}/{target_gdd} ({(request.current_gdd_accumulated/target_gdd*100):.1f}% complete). Estimated {days_to_harvest} days to maturity."
+# ============================================================
+# Tool 6: Evaluate Many Farms
+# ============================================================
+
+
+@app.post(
+    "/tools/evaluate_farms",
+    response_model=BatchEvaluationResponse,
+    tags=["tools"],
+    summary="Evaluate rules for many farms in one call",
+)
+async def evaluate_farms(request: BatchEvaluationRequest) -> BatchEvaluationResponse:
+    """Run irrigation, fertilization and/or pest rules for a list of farms.
+
+    Farms in the same conditions share memoized rule matches, so large
+    batches cost about one rule evaluation per distinct condition band.
+    A tool that cannot run for a farm (e.g. missing temperature) yields
+    ``{"error": ...}`` for that farm only.
+
+    **Returns:** One result per farm, in request order
+    """
+    logger.info("batch_evaluation", farms=len(request.farms), tools=request.tools)
 
-        return HarvestResponse(
-            predicted_harvest_date=predicted_harvest_date.strftime("%Y-%m-%d"),
-            days_to_harvest=days_to_harvest,
-            maturity_confidence=maturity_confidence,
-            recommended_checks=recommended_checks,
-            rule_id=rule_id,
+    try:
+        result = get_evaluator().evaluate_farms(
+            [farm.model_dump() for farm in request.farms],
+            tools=request.tools,
         )
+        return BatchEvaluationResponse(**result)
 
     except Exception as e:
-        logger.error("harvest_prediction_error", error=str(e), farm_id=request.farm_id)
-        raise HTTPException(status_code=500, detail=f"Harvest prediction failed: {str(e)}")
+        logger.error("batch_evaluation_error", error=str(e))
+        raise HTTPException(status_code=500, detail=f"Batch evaluation failed: {str(e)}")
 
 
 # ============================================================
@@ -653,34 +691,16 @@ async def predict_harvest_date(request: HarvestRequest) -> HarvestResponse:
 # ============================================================
 
 
-@app.get("/resources/rules", tags=["resources"], summary="Get all rules as YAML")
+@app.get("/resources/rules", tags=["resources"], summary="Get the active rule set")
 async def get_rules_resource():
-    """Return all agricultural rules as structured data.
+    """Return the active agricultural rule set as structured data.
 
-    Returns: List of all rules with conditions and actions
+    Returns: Rule-set version plus every rule (conditions, metadata)
+        grouped by category
     """
     logger.info("rules_resource_requested")
 
-    rules = {
-        "version": "1.0.0",
-        "last_updated": datetime.now().isoformat(),
-        "rules": {
-            "irrigation": {
-                "RULE_IRR_001": "Water cotton at 6am when soil <60% moisture",
-                "RULE_IRR_002": "Water wheat at noon in cold weather",
-            },
-            "fertilization": {
-                "RULE_FERT_001": "Cotton: 150N, 80P, 80K kg/ha base rate",
-                "RULE_FERT_002": "Wheat: 120N, 60P, 60K kg/ha base rate",
-            },
-            "pest_control": {
-                "RULE_PEST_001": "Monitor daily during high-risk weather",
-                "RULE_PEST_002": "Cotton bollworm: immediate treatment required",
-            },
-        },
-    }
-
-    return rules
+    return get_evaluator().rules_resource()
 
 
 @app.get("/resources/crop_profiles", tags=["resources"], summary="Get crop profiles")
@@ -691,31 +711,7 @@ async def get_crop_profiles():
     """
     logger.info("crop_profiles_resource_requested")
 
-    profiles = {
-        "cotton": {
-            "gdd_requirement": 2600,
-            "gdd_base_temp_c": 10,
-            "water_requirement_mm": 400,
-            "nitrogen_kg_ha": 150,
-            "days_to_maturity": 150,
-        },
-        "wheat": {
-            "gdd_requirement": 2000,
-            "gdd_base_temp_c": 10,
-            "water_requirement_mm": 300,
-            "nitrogen_kg_ha": 120,
-            "days_to_maturity": 120,
-        },
-        "vegetables": {
-            "gdd_requirement": 1500,
-            "gdd_base_temp_c": 10,
-            "water_requirement_mm": 350,
-            "nitrogen_kg_ha": 100,
-            "days_to_maturity": 90,
-        },
-    }
-
-    return profiles
+    return CROP_PROFILES
 
 
 @app.get("/resources/subsidy_database", tags=["resources"], summary="Get subsidy info")
@@ -726,30 +722,77 @@ async def get_subsidy_database():
     """
     logger.info("subsidy_database_resource_requested")
 
-    database = {
-        "version": "2026-01",
-        "programs": {
-            "cotton": {
-                "rate_azn_per_hectare": 500,
-                "eligibility": "All registered farms",
-                "young_farmer_bonus": 0.25,
-            },
-            "wheat": {
-                "rate_azn_per_hectare": 300,
-                "eligibility": "Licensed grain producers",
-                "young_farmer_bonus": 0.25,
-            },
-            "vegetables": {
-                "rate_azn_per_hectare": 400,
-                "eligibility": "All registered farms",
-                "young_farmer_bonus": 0.25,
-            },
-        },
-        "application_period": "January 1 - December 31",
-        "contact": "subsidy-info@zekalab.gov.az",
-    }
+    return SUBSIDY_DATABASE
 
-    return database
+
+# ============================================================
+# Batched Invocation
+# ============================================================
+
+# tool name -> (request model or None for resources, route function)
+_BATCH_ROUTES: dict[str, tuple[type[BaseModel] | None, Callable[..., Awaitable]]] = {
+    "evaluate_irrigation_rules": (IrrigationRequest, evaluate_irrigation_rules),
+    "evaluate_fertilization_rules": (FertilizationRequest, evaluate_fertilization_rules),
+    "evaluate_pest_control_rules": (PestControlRequest, evaluate_pest_control_rules),
+    "calculate_subsidy": (SubsidyRequest, calculate_subsidy),
+    "predict_harvest_date": (HarvestRequest, predict_harvest_date),
+    "predict_harvest_batch": (HarvestBatchRequest, predict_harvest_batch),
+    "evaluate_farms": (BatchEvaluationRequest, evaluate_farms),
+    "get_rules": (None, get_rules_resource),
+    "get_crop_profiles": (None, get_crop_profiles),
+    "get_subsidy_database": (None, get_subsidy_database),
+}
+
+
+async def _run_invocation(call: ToolInvocation) -> ToolResult:
+    """Run one batched call through its route, capturing any failure."""
+    start_time = time.perf_counter()
+    status_code, output, error = 200, {}, None
+
+    try:
+        if call.tool not in _BATCH_ROUTES:
+            raise HTTPException(status_code=404, detail=f"Unknown tool: {call.tool}")
+        model, route = _BATCH_ROUTES[call.tool]
+        result = await (route(model.model_validate(call.arguments)) if model else route())
+        output = result.model_dump(mode="json") if isinstance(result, BaseModel) else result
+
+    except ValidationError as e:
+        status_code, error = 422, str(e)
+    except HTTPException as e:
+        status_code, error = e.status_code, str(e.detail)
+    except Exception as e:
+        status_code, error = 500, str(e)
+
+    return ToolResult(
+        tool=call.tool,
+        success=error is None,
+        status_code=status_code,
+        output=output,
+        error=error,
+        duration_ms=(time.perf_counter() - start_time) * 1000,
+    )
+
+
+@app.post(
+    "/tools/batch",
+    response_model=BatchToolResponse,
+    tags=["tools"],
+    summary="Run several tools in one call",
+)
+async def batch_tools(request: BatchToolRequest) -> BatchToolResponse:
+    """Run a list of tool/resource invocations concurrently.
+
+    Lets an agent turn that needs e.g. the rules resource and an
+    irrigation decision pay for one round-trip instead of two. Each call
+    succeeds or fails on its own; a failed call reports the status code
+    its single-call route would have returned.
+
+    **Returns:** One result per call, in request order
+    """
+    logger.info("batch_tools", tools=[call.tool for call in request.calls])
+
+    results = await asyncio.gather(*(_run_invocation(call) for call in request.calls))
+    return BatchToolResponse(results=list(results))
 
 
 # ============================================================
@@ -764,6 +807,7 @@ async def health_check():
         "status": "healthy",
         "service": "zekalab-internal-mcp",
         "version": "1.0.0",
+        "rules": get_evaluator().status(),
         "timestamp": datetime.now().isoformat(),
     }
 
@@ -855,6 +899,18 @@ async def list_tools():
                 "name": "predict_harvest_date",
                 "description": "Predict harvest date based on growing conditions",
             },
+            {
+                "name": "predict_harvest_batch",
+                "description": "Predict harvest dates for many sowing declarations",
+            },
+            {
+                "name": "evaluate_farms",
+                "description": "Evaluate irrigation/fertilization/pest rules for many farms",
+            },
+            {
+                "name": "batch",
+                "description": "Run several tool/resource calls concurrently in one request",
+            },
         ]
     }
 
@@ -1,16 +1,38 @@
 # src/ALİM/mcp_server/tools/__init__.py
 """ZekaLab MCP Tools - Agricultural rule evaluation.
 
-Exports all 5 tools:
-1. evaluate_irrigation_rules
-2. evaluate_fertilization_rules
-3. evaluate_pest_control_rules
-4. calculate_subsidy
-5. predict_harvest_date
+Shared, rules-backed implementation of the ZekaLab tools:
+1. evaluate_irrigation_rules     -> ZekaLabEvaluator.irrigation
+2. evaluate_fertilization_rules  -> ZekaLabEvaluator.fertilization
+3. evaluate_pest_control_rules   -> ZekaLabEvaluator.pest_control
+4. calculate_subsidy             -> ZekaLabEvaluator.subsidy
+5. predict_harvest_date          -> ZekaLabEvaluator.harvest
+6. evaluate_farms                -> ZekaLabEvaluator.evaluate_farms (batch)
+7. predict_harvest_batch         -> ZekaLabEvaluator.harvest_batch (batch)
 
-Note: Actual implementations are in main.py for simplicity.
-This module is a placeholder for future modularization.
+Harvest prediction reads GDD from :class:`GDDService` (per-region/tile
+daily accumulations).
+
+Both servers (main.py and zekalab_fastmcp.py) expose these as routes/tools.
 """
 
-# Tools are defined in main.py as FastAPI routes
-# They can be imported here once modularized
+from alim.mcp_server.tools.evaluator import (
+    BATCH_TOOLS,
+    CROP_PROFILES,
+    SUBSIDY_DATABASE,
+    ZEKALAB_RULES_DIR,
+    ZekaLabEvaluator,
+    get_evaluator,
+)
+from alim.mcp_server.tools.gdd import GDDService, get_gdd_service
+
+__all__ = [
+    "BATCH_TOOLS",
+    "CROP_PROFILES",
+    "SUBSIDY_DATABASE",
+    "ZEKALAB_RULES_DIR",
+    "GDDService",
+    "ZekaLabEvaluator",
+    "get_evaluator",
+    "get_gdd_service",
+]
@@ -0,0 +1,655 @@
+# src/ALİM/mcp_server/tools/evaluator.py
+"""Rules-backed implementation of the ZekaLab MCP tools.
+
+Both ZekaLab servers (the FastAPI app in ``main.py`` and the FastMCP
+server in ``zekalab_fastmcp.py``) delegate here. Decisions come from the
+YAML rules in ``mcp_server/rules`` (hot-reloaded through a
+:class:`RuleSetRegistry`); this module only builds the rule context and
+turns the matched rules' metadata into tool responses.
+
+Rule matching goes through a :class:`MatchMemo`: farms in the same
+conditions - same crop and soil, temperature and moisture in the same
+bands between rule thresholds - share one cache entry. Amounts (water mm,
+NPK kg/ha, dates) are still computed from each farm's exact inputs.
+"""
+
+import os
+from datetime import date, datetime, timedelta
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from alim.config import settings
+from alim.mcp_server.tools.gdd import GDDService, get_gdd_service
+from alim.rules.engine import Rule, RuleCategory
+from alim.rules.memo import MatchMemo
+from alim.rules.registry import DirectoryRuleSource, RuleSetRegistry, RuleSetVersion
+
+logger = structlog.get_logger(__name__)
+
+ZEKALAB_RULES_DIR = Path(os.getenv("ZEKALAB_RULES_PATH") or Path(__file__).parent.parent / "rules")
+
+# Soil moisture (%) below which irrigation is considered, by soil type
+SOIL_MOISTURE_THRESHOLDS = {
+    "sandy": 50,  # drains fast, irrigate more often
+    "clay": 70,  # retains water
+}
+DEFAULT_MOISTURE_THRESHOLD = 60
+
+SEVERITY_ORDER = ["low", "medium", "high", "critical"]
+
+# Tools available to evaluate_farms
+BATCH_TOOLS = ("irrigation", "fertilization", "pest_control")
+
+CROP_PROFILES = {
+    "cotton": {
+        "gdd_requirement": 2600,
+        "gdd_base_temp_c": 10,
+        "water_requirement_mm": 400,
+        "nitrogen_kg_ha": 150,
+        "days_to_maturity": 150,
+    },
+    "wheat": {
+        "gdd_requirement": 2000,
+        "gdd_base_temp_c": 10,
+        "water_requirement_mm": 300,
+        "nitrogen_kg_ha": 120,
+        "days_to_maturity": 120,
+    },
+    "vegetables": {
+        "gdd_requirement": 1500,
+        "gdd_base_temp_c": 10,
+        "water_requirement_mm": 350,
+        "nitrogen_kg_ha": 100,
+        "days_to_maturity": 90,
+    },
+}
+
+SUBSIDY_DATABASE = {
+    "version": "2026-01",
+    "programs": {
+        "cotton": {
+            "rate_azn_per_hectare": 500,
+            "eligibility": "All registered farms",
+            "young_farmer_bonus": 0.25,
+        },
+        "wheat": {
+            "rate_azn_per_hectare": 300,
+            "eligibility": "Licensed grain producers",
+            "young_farmer_bonus": 0.25,
+        },
+        "vegetables": {
+            "rate_azn_per_hectare": 400,
+            "eligibility": "All registered farms",
+            "young_farmer_bonus": 0.25,
+        },
+    },
+    "application_period": "January 1 - December 31",
+    "contact": "subsidy-info@zekalab.gov.az",
+}
+
+
+def _text(value: Any) -> str:
+    """Lower-case string form of a crop/soil value (enum or str)."""
+    if isinstance(value, Enum):
+        value = value.value
+    return str(value).lower()
+
+
+class ZekaLabEvaluator:
+    """Evaluates ZekaLab tool requests against the ZekaLab rule set."""
+
+    def __init__(
+        self,
+        registry: RuleSetRegistry | None = None,
+        memo_size: int = 4096,
+        gdd: GDDService | None = None,
+    ):
+        """Initialize the evaluator.
+
+        Args:
+            registry: Rule-set registry; defaults to one over ZEKALAB_RULES_DIR
+            memo_size: Entries in the quantized-context match memo
+            gdd: GDD service for harvest prediction (default: the shared one)
+        """
+        self.registry = registry or RuleSetRegistry(DirectoryRuleSource(ZEKALAB_RULES_DIR))
+        self.memo = MatchMemo(maxsize=memo_size)
+        self.gdd = gdd or get_gdd_service()
+
+    def _match(
+        self,
+        version: RuleSetVersion,
+        context: dict[str, Any],
+        category: RuleCategory,
+    ) -> tuple[Rule, ...]:
+        matched = self.memo.match(version.compiled, context, [category])
+        if not matched:
+            raise LookupError(f"No {category.value} rule matched; rule set {version.version}")
+        return matched
+
+    # ----- Tools -----
+
+    def irrigation(
+        self,
+        crop_type: Any,
+        soil_type: Any,
+        current_soil_moisture_percent: float,
+        temperature_c: float,
+        rainfall_mm_last_7_days: float = 0,
+        growth_stage_days: int = 0,
+    ) -> dict[str, Any]:
+        """Whether and how much to irrigate (first matching rule decides)."""
+        soil = _text(soil_type)
+        moisture = current_soil_moisture_percent
+        threshold = SOIL_MOISTURE_THRESHOLDS.get(soil, DEFAULT_MOISTURE_THRESHOLD)
+        context = {
+            "farm": {
+                "crop": _text(crop_type),
+                "soil": soil,
+                "moisture_of_threshold_percent": moisture / threshold * 100,
+                "growth_stage_days": growth_stage_days,
+            },
+            "weather": {
+                "temperature_c": temperature_c,
+                "rainfall_7d_mm": rainfall_mm_last_7_days,
+            },
+        }
+        version = self.registry.current
+        rule = self._match(version, context, RuleCategory.IRRIGATION)[0]
+        meta = rule.metadata or {}
+
+        should_irrigate = bool(meta.get("should_irrigate"))
+        timing = meta.get("timing", "anytime")
+        water_mm = 0.0
+        if should_irrigate:
+            water_mm = (threshold - moisture) * meta.get("water_mm_per_deficit_percent", 0)
+        reasoning = meta.get("reasoning", rule.recommendation_en or "").format(
+            moisture=moisture,
+            threshold=threshold,
+            rainfall=rainfall_mm_last_7_days,
+            water_mm=water_mm,
+            timing=timing,
+        )
+
+        return {
+            "should_irrigate": should_irrigate,
+            "recommended_water_mm": water_mm,
+            "timing": timing,
+            "confidence": rule.confidence,
+            "rule_id": rule.id,
+            "reasoning": reasoning,
+            "rule_set_version": version.version,
+        }
+
+    def fertilization(
+        self,
+        crop_type: Any,
+        soil_type: Any,
+        soil_nitrogen_ppm: float | None = None,
+        soil_phosphorus_ppm: float | None = None,
+        soil_potassium_ppm: float | None = None,
+        growth_stage_days: int = 0,
+        previous_fertilizer_days_ago: int | None = None,
+    ) -> dict[str, Any]:
+        """NPK rates: the crop's base rule times every matching adjustment."""
+        context = {
+            "farm": {
+                "crop": _text(crop_type),
+                "soil": _text(soil_type),
+                "growth_stage_days": growth_stage_days,
+                "previous_fertilizer_days_ago": previous_fertilizer_days_ago,
+            },
+            "soil": {
+                "nitrogen_ppm": soil_nitrogen_ppm,
+                "phosphorus_ppm": soil_phosphorus_ppm,
+                "potassium_ppm": soil_potassium_ppm,
+            },
+        }
+        version = self.registry.current
+        matched = self._match(version, context, RuleCategory.FERTILIZATION)
+        base = next((r for r in matched if (r.metadata or {}).get("role") == "base"), None)
+        if base is None:
+            raise LookupError(f"No base fertilization rule matched; rule set {version.version}")
+
+        npk = {
+            nutrient: float(base.metadata.get(f"{nutrient}_kg_per_hectare", 0))
+            for nutrient in ("nitrogen", "phosphorus", "potassium")
+        }
+        timing = "Now"
+        for rule in matched:
+            meta = rule.metadata or {}
+            if meta.get("role") != "adjustment":
+                continue
+            for nutrient in npk:
+                npk[nutrient] *= meta.get(f"{nutrient}_factor", 1)
+            timing = meta.get("timing", timing)
+
+        reasoning = (
+            f"Recommended NPK: N={npk['nitrogen']:.0f}, P={npk['phosphorus']:.0f}, "
+            f"K={npk['potassium']:.0f} kg/ha. {timing}."
+        )
+
+        return {
+            "should_fertilize": True,
+            "nitrogen_kg_per_hectare": npk["nitrogen"],
+            "phosphorus_kg_per_hectare": npk["phosphorus"],
+            "potassium_kg_per_hectare": npk["potassium"],
+            "timing": timing,
+            "confidence": base.confidence,
+            "rule_id": base.id,
+            "reasoning": reasoning,
+            "rule_set_version": version.version,
+        }
+
+    def pest_control(
+        self,
+        crop_type: Any,
+        temperature_c: float,
+        humidity_percent: float,
+        observed_pests: list[str] | None = None,
+        growth_stage_days: int = 0,
+        rainfall_mm_last_3_days: float = 0,
+    ) -> dict[str, Any]:
+        """Pest action from the first matching rule; severity is the worst match."""
+        detected = list(dict.fromkeys(observed_pests or []))
+        context = {
+            "farm": {"crop": _text(crop_type), "growth_stage_days": growth_stage_days},
+            "weather": {
+                "temperature_c": temperature_c,
+                "humidity_percent": humidity_percent,
+                "rainfall_3d_mm": rainfall_mm_last_3_days,
+            },
+            "pests": dict.fromkeys(detected, True),
+        }
+        version = self.registry.current
+        matched = self._match(version, context, RuleCategory.PEST_CONTROL)
+        rule = matched[0]
+        meta = rule.metadata or {}
+        severity = max(
+            ((r.metadata or {}).get("severity", "low") for r in matched),
+            key=lambda s: SEVERITY_ORDER.index(s) if s in SEVERITY_ORDER else 0,
+        )
+        action = rule.recommendation_en or ""
+
+        reasoning = (
+            f"Pests detected: {', '.join(detected) if detected else 'None'}. "
+            f"Conditions: {temperature_c}°C, {humidity_percent}% RH. {action}"
+        )
+
+        return {
+            "pests_detected": detected,
+            "recommended_action": action,
+            "method": meta.get("method", "integrated"),
+            "severity": severity,
+            "confidence": rule.confidence,
+            "rule_id": rule.id,
+            "reasoning": reasoning,
+            "rule_set_version": version.version,
+        }
+
+    def harvest(
+        self,
+        crop_type: Any,
+        planting_date: str,
+        current_gdd_accumulated: float | None = None,
+        base_temperature_c: float = 10,
+        region: str | None = None,
+        latitude: float | None = None,
+        longitude: float | None = None,
+        as_of: str | None = None,
+    ) -> dict[str, Any]:
+        """Harvest date from the crop's GDD requirement.
+
+        GDD come from the :class:`GDDService` for the farm's region (or
+        weather tile, given coordinates): accumulated since planting unless
+        ``current_gdd_accumulated`` is reported, and projected forward from
+        ``as_of`` (default today) to the crop's requirement. The rule's
+        ``daily_gdd`` is only used if the requirement is not reached within
+        the service's horizon.
+
+        Raises:
+            ValueError: planting_date or as_of is not YYYY-MM-DD
+        """
+        crop = _text(crop_type)
+        planting = datetime.strptime(planting_date, "%Y-%m-%d").date()
+        today = datetime.strptime(as_of, "%Y-%m-%d").date() if as_of else date.today()
+        version = self.registry.current
+        rule = self._match(version, {"farm": {"crop": crop}}, RuleCategory.HARVEST)[0]
+        meta = rule.metadata or {}
+
+        key = self.gdd.key_for(region, latitude, longitude)
+        target_gdd = meta.get("gdd_requirement", 2000)
+        if current_gdd_accumulated is None:
+            accumulated = self.gdd.gdd_between(key, planting, today, base_temperature_c)
+        else:
+            accumulated = float(current_gdd_accumulated)
+
+        start = max(planting, today)
+        reached = self.gdd.date_reaching(
+            key, start, max(0.0, target_gdd - accumulated), base_temperature_c
+        )
+        return self._harvest_result(
+            rule, version, meta, target_gdd, accumulated, reached, start, today
+        )
+
+    def harvest_batch(
+        self,
+        declarations: list[dict[str, Any]],
+        as_of: str | None = None,
+    ) -> dict[str, Any]:
+        """Predict harvest for many sowing declarations in one call.
+
+        Declarations are grouped by GDD timeline (region/tile and base
+        temperature); each group costs one cumulative-sum lookup and one
+        vectorized binary search however many declarations it has.
+
+        Args:
+            declarations: Dicts with declaration_id, crop_type, sowing_date
+                and optionally region, latitude, longitude,
+                current_gdd_accumulated, base_temperature_c
+            as_of: Prediction date (YYYY-MM-DD, default today)
+        """
+        today = datetime.strptime(as_of, "%Y-%m-%d").date() if as_of else date.today()
+        version = self.registry.current
+        results: list[dict[str, Any] | None] = [None] * len(declarations)
+        groups: dict[tuple[str, float], list[tuple[int, dict[str, Any], date]]] = {}
+
+        for i, declaration in enumerate(declarations):
+            try:
+                sowing = datetime.strptime(declaration["sowing_date"], "%Y-%m-%d").date()
+                key = self.gdd.key_for(
+                    declaration.get("region"),
+                    declaration.get("latitude"),
+                    declaration.get("longitude"),
+                )
+            except KeyError as e:
+                results[i] = {"error": f"Missing field: {e.args[0]}"}
+                continue
+            except Exception as e:
+                results[i] = {"error": str(e)}
+                continue
+            base = float(declaration.get("base_temperature_c", 10))
+            groups.setdefault((key, base), []).append((i, declaration, sowing))
+
+        for (key, base), members in groups.items():
+            sowings = [sowing for _, _, sowing in members]
+            accumulated = self.gdd.gdd_between_many(key, sowings, today, base)
+            rules = []
+            for j, (_, declaration, _) in enumerate(members):
+                rule = self._match(
+                    version,
+                    {"farm": {"crop": _text(declaration.get("crop_type"))}},
+                    RuleCategory.HARVEST,
+                )[0]
+                rules.append(rule)
+                reported = declaration.get("current_gdd_accumulated")
+                if reported is not None:
+                    accumulated[j] = reported
+
+            targets = [(rule.metadata or {}).get("gdd_requirement", 2000) for rule in rules]
+            starts = [max(sowing, today) for sowing in sowings]
+            remaining = [max(0.0, t - a) for t, a in zip(targets, accumulated, strict=True)]
+            reached = self.gdd.dates_reaching(key, starts, remaining, base)
+
+            for j, (i, declaration, _) in enumerate(members):
+                result = self._harvest_result(
+                    rules[j],
+                    version,
+                    rules[j].metadata or {},
+                    targets[j],
+                    float(accumulated[j]),
+                    reached[j],
+                    starts[j],
+                    today,
+                )
+                results[i] = {"declaration_id": declaration.get("declaration_id"), **result}
+
+        logger.info(
+            "zekalab_harvest_batch",
+            declarations=len(declarations),
+            timelines=len(groups),
+            as_of=today.isoformat(),
+        )
+
+        return {
+            "results": results,
+            "declaration_count": len(results),
+            "as_of": today.isoformat(),
+            "rule_set_version": version.version,
+        }
+
+    def _harvest_result(
+        self,
+        rule: Rule,
+        version: RuleSetVersion,
+        meta: dict[str, Any],
+        target_gdd: float,
+        accumulated: float,
+        reached: date | None,
+        start: date,
+        today: date,
+    ) -> dict[str, Any]:
+        """Harvest response for one crop, given when its GDD target is reached."""
+        if reached is None:
+            daily_gdd = meta.get("daily_gdd", 15)
+            gdd_remaining = max(0, target_gdd - accumulated)
+            reached = start + timedelta(
+                days=int(gdd_remaining / daily_gdd) if daily_gdd > 0 else 60
+            )
+        days_to_harvest = max(0, (reached - today).days)
+        progress = min(1.0, accumulated / target_gdd)
+
+        return {
+            "predicted_harvest_date": reached.isoformat(),
+            "days_to_harvest": days_to_harvest,
+            "maturity_confidence": min(0.95, 0.60 + progress * 0.35),
+            "gdd_accumulated": round(accumulated, 1),
+            "gdd_required": target_gdd,
+            "recommended_checks": [
+                "Monitor boll development",
+                "Check for boll lock (cotton) or grain moisture (wheat)",
+                "Plan harvesting logistics",
+            ],
+            "rule_id": rule.id,
+            "reasoning": (
+                f"GDD accumulated: {accumulated:.0f}/{target_gdd} "
+                f"({progress * 100:.1f}% complete). "
+                f"Estimated {days_to_harvest} days to maturity."
+            ),
+            "rule_set_version": version.version,
+        }
+
+    def subsidy(
+        self,
+        crop_type: Any,
+        hectares: float,
+        soil_type: Any,
+        farmer_age: int | None = None,
+        is_young_farmer: bool = False,
+    ) -> dict[str, Any]:
+        """Subsidy from the programme table (not rule-driven)."""
+        crop = _text(crop_type)
+        program = SUBSIDY_DATABASE["programs"].get(crop, {})
+        rate_per_hectare = program.get("rate_azn_per_hectare", 300)
+        subsidy_azn = rate_per_hectare * hectares
+        conditions = []
+        rule_id = "RULE_SUBSIDY_001_BASE"
+
+        if is_young_farmer or (farmer_age and farmer_age < 40):
+            subsidy_azn *= 1.25
+            conditions.append("Young farmer bonus applied (+25%)")
+            rule_id = "RULE_SUBSIDY_002_YOUNG_FARMER"
+
+        if _text(soil_type) == "calcareous":
+            subsidy_azn *= 1.15
+            conditions.append("Calcareous soil support applied (+15%)")
+            rule_id = "RULE_SUBSIDY_003_SOIL_SUPPORT"
+
+        if hectares > 50:
+            subsidy_azn *= 0.9
+            conditions.append("Large farm reduction (-10%)")
+
+        conditions.extend(
+            [
+                "Must maintain production records",
+                "Eco-friendly practices encouraged",
+                "Must report production outcomes",
+            ]
+        )
+
+        return {
+            "eligible": True,
+            "subsidy_azn": subsidy_azn,
+            "subsidy_per_hectare_azn": rate_per_hectare,
+            "conditions": conditions,
+            "rule_id": rule_id,
+            "next_review_date": (datetime.now() + timedelta(days=365)).strftime("%Y-%m-%d"),
+        }
+
+    # ----- Batch -----
+
+    def evaluate_farm(
+        self,
+        farm: dict[str, Any],
+        tools: tuple[str, ...] | list[str] = BATCH_TOOLS,
+    ) -> dict[str, Any]:
+        """Run several tools for one farm; a failing tool yields {"error": ...}."""
+        result: dict[str, Any] = {"farm_id": farm.get("farm_id")}
+        for tool in tools:
+            try:
+                if tool == "irrigation":
+                    result[tool] = self.irrigation(
+                        crop_type=farm["crop_type"],
+                        soil_type=farm["soil_type"],
+                        current_soil_moisture_percent=farm["current_soil_moisture_percent"],
+                        temperature_c=farm["temperature_c"],
+                        rainfall_mm_last_7_days=farm.get("rainfall_mm_last_7_days") or 0,
+                        growth_stage_days=farm.get("growth_stage_days") or 0,
+                    )
+                elif tool == "fertilization":
+                    result[tool] = self.fertilization(
+                        crop_type=farm["crop_type"],
+                        soil_type=farm["soil_type"],
+                        soil_nitrogen_ppm=farm.get("soil_nitrogen_ppm"),
+                        soil_phosphorus_ppm=farm.get("soil_phosphorus_ppm"),
+                        soil_potassium_ppm=farm.get("soil_potassium_ppm"),
+                        growth_stage_days=farm.get("growth_stage_days") or 0,
+                        previous_fertilizer_days_ago=farm.get("previous_fertilizer_days_ago"),
+                    )
+                elif tool == "pest_control":
+                    result[tool] = self.pest_control(
+                        crop_type=farm["crop_type"],
+                        temperature_c=farm["temperature_c"],
+                        humidity_percent=farm["humidity_percent"],
+                        observed_pests=farm.get("observed_pests"),
+                        growth_stage_days=farm.get("growth_stage_days") or 0,
+                        rainfall_mm_last_3_days=farm.get("rainfall_mm_last_3_days") or 0,
+                    )
+                else:
+                    raise ValueError(f"Unknown tool: {tool}")
+            except KeyError as e:
+                result[tool] = {"error": f"Missing field: {e.args[0]}"}
+            except Exception as e:
+                result[tool] = {"error": str(e)}
+        return result
+
+    def evaluate_farms(
+        self,
+        farms: list[dict[str, Any]],
+        tools: tuple[str, ...] | list[str] = BATCH_TOOLS,
+    ) -> dict[str, Any]:
+        """Evaluate many farms in one call.
+
+        Farms in the same conditions hit the same memo entries, so a batch
+        costs about one rule evaluation per distinct condition band.
+        """
+        version = self.registry.current
+        before = self.memo.info()
+        results = [self.evaluate_farm(farm, tools) for farm in farms]
+        after = self.memo.info()
+
+        logger.info(
+            "zekalab_batch_evaluated",
+            farms=len(farms),
+            tools=list(tools),
+            memo_hits=after["hits"] - before["hits"],
+            memo_misses=after["misses"] - before["misses"],
+        )
+
+        return {
+            "results": results,
+            "farm_count": len(results),
+            "rule_set_version": version.version,
+            "cache": {
+                "hits": after["hits"] - before["hits"],
+                "misses": after["misses"] - before["misses"],
+            },
+        }
+
+    # ----- Resources -----
+
+    def rules_resource(self) -> dict[str, Any]:
+        """The active rule set, grouped by category."""
+        version = self.registry.current
+        rules: dict[str, dict[str, Any]] = {
+            c.value: {}
+            for c in (
+                RuleCategory.IRRIGATION,
+                RuleCategory.FERTILIZATION,
+                RuleCategory.PEST_CONTROL,
+                RuleCategory.HARVEST,
+            )
+        }
+        for rule in version.rules:
+            rules.setdefault(rule.category.value, {})[rule.id] = {
+                "name": rule.name,
+                "description": rule.description,
+                "priority": rule.priority.value,
+                "confidence": rule.confidence,
+                "conditions": [
+                    {"field": c.field, "operator": c.operator.value, "value": c.value}
+                    for c in rule.conditions
+                ],
+                "recommendation_az": rule.recommendation_az,
+                "recommendation_en": rule.recommendation_en,
+                "metadata": rule.metadata or {},
+            }
+
+        return {
+            "version": version.version,
+            "last_updated": version.created_at.isoformat(),
+            "rule_count": version.rule_count,
+            "rules": rules,
+        }
+
+    def status(self) -> dict[str, Any]:
+        """Registry and memo state, for health endpoints."""
+        return {
+            "rules": self.registry.status(),
+            "memo": self.memo.info(),
+            "gdd": self.gdd.info(),
+        }
+
+
+# ============================================================
+# Singleton Instance
+# ============================================================
+
+_evaluator: ZekaLabEvaluator | None = None
+
+
+def get_evaluator() -> ZekaLabEvaluator:
+    """Get the singleton ZekaLab evaluator."""
+    global _evaluator
+    if _evaluator is None:
+        _evaluator = ZekaLabEvaluator(
+            RuleSetRegistry(
+                DirectoryRuleSource(ZEKALAB_RULES_DIR),
+                keep_versions=settings.rules_keep_versions,
+                poll_interval_seconds=settings.rules_reload_interval_seconds,
+            ),
+            memo_size=settings.rules_memo_size,
+        )
+    return _evaluator
@@ -0,0 +1,316 @@
+# src/ALİM/mcp_server/tools/gdd.py
+"""Growing Degree Day (GDD) accumulation service.
+
+Harvest prediction needs "GDD between two dates" for a region or weather
+tile. The service keeps one contiguous daily timeline per key:
+
+- Days start from the region's monthly climate normals (interpolated
+  daily) and are overwritten by observed weather as it is ingested
+- Daily GDD and its cumulative sum are cached per base temperature, so a
+  range query is two array lookups and "date a target is reached" is a
+  binary search
+- Timelines grow a year at a time as queries or observations need them;
+  ingesting observations only invalidates that key's cached sums
+
+Example:
+    ```python
+    gdd = get_gdd_service()
+    key = gdd.key_for("aran")
+    gdd.ingest(key, [(date(2026, 5, 1), 14.0, 27.5)])
+    accumulated = gdd.gdd_between(key, date(2026, 4, 1), date.today())
+    maturity = gdd.date_reaching(key, date.today(), 2600 - accumulated)
+    ```
+"""
+
+import math
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+import numpy as np
+import structlog
+
+from alim.config import settings
+
+logger = structlog.get_logger(__name__)
+
+# Monthly mean (min, max) air temperature in °C, January..December
+REGION_CLIMATE: dict[str, tuple[tuple[float, float], ...]] = {
+    "aran": (
+        (1, 9), (2, 11), (5, 15), (10, 22), (15, 27), (20, 32),
+        (23, 35), (22, 34), (17, 29), (11, 22), (6, 15), (2, 10),
+    ),
+    "ganja_gazakh": (
+        (-1, 6), (0, 8), (3, 13), (8, 19), (13, 24), (17, 29),
+        (20, 32), (19, 31), (15, 26), (9, 19), (4, 12), (0, 7),
+    ),
+    "shaki_zagatala": (
+        (-3, 5), (-2, 7), (2, 12), (7, 18), (11, 23), (15, 27),
+        (18, 30), (17, 29), (13, 24), (8, 18), (3, 11), (-1, 6),
+    ),
+    "lankaran": (
+        (2, 9), (3, 10), (5, 12), (10, 18), (15, 24), (19, 28),
+        (22, 31), (21, 30), (17, 26), (12, 20), (8, 15), (4, 11),
+    ),
+    "guba_khachmaz": (
+        (-4, 4), (-3, 5), (0, 9), (5, 15), (10, 21), (14, 25),
+        (17, 28), (16, 27), (12, 22), (7, 16), (2, 10), (-2, 5),
+    ),
+    "mountainous_shirvan": (
+        (-3, 5), (-2, 6), (1, 11), (6, 17), (11, 22), (15, 27),
+        (18, 30), (17, 29), (13, 24), (8, 17), (3, 11), (-1, 6),
+    ),
+    "upper_karabakh": (
+        (-4, 3), (-3, 5), (0, 9), (5, 15), (9, 20), (13, 24),
+        (16, 27), (15, 27), (11, 22), (6, 15), (1, 9), (-2, 4),
+    ),
+}  # fmt: skip
+DEFAULT_REGION = "aran"
+
+# Years past the query date a "date reaching" search may look ahead
+HORIZON_YEARS = 2
+
+
+def _normalize(region: str | None) -> str:
+    """Region key: lower case, spaces/dashes as underscores."""
+    if not region:
+        return DEFAULT_REGION
+    return str(getattr(region, "value", region)).strip().lower().replace("-", "_").replace(" ", "_")
+
+
+@dataclass
+class _Timeline:
+    """Daily temperatures for one key, from January 1 of ``first_year``."""
+
+    first_year: int
+    region: str
+    tmin: np.ndarray
+    tmax: np.ndarray
+    observed: np.ndarray
+    # base temperature -> cumulative GDD with a leading 0
+    # (cumsum[i] = GDD of days [0, i))
+    cumsum: dict[float, np.ndarray] = field(default_factory=dict)
+
+    @property
+    def origin(self) -> date:
+        return date(self.first_year, 1, 1)
+
+    @property
+    def end(self) -> date:
+        """First day not covered."""
+        return self.origin + timedelta(days=len(self.tmin))
+
+
+class GDDService:
+    """Per-region/per-tile daily GDD with O(1) range queries."""
+
+    def __init__(
+        self,
+        climate: dict[str, tuple[tuple[float, float], ...]] | None = None,
+        tile_degrees: float | None = None,
+    ):
+        """Initialize the service.
+
+        Args:
+            climate: Monthly (min, max) normals by region (default REGION_CLIMATE)
+            tile_degrees: Tile edge for coordinate keys (default: weather cache tiles)
+        """
+        self.climate = climate or REGION_CLIMATE
+        self.tile_degrees = tile_degrees or settings.weather_tile_degrees
+        self._timelines: dict[str, _Timeline] = {}
+        self._regions: dict[str, str] = {}
+
+    # ====================================================================
+    # Keys
+    # ====================================================================
+
+    def key_for(
+        self,
+        region: str | None = None,
+        latitude: float | None = None,
+        longitude: float | None = None,
+    ) -> str:
+        """Timeline key for a region, or for the weather tile of a coordinate.
+
+        A tile uses its region's climate normals until observations arrive.
+        """
+        region = _normalize(region)
+        if latitude is None or longitude is None:
+            key = region
+        else:
+            lat_idx = math.floor(latitude / self.tile_degrees)
+            lon_idx = math.floor(longitude / self.tile_degrees)
+            key = f"tile:{self.tile_degrees}:{lat_idx}:{lon_idx}"
+        self._regions.setdefault(key, region)
+        return key
+
+    # ====================================================================
+    # Ingestion
+    # ====================================================================
+
+    def ingest(self, key: str, observations: Iterable[tuple[date, float, float]]) -> int:
+        """Overwrite days with observed (min, max) temperatures.
+
+        Args:
+            key: Timeline key (see :meth:`key_for`)
+            observations: (day, tmin_c, tmax_c) tuples
+
+        Returns:
+            Number of days written
+        """
+        observations = sorted(observations)
+        if not observations:
+            return 0
+
+        timeline = self._ensure(key, observations[0][0].year, observations[-1][0].year)
+        days = np.array([(day - timeline.origin).days for day, _, _ in observations])
+        timeline.tmin[days] = [tmin for _, tmin, _ in observations]
+        timeline.tmax[days] = [tmax for _, _, tmax in observations]
+        timeline.observed[days] = True
+        timeline.cumsum.clear()
+
+        logger.info(
+            "gdd_observations_ingested",
+            key=key,
+            days=len(observations),
+            start=observations[0][0].isoformat(),
+            end=observations[-1][0].isoformat(),
+        )
+        return len(observations)
+
+    # ====================================================================
+    # Queries
+    # ====================================================================
+
+    def gdd_between(self, key: str, start: date, end: date, base_c: float = 10.0) -> float:
+        """GDD accumulated over [start, end); 0 if end <= start."""
+        if end <= start:
+            return 0.0
+        timeline, cumsum = self.cumulative(key, start.year, end.year, base_c)
+        origin = timeline.origin
+        return float(cumsum[(end - origin).days] - cumsum[(start - origin).days])
+
+    def date_reaching(
+        self, key: str, start: date, target_gdd: float, base_c: float = 10.0
+    ) -> date | None:
+        """Day on which GDD accumulated from ``start`` reaches ``target_gdd``.
+
+        Returns None if it is not reached within HORIZON_YEARS.
+        """
+        return self.dates_reaching(key, [start], [target_gdd], base_c)[0]
+
+    def gdd_between_many(
+        self, key: str, starts: Sequence[date], end: date, base_c: float = 10.0
+    ) -> np.ndarray:
+        """Vectorized :meth:`gdd_between` for many start dates and one end."""
+        if not starts:
+            return np.zeros(0)
+        first = min(min(starts), end)
+        timeline, cumsum = self.cumulative(key, first.year, end.year, base_c)
+        origin = timeline.origin
+        start_idx = np.array([(start - origin).days for start in starts])
+        totals = cumsum[(end - origin).days] - cumsum[start_idx]
+        return np.maximum(totals, 0.0)
+
+    def dates_reaching(
+        self,
+        key: str,
+        starts: Sequence[date],
+        targets: Sequence[float],
+        base_c: float = 10.0,
+    ) -> list[date | None]:
+        """Vectorized :meth:`date_reaching` (one binary search per start)."""
+        if not starts:
+            return []
+        timeline, cumsum = self.cumulative(
+            key, min(starts).year, max(starts).year + HORIZON_YEARS, base_c
+        )
+        origin = timeline.origin
+        start_idx = np.array([(start - origin).days for start in starts])
+        needed = cumsum[start_idx] + np.maximum(np.asarray(targets, dtype=float), 0.0)
+        # First i with cumsum[i] >= needed: the target is reached on day i - 1
+        reached = np.searchsorted(cumsum, needed, side="left")
+
+        dates: list[date | None] = []
+        for first, end in zip(start_idx, reached, strict=True):
+            if end >= len(cumsum):
+                dates.append(None)
+            else:
+                dates.append(origin + timedelta(days=int(max(end - 1, first))))
+        return dates
+
+    def cumulative(
+        self, key: str, first_year: int, last_year: int, base_c: float = 10.0
+    ) -> tuple[_Timeline, np.ndarray]:
+        """Timeline covering the years and its cumulative GDD for ``base_c``."""
+        timeline = self._ensure(key, first_year, last_year)
+        cumsum = timeline.cumsum.get(base_c)
+        if cumsum is None:
+            mean = (timeline.tmin + timeline.tmax) / 2
+            cumsum = np.concatenate(([0.0], np.cumsum(np.maximum(mean - base_c, 0.0))))
+            timeline.cumsum[base_c] = cumsum
+        return timeline, cumsum
+
+    def info(self) -> dict[str, int]:
+        """Timeline sizes, for health endpoints."""
+        return {
+            "keys": len(self._timelines),
+            "days": sum(len(t.tmin) for t in self._timelines.values()),
+            "observed_days": sum(int(t.observed.sum()) for t in self._timelines.values()),
+        }
+
+    # ====================================================================
+    # Internals
+    # ====================================================================
+
+    def _ensure(self, key: str, first_year: int, last_year: int) -> _Timeline:
+        """Get the key's timeline, extended to cover [first_year, last_year]."""
+        timeline = self._timelines.get(key)
+        if timeline is None:
+            region = self._regions.get(key) or _normalize(key)
+            tmin, tmax = self._normals(region, first_year, last_year)
+            timeline = _Timeline(first_year, region, tmin, tmax, np.zeros(len(tmin), dtype=bool))
+            self._timelines[key] = timeline
+            return timeline
+
+        last = timeline.end.year - 1
+        if first_year < timeline.first_year:
+            tmin, tmax = self._normals(timeline.region, first_year, timeline.first_year - 1)
+            timeline.tmin = np.concatenate((tmin, timeline.tmin))
+            timeline.tmax = np.concatenate((tmax, timeline.tmax))
+            timeline.observed = np.concatenate((np.zeros(len(tmin), dtype=bool), timeline.observed))
+            timeline.first_year = first_year
+            timeline.cumsum.clear()
+        if last_year > last:
+            tmin, tmax = self._normals(timeline.region, last + 1, last_year)
+            timeline.tmin = np.concatenate((timeline.tmin, tmin))
+            timeline.tmax = np.concatenate((timeline.tmax, tmax))
+            timeline.observed = np.concatenate((timeline.observed, np.zeros(len(tmin), dtype=bool)))
+            timeline.cumsum.clear()
+        return timeline
+
+    def _normals(
+        self, region: str, first_year: int, last_year: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Daily (tmin, tmax) interpolated from monthly normals, mid-month anchored."""
+        monthly = np.array(self.climate.get(region) or self.climate[DEFAULT_REGION], dtype=float)
+        tmin, tmax = [], []
+        for year in range(first_year, last_year + 1):
+            jan1 = date(year, 1, 1)
+            length = (date(year + 1, 1, 1) - jan1).days
+            anchors = [(date(year, month, 15) - jan1).days for month in range(1, 13)]
+            days = np.arange(length)
+            tmin.append(np.interp(days, anchors, monthly[:, 0], period=length))
+            tmax.append(np.interp(days, anchors, monthly[:, 1], period=length))
+        return np.concatenate(tmin), np.concatenate(tmax)
+
+
+_gdd_service: GDDService | None = None
+
+
+def get_gdd_service() -> GDDService:
+    """Get the process-wide GDD service (singleton)."""
+    global _gdd_service
+    if _gdd_service is None:
+        _gdd_service = GDDService()
+    return _gdd_service
@@ -22,30 +22,54 @@ Example:
     ```
 """
 
+from alim.rules.batch import RuleBatch
+from alim.rules.compiler import CompiledRuleSet, compile_rules
 from alim.rules.engine import (
     Condition,
     Operator,
     Rule,
     RuleCategory,
     RuleLoader,
+    RuleLoadError,
     RulePriority,
     RulesEngine,
     build_rule_context,
     get_rules_engine,
 )
+from alim.rules.memo import ContextQuantizer, MatchMemo
+from alim.rules.registry import (
+    DirectoryRuleSource,
+    RuleSetRegistry,
+    RuleSetVersion,
+    RuleSource,
+    get_rule_registry,
+)
 
 __all__ = [
     # Engine
     "RulesEngine",
     "get_rules_engine",
+    # Compiler
+    "CompiledRuleSet",
+    "compile_rules",
+    "RuleBatch",
+    "MatchMemo",
+    "ContextQuantizer",
     # Models
     "Rule",
     "Condition",
     "Operator",
     "RuleCategory",
     "RulePriority",
+    # Registry
+    "RuleSetRegistry",
+    "RuleSetVersion",
+    "RuleSource",
+    "DirectoryRuleSource",
+    "get_rule_registry",
     # Loader
     "RuleLoader",
+    "RuleLoadError",
     # Helpers
     "build_rule_context",
 ]
@@ -0,0 +1,419 @@
+# src/ALİM/rules/batch.py
+"""Vectorized rule evaluation over many contexts.
+
+Used for nightly runs over every farm (one context per farm-day). A batch
+of contexts is turned into one column per referenced field and every
+distinct condition becomes a boolean mask over the whole batch; a rule
+matches where the AND of its condition masks is true.
+
+Each column is split by value kind so results stay identical to the
+scalar :meth:`CompiledRuleSet.evaluate`:
+
+- numbers (int/float/bool) go into a float array and are compared with
+  NumPy (``gt/gte/lt/lte/between/eq/ne/in/not_in``);
+- other hashable values (strings, ...) are factorized, and the condition
+  is evaluated once per distinct value and broadcast back;
+- missing values (None / absent keys) never match, as in the scalar path;
+- anything else (unhashable values, exotic operands) falls back to the
+  scalar predicate for just those rows.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from typing import Any
+
+import numpy as np
+
+from alim.rules.compiler import CompiledRule, compile_accessor, compile_predicate
+from alim.rules.engine import Condition, Operator, Rule, RuleCategory
+
+# Integers beyond this lose precision as float64; keep them on the scalar path
+_MAX_EXACT_INT = 2**53
+
+_NUMBER_TYPES = (int, float, bool)
+_COMPARISONS = {
+    Operator.EQ: np.equal,
+    Operator.NE: np.not_equal,
+    Operator.GT: np.greater,
+    Operator.GTE: np.greater_equal,
+    Operator.LT: np.less,
+    Operator.LTE: np.less_equal,
+}
+
+
+# ============================================================
+# Columnar Batch
+# ============================================================
+
+
+class Column:
+    """One field across a batch, split into numeric and other rows."""
+
+    __slots__ = (
+        "values",
+        "numbers",
+        "is_number",
+        "other_rows",
+        "other_codes",
+        "other_values",
+        "loose_rows",
+    )
+
+    def __init__(
+        self,
+        values: Sequence[Any] | None,
+        numbers: np.ndarray | None,
+        is_number: np.ndarray | None,
+        other_rows: np.ndarray | None = None,
+        other_codes: np.ndarray | None = None,
+        other_values: list[Any] | None = None,
+        loose_rows: list[int] | None = None,
+    ):
+        self.values = values  # original values, for scalar fallback
+        self.numbers = numbers  # numeric view; junk where is_number is False
+        self.is_number = is_number  # None means every row is numeric
+        self.other_rows = other_rows  # rows holding hashable non-numbers
+        self.other_codes = other_codes  # index into other_values per other row
+        self.other_values = other_values or []
+        self.loose_rows = loose_rows or []  # unhashable values
+
+    def value(self, row: int) -> Any:
+        """Original value of one row."""
+        if self.values is not None:
+            return self.values[row]
+        return self.numbers[row].item()
+
+    def number_rows(self) -> np.ndarray:
+        if self.numbers is None:
+            return np.empty(0, dtype=np.intp)
+        if self.is_number is None:
+            return np.arange(len(self.numbers))
+        return np.flatnonzero(self.is_number)
+
+    @classmethod
+    def from_values(cls, values: Sequence[Any]) -> Column:
+        """Classify a sequence of Python values."""
+        number_rows: list[int] = []
+        number_values: list[float] = []
+        other_rows: list[int] = []
+        other_codes: list[int] = []
+        other_values: list[Any] = []
+        codes: dict[tuple[type, Any], int] = {}
+        loose: list[int] = []
+
+        for i, v in enumerate(values):
+            t = type(v)
+            if t is float or t is bool or (t is int and -_MAX_EXACT_INT <= v <= _MAX_EXACT_INT):
+                number_rows.append(i)
+                number_values.append(v)
+            elif v is None:
+                continue
+            else:
+                # Keyed by type too: 1, 1.0 and True hash alike but str() differently
+                key = (t, v)
+                try:
+                    code = codes.get(key)
+                    if code is None:
+                        code = codes[key] = len(other_values)
+                        other_values.append(v)
+                except TypeError:
+                    loose.append(i)
+                    continue
+                other_rows.append(i)
+                other_codes.append(code)
+
+        n = len(values)
+        numbers = is_number = None
+        if number_rows:
+            numbers = np.zeros(n, dtype=np.float64)
+            is_number = np.zeros(n, dtype=bool)
+            idx = np.asarray(number_rows, dtype=np.intp)
+            numbers[idx] = number_values
+            is_number[idx] = True
+
+        return cls(
+            values,
+            numbers,
+            is_number,
+            np.asarray(other_rows, dtype=np.intp) if other_rows else None,
+            np.asarray(other_codes, dtype=np.intp) if other_codes else None,
+            other_values,
+            loose,
+        )
+
+    @classmethod
+    def from_array(cls, data: Any) -> Column:
+        """Wrap an array-like column (NumPy arrays are used without copying)."""
+        array = np.asarray(data)
+        if array.dtype.kind in "biuf":
+            if array.dtype.kind in "iu" and array.size and np.abs(array).max() > _MAX_EXACT_INT:
+                return cls.from_values(array.tolist())
+            return cls(None, array, None)
+        if array.dtype.kind in "US":
+            uniques, codes = np.unique(array, return_inverse=True)
+            return cls(
+                None,
+                None,
+                None,
+                np.arange(len(array)),
+                codes.astype(np.intp, copy=False),
+                uniques.tolist(),
+            )
+        return cls.from_values(array.tolist())
+
+
+class RuleBatch:
+    """A batch of contexts in columnar form, keyed by dotted field path.
+
+    Build it from context dicts, or straight from arrays when the data
+    already is columnar (e.g. a nightly query over all farms):
+
+        ```python
+        batch = RuleBatch.from_columns(
+            {
+                "weather.temperature_c": temps,  # float64 array
+                "farm.region": regions,  # str array
+                "intent": ["irrigation"] * len(temps),
+            }
+        )
+        ```
+
+    In object columns None means "missing"; numeric arrays have no
+    missing values (NaN is an ordinary value, as it is in a context).
+    """
+
+    def __init__(self, columns: dict[str, Column], size: int):
+        self.columns = columns
+        self.size = size
+
+    @classmethod
+    def from_contexts(cls, contexts: Sequence[dict[str, Any]], fields: Iterable[str]) -> RuleBatch:
+        """Extract the given fields from context dicts."""
+        columns = {}
+        for path in fields:
+            get = compile_accessor(path)
+            columns[path] = Column.from_values([get(c) for c in contexts])
+        return cls(columns, len(contexts))
+
+    @classmethod
+    def from_columns(cls, columns: Mapping[str, Any]) -> RuleBatch:
+        """Wrap arrays keyed by field path; all must have the same length."""
+        wrapped = {path: Column.from_array(data) for path, data in columns.items()}
+        sizes = {len(data) for data in columns.values()}
+        if len(sizes) > 1:
+            raise ValueError(f"Columns have different lengths: {sorted(sizes)}")
+        return cls(wrapped, sizes.pop() if sizes else 0)
+
+    def __len__(self) -> int:
+        return self.size
+
+
+# ============================================================
+# Condition Masks
+# ============================================================
+
+
+def _is_number(value: Any) -> bool:
+    return type(value) in _NUMBER_TYPES
+
+
+def _numeric_test(condition: Condition) -> Callable[[np.ndarray], np.ndarray] | None:
+    """Vectorized form of a condition for numeric rows, if there is one."""
+    op, value = condition.operator, condition.value
+
+    if op in _COMPARISONS:
+        if _is_number(value):
+            compare = _COMPARISONS[op]
+            return lambda x: compare(x, value)
+        if isinstance(value, str) and op in (Operator.EQ, Operator.NE):
+            # A number never equals a string
+            constant = op == Operator.NE
+            return lambda x: np.full(len(x), constant)
+        return None
+
+    if op == Operator.BETWEEN:
+        if isinstance(value, list | tuple) and len(value) >= 2:
+            low, high = value[0], value[1]
+            if _is_number(low) and _is_number(high):
+                return lambda x: (x >= low) & (x <= high)
+        return None
+
+    if op in (Operator.IN, Operator.NOT_IN):
+        if not isinstance(value, list | tuple | set | frozenset):
+            return None
+        if not all(v is None or isinstance(v, str) or _is_number(v) for v in value):
+            return None
+        members = np.asarray([v for v in value if _is_number(v)], dtype=np.float64)
+        if op == Operator.IN:
+            return lambda x: np.isin(x, members)
+        return lambda x: ~np.isin(x, members)
+
+    return None
+
+
+class _ConditionSlot:
+    """A distinct condition and how to evaluate it over a column."""
+
+    __slots__ = ("field", "test", "numeric")
+
+    def __init__(self, condition: Condition):
+        self.field = condition.field
+        self.test = compile_predicate(condition)
+        self.numeric = _numeric_test(condition)
+
+    def mask(self, column: Column | None, size: int) -> np.ndarray:
+        mask = np.zeros(size, dtype=bool)
+        if column is None:
+            return mask
+
+        test = self.test
+
+        if column.numbers is not None:
+            if self.numeric is not None:
+                with np.errstate(invalid="ignore"):
+                    hits = self.numeric(column.numbers)
+                if column.is_number is not None:
+                    hits &= column.is_number
+                mask |= hits
+            else:
+                for row in column.number_rows().tolist():
+                    mask[row] = test(column.value(row))
+
+        if column.other_rows is not None:
+            table = np.fromiter(
+                (bool(test(v)) for v in column.other_values),
+                dtype=bool,
+                count=len(column.other_values),
+            )
+            mask[column.other_rows] = table[column.other_codes]
+
+        for row in column.loose_rows:
+            mask[row] = test(column.value(row))
+
+        return mask
+
+
+def _condition_key(condition: Condition) -> tuple[str, Operator, Any]:
+    value = condition.value
+    if isinstance(value, list):
+        value = tuple(value)
+    try:
+        hash(value)
+    except TypeError:
+        value = ("__unhashable__", id(condition.value))
+    # The type is part of the key: 1 == True but "1" is not str(True)
+    return condition.field, condition.operator, (type(condition.value), value)
+
+
+# ============================================================
+# Batch Plan
+# ============================================================
+
+
+class BatchPlan:
+    """Vectorized evaluation plan for a compiled rule set.
+
+    Conditions shared between rules are evaluated once per batch.
+    """
+
+    def __init__(self, rules: Sequence[CompiledRule]):
+        """Build the plan.
+
+        Args:
+            rules: Compiled rules in priority order
+        """
+        slots: dict[tuple[str, Operator, Any], int] = {}
+        self._slots: list[_ConditionSlot] = []
+        self._rules: list[tuple[CompiledRule, tuple[int, ...]]] = []
+        uses: list[int] = []
+
+        for compiled in rules:
+            ids = []
+            for condition in compiled.rule.conditions:
+                key = _condition_key(condition)
+                slot = slots.get(key)
+                if slot is None:
+                    slot = slots[key] = len(self._slots)
+                    self._slots.append(_ConditionSlot(condition))
+                    uses.append(0)
+                uses[slot] += 1
+                ids.append(slot)
+            self._rules.append((compiled, tuple(ids)))
+
+        self._shared = {slot for slot, count in enumerate(uses) if count > 1}
+        self.fields = list(dict.fromkeys(s.field for s in self._slots))
+
+    def match(
+        self,
+        batch: RuleBatch,
+        categories: Iterable[RuleCategory] | None = None,
+    ) -> list[tuple[Rule, np.ndarray]]:
+        """Rows matched by each rule, for rules that match any row.
+
+        Args:
+            batch: Columnar contexts
+            categories: Optional filter for rule categories
+
+        Returns:
+            (rule, row indices) pairs in priority order
+        """
+        return [(compiled.rule, rows) for compiled, rows in self._match(batch, categories)]
+
+    def _match(
+        self,
+        batch: RuleBatch,
+        categories: Iterable[RuleCategory] | None,
+    ) -> list[tuple[CompiledRule, np.ndarray]]:
+        wanted = frozenset(categories) if categories else None
+        size = batch.size
+        cache: dict[int, np.ndarray] = {}
+        results = []
+
+        def slot_mask(slot: int) -> np.ndarray:
+            mask = cache.get(slot)
+            if mask is None:
+                condition = self._slots[slot]
+                mask = condition.mask(batch.columns.get(condition.field), size)
+                if slot in self._shared:
+                    cache[slot] = mask
+            return mask
+
+        for compiled, ids in self._rules:
+            if wanted is not None and compiled.category not in wanted:
+                continue
+            if not ids:  # no conditions: matches everything, like all([])
+                results.append((compiled, np.arange(size)))
+                continue
+
+            mask = slot_mask(ids[0])
+            for slot in ids[1:]:
+                if not mask.any():
+                    break
+                mask = mask & slot_mask(slot)
+
+            rows = np.flatnonzero(mask)
+            if len(rows):
+                results.append((compiled, rows))
+
+        return results
+
+    def evaluate(
+        self,
+        contexts: Sequence[dict[str, Any]] | RuleBatch,
+        categories: Iterable[RuleCategory] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Per-context match lists, sorted by priority like the scalar path."""
+        batch = (
+            contexts
+            if isinstance(contexts, RuleBatch)
+            else RuleBatch.from_contexts(contexts, self.fields)
+        )
+        per_context: list[list[dict[str, Any]]] = [[] for _ in range(batch.size)]
+
+        for compiled, rows in self._match(batch, categories):
+            template = compiled.match
+            for row in rows.tolist():
+                per_context[row].append(dict(template))
+
+        return per_context
@@ -0,0 +1,473 @@
+# src/ALİM/rules/compiler.py
+"""Rule set compiler.
+
+Turns a list of :class:`Rule` objects into a :class:`CompiledRuleSet`:
+
+- every condition becomes a closure with its field path pre-split and
+  its operator resolved once, instead of per evaluation;
+- every rule is anchored on its most selective indexable condition
+  (``eq`` > ``in`` > ``between`` > ``gt/gte/lt/lte``) and registered in a
+  per-field index - a hash map for equality, sorted threshold arrays
+  searched with ``bisect`` for ranges - so that evaluation only visits
+  rules whose anchor already matches the context;
+- rules are presorted by priority, so matches come out in order without
+  a sort per call.
+
+Results are identical to evaluating every rule in load order and sorting
+by priority, which is what ``RulesEngine.evaluate`` used to do.
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from alim.rules.engine import Condition, Operator, Rule, RuleCategory
+
+if TYPE_CHECKING:
+    from alim.rules.batch import BatchPlan, RuleBatch
+
+Accessor = Callable[[dict[str, Any]], Any]
+Check = Callable[[dict[str, Any]], bool]
+
+# Sort key for rule priorities (critical first); unknown priorities sort last
+PRIORITY_ORDER = {
+    "critical": 0,
+    "high": 1,
+    "medium": 2,
+    "low": 3,
+}
+
+# Anchor preference per operator - lower is more selective
+_SELECTIVITY = {
+    Operator.EQ: 0,
+    Operator.IN: 1,
+    Operator.BETWEEN: 2,
+    Operator.GT: 3,
+    Operator.GTE: 3,
+    Operator.LT: 3,
+    Operator.LTE: 3,
+}
+
+_RANGE_OPERATORS = (Operator.GT, Operator.GTE, Operator.LT, Operator.LTE)
+
+
+# ============================================================
+# Condition Compilation
+# ============================================================
+
+
+@lru_cache(maxsize=1024)
+def compile_accessor(path: str) -> Accessor:
+    """Compile a dotted field path into a context accessor.
+
+    Mirrors ``Condition._get_field_value``: a missing key or a non-dict
+    intermediate yields None. Accessors are pure, so one is shared by
+    every condition on the same path.
+    """
+    parts = tuple(path.split("."))
+
+    if len(parts) == 1:
+        (key,) = parts
+
+        def get_one(context: dict[str, Any]) -> Any:
+            return context.get(key)
+
+        return get_one
+
+    if len(parts) == 2:
+        outer, inner = parts
+
+        def get_two(context: dict[str, Any]) -> Any:
+            value = context.get(outer)
+            return value.get(inner) if isinstance(value, dict) else None
+
+        return get_two
+
+    def get_path(context: dict[str, Any]) -> Any:
+        value: Any = context
+        for part in parts:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(part)
+        return value
+
+    return get_path
+
+
+def _predicate(operator: Operator, expected: Any) -> Callable[[Any], bool]:
+    """Build the comparison for one operator with its operand bound."""
+    if operator == Operator.EQ:
+        return lambda actual: actual == expected
+    if operator == Operator.NE:
+        return lambda actual: actual != expected
+    if operator == Operator.GT:
+        return lambda actual: actual > expected
+    if operator == Operator.GTE:
+        return lambda actual: actual >= expected
+    if operator == Operator.LT:
+        return lambda actual: actual < expected
+    if operator == Operator.LTE:
+        return lambda actual: actual <= expected
+    if operator == Operator.IN:
+        return lambda actual: actual in expected
+    if operator == Operator.NOT_IN:
+        return lambda actual: actual not in expected
+    if operator == Operator.CONTAINS:
+        return lambda actual: expected in str(actual)
+    if operator == Operator.BETWEEN:
+        try:
+            low, high = expected[0], expected[1]
+        except (TypeError, IndexError, KeyError):
+            # Malformed operand: evaluate lazily so the error is swallowed
+            # per call exactly like Condition.evaluate does
+            return lambda actual: expected[0] <= actual <= expected[1]
+        return lambda actual: low <= actual <= high
+    return lambda actual: False
+
+
+def compile_condition(condition: Condition) -> Check:
+    """Compile a condition into a closure equivalent to ``condition.evaluate``."""
+    get = compile_accessor(condition.field)
+    predicate = _predicate(condition.operator, condition.value)
+
+    def check(context: dict[str, Any]) -> bool:
+        actual = get(context)
+        if actual is None:
+            return False
+        try:
+            return predicate(actual)
+        except (TypeError, ValueError):
+            return False
+
+    return check
+
+
+def compile_predicate(condition: Condition) -> Callable[[Any], bool]:
+    """Compile a condition into a test on an already-resolved field value."""
+    predicate = _predicate(condition.operator, condition.value)
+
+    def test(actual: Any) -> bool:
+        if actual is None:
+            return False
+        try:
+            return predicate(actual)
+        except (TypeError, ValueError):
+            return False
+
+    return test
+
+
+# ============================================================
+# Field Index
+# ============================================================
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, int | float) and not isinstance(value, bool) and not math.isnan(value)
+
+
+def _is_indexable(condition: Condition) -> bool:
+    """Whether a condition can be answered by the field index."""
+    op, value = condition.operator, condition.value
+
+    if op == Operator.EQ:
+        try:
+            hash(value)
+        except TypeError:
+            return False
+        return value is not None and value == value  # NaN never compares equal
+    if op == Operator.IN:
+        if not isinstance(value, list | tuple | set | frozenset):
+            return False
+        try:
+            for item in value:
+                hash(item)
+        except TypeError:
+            return False
+        return True
+    if op == Operator.BETWEEN:
+        return (
+            isinstance(value, list | tuple)
+            and len(value) >= 2
+            and _is_number(value[0])
+            and _is_number(value[1])
+        )
+    if op in _RANGE_OPERATORS:
+        return _is_number(value)
+    return False
+
+
+class _Thresholds:
+    """Sorted thresholds with the rule positions they belong to."""
+
+    __slots__ = ("values", "positions")
+
+    def __init__(self, entries: list[tuple[float, int]]):
+        entries.sort()
+        self.values = [v for v, _ in entries]
+        self.positions = [p for _, p in entries]
+
+
+class FieldIndex:
+    """Candidate lookup for all rules anchored on one field."""
+
+    __slots__ = ("accessor", "equals", "gt", "gte", "lt", "lte", "between")
+
+    def __init__(self, path: str):
+        self.accessor = compile_accessor(path)
+        self.equals: dict[Any, list[int]] = {}
+        self.gt: _Thresholds | None = None
+        self.gte: _Thresholds | None = None
+        self.lt: _Thresholds | None = None
+        self.lte: _Thresholds | None = None
+        # (lows, highs, positions) sorted by low bound
+        self.between: tuple[list[float], list[float], list[int]] | None = None
+
+    def lookup(self, context: dict[str, Any], out: list[int]) -> None:
+        """Append positions of rules whose anchor condition holds."""
+        actual = self.accessor(context)
+        if actual is None:
+            return
+
+        if self.equals:
+            try:
+                hits = self.equals.get(actual)
+            except TypeError:  # unhashable value cannot equal a hashable operand
+                hits = None
+            if hits:
+                out.extend(hits)
+
+        if isinstance(actual, float) and math.isnan(actual):
+            return
+
+        try:
+            if self.gt is not None:  # threshold < actual
+                out.extend(self.gt.positions[: bisect_left(self.gt.values, actual)])
+            if self.gte is not None:  # threshold <= actual
+                out.extend(self.gte.positions[: bisect_right(self.gte.values, actual)])
+            if self.lt is not None:  # threshold > actual
+                out.extend(self.lt.positions[bisect_right(self.lt.values, actual) :])
+            if self.lte is not None:  # threshold >= actual
+                out.extend(self.lte.positions[bisect_left(self.lte.values, actual) :])
+            if self.between is not None:
+                lows, highs, positions = self.between
+                for i in range(bisect_right(lows, actual)):
+                    if actual <= highs[i]:
+                        out.append(positions[i])
+        except TypeError:
+            # Non-numeric value against numeric thresholds: comparison
+            # would have raised in Condition.evaluate too
+            return
+
+
+# ============================================================
+# Compiled Rule Set
+# ============================================================
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledRule:
+    """A rule reduced to its residual checks and a match template."""
+
+    rule: Rule
+    category: RuleCategory
+    checks: tuple[Check, ...]  # conditions not guaranteed by the index
+    match: dict[str, Any] = field(repr=False)
+
+    def matches(self, context: dict[str, Any]) -> bool:
+        for check in self.checks:
+            if not check(context):
+                return False
+        return True
+
+
+class CompiledRuleSet:
+    """Immutable, field-indexed form of a rule list.
+
+    Example:
+        ```python
+        compiled = CompiledRuleSet(loader.load_all())
+        matches = compiled.evaluate(context, categories=[RuleCategory.IRRIGATION])
+        ```
+    """
+
+    def __init__(self, rules: Sequence[Rule], version: str | None = None):
+        """Compile rules.
+
+        Args:
+            rules: Rules in load order; ties in priority keep this order
+            version: Rule-set version stamped on every match as
+                ``rule_set_version`` (omitted when None)
+        """
+        self.version = version
+        ordered = sorted(rules, key=lambda r: PRIORITY_ORDER.get(r.priority.value, 4))
+
+        self._rules: list[CompiledRule] = []
+        self._indexes: dict[str, FieldIndex] = {}
+        self._unindexed: list[int] = []
+
+        ranges: dict[tuple[str, Operator], list[tuple[float, int]]] = {}
+        betweens: dict[str, list[tuple[float, float, int]]] = {}
+
+        for position, rule in enumerate(ordered):
+            anchor = self._choose_anchor(rule)
+            checks = tuple(
+                compile_condition(c) for i, c in enumerate(rule.conditions) if i != anchor
+            )
+            match = rule.to_match_dict()
+            if version is not None:
+                match["rule_set_version"] = version
+            self._rules.append(CompiledRule(rule, rule.category, checks, match))
+
+            if anchor is None:
+                self._unindexed.append(position)
+                continue
+
+            condition = rule.conditions[anchor]
+            index = self._indexes.get(condition.field)
+            if index is None:
+                index = self._indexes[condition.field] = FieldIndex(condition.field)
+
+            op, value = condition.operator, condition.value
+            if op == Operator.EQ:
+                index.equals.setdefault(value, []).append(position)
+            elif op == Operator.IN:
+                for item in dict.fromkeys(value):  # dedupe, keep order
+                    index.equals.setdefault(item, []).append(position)
+            elif op == Operator.BETWEEN:
+                betweens.setdefault(condition.field, []).append((value[0], value[1], position))
+            else:
+                ranges.setdefault((condition.field, op), []).append((value, position))
+
+        for (path, op), entries in ranges.items():
+            setattr(self._indexes[path], op.value, _Thresholds(entries))
+        for path, entries in betweens.items():
+            entries.sort()
+            self._indexes[path].between = (
+                [low for low, _, _ in entries],
+                [high for _, high, _ in entries],
+                [p for _, _, p in entries],
+            )
+
+        self._index_list = list(self._indexes.values())
+        self._batch_plan: BatchPlan | None = None
+
+    @staticmethod
+    def _choose_anchor(rule: Rule) -> int | None:
+        """Index of the most selective indexable condition, or None."""
+        best: int | None = None
+        best_rank = len(_SELECTIVITY)
+        for i, condition in enumerate(rule.conditions):
+            rank = _SELECTIVITY.get(condition.operator)
+            if rank is not None and rank < best_rank and _is_indexable(condition):
+                best, best_rank = i, rank
+        return best
+
+    def candidates(self, context: dict[str, Any]) -> list[int]:
+        """Positions (in priority order) of rules worth evaluating."""
+        found: list[int] = []
+        for index in self._index_list:
+            index.lookup(context, found)
+        if self._unindexed:
+            found.extend(self._unindexed)
+        # A rule is anchored on exactly one condition, so no duplicates
+        found.sort()
+        return found
+
+    def evaluate(
+        self,
+        context: dict[str, Any],
+        categories: Iterable[RuleCategory] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Evaluate context and return match dicts sorted by priority.
+
+        Args:
+            context: Context dictionary with farm, weather, intent, etc.
+            categories: Optional filter for rule categories
+
+        Returns:
+            List of matched rule dictionaries
+        """
+        # str-valued enums hash and compare like their value, so a set
+        # matches both RuleCategory members and plain strings
+        wanted = frozenset(categories) if categories else None
+        rules = self._rules
+        matches = []
+
+        for position in self.candidates(context):
+            compiled = rules[position]
+            if wanted is not None and compiled.category not in wanted:
+                continue
+            if compiled.matches(context):
+                matches.append(dict(compiled.match))
+
+        return matches
+
+    def match_rules(
+        self,
+        context: dict[str, Any],
+        categories: Iterable[RuleCategory] | None = None,
+    ) -> list[Rule]:
+        """Like :meth:`evaluate`, but return the matched Rule objects."""
+        wanted = frozenset(categories) if categories else None
+        rules = self._rules
+        matched = []
+
+        for position in self.candidates(context):
+            compiled = rules[position]
+            if wanted is not None and compiled.category not in wanted:
+                continue
+            if compiled.matches(context):
+                matched.append(compiled.rule)
+
+        return matched
+
+    def evaluate_batch(
+        self,
+        contexts: Sequence[dict[str, Any]] | RuleBatch,
+        categories: Iterable[RuleCategory] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Evaluate many contexts at once with vectorized condition masks.
+
+        Returns the same lists ``[self.evaluate(c, categories) for c in contexts]``
+        would; see :mod:`alim.rules.batch`.
+        """
+        return self.batch_plan.evaluate(contexts, categories)
+
+    @property
+    def batch_plan(self) -> BatchPlan:
+        """Vectorized evaluation plan, built on first batch use."""
+        plan = self._batch_plan
+        if plan is None:
+            from alim.rules.batch import BatchPlan
+
+            plan = self._batch_plan = BatchPlan(self._rules)
+        return plan
+
+    @property
+    def rules(self) -> list[Rule]:
+        """Rules in priority order."""
+        return [c.rule for c in self._rules]
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Index shape, for diagnostics."""
+        return {
+            "rules": len(self._rules),
+            "indexed": len(self._rules) - len(self._unindexed),
+            "unindexed": len(self._unindexed),
+            "indexed_fields": len(self._indexes),
+        }
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+
+def compile_rules(rules: Sequence[Rule], version: str | None = None) -> CompiledRuleSet:
+    """Compile a rule list into a :class:`CompiledRuleSet`."""
+    return CompiledRuleSet(rules, version)
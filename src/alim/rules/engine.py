@@ -9,10 +9,20 @@ from dataclasses import dataclass
 from datetime import date
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+import structlog
 import yaml
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from alim.rules.batch import RuleBatch
+    from alim.rules.compiler import CompiledRuleSet
+    from alim.rules.registry import RuleSetRegistry
+
+logger = structlog.get_logger(__name__)
+
 # ============================================================
 # Rule Data Types
 # ============================================================
@@ -160,19 +170,25 @@ class Rule:
 # ============================================================
 
 
+class RuleLoadError(Exception):
+    """Raised by a strict RuleLoader when a rule file cannot be loaded."""
+
+
 class RuleLoader:
     """Loads rules from YAML files."""
 
-    def __init__(self, rules_dir: Path | str | None = None):
+    def __init__(self, rules_dir: Path | str | None = None, strict: bool = False):
         """Initialize the loader.
 
         Args:
             rules_dir: Directory containing rule YAML files
+            strict: Raise RuleLoadError on a bad file instead of skipping it
         """
         if rules_dir is None:
             rules_dir = Path(__file__).parent / "rules"
 
         self.rules_dir = Path(rules_dir)
+        self.strict = strict
 
     def load_all(self) -> list[Rule]:
         """Load all rules from the rules directory."""
@@ -181,14 +197,17 @@ class RuleLoader:
         if not self.rules_dir.exists():
             return rules
 
-        for yaml_file in self.rules_dir.glob("*.yaml"):
-            rules.extend(self.load_file(yaml_file))
-
-        for yml_file in self.rules_dir.glob("*.yml"):
-            rules.extend(self.load_file(yml_file))
+        for path in self.rule_files():
+            rules.extend(self.load_file(path))
 
         return rules
 
+    def rule_files(self) -> list[Path]:
+        """Rule files in load order (sorted, so rule order is stable)."""
+        if not self.rules_dir.exists():
+            return []
+        return sorted(self.rules_dir.glob("*.yaml")) + sorted(self.rules_dir.glob("*.yml"))
+
     def load_file(self, filepath: Path) -> list[Rule]:
         """Load rules from a single YAML file."""
         try:
@@ -201,7 +220,9 @@ class RuleLoader:
             return [self._parse_rule(r) for r in data["rules"]]
 
         except Exception as e:
-            print(f"Error loading rules from {filepath}: {e}")
+            if self.strict:
+                raise RuleLoadError(f"Error loading rules from {filepath}: {e}") from e
+            logger.warning("rules_file_load_failed", path=str(filepath), error=str(e))
             return []
 
     def _parse_rule(self, data: dict) -> Rule:
@@ -259,15 +280,23 @@ class RulesEngine:
         ```
     """
 
-    def __init__(self, rules_dir: Path | str | None = None):
+    def __init__(
+        self,
+        rules_dir: Path | str | None = None,
+        registry: "RuleSetRegistry | None" = None,
+    ):
         """Initialize the engine.
 
         Args:
             rules_dir: Directory containing rule YAML files
+            registry: Serve the registry's current (hot-reloaded) rule set
+                instead of loading rules_dir once
         """
         self.loader = RuleLoader(rules_dir)
+        self.registry = registry
         self._rules: list[Rule] = []
         self._loaded = False
+        self._compiled: CompiledRuleSet | None = None
 
     def load_rules(self) -> int:
         """Load rules from files.
@@ -275,8 +304,12 @@ class RulesEngine:
         Returns:
             Number of rules loaded
         """
+        if self.registry is not None:
+            return self.registry.reload(force=True).rule_count
+
         self._rules = self.loader.load_all()
         self._loaded = True
+        self._compiled = None
         return len(self._rules)
 
     def add_rule(self, rule: Rule) -> None:
@@ -285,7 +318,13 @@ class RulesEngine:
         Args:
             rule: Rule to add
         """
-        self._rules.append(rule)
+        if self.registry is not None:
+            self.registry.publish([*self.registry.current.rules, rule], source="add_rule")
+            return
+
+        # Copy-on-write: evaluations holding the previous compiled set are unaffected
+        self._rules = [*self._rules, rule]
+        self._compiled = None
 
     def evaluate(
         self,
@@ -294,37 +333,52 @@ class RulesEngine:
     ) -> list[dict[str, Any]]:
         """Evaluate context against all rules.
 
+        Only rules whose indexed anchor condition matches are visited;
+        see :mod:`alim.rules.compiler`.
+
         Args:
             context: Context dictionary with farm, weather, intent, etc.
             categories: Optional filter for rule categories
 
         Returns:
-            List of matched rule dictionaries
+            List of matched rule dictionaries, sorted by priority
         """
-        if not self._loaded:
-            self.load_rules()
+        return self.compiled.evaluate(context, categories)
 
-        matches = []
+    def evaluate_batch(
+        self,
+        contexts: "Sequence[dict[str, Any]] | RuleBatch",
+        categories: list[RuleCategory] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Evaluate many contexts at once (e.g. every farm, nightly).
 
-        for rule in self._rules:
-            # Filter by category if specified
-            if categories and rule.category not in categories:
-                continue
+        Conditions are evaluated as NumPy masks over the whole batch;
+        results equal ``[self.evaluate(c, categories) for c in contexts]``.
 
-            # Evaluate rule
-            if rule.evaluate(context):
-                matches.append(rule.to_match_dict())
+        Args:
+            contexts: Context dicts, or a prebuilt columnar RuleBatch
+            categories: Optional filter for rule categories
 
-        # Sort by priority (critical > high > medium > low)
-        priority_order = {
-            "critical": 0,
-            "high": 1,
-            "medium": 2,
-            "low": 3,
-        }
-        matches.sort(key=lambda m: priority_order.get(m["priority"], 4))
+        Returns:
+            One list of matched rule dictionaries per context
+        """
+        return self.compiled.evaluate_batch(contexts, categories)
+
+    @property
+    def compiled(self) -> "CompiledRuleSet":
+        """Field-indexed form of the loaded rules, rebuilt after changes."""
+        if self.registry is not None:
+            return self.registry.current.compiled
+
+        if not self._loaded:
+            self.load_rules()
+
+        compiled = self._compiled
+        if compiled is None:
+            from alim.rules.compiler import CompiledRuleSet
 
-        return matches
+            compiled = self._compiled = CompiledRuleSet(self._rules)
+        return compiled
 
     def get_rules_for_intent(self, intent: str) -> list[Rule]:
         """Get rules relevant to a specific intent.
@@ -335,18 +389,27 @@ class RulesEngine:
         Returns:
             List of relevant rules
         """
-        if not self._loaded:
-            self.load_rules()
-
         try:
             category = RuleCategory(intent)
-            return [r for r in self._rules if r.category == category]
+            return [r for r in self.rules if r.category == category]
         except ValueError:
             return []
 
+    @property
+    def rules(self) -> list[Rule]:
+        """Loaded rules in load order."""
+        if self.registry is not None:
+            return list(self.registry.current.rules)
+
+        if not self._loaded:
+            self.load_rules()
+        return self._rules
+
     @property
     def rule_count(self) -> int:
         """Get the number of loaded rules."""
+        if self.registry is not None:
+            return self.registry.current.rule_count
         return len(self._rules)
 
 
@@ -397,9 +460,10 @@ _engine: RulesEngine | None = None
 
 
 def get_rules_engine() -> RulesEngine:
-    """Get the singleton rules engine."""
+    """Get the singleton rules engine, backed by the hot-reloading registry."""
     global _engine
     if _engine is None:
-        _engine = RulesEngine()
-        _engine.load_rules()
+        from alim.rules.registry import get_rule_registry
+
+        _engine = RulesEngine(registry=get_rule_registry())
     return _engine
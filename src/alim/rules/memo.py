@@ -0,0 +1,166 @@
+# src/ALİM/rules/memo.py
+"""Memoized rule matching on quantized contexts.
+
+Many evaluations differ only in values no rule can tell apart: with
+thresholds at 10 and 30, temperatures of 18.2 and 24.9 fail and pass
+exactly the same conditions. :class:`ContextQuantizer` maps a context to
+a key made of, per field a rule looks at, the band between consecutive
+thresholds the value falls in (or the value itself for non-numbers).
+Contexts with equal keys are guaranteed to match the same rules, so
+:class:`MatchMemo` can serve them from an LRU without ever changing a
+decision - the bands are derived from the rules, not picked by hand.
+
+Example:
+    ```python
+    memo = MatchMemo(maxsize=4096)
+    rules = memo.match(registry.current.compiled, context, [RuleCategory.IRRIGATION])
+    memo.info()  # {"hits": ..., "misses": ..., "size": ..., "maxsize": ...}
+    ```
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import threading
+import weakref
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any
+
+from alim.rules.compiler import CompiledRuleSet, compile_accessor
+from alim.rules.engine import Operator, Rule, RuleCategory
+
+_tokens = itertools.count()
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not (isinstance(value, float) and math.isnan(value))
+
+
+class ContextQuantizer:
+    """Maps contexts to keys that determine which rules match."""
+
+    def __init__(self, rules: Iterable[Rule]):
+        """Collect the fields and numeric thresholds the rules test.
+
+        Args:
+            rules: Rules whose outcome the key must preserve
+        """
+        thresholds: dict[str, set[float]] = {}
+        exact: set[str] = set()
+
+        for rule in rules:
+            for condition in rule.conditions:
+                found = thresholds.setdefault(condition.field, set())
+                if condition.operator == Operator.CONTAINS:
+                    # Depends on the digits of str(value), not its magnitude
+                    exact.add(condition.field)
+                    continue
+                value = condition.value
+                for item in value if isinstance(value, (list, tuple)) else (value,):
+                    if _is_number(item):
+                        found.add(item)
+
+        self.token = next(_tokens)  # never reused, unlike id()
+        self.fields: list[tuple[str, Any, list[float] | None]] = [
+            (path, compile_accessor(path), None if path in exact else sorted(found))
+            for path, found in sorted(thresholds.items())
+        ]
+
+    def key(self, context: dict[str, Any]) -> tuple | None:
+        """Quantized key for a context, or None if it cannot be cached."""
+        parts: list[Any] = [self.token]
+        for _, get, bounds in self.fields:
+            value = get(context)
+            if bounds is not None and _is_number(value):
+                # Same position relative to every threshold, same comparisons
+                i = bisect_left(bounds, value)
+                parts.append((0, i, i < len(bounds) and bounds[i] == value))
+            elif isinstance(value, float) and math.isnan(value):
+                parts.append((2,))  # NaN compares False to everything
+            else:
+                try:
+                    hash(value)
+                except TypeError:
+                    return None  # lists, dicts: evaluate without the memo
+                parts.append((1, value))
+        return tuple(parts)
+
+
+class MatchMemo:
+    """Bounded LRU of matched rules, keyed by quantized context."""
+
+    def __init__(self, maxsize: int = 4096):
+        """Initialize an empty memo.
+
+        Args:
+            maxsize: Entries kept before least recently used ones are dropped
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, tuple[Rule, ...]] = OrderedDict()
+        self._quantizers: weakref.WeakKeyDictionary[
+            CompiledRuleSet, dict[tuple | None, ContextQuantizer]
+        ] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def quantizer(
+        self,
+        compiled: CompiledRuleSet,
+        categories: Iterable[RuleCategory] | None = None,
+    ) -> ContextQuantizer:
+        """The quantizer for a compiled rule set and category filter."""
+        wanted = tuple(categories) if categories else None
+        with self._lock:
+            per_set = self._quantizers.setdefault(compiled, {})
+            quantizer = per_set.get(wanted)
+            if quantizer is None:
+                rules = compiled.rules
+                if wanted is not None:
+                    rules = [r for r in rules if r.category in wanted]
+                quantizer = per_set[wanted] = ContextQuantizer(rules)
+        return quantizer
+
+    def match(
+        self,
+        compiled: CompiledRuleSet,
+        context: dict[str, Any],
+        categories: Iterable[RuleCategory] | None = None,
+    ) -> tuple[Rule, ...]:
+        """Matched rules in priority order, from the memo when possible."""
+        wanted = tuple(categories) if categories else None
+        key = self.quantizer(compiled, wanted).key(context)
+        if key is not None:
+            with self._lock:
+                cached = self._entries.get(key)
+                if cached is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return cached
+
+        matched = tuple(compiled.match_rules(context, wanted))
+        with self._lock:
+            self.misses += 1
+            if key is not None and self.maxsize > 0:
+                self._entries[key] = matched
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return matched
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> dict[str, int]:
+        """Hit/miss counters and size, for metrics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
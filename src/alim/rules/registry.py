@@ -0,0 +1,378 @@
+# src/ALİM/rules/registry.py
+"""Versioned, hot-reloadable rule sets.
+
+The registry watches a rule source (the YAML directory by default),
+compiles a new :class:`RuleSetVersion` in the background whenever it
+changes and swaps it in with a single reference assignment. Versions are
+immutable, so an evaluation that picked up a version keeps using it to
+the end even if a reload lands meanwhile - nobody ever sees a half-loaded
+rule set. The last N versions are kept for A/B evaluation and rollback.
+
+A reload that fails to parse is rejected and logged; the current version
+keeps serving.
+
+Example:
+    ```python
+    registry = get_rule_registry()
+    registry.start()  # poll for changes (inside a running event loop)
+
+    matches = registry.evaluate(context)  # each match has "rule_set_version"
+    candidate = registry.evaluate(context, version="v3-1a2b3c4d")  # A/B
+    registry.rollback()
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import threading
+from collections import deque
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Protocol
+
+import structlog
+
+from alim.config import settings
+from alim.rules.batch import RuleBatch
+from alim.rules.compiler import CompiledRuleSet
+from alim.rules.engine import Rule, RuleCategory, RuleLoader, RuleLoadError
+
+logger = structlog.get_logger(__name__)
+
+
+# ============================================================
+# Rule Sources
+# ============================================================
+
+
+class RuleSource(Protocol):
+    """Where rule sets come from (a directory, a database table, ...)."""
+
+    name: str
+
+    def snapshot(self) -> str:
+        """Cheap change marker; a different value means "reload"."""
+        ...
+
+    def load(self, strict: bool = True) -> list[Rule]:
+        """Load all rules; with strict, raise RuleLoadError on bad input."""
+        ...
+
+
+class DirectoryRuleSource:
+    """Rules from ``*.yaml``/``*.yml`` files in a directory."""
+
+    def __init__(self, rules_dir: Path | str | None = None):
+        self._strict = RuleLoader(rules_dir, strict=True)
+        self._lenient = RuleLoader(rules_dir)
+        self.name = str(self._strict.rules_dir)
+
+    def snapshot(self) -> str:
+        """File names, sizes and mtimes - a stat per file, no reads."""
+        parts = []
+        for path in self._strict.rule_files():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # deleted between listing and stat
+                continue
+            parts.append(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}")
+        return "|".join(parts)
+
+    def load(self, strict: bool = True) -> list[Rule]:
+        return (self._strict if strict else self._lenient).load_all()
+
+
+# ============================================================
+# Versions
+# ============================================================
+
+
+def rules_digest(rules: Sequence[Rule]) -> str:
+    """Content hash of a rule list (order-sensitive)."""
+    return hashlib.sha256(repr(list(rules)).encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class RuleSetVersion:
+    """An immutable, compiled rule set."""
+
+    version: str
+    number: int
+    digest: str
+    rules: tuple[Rule, ...]  # load order
+    compiled: CompiledRuleSet = field(repr=False)
+    source: str = ""
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    @property
+    def rule_count(self) -> int:
+        return len(self.rules)
+
+    def evaluate(
+        self,
+        context: dict[str, Any],
+        categories: Iterable[RuleCategory] | None = None,
+    ) -> list[dict[str, Any]]:
+        return self.compiled.evaluate(context, categories)
+
+    def evaluate_batch(
+        self,
+        contexts: Sequence[dict[str, Any]] | RuleBatch,
+        categories: Iterable[RuleCategory] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        return self.compiled.evaluate_batch(contexts, categories)
+
+    def describe(self) -> dict[str, Any]:
+        return {
+            "version": self.version,
+            "rules": self.rule_count,
+            "digest": self.digest[:12],
+            "source": self.source,
+            "created_at": self.created_at.isoformat(),
+        }
+
+
+# ============================================================
+# Registry
+# ============================================================
+
+
+class RuleSetRegistry:
+    """Holds the active rule set plus recent versions, and reloads on change."""
+
+    def __init__(
+        self,
+        source: RuleSource | None = None,
+        keep_versions: int = 5,
+        poll_interval_seconds: float = 5.0,
+    ):
+        """Initialize the registry (nothing is loaded until first use).
+
+        Args:
+            source: Rule source; defaults to the bundled YAML directory
+            keep_versions: Versions retained for A/B and rollback
+            poll_interval_seconds: How often the watcher checks the source
+        """
+        self.source = source or DirectoryRuleSource()
+        self.poll_interval_seconds = poll_interval_seconds
+        self._versions: deque[RuleSetVersion] = deque(maxlen=max(keep_versions, 1))
+        self._current: RuleSetVersion | None = None
+        self._snapshot: str | None = None
+        self._number = 0
+        # Serializes writers only; readers just dereference self._current
+        self._lock = threading.Lock()
+        self._task: asyncio.Task | None = None
+
+    # ----- Reading -----
+
+    @property
+    def current(self) -> RuleSetVersion:
+        """The active version (loaded synchronously on first access)."""
+        current = self._current
+        if current is None:
+            current = self._load_initial()
+        return current
+
+    def get(self, version: str) -> RuleSetVersion | None:
+        """A retained version by label."""
+        for candidate in self._versions:
+            if candidate.version == version:
+                return candidate
+        return None
+
+    @property
+    def versions(self) -> list[RuleSetVersion]:
+        """Retained versions, oldest first."""
+        return list(self._versions)
+
+    def evaluate(
+        self,
+        context: dict[str, Any],
+        categories: Iterable[RuleCategory] | None = None,
+        version: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Evaluate against the active version, or a retained one for A/B."""
+        return self._resolve(version).evaluate(context, categories)
+
+    def evaluate_batch(
+        self,
+        contexts: Sequence[dict[str, Any]] | RuleBatch,
+        categories: Iterable[RuleCategory] | None = None,
+        version: str | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Batch-evaluate against the active version, or a retained one."""
+        return self._resolve(version).evaluate_batch(contexts, categories)
+
+    def _resolve(self, version: str | None) -> RuleSetVersion:
+        if version is None:
+            return self.current
+        found = self.get(version)
+        if found is None:
+            raise KeyError(f"Unknown rule set version: {version}")
+        return found
+
+    # ----- Writing -----
+
+    def publish(
+        self,
+        rules: Sequence[Rule],
+        source: str | None = None,
+        activate: bool = True,
+    ) -> RuleSetVersion:
+        """Compile rules into a new version and (by default) make it active.
+
+        Compilation happens before the lock is taken; publishing rules
+        identical to the active version returns the active version. When
+        publishes overlap, the one that started last stays active.
+        """
+        rules = tuple(rules)
+        digest = rules_digest(rules)
+        current = self._current
+        if current is not None and current.digest == digest:
+            return current
+
+        with self._lock:
+            self._number += 1
+            number = self._number
+        label = f"v{number}-{digest[:8]}"
+        compiled = CompiledRuleSet(rules, version=label)
+
+        with self._lock:
+            version = RuleSetVersion(
+                version=label,
+                number=number,
+                digest=digest,
+                rules=rules,
+                compiled=compiled,
+                source=source or self.source.name,
+            )
+            self._versions.append(version)
+            # Concurrent publishes can finish out of order; never let an
+            # older one replace a newer active version
+            current = self._current
+            if activate and (current is None or number > current.number):
+                self._current = version
+            active = self._current is version
+
+        logger.info(
+            "rule_set_published",
+            version=label,
+            rules=len(rules),
+            source=version.source,
+            active=active,
+        )
+        return version
+
+    def reload(self, force: bool = False) -> RuleSetVersion:
+        """Reload from the source if it changed (or always, with force).
+
+        Returns:
+            The active version afterwards
+
+        Raises:
+            RuleLoadError: The source is invalid; the active version is kept
+        """
+        snapshot = self.source.snapshot()
+        if not force and snapshot == self._snapshot and self._current is not None:
+            return self._current
+
+        # Remember the snapshot even on failure so a broken file is
+        # reported once, not on every poll
+        self._snapshot = snapshot
+        rules = self.source.load(strict=True)
+        return self.publish(rules)
+
+    def activate(self, version: str) -> RuleSetVersion:
+        """Make a retained version active (rollback / pinning)."""
+        with self._lock:
+            found = self.get(version)
+            if found is None:
+                raise KeyError(f"Unknown rule set version: {version}")
+            self._current = found
+        logger.info("rule_set_activated", version=version)
+        return found
+
+    def rollback(self) -> RuleSetVersion:
+        """Activate the version published before the active one."""
+        versions = self.versions
+        current = self.current
+        older = [v for v in versions if v.number < current.number]
+        if not older:
+            raise KeyError("No earlier rule set version retained")
+        return self.activate(older[-1].version)
+
+    def _load_initial(self) -> RuleSetVersion:
+        with self._lock:
+            if self._current is not None:
+                return self._current
+        try:
+            return self.reload(force=True)
+        except RuleLoadError as e:
+            # Serve what does parse rather than nothing; fix and the
+            # watcher will pick the corrected files up
+            logger.error("rule_set_load_failed", source=self.source.name, error=str(e))
+            return self.publish(self.source.load(strict=False))
+
+    # ----- Watching -----
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval_seconds)
+            try:
+                # Parsing + compiling runs off the event loop
+                await asyncio.to_thread(self.reload)
+            except RuleLoadError as e:
+                logger.error(
+                    "rule_set_reload_rejected",
+                    source=self.source.name,
+                    error=str(e),
+                    active=self._current.version if self._current else None,
+                )
+            except Exception as e:
+                logger.warning("rule_set_reload_failed", source=self.source.name, error=str(e))
+
+    def start(self) -> None:
+        """Start watching the source for changes (idempotent)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="rule-set-watcher")
+
+    async def stop(self) -> None:
+        """Stop watching."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def status(self) -> dict[str, Any]:
+        """Active and retained versions, for health endpoints."""
+        current = self._current
+        return {
+            "active": current.describe() if current else None,
+            "versions": [v.version for v in self._versions],
+            "watching": self._task is not None and not self._task.done(),
+        }
+
+
+# ============================================================
+# Singleton Instance
+# ============================================================
+
+_registry: RuleSetRegistry | None = None
+
+
+def get_rule_registry() -> RuleSetRegistry:
+    """Get the singleton rule-set registry."""
+    global _registry
+    if _registry is None:
+        _registry = RuleSetRegistry(
+            keep_versions=settings.rules_keep_versions,
+            poll_interval_seconds=settings.rules_reload_interval_seconds,
+        )
+    return _registry
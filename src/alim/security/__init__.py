@@ -6,6 +6,7 @@ Provides comprehensive security controls:
 - Input validation (prompt injection defense)
 - Output validation (response safety)
 - Secure prompt building (injection resistance)
+- A fused pre-graph pipeline (validation + PII masking, timed per detector)
 
 All user input MUST pass through these security layers before reaching the LLM.
 All LLM output SHOULD be validated before returning to users.
@@ -38,6 +39,7 @@ from alim.security.pii_gateway import (
     has_pii,
     strip_pii,
 )
+from alim.security.pipeline import SecurityPipeline, SecurityResult, get_security_pipeline
 
 __all__ = [
     # PII Gateway
@@ -64,4 +66,8 @@ __all__ = [
     "get_secure_prompt_builder",
     "validate_output",
     "is_safe_output",
+    # Fused pre-graph pipeline
+    "SecurityPipeline",
+    "SecurityResult",
+    "get_security_pipeline",
 ]
@@ -9,12 +9,17 @@ Protects against:
 All user input MUST pass through this validator before reaching the LLM.
 """
 
+import hashlib
 import re
+import threading
 import unicodedata
+from collections import OrderedDict
 from enum import Enum
 
 from pydantic import BaseModel
 
+from alim.security.pattern_set import PatternSet
+
 
 class RiskLevel(str, Enum):
     """Risk level classification for inputs."""
@@ -114,6 +119,40 @@ COMPILED_INJECTION_PATTERNS = [
     for pattern, weight, flag in INJECTION_PATTERNS
 ]
 
+# All injection patterns behind one literal prefilter
+INJECTION_PATTERN_SET = PatternSet(
+    [(pattern, re.IGNORECASE) for pattern, _, _ in INJECTION_PATTERNS]
+)
+
+# Structural manipulation markers
+XML_TAG = re.compile(r"<[/]?[a-z]+[^>]*>", re.IGNORECASE)
+SECTION_SEPARATOR = re.compile(r"[-=]{5,}")
+HEADER_MARKERS = re.compile(r"^#{3,}", re.MULTILINE)
+CHAR_REPETITION = re.compile(r"(.)\1{10,}")
+
+# Whitespace runs collapsed by sanitization
+SPACE_RUN = re.compile(r"[^\S\n]+")
+NEWLINE_RUN = re.compile(r"\n{3,}")
+
+
+def normalize_unicode(text: str) -> str:
+    """NFKC-normalize ``text`` and drop zero-width and invisible characters."""
+    # NFKC: compatibility decomposition + canonical composition
+    if not text.isascii():
+        text = unicodedata.normalize("NFKC", text)
+        text = INVISIBLE_CHARS.sub("", text)
+    return text
+
+
+def normalize_whitespace(text: str) -> str:
+    """Collapse runs of spaces and blank lines (single newlines are kept)."""
+    # Replace multiple spaces with single space
+    text = SPACE_RUN.sub(" ", text)
+    # Replace multiple newlines with double newline
+    text = NEWLINE_RUN.sub("\n\n", text)
+    # Strip leading/trailing whitespace
+    return text.strip()
+
 
 class InputValidator:
     """Validates and sanitizes user input.
@@ -150,11 +189,15 @@ class InputValidator:
     HIGH_RISK_THRESHOLD = 0.5
     MEDIUM_RISK_THRESHOLD = 0.3
 
+    # Recent results kept, so repeated messages (retries, starters) skip scanning
+    CACHE_SIZE = 1024
+
     def __init__(
         self,
         max_length: int = MAX_LENGTH,
         rejection_threshold: float = REJECTION_THRESHOLD,
         strict_mode: bool = False,
+        cache_size: int = CACHE_SIZE,
     ):
         """Initialize validator.
 
@@ -162,22 +205,96 @@ class InputValidator:
             max_length: Maximum allowed input length.
             rejection_threshold: Risk score above which to reject.
             strict_mode: If True, reject medium-risk inputs too.
+            cache_size: Results of recent messages to keep (0 disables the cache).
         """
         self.max_length = max_length
         self.rejection_threshold = rejection_threshold
         self.strict_mode = strict_mode
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache: OrderedDict[bytes, ValidationResult] = OrderedDict()
+        self._lock = threading.Lock()
 
     def validate(self, raw_input: str) -> ValidationResult:
         """Run full validation pipeline on input.
 
+        Results are cached by message hash; a repeated message returns a
+        copy of the earlier result without scanning.
+
         Args:
             raw_input: User's raw input text.
 
         Returns:
             ValidationResult with validation outcome and details.
         """
+        if not self.cache_size or not isinstance(raw_input, str):
+            return self._validate(raw_input)
+
+        key = hashlib.blake2b(raw_input.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return cached.model_copy(deep=True)
+
+        result = self._validate(raw_input)
+        with self._lock:
+            self.cache_misses += 1
+            self._cache[key] = result.model_copy(deep=True)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def cache_info(self) -> dict[str, int]:
+        """Hit/miss counters and size of the result cache, for metrics."""
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "size": len(self._cache),
+            "maxsize": self.cache_size,
+        }
+
+    def _validate(self, raw_input: str) -> ValidationResult:
+        """Validation pipeline without the cache."""
         flags: list[str] = []
 
+        rejection = self._basic_rejection(raw_input)
+        if rejection is not None:
+            return rejection
+
+        # 5. Invisible character check
+        if INVISIBLE_CHARS.search(raw_input):
+            flags.append("invisible_chars")
+            # Don't reject, but flag and remove
+
+        # 6. Prompt injection risk assessment
+        risk_score, injection_flags = self._calculate_injection_risk(raw_input)
+        flags.extend(injection_flags)
+
+        # Structural risk factors
+        structural_score, structural_flags = self._assess_structural_risk(raw_input)
+        risk_score = min(1.0, risk_score + structural_score)
+        flags.extend(structural_flags)
+
+        rejection = self._risk_rejection(risk_score, flags)
+        if rejection is not None:
+            return rejection
+
+        # 9. Sanitize and return
+        sanitized = self._sanitize(raw_input)
+
+        return ValidationResult(
+            is_valid=True,
+            sanitized_input=sanitized,
+            risk_level=self._risk_level(risk_score),
+            risk_score=risk_score,
+            flags=flags,
+        )
+
+    def _basic_rejection(self, raw_input: str) -> ValidationResult | None:
+        """Steps 1-4: empty, length, encoding and control characters."""
         # 1. Empty check
         if not raw_input or not raw_input.strip():
             return ValidationResult(
@@ -203,36 +320,27 @@ class InputValidator:
 
         # 4. Control character check
         if CONTROL_CHARS.search(raw_input):
-            flags.append("control_chars")
             return ValidationResult(
                 is_valid=False,
                 rejection_reason="İcazə verilməyən simvollar aşkarlandı",
-                flags=flags,
+                flags=["control_chars"],
             )
 
-        # 5. Invisible character check
-        if INVISIBLE_CHARS.search(raw_input):
-            flags.append("invisible_chars")
-            # Don't reject, but flag and remove
-
-        # 6. Prompt injection risk assessment
-        risk_score, injection_flags = self._calculate_injection_risk(raw_input)
-        flags.extend(injection_flags)
-
-        # Structural risk factors
-        structural_score, structural_flags = self._assess_structural_risk(raw_input)
-        risk_score = min(1.0, risk_score + structural_score)
-        flags.extend(structural_flags)
+        return None
 
-        # Determine risk level
+    def _risk_level(self, risk_score: float) -> RiskLevel:
+        """Classify a combined risk score."""
         if risk_score >= self.REJECTION_THRESHOLD:
-            risk_level = RiskLevel.CRITICAL
-        elif risk_score >= self.HIGH_RISK_THRESHOLD:
-            risk_level = RiskLevel.HIGH
-        elif risk_score >= self.MEDIUM_RISK_THRESHOLD:
-            risk_level = RiskLevel.MEDIUM
-        else:
-            risk_level = RiskLevel.LOW
+            return RiskLevel.CRITICAL
+        if risk_score >= self.HIGH_RISK_THRESHOLD:
+            return RiskLevel.HIGH
+        if risk_score >= self.MEDIUM_RISK_THRESHOLD:
+            return RiskLevel.MEDIUM
+        return RiskLevel.LOW
+
+    def _risk_rejection(self, risk_score: float, flags: list[str]) -> ValidationResult | None:
+        """Steps 7-8: reject inputs whose risk is over the threshold."""
+        risk_level = self._risk_level(risk_score)
 
         # 7. Reject if above threshold
         if risk_score >= self.rejection_threshold:
@@ -254,16 +362,7 @@ class InputValidator:
                 flags=flags,
             )
 
-        # 9. Sanitize and return
-        sanitized = self._sanitize(raw_input)
-
-        return ValidationResult(
-            is_valid=True,
-            sanitized_input=sanitized,
-            risk_level=risk_level,
-            risk_score=risk_score,
-            flags=flags,
-        )
+        return None
 
     def _calculate_injection_risk(self, text: str) -> tuple[float, list[str]]:
         """Calculate prompt injection risk score.
@@ -278,16 +377,17 @@ class InputValidator:
         flags: list[str] = []
         triggered_categories: set[str] = set()
 
-        for pattern, weight, flag in COMPILED_INJECTION_PATTERNS:
-            if pattern.search(text):
-                # Only add full weight for first pattern in category
-                if flag not in triggered_categories:
-                    score += weight
-                    triggered_categories.add(flag)
-                else:
-                    # Diminishing returns for same category
-                    score += weight * 0.3
-                flags.append(flag)
+        # Same order as COMPILED_INJECTION_PATTERNS, so scores add up identically
+        for i in INJECTION_PATTERN_SET.matching(text):
+            _, weight, flag = COMPILED_INJECTION_PATTERNS[i]
+            # Only add full weight for first pattern in category
+            if flag not in triggered_categories:
+                score += weight
+                triggered_categories.add(flag)
+            else:
+                # Diminishing returns for same category
+                score += weight * 0.3
+            flags.append(flag)
 
         return min(score, 1.0), list(set(flags))
 
@@ -315,22 +415,22 @@ class InputValidator:
             flags.append("code_block")
 
         # XML/HTML-like tags
-        if re.search(r"<[/]?[a-z]+[^>]*>", text, re.IGNORECASE):
+        if "<" in text and XML_TAG.search(text):
             score += 0.15
             flags.append("xml_tags")
 
         # Multiple dashes/equals (section separators)
-        if re.search(r"[-=]{5,}", text):
+        if SECTION_SEPARATOR.search(text):
             score += 0.1
             flags.append("section_separator")
 
         # Hash marks (header/comment patterns)
-        if re.search(r"^#{3,}", text, re.MULTILINE):
+        if "###" in text and HEADER_MARKERS.search(text):
             score += 0.1
             flags.append("header_markers")
 
         # Unusual character repetition
-        if re.search(r"(.)\1{10,}", text):
+        if CHAR_REPETITION.search(text):
             score += 0.05
             flags.append("char_repetition")
 
@@ -345,22 +445,7 @@ class InputValidator:
         Returns:
             Sanitized text.
         """
-        # 1. Normalize Unicode (NFKC: compatibility decomposition + canonical composition)
-        result = unicodedata.normalize("NFKC", text)
-
-        # 2. Remove zero-width and invisible characters
-        result = INVISIBLE_CHARS.sub("", result)
-
-        # 3. Normalize whitespace (but preserve single newlines)
-        # Replace multiple spaces with single space
-        result = re.sub(r"[^\S\n]+", " ", result)
-        # Replace multiple newlines with double newline
-        result = re.sub(r"\n{3,}", "\n\n", result)
-
-        # 4. Strip leading/trailing whitespace
-        result = result.strip()
-
-        return result
+        return normalize_whitespace(normalize_unicode(text))
 
     def quick_check(self, text: str) -> bool:
         """Quick check if input is likely safe.
@@ -0,0 +1,149 @@
+# src/ALİM/security/output_stream.py
+"""Incremental output validation for streamed LLM responses.
+
+:class:`StreamingOutputValidator` runs the leakage, jailbreak and harmful
+pattern sets over a response while it is generated:
+
+- Each chunk is scanned together with a bounded look-behind window of
+  the text before it, so patterns split across tokens are found
+- A match counts once ``settle_chars`` more characters have followed it
+  (or the stream ended), so ``\\b`` and lookaheads such as "suicide
+  prevention" see the text they depend on
+- Text is shown only once ``holdback_chars`` have followed it, so an
+  unsafe phrase is usually blocked before any of it reaches the user;
+  once a blocking issue is found, nothing more is released
+
+:func:`guard_stream` wraps an async token stream: it stops reading (and
+closes) the upstream generator on the first blocking issue, which ends
+generation early, and yields a safe fallback instead.
+
+Example:
+    ```python
+    async for chunk in guard_stream(provider.stream(messages), fallback=fallback_text):
+        yield chunk
+    ```
+"""
+
+from collections.abc import AsyncIterator
+
+import structlog
+
+from alim.security.output_validator import (
+    OUTPUT_PATTERN_SET,
+    OutputIssue,
+    OutputValidator,
+    get_output_validator,
+    output_issue,
+)
+
+logger = structlog.get_logger(__name__)
+
+# Text kept from earlier chunks, so matches spanning chunks are seen whole
+WINDOW_CHARS = 512
+
+# Characters that must follow a match before it counts
+SETTLE_CHARS = 24
+
+# Characters held back from the user (longer than most unsafe phrases)
+HOLDBACK_CHARS = 64
+
+
+class StreamingOutputValidator:
+    """Validates a response chunk by chunk and releases only checked text."""
+
+    def __init__(
+        self,
+        validator: OutputValidator | None = None,
+        window_chars: int = WINDOW_CHARS,
+        settle_chars: int = SETTLE_CHARS,
+        holdback_chars: int = HOLDBACK_CHARS,
+    ):
+        """Initialize the streaming validator.
+
+        Args:
+            validator: Validator whose strictness to apply (default: singleton)
+            window_chars: Look-behind kept from earlier chunks
+            settle_chars: Characters that must follow a match before it counts
+            holdback_chars: Characters not yet shown (at least settle_chars)
+        """
+        self.validator = validator or get_output_validator()
+        self.settle_chars = settle_chars
+        self.holdback_chars = max(holdback_chars, settle_chars)
+        self.window_chars = max(window_chars, self.holdback_chars)
+        self.issues: list[OutputIssue] = []
+        self._reported: set[int] = set()
+        self._window = ""
+        self._pending = ""
+
+    @property
+    def is_safe(self) -> bool:
+        """False once an issue that blocks the response has been found."""
+        return self.validator.issues_are_safe(self.issues)
+
+    def feed(self, chunk: str) -> str:
+        """Check a chunk; return the text now safe to show ("" once blocked)."""
+        if not chunk or not self.is_safe:
+            return ""
+        self._check(self._window + chunk, final=False)
+        self._pending += chunk
+        if not self.is_safe:
+            self._pending = ""
+            return ""
+        release = len(self._pending) - self.holdback_chars
+        if release <= 0:
+            return ""
+        released, self._pending = self._pending[:release], self._pending[release:]
+        return released
+
+    def close(self) -> str:
+        """End of stream: check the held-back tail and return it if safe."""
+        if self.is_safe:
+            self._check(self._window, final=True)
+        released, self._pending = (self._pending if self.is_safe else ""), ""
+        return released
+
+    def _check(self, text: str, final: bool) -> None:
+        """Report patterns first matched in ``text`` whose match has settled."""
+        settled = len(text) if final else len(text) - self.settle_chars
+        for i, match in OUTPUT_PATTERN_SET.search_all(text):
+            if i not in self._reported and match.end() <= settled:
+                self._reported.add(i)
+                self.issues.append(output_issue(i, match))
+        self._window = text[-self.window_chars :]
+
+
+async def guard_stream(
+    chunks: AsyncIterator[str],
+    validator: StreamingOutputValidator | None = None,
+    fallback: str | None = None,
+) -> AsyncIterator[str]:
+    """Yield validated text from ``chunks``; stop generation on a blocking issue.
+
+    Args:
+        chunks: Upstream token stream (closed early when blocked)
+        validator: Streaming validator to use (default: a new one)
+        fallback: Text yielded instead of the rest when blocked
+    """
+    validator = validator or StreamingOutputValidator()
+    async for chunk in chunks:
+        released = validator.feed(chunk)
+        if released:
+            yield released
+        if not validator.is_safe:
+            break
+    else:
+        released = validator.close()
+        if released:
+            yield released
+        return
+
+    # Blocked: stop the LLM instead of generating tokens nobody will see
+    aclose = getattr(chunks, "aclose", None)
+    if aclose is not None:
+        await aclose()
+    logger.warning(
+        "output_stream_blocked",
+        issues=[issue.issue_type for issue in validator.issues],
+    )
+    if fallback:
+        yield fallback
@@ -15,6 +15,8 @@ from enum import Enum
 
 from pydantic import BaseModel
 
+from alim.security.pattern_set import PatternSet
+
 
 class OutputSeverity(str, Enum):
     """Severity level of detected output issues."""
@@ -149,6 +151,28 @@ COMPILED_LEAKAGE = [(re.compile(p, re.IGNORECASE), s, t) for p, s, t in LEAKAGE_
 COMPILED_JAILBREAK = [(re.compile(p, re.IGNORECASE), s, t) for p, s, t in JAILBREAK_PATTERNS]
 COMPILED_HARMFUL = [(re.compile(p, re.IGNORECASE), s, t) for p, s, t in HARMFUL_PATTERNS]
 
+# All output patterns behind one literal prefilter, with the description of their group
+OUTPUT_CHECKS: list[tuple[OutputSeverity, str, str]] = [
+    *((s, t, "Potential system prompt leakage detected") for _, s, t in LEAKAGE_PATTERNS),
+    *((s, t, "Jailbreak indicator detected") for _, s, t in JAILBREAK_PATTERNS),
+    *((s, t, "Potentially harmful content detected") for _, s, t in HARMFUL_PATTERNS),
+]
+OUTPUT_PATTERN_SET = PatternSet(
+    [(p, re.IGNORECASE) for p, _, _ in LEAKAGE_PATTERNS + JAILBREAK_PATTERNS + HARMFUL_PATTERNS]
+)
+
+
+def output_issue(index: int, match: re.Match) -> OutputIssue:
+    """Issue for a match of OUTPUT_PATTERN_SET pattern ``index``."""
+    severity, issue_type, description = OUTPUT_CHECKS[index]
+    matched = match.group()
+    return OutputIssue(
+        issue_type=issue_type,
+        severity=severity,
+        description=description,
+        matched_pattern=matched[:50] + "..." if len(matched) > 50 else matched,
+    )
+
 
 class OutputValidator:
     """Validates LLM output for safety issues.
@@ -203,58 +227,9 @@ class OutputValidator:
         if not response:
             return OutputValidationResult(is_safe=True, sanitized_output="")
 
-        issues: list[OutputIssue] = []
-
-        # Check for leakage
-        for pattern, severity, issue_type in COMPILED_LEAKAGE:
-            match = pattern.search(response)
-            if match:
-                issues.append(
-                    OutputIssue(
-                        issue_type=issue_type,
-                        severity=severity,
-                        description="Potential system prompt leakage detected",
-                        matched_pattern=match.group()[:50] + "..."
-                        if len(match.group()) > 50
-                        else match.group(),
-                    )
-                )
-
-        # Check for jailbreak indicators
-        for pattern, severity, issue_type in COMPILED_JAILBREAK:
-            match = pattern.search(response)
-            if match:
-                issues.append(
-                    OutputIssue(
-                        issue_type=issue_type,
-                        severity=severity,
-                        description="Jailbreak indicator detected",
-                        matched_pattern=match.group()[:50] + "..."
-                        if len(match.group()) > 50
-                        else match.group(),
-                    )
-                )
-
-        # Check for harmful content
-        for pattern, severity, issue_type in COMPILED_HARMFUL:
-            match = pattern.search(response)
-            if match:
-                issues.append(
-                    OutputIssue(
-                        issue_type=issue_type,
-                        severity=severity,
-                        description="Potentially harmful content detected",
-                        matched_pattern=match.group()[:50] + "..."
-                        if len(match.group()) > 50
-                        else match.group(),
-                    )
-                )
-
-        # Determine if safe
-        has_critical = any(issue.severity == OutputSeverity.CRITICAL for issue in issues)
-        has_warning = any(issue.severity == OutputSeverity.WARNING for issue in issues)
-
-        is_safe = not has_critical and not (self.strict_mode and has_warning)
+        # Leakage, jailbreak indicators and harmful content, in that order
+        issues = [output_issue(i, match) for i, match in OUTPUT_PATTERN_SET.search_all(response)]
+        is_safe = self.issues_are_safe(issues)
 
         # Sanitize if needed and requested
         sanitized = response
@@ -271,6 +246,12 @@ class OutputValidator:
             was_modified=was_modified,
         )
 
+    def issues_are_safe(self, issues: list[OutputIssue]) -> bool:
+        """False if any issue blocks the response (WARNING too in strict mode)."""
+        has_critical = any(issue.severity == OutputSeverity.CRITICAL for issue in issues)
+        has_warning = any(issue.severity == OutputSeverity.WARNING for issue in issues)
+        return not has_critical and not (self.strict_mode and has_warning)
+
     def _sanitize_response(self, response: str) -> str:
         """Remove or replace problematic content from response.
 
@@ -327,11 +308,10 @@ class OutputValidator:
             return True
 
         # Check critical patterns only
-        for pattern, severity, _ in COMPILED_LEAKAGE + COMPILED_JAILBREAK + COMPILED_HARMFUL:
-            if severity == OutputSeverity.CRITICAL and pattern.search(response):
-                return False
-
-        return True
+        return not any(
+            OUTPUT_CHECKS[i][0] == OutputSeverity.CRITICAL
+            for i, _ in OUTPUT_PATTERN_SET.search_all(response)
+        )
 
     def get_safe_fallback(self, language: str = "az") -> str:
         """Get a safe fallback response when output is blocked.
@@ -0,0 +1,148 @@
+# src/ALİM/security/pattern_set.py
+"""Multi-pattern search with a literal prefilter.
+
+The validators ask "which of these ~35 regexes occur in the text?" for
+every message. Searching each regex separately scans the text once per
+pattern. :class:`PatternSet` works like Hyperscan's literal prefilter:
+
+- At compile time, each regex is parsed and a required literal factor is
+  extracted: strings, at least one of which occurs in every match (e.g.
+  ``bypass\\s+(?:filters?|safety)`` needs "bypass")
+- Per text, the factors are looked up with plain substring checks, which
+  run at C speed; only regexes whose factor is present are searched
+- Regexes without a usable factor are always searched
+
+Results are exactly those of ``pattern.search(text)`` per pattern.
+Case-insensitive factors are checked against a case-folded copy of the
+text that mirrors how ``re.IGNORECASE`` matches ASCII letters.
+
+Example:
+    ```python
+    patterns = PatternSet([(r"ignore\\s+previous", re.IGNORECASE), (r"<<\\s*SYS", 0)])
+    for index, match in patterns.search_all(text):
+        print(index, match.group())
+    ```
+"""
+
+import re
+from collections.abc import Iterator, Sequence
+
+# The stdlib's own regex parser (public as sre_parse before 3.11)
+from re import _constants as sre
+from re import _parser as sre_parse
+
+# Non-ASCII characters that re.IGNORECASE matches to ASCII letters
+# (İ, ı -> i; ſ -> s; Kelvin sign -> k); str.lower() alone misses them
+_ASCII_FOLD = (("İ", "i"), ("ı", "i"), ("ſ", "s"), ("K", "k"))
+
+
+def fold(text: str) -> str:
+    """Lower-case ``text`` so case-insensitive ASCII literals can be found with ``in``."""
+    if not text.isascii():
+        for char, ascii_char in _ASCII_FOLD:
+            if char in text:
+                text = text.replace(char, ascii_char)
+    return text.lower()
+
+
+def required_literals(pattern: str, flags: int = 0) -> tuple[str, ...] | None:
+    """Strings at least one of which occurs in every match of ``pattern``.
+
+    Case-insensitive patterns get lower-cased literals (see :func:`fold`).
+    Returns None if no such set could be derived.
+    """
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+    except re.error:
+        return None
+    ignore_case = bool(parsed.state.flags & re.IGNORECASE)
+    return _sequence(list(parsed), ignore_case)
+
+
+def _sequence(items: list, ignore_case: bool) -> tuple[str, ...] | None:
+    """Best literal set among the required parts of a regex sequence."""
+    candidates: list[tuple[str, ...]] = []
+    run: list[str] = []
+    for op, av in items:
+        if op is sre.LITERAL and (not ignore_case or av < 128):
+            run.append(chr(av).lower() if ignore_case else chr(av))
+            continue
+        if run:
+            candidates.append(("".join(run),))
+            run = []
+        found = _required(op, av, ignore_case)
+        if found:
+            candidates.append(found)
+    if run:
+        candidates.append(("".join(run),))
+    if not candidates:
+        return None
+    # Longest shortest alternative first (fewest false positives), then fewest alternatives
+    return max(candidates, key=lambda c: (min(map(len, c)), -len(c)))
+
+
+def _required(op, av, ignore_case: bool) -> tuple[str, ...] | None:
+    """Literal set for one non-literal regex item, if it is required."""
+    if op is sre.SUBPATTERN:
+        _, add_flags, del_flags, body = av
+        if add_flags or del_flags:
+            return None
+        return _sequence(list(body), ignore_case)
+    if op is sre.BRANCH:
+        union: list[str] = []
+        for branch in av[1]:
+            found = _sequence(list(branch), ignore_case)
+            if not found:
+                return None
+            union.extend(s for s in found if s not in union)
+        return tuple(union)
+    if op in (sre.MAX_REPEAT, sre.MIN_REPEAT) and av[0] >= 1:
+        return _sequence(list(av[2]), ignore_case)
+    if (
+        op is sre.IN
+        and av
+        and all(
+            item_op is sre.LITERAL and (not ignore_case or item_av < 128) for item_op, item_av in av
+        )
+    ):
+        return tuple(dict.fromkeys(chr(c).lower() if ignore_case else chr(c) for _, c in av))
+    return None
+
+
+class PatternSet:
+    """Searches many regexes over one text, skipping those that cannot match."""
+
+    def __init__(self, patterns: Sequence[tuple[str, int]]):
+        """Compile the patterns and extract their literal factors.
+
+        Args:
+            patterns: (regex, flags) pairs; results keep this order
+        """
+        self.patterns = [re.compile(regex, flags) for regex, flags in patterns]
+        self.literals = [required_literals(regex, flags) for regex, flags in patterns]
+        # Literals are looked up once per text, tagged with the text they are checked in
+        self._keys = [
+            None if literals is None else {(bool(p.flags & re.IGNORECASE), s) for s in literals}
+            for p, literals in zip(self.patterns, self.literals, strict=True)
+        ]
+        self._folded = sorted({s for keys in self._keys if keys for folded, s in keys if folded})
+        self._exact = sorted({s for keys in self._keys if keys for folded, s in keys if not folded})
+
+    def search_all(self, text: str) -> Iterator[tuple[int, re.Match]]:
+        """(index, first match) for every pattern that occurs in ``text``, in order."""
+        present = {(False, s) for s in self._exact if s in text}
+        if self._folded:
+            folded = fold(text)
+            present.update((True, s) for s in self._folded if s in folded)
+
+        for i, pattern in enumerate(self.patterns):
+            keys = self._keys[i]
+            if keys is not None and present.isdisjoint(keys):
+                continue
+            match = pattern.search(text)
+            if match:
+                yield i, match
+
+    def matching(self, text: str) -> list[int]:
+        """Indexes of the patterns that occur in ``text``."""
+        return [i for i, _ in self.search_all(text)]
@@ -5,13 +5,36 @@ Ensures no real personal data reaches the LLM. Uses Azerbaijani-specific
 patterns for names, phone numbers, FIN codes, etc.
 
 The AI NEVER sees real PII - all detected PII is replaced with placeholders.
+
+All patterns are matched in one pass by a :class:`PIIScanner`; where
+matches overlap, the pattern earlier in ``PIIGateway.PATTERN_ORDER`` wins.
 """
 
-import re
 from dataclasses import dataclass
 
 from pydantic import BaseModel
 
+from alim.security.pii_scanner import PIIScanner, trie_pattern
+
+# Common Azerbaijani first names (male, then female)
+FIRST_NAMES = (
+    "Əli", "Vəli", "Məmməd", "Rəsul", "Elçin", "Orxan", "Tural", "Namiq", "Rəşad", "Cavid",
+    "Farid", "Samir", "Elşən", "Rauf", "Fikrət", "İlham", "Ramil", "Anar", "Zaur", "Ramin",
+    "Şahin", "Emin", "Seymur", "Nicat", "Elvin", "Ceyhun", "Murad", "Ruslan", "Akif",
+    "Nigar", "Aynur", "Günay", "Leyla", "Sevinc", "Aysel", "Günel", "Lalə", "Nərgiz", "Samirə",
+    "Sevil", "Fidan", "Aytən", "Nuray", "Könül", "Arzu", "Vüsalə", "Səbinə", "Röya", "Ülviyyə",
+)  # fmt: skip
+
+# Patronymic surnames that follow a first name
+SURNAMES = (
+    "Məmmədov", "Əliyev", "Həsənov", "Hüseynov", "Quliyev", "Rəhimov", "İsmayılov",
+    "Mustafayev", "Babayev", "Nəsirov", "Süleymanov", "Kazımov", "Məmmədova", "Əliyeva",
+    "Həsənova", "Hüseynova", "Quliyeva", "Rəhimova", "İsmayılova", "Mustafayeva",
+)  # fmt: skip
+
+# Surnames common enough to strip on their own
+STANDALONE_SURNAMES = SURNAMES[:17]
+
 
 @dataclass
 class PIIDetection:
@@ -99,32 +122,14 @@ class PIIGateway:
             "[VOEN]",
         ),
         # Personal names - common Azerbaijani name patterns
-        # First names (extended list)
         "name_full": (
-            r"\b(?:"
-            # Male first names
-            r"Əli|Vəli|Məmməd|Rəsul|Elçin|Orxan|Tural|Namiq|Rəşad|Cavid|"
-            r"Farid|Samir|Elşən|Rauf|Fikrət|İlham|Ramil|Anar|Zaur|Ramin|"
-            r"Şahin|Emin|Seymur|Nicat|Elvin|Ceyhun|Murad|Ruslan|Akif|"
-            # Female first names
-            r"Nigar|Aynur|Günay|Leyla|Sevinc|Aysel|Günel|Lalə|Nərgiz|Samirə|"
-            r"Sevil|Fidan|Aytən|Nuray|Könül|Arzu|Vüsalə|Səbinə|Röya|Ülviyyə"
-            r")\s+"
-            # Patronymic surnames
-            r"(?:Məmmədov|Əliyev|Həsənov|Hüseynov|Quliyev|Rəhimov|İsmayılov|"
-            r"Mustafayev|Babayev|Nəsirov|Süleymanov|Kazımov|Məmmədova|Əliyeva|"
-            r"Həsənova|Hüseynova|Quliyeva|Rəhimova|İsmayılova|Mustafayeva)"
+            rf"\b{trie_pattern(FIRST_NAMES)}\s+{trie_pattern(SURNAMES)}"
             # Optional patronymic suffix
             r"(?:\s+(?:oğlu|qızı))?",
             "[ŞƏXS]",
         ),
         # Standalone common surnames (less specific, lower priority)
-        "surname_only": (
-            r"\b(?:Məmmədov|Əliyev|Həsənov|Hüseynov|Quliyev|Rəhimov|"
-            r"İsmayılov|Mustafayev|Babayev|Nəsirov|Süleymanov|Kazımov|"
-            r"Məmmədova|Əliyeva|Həsənova|Hüseynova|Quliyeva)a?\b",
-            "[ŞƏXS]",
-        ),
+        "surname_only": (rf"\b{trie_pattern(STANDALONE_SURNAMES)}a?\b", "[ŞƏXS]"),
         # Digital identifiers
         "email": (r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}", "[EMAIL]"),
         "iban_az": (
@@ -157,50 +162,72 @@ class PIIGateway:
         ),
     }
 
+    # Overlap priority: more specific first (full names before surnames,
+    # specific phone formats before generic ones)
+    PATTERN_ORDER: tuple[str, ...] = (
+        "name_full",
+        "phone_az_intl",
+        "phone_az_local",
+        "iban_az",
+        "id_card",
+        "voen",
+        "gps_coordinates",
+        "real_parcel_id",
+        "address_detailed",
+        "email",
+        "card_number",
+        "phone_simple",
+        "surname_only",
+        "fin_code",
+    )
+
+    CASE_SENSITIVE = frozenset({"fin_code", "id_card", "iban_az", "real_parcel_id"})
+
+    # Literal every match of the pattern contains; texts without it skip the pattern
+    PATTERN_GATES = {"email": "@"}
+
     def __init__(self, additional_patterns: dict[str, tuple[str, str]] | None = None):
         """Initialize PII Gateway.
 
         Args:
-            additional_patterns: Extra patterns to detect, format: {name: (regex, replacement)}
+            additional_patterns: Extra patterns to detect, format: {name: (regex, replacement)};
+                they rank after the built-in patterns
         """
         patterns = self.PATTERNS.copy()
         if additional_patterns:
             patterns.update(additional_patterns)
 
-        # Compile all patterns (case-insensitive for most)
-        self._compiled_patterns: dict[str, tuple[re.Pattern, str]] = {}
-        for name, (pattern, replacement) in patterns.items():
-            # Some patterns should be case-sensitive (FIN, IBAN, etc.)
-            case_sensitive = name in {"fin_code", "id_card", "iban_az", "real_parcel_id"}
-            flags = 0 if case_sensitive else re.IGNORECASE
-            self._compiled_patterns[name] = (re.compile(pattern, flags), replacement)
+        order = [name for name in self.PATTERN_ORDER if name in patterns]
+        order += [name for name in patterns if name not in order]
+
+        self._replacements = {name: patterns[name][1] for name in order}
+        self._scanner = PIIScanner(
+            [(name, *patterns[name], name in self.CASE_SENSITIVE) for name in order],
+            gates=self.PATTERN_GATES,
+        )
 
     def detect_pii(self, text: str) -> list[PIIDetection]:
         """Detect all PII instances in text without modifying it.
 
+        Overlapping matches are resolved as in :meth:`strip_pii`, so the
+        detections are exactly the spans that would be replaced.
+
         Args:
             text: Input text to scan.
 
         Returns:
-            List of PIIDetection objects with details about each detection.
+            List of PIIDetection objects, ordered by position.
         """
-        detections: list[PIIDetection] = []
-
-        for pii_type, (pattern, replacement) in self._compiled_patterns.items():
-            for match in pattern.finditer(text):
-                detections.append(
-                    PIIDetection(
-                        pii_type=pii_type,
-                        original=match.group(),
-                        replacement=replacement,
-                        start_pos=match.start(),
-                        end_pos=match.end(),
-                    )
-                )
-
-        # Sort by position for consistent ordering
-        detections.sort(key=lambda d: d.start_pos)
-        return detections
+        return [
+            PIIDetection(
+                pii_type=pii_type,
+                original=text[start:end],
+                replacement=self._replacements[pii_type],
+                start_pos=start,
+                end_pos=end,
+            )
+            for start, end, pii_type in self._scanner.scan(text)
+        ]
 
     def strip_pii(self, text: str) -> PIIResult:
         """Detect and strip all PII from text.
@@ -218,48 +245,16 @@ class PIIGateway:
                 detection_count=0,
             )
 
-        cleaned = text
-        pii_types: set[str] = set()
-        total_detections = 0
-
-        # Apply patterns in order (more specific first)
-        # Order matters: full names before surnames, specific phone before generic
-        pattern_order = [
-            "name_full",
-            "phone_az_intl",
-            "phone_az_local",
-            "iban_az",
-            "id_card",
-            "voen",
-            "gps_coordinates",
-            "real_parcel_id",
-            "address_detailed",
-            "email",
-            "card_number",
-            "phone_simple",
-            "surname_only",
-            "fin_code",
-        ]
-
-        for pii_type in pattern_order:
-            if pii_type not in self._compiled_patterns:
-                continue
-            pattern, replacement = self._compiled_patterns[pii_type]
-
-            # Count matches before replacing
-            matches = pattern.findall(cleaned)
-            if matches:
-                total_detections += len(matches)
-                pii_types.add(pii_type)
-
-            # Replace all occurrences
-            cleaned = pattern.sub(replacement, cleaned)
+        spans = self._scanner.scan(text)
+        if not spans:
+            return PIIResult(cleaned_text=text, has_pii=False, detection_count=0)
 
+        found = {pii_type for _, _, pii_type in spans}
         return PIIResult(
-            cleaned_text=cleaned,
-            has_pii=total_detections > 0,
-            detection_count=total_detections,
-            pii_types_found=list(pii_types),
+            cleaned_text=self._scanner.replace(text, spans),
+            has_pii=True,
+            detection_count=len(spans),
+            pii_types_found=[name for name in self._replacements if name in found],
         )
 
     def has_pii(self, text: str) -> bool:
@@ -273,13 +268,7 @@ class PIIGateway:
         Returns:
             True if any PII pattern matches.
         """
-        if not text:
-            return False
-
-        for pattern, _ in self._compiled_patterns.values():
-            if pattern.search(text):
-                return True
-        return False
+        return self._scanner.search(text)
 
     def mask_for_logging(self, text: str, mask_char: str = "*") -> str:
         """Create a masked version suitable for logging.
@@ -296,19 +285,20 @@ class PIIGateway:
         if not text:
             return ""
 
-        result = text
-        for pattern, _ in self._compiled_patterns.values():
-
-            def mask_match(m: re.Match) -> str:
-                original = m.group()
-                if len(original) <= 4:
-                    return mask_char * len(original)
+        pieces: list[str] = []
+        pos = 0
+        for start, end, _ in self._scanner.scan(text):
+            original = text[start:end]
+            if len(original) <= 4:
+                masked = mask_char * len(original)
+            else:
                 # Keep first and last char, mask middle
-                return original[0] + mask_char * (len(original) - 2) + original[-1]
-
-            result = pattern.sub(mask_match, result)
-
-        return result
+                masked = original[0] + mask_char * (len(original) - 2) + original[-1]
+            pieces.append(text[pos:start])
+            pieces.append(masked)
+            pos = end
+        pieces.append(text[pos:])
+        return "".join(pieces)
 
 
 # Singleton instance for easy import
@@ -0,0 +1,257 @@
+# src/ALİM/security/pii_scanner.py
+"""Single-pass multi-pattern scanner for PII detection.
+
+All PII patterns are compiled into one regex: a lookahead alternation of
+named groups in priority order. One ``finditer`` reports, for every
+position, the highest-priority pattern that matches there, so a message
+is scanned once instead of twice per pattern.
+
+Overlaps are resolved by priority: higher-priority spans are claimed
+first, and a lower-priority match is kept only if it does not overlap
+anything claimed. This reproduces applying the patterns one after another
+with ``re.sub``, without rewriting the text between patterns. Only when a
+match runs into a later, higher-priority span is it matched again against
+the text with that span replaced, as the sequential version saw it.
+
+Word dictionaries (first names, surnames) are compiled with
+:func:`trie_pattern` into prefix-factored alternations, so matching a
+name costs one walk down the trie instead of trying every word.
+
+Example:
+    ```python
+    scanner = PIIScanner([
+        ("phone", r"\\+994\\d{9}", "[TELEFON]", False),
+        ("fin", r"\\b[A-Z0-9]{7}\\b", "[FİN]", True),
+    ])
+    spans = scanner.scan(text)          # [(start, end, "phone"), ...]
+    cleaned = scanner.replace(text, spans)
+    ```
+"""
+
+import bisect
+import re
+from collections.abc import Iterable, Sequence
+from typing import NamedTuple
+
+# Non-alphanumeric characters that patterns treat as part of a token
+# (email local parts, IBAN/card separators)
+_JOINERS = "._%+-@"
+
+
+def trie_pattern(words: Iterable[str]) -> str:
+    """Regex alternation of ``words``, factored by common prefixes.
+
+    Branches keep the order in which words first appear. This matches what
+    ``"|".join(map(re.escape, words))`` matches as long as every word that
+    is a prefix of other words comes before all of them or after all of
+    them. Otherwise the two can differ: for ``["abcd", "ab", "abce"]`` on
+    ``"abce"`` the trie matches ``abce`` and the flat alternation ``ab``.
+    The gateway's name lists are checked in tests/unit/test_pii_scanner.py.
+    """
+    root: dict[str, dict] = {}
+    for word in words:
+        node = root
+        for char in word:
+            node = node.setdefault(char, {})
+        node.setdefault("", {})
+
+    def emit(node: dict[str, dict]) -> str:
+        branches = [
+            "" if char == "" else re.escape(char) + emit(child) for char, child in node.items()
+        ]
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    return emit(root)
+
+
+class _View(NamedTuple):
+    """Text with higher-priority spans replaced by their placeholders."""
+
+    text: str
+    # (start, end, shift after, placeholder length) per replaced span
+    spans: list[tuple[int, int, int, int]]
+
+
+def _joins(text: str, pos: int) -> bool:
+    """True if the character at ``pos`` could extend a match across a span edge."""
+    return 0 <= pos < len(text) and (text[pos].isalnum() or text[pos] in _JOINERS)
+
+
+class PIIScanner:
+    """Finds non-overlapping PII spans for prioritized patterns in one pass."""
+
+    def __init__(
+        self,
+        patterns: Sequence[tuple[str, str, str, bool]],
+        gates: dict[str, str] | None = None,
+    ):
+        """Compile the scanner.
+
+        Args:
+            patterns: (name, regex, replacement, case_sensitive) in priority order
+            gates: Pattern name -> literal every match contains (e.g.
+                email -> "@"); the pattern is left out of the scan for
+                texts without the literal
+        """
+        self.names = [name for name, _, _, _ in patterns]
+        self.replacements = [replacement for _, _, replacement, _ in patterns]
+        self._regexes = [
+            f"(?{'' if case_sensitive else 'i'}:{regex})"
+            for _, regex, _, case_sensitive in patterns
+        ]
+        # Standalone patterns, for resolving conflicts at one position
+        self._single = [re.compile(regex) for regex in self._regexes]
+        self._gates = {
+            name: literal for name, literal in (gates or {}).items() if name in self.names
+        }
+        self._scanners: dict[frozenset[str], re.Pattern] = {}
+
+    def search(self, text: str) -> bool:
+        """True if any pattern matches anywhere in ``text``."""
+        return bool(text) and self._scanner(text).search(text) is not None
+
+    def scan(self, text: str) -> list[tuple[int, int, str]]:
+        """Non-overlapping (start, end, pattern name) spans, sorted by start."""
+        if not text:
+            return []
+
+        # candidates[rank]: spans where that pattern is the best match at its start
+        candidates: list[list[tuple[int, int]]] = [[] for _ in self.names]
+        for match in self._scanner(text).finditer(text):
+            group = match.lastgroup
+            start, end = match.span(group)
+            if end > start:
+                candidates[int(group[2:])].append((start, end))
+
+        covered = bytearray(len(text))
+        accepted: list[tuple[int, int, int]] = []
+        attached = False
+        for rank, spans in enumerate(candidates):
+            if attached:
+                # A claimed span touches a word: its placeholder changes word
+                # boundaries around it, so lower patterns scan the replaced
+                # text as they did sequentially
+                spans = self._rescan(text, accepted, rank)
+            view = None
+            for start, end in spans:
+                if covered.find(1, start, end) != -1:
+                    if covered[start]:
+                        continue
+                    # Blocked by a span that starts later. Sequentially, that
+                    # span would already be a placeholder, so match again
+                    # against the text as it would look then
+                    view = view or self._view(text, accepted, rank)
+                    end = self._rematch(view, start, rank)
+                    if end is None:
+                        self._next_candidate(text, start, rank, candidates)
+                        continue
+                covered[start:end] = b"\x01" * (end - start)
+                accepted.append((start, end, rank))
+                attached = attached or _joins(text, start - 1) or _joins(text, end)
+
+        accepted.sort()
+        return [(start, end, self.names[rank]) for start, end, rank in accepted]
+
+    def replace(self, text: str, spans: list[tuple[int, int, str]] | None = None) -> str:
+        """``text`` with each span (default: :meth:`scan`) replaced by its placeholder."""
+        if spans is None:
+            spans = self.scan(text)
+        replacement = dict(zip(self.names, self.replacements, strict=True))
+        pieces: list[str] = []
+        pos = 0
+        for start, end, name in spans:
+            pieces.append(text[pos:start])
+            pieces.append(replacement[name])
+            pos = end
+        pieces.append(text[pos:])
+        return "".join(pieces)
+
+    # ====================================================================
+    # Internals
+    # ====================================================================
+
+    def _scanner(self, text: str) -> re.Pattern:
+        """Combined lookahead regex, without patterns whose gate is absent."""
+        skipped = frozenset(name for name, literal in self._gates.items() if literal not in text)
+        scanner = self._scanners.get(skipped)
+        if scanner is None:
+            alternatives = [
+                f"(?P<_p{rank}>{regex})"
+                for rank, (name, regex) in enumerate(zip(self.names, self._regexes, strict=True))
+                if name not in skipped
+            ]
+            # "(?!)" never matches: every pattern is gated out
+            scanner = re.compile("(?=" + "|".join(alternatives) + ")" if alternatives else "(?!)")
+            self._scanners[skipped] = scanner
+        return scanner
+
+    def _view(self, text: str, accepted: list[tuple[int, int, int]], rank: int) -> _View:
+        """Text as pattern ``rank`` sees it sequentially: higher-priority spans replaced."""
+        pieces: list[str] = []
+        spans: list[tuple[int, int, int, int]] = []
+        pos = shift = 0
+        for start, end, higher in sorted(accepted):
+            if higher >= rank:
+                continue
+            pieces.append(text[pos:start])
+            pieces.append(self.replacements[higher])
+            shift += len(self.replacements[higher]) - (end - start)
+            spans.append((start, end, shift, len(self.replacements[higher])))
+            pos = end
+        pieces.append(text[pos:])
+        return _View("".join(pieces), spans)
+
+    def _rematch(self, view: _View, start: int, rank: int) -> int | None:
+        """End of the pattern's match at ``start`` in the replaced text.
+
+        Returns None if it does not match there, or only by running into a
+        placeholder.
+        """
+        i = bisect.bisect_left(view.spans, (start,))
+        shift = view.spans[i - 1][2] if i else 0
+        match = self._single[rank].match(view.text, start + shift)
+        if match is None or match.end() == start + shift:
+            return None
+        end = match.end() - shift
+        if i < len(view.spans) and end > view.spans[i][0]:
+            return None
+        return end
+
+    def _rescan(
+        self, text: str, accepted: list[tuple[int, int, int]], rank: int
+    ) -> list[tuple[int, int]]:
+        """Pattern ``rank``'s matches in the replaced text, in original positions.
+
+        Matches that include part of a placeholder have no original span
+        and are dropped.
+        """
+        view = self._view(text, accepted, rank)
+        # (start, end, shift after) of each placeholder in the replaced text
+        placeholders = [
+            (end + shift - length, end + shift, shift) for _, end, shift, length in view.spans
+        ]
+        spans = []
+        for match in self._single[rank].finditer(view.text):
+            m_start, m_end = match.span()
+            if m_end == m_start:
+                continue
+            i = bisect.bisect_right(placeholders, (m_start, m_start))
+            if i and placeholders[i - 1][1] > m_start:
+                continue
+            if i < len(placeholders) and placeholders[i][0] < m_end:
+                continue
+            shift = placeholders[i - 1][2] if i else 0
+            spans.append((m_start - shift, m_end - shift))
+        return spans
+
+    def _next_candidate(
+        self, text: str, start: int, rank: int, candidates: list[list[tuple[int, int]]]
+    ) -> None:
+        """Offer the next pattern that matches at ``start`` to its rank."""
+        for lower in range(rank + 1, len(self._single)):
+            match = self._single[lower].match(text, start)
+            if match and match.end() > start:
+                bisect.insort(candidates[lower], (start, match.end()))
+                return
@@ -0,0 +1,163 @@
+# src/ALİM/security/pii_stream.py
+"""Incremental PII masking for token streams and documents.
+
+:class:`PIIStreamMasker` masks text that arrives in chunks (LLM tokens,
+file blocks) without holding the whole text:
+
+- Each chunk is appended to a small buffer that is scanned with the
+  gateway's patterns
+- Text that no future chunk can turn into (part of) a match is masked
+  and emitted; only the suffix where a match could still be in progress
+  is held back
+- That suffix is at most ``max_match_chars`` long, and ends at the last
+  character no pattern can match across (e.g. "?" or "!"), so memory
+  stays constant and sentence-by-sentence output flows without delay
+- The last ``max_match_chars`` of emitted text are rescanned with the
+  suffix, so word boundaries and pattern priorities are decided as
+  ``strip_pii`` decides them on the whole text
+
+The one pattern this cannot follow exactly is the parcel ID's "no 'syn'
+later on the line" check, which may look further ahead than the window.
+An undecided parcel ID is masked.
+
+Example:
+    ```python
+    async for chunk in mask_stream(provider.stream(messages)):
+        yield chunk
+
+    masker = PIIStreamMasker()
+    for block in mask_document_chunks("upload.txt", masker):
+        out.write(block)
+    masker.pii_types_found  # ["phone_az_intl", ...]
+    ```
+"""
+
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from pathlib import Path
+
+from alim.security.pii_gateway import PIIGateway, get_pii_gateway
+
+# Longest match the masker guarantees to catch whole; longer matches
+# (e.g. very long street addresses) may be emitted partly unmasked
+MAX_MATCH_CHARS = 128
+
+# Characters no built-in pattern matches, so no match spans them
+BREAK_CHARS = frozenset("?!;\"'/\\*#[]{}<>|=~^&$`")
+
+# Read size for documents
+DOCUMENT_CHUNK_CHARS = 64 * 1024
+
+
+class PIIStreamMasker:
+    """Masks PII in text fed chunk by chunk."""
+
+    def __init__(
+        self,
+        gateway: PIIGateway | None = None,
+        max_match_chars: int = MAX_MATCH_CHARS,
+        break_chars: Iterable[str] = BREAK_CHARS,
+    ):
+        """Initialize the masker.
+
+        Args:
+            gateway: Gateway whose patterns to apply (default: singleton)
+            max_match_chars: Longest match to hold back for
+            break_chars: Characters no pattern matches; pass an empty set for
+                gateways with custom patterns that may contain them
+        """
+        self.gateway = gateway or get_pii_gateway()
+        self.max_match_chars = max_match_chars
+        self.break_chars = frozenset(break_chars)
+        self.detection_count = 0
+        self.pii_types_found: list[str] = []
+        self._buffer = ""
+        self._context = ""
+
+    @property
+    def pending(self) -> int:
+        """Characters held back, waiting for more input."""
+        return len(self._buffer)
+
+    def feed(self, chunk: str) -> str:
+        """Add a chunk; return the masked text that is now final (may be empty)."""
+        if not chunk:
+            return ""
+        self._buffer += chunk
+        return self._emit(final=False)
+
+    def flush(self) -> str:
+        """End of input: mask and return everything held back."""
+        return self._emit(final=True)
+
+    def _emit(self, final: bool) -> str:
+        text = self._context + self._buffer
+        offset = len(self._context)
+        if len(text) == offset:
+            return ""
+
+        # A match starting at or after ``limit`` may continue into the next chunk
+        limit = len(text) if final else self._safe_limit(text, offset)
+        commit = limit
+        pieces: list[str] = []
+        pos = offset
+        for detection in self.gateway.detect_pii(text):
+            if detection.end_pos <= offset:
+                continue  # Emitted already
+            if detection.start_pos >= limit:
+                break
+            # A match reaching back into emitted text: mask the part not yet out
+            pieces.append(text[pos : max(detection.start_pos, offset)])
+            pieces.append(detection.replacement)
+            pos = detection.end_pos
+            commit = max(commit, detection.end_pos)
+            self.detection_count += 1
+            if detection.pii_type not in self.pii_types_found:
+                self.pii_types_found.append(detection.pii_type)
+        pieces.append(text[pos:commit])
+
+        # Raw, not masked: the scan must see what strip_pii saw to agree with it
+        self._context = text[max(commit - self.max_match_chars, 0) : commit]
+        self._buffer = text[commit:]
+        return "".join(pieces)
+
+    def _safe_limit(self, text: str, offset: int) -> int:
+        """Earliest position from which a match may still be in progress."""
+        limit = max(len(text) - self.max_match_chars, offset)
+        last_break = max((text.rfind(char, limit) for char in self.break_chars), default=-1)
+        return max(limit, last_break + 1)
+
+
+async def mask_stream(
+    chunks: AsyncIterable[str], masker: PIIStreamMasker | None = None
+) -> AsyncIterator[str]:
+    """Mask an async text stream (e.g. LLM tokens), holding back as little as possible."""
+    masker = masker or PIIStreamMasker()
+    async for chunk in chunks:
+        masked = masker.feed(chunk)
+        if masked:
+            yield masked
+    tail = masker.flush()
+    if tail:
+        yield tail
+
+
+def mask_chunks(chunks: Iterable[str], masker: PIIStreamMasker | None = None) -> Iterator[str]:
+    """Synchronous :func:`mask_stream`."""
+    masker = masker or PIIStreamMasker()
+    for chunk in chunks:
+        masked = masker.feed(chunk)
+        if masked:
+            yield masked
+    tail = masker.flush()
+    if tail:
+        yield tail
+
+
+def mask_document_chunks(
+    path: str | Path,
+    masker: PIIStreamMasker | None = None,
+    chunk_chars: int = DOCUMENT_CHUNK_CHARS,
+) -> Iterator[str]:
+    """Masked text of a UTF-8 document, read ``chunk_chars`` at a time."""
+    with open(path, encoding="utf-8", errors="replace") as source:
+        yield from mask_chunks(iter(lambda: source.read(chunk_chars), ""), masker)
@@ -0,0 +1,121 @@
+# tests/integration/test_checkpoint_gc_postgres.py
+"""Integration tests for checkpoint compaction against real checkpoint tables.
+
+Requires PostgreSQL at ALIM_DATABASE_URL with the LangGraph checkpoint tables
+(``python scripts/setup_langgraph_checkpoint_tables.py``):
+
+    pytest tests/integration/test_checkpoint_gc_postgres.py -v -m "integration"
+
+The compactor scans the whole database, so point it at a test database.
+"""
+
+import operator
+import uuid
+from typing import Annotated
+
+import pytest
+from langgraph.graph import END, StateGraph
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from typing_extensions import TypedDict
+
+from alim.config import settings
+from alim.data.checkpoint_gc import CheckpointCompactor
+
+try:
+    from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+except ImportError:  # pragma: no cover
+    AsyncPostgresSaver = None
+
+
+class TurnState(TypedDict, total=False):
+    current_input: str
+    nodes_visited: Annotated[list[str], operator.add]
+
+
+def make_graph(saver):
+    graph = StateGraph(TurnState)
+    graph.add_node("agronomist", lambda state: {"nodes_visited": ["agronomist"]})
+    graph.set_entry_point("agronomist")
+    graph.add_edge("agronomist", END)
+    return graph.compile(checkpointer=saver)
+
+
+@pytest.fixture
+async def engine():
+    """Skip unless PostgreSQL with checkpoint tables is reachable."""
+    if AsyncPostgresSaver is None or not settings.database_url.startswith("postgresql"):
+        pytest.skip("PostgreSQL checkpointer not available")
+    engine = create_async_engine(settings.database_url)
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1 FROM checkpoints LIMIT 1"))
+    except Exception:
+        await engine.dispose()
+        pytest.skip("PostgreSQL with checkpoint tables not available")
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def graph():
+    url = settings.database_url.replace("+asyncpg", "")
+    async with AsyncPostgresSaver.from_conn_string(url) as saver:
+        yield make_graph(saver)
+
+
+async def count(engine, table: str, thread_id: str) -> int:
+    async with engine.connect() as conn:
+        return await conn.scalar(
+            text(f"SELECT count(*) FROM {table} WHERE thread_id = :thread_id"),
+            {"thread_id": thread_id},
+        )
+
+
+async def age(engine, thread_id: str, days: int) -> None:
+    """Backdate every checkpoint of a thread."""
+    async with engine.begin() as conn:
+        await conn.execute(
+            text(
+                """
+                UPDATE checkpoints
+                SET checkpoint = jsonb_set(
+                    checkpoint, '{ts}', to_jsonb((now() - make_interval(days => :days))::text)
+                )
+                WHERE thread_id = :thread_id
+                """
+            ),
+            {"thread_id": thread_id, "days": days},
+        )
+
+
+@pytest.mark.integration
+class TestCheckpointCompaction:
+    """Compaction keeps the latest checkpoints loadable and expires idle threads."""
+
+    @pytest.mark.asyncio
+    async def test_compacts_and_expires(self, engine, graph):
+        kept, idle = f"test-{uuid.uuid4()}", f"test-{uuid.uuid4()}"
+        for thread_id in (kept, idle):
+            config = {"configurable": {"thread_id": thread_id}}
+            for i in range(6):
+                await graph.ainvoke({"current_input": f"sual {i}"}, config)
+        await age(engine, kept, days=2)
+        await age(engine, idle, days=60)
+        compactor = CheckpointCompactor(
+            engine, keep_latest=2, ttl_days=30, batch_size=1000, pause_seconds=0
+        )
+
+        dry = await compactor.run_once(dry_run=True)
+        assert await count(engine, "checkpoints", kept) > 2
+
+        report = await compactor.run_once()
+
+        assert report.rows == dry.rows
+        assert report.rows_reclaimed > 0
+        assert await count(engine, "checkpoints", kept) == 2
+        assert await count(engine, "checkpoints", idle) == 0
+        assert await count(engine, "checkpoint_blobs", idle) == 0
+        state = await graph.aget_state({"configurable": {"thread_id": kept}})
+        assert state.values["nodes_visited"] == ["agronomist"] * 6
+        assert compactor.metrics.snapshot()["tables"]["checkpoints"]["bytes"] > 0
@@ -35,7 +35,7 @@ async def test_context_loader_calls_weather_mcp(initial_state):
     )
 
     # Mock database calls
-    with patch("alim.agent.nodes.context_loader.get_db_session") as mock_get_db:
+    with patch("alim.agent.nodes.context_loader.get_db_read_session") as mock_get_db:
         # Mock Redis Cache to avoid connection errors
         with patch("alim.agent.nodes.context_loader.CachedUserRepository.get_context_for_ai"):
             with patch("alim.agent.nodes.context_loader.CachedFarmRepository.get_context_for_ai"):
@@ -124,7 +124,7 @@ async def test_context_loader_respects_consent(initial_state):
     )
 
     # Mock database
-    with patch("alim.agent.nodes.context_loader.get_db_session") as mock_get_db:
+    with patch("alim.agent.nodes.context_loader.get_db_read_session") as mock_get_db:
         mock_session = AsyncMock()
         mock_get_db.return_value.__aenter__.return_value = mock_session
 
@@ -169,7 +169,7 @@ async def test_context_loader_fallback_on_mcp_failure(initial_state):
         requires_context=["farm", "weather"],
     )
 
-    with patch("alim.agent.nodes.context_loader.get_db_session") as mock_get_db:
+    with patch("alim.agent.nodes.context_loader.get_db_read_session") as mock_get_db:
         mock_session = AsyncMock()
         mock_get_db.return_value.__aenter__.return_value = mock_session
 
@@ -0,0 +1,60 @@
+# tests/integration/test_rate_limit_redis.py
+"""Integration tests for the rate limiter's Lua scripts.
+
+Requires a Redis server at ALIM_REDIS_URL (default redis://localhost:6379/0):
+
+    pytest tests/integration/test_rate_limit_redis.py -v -m "integration"
+"""
+
+import asyncio
+import uuid
+
+import pytest
+
+from alim.api.middleware.rate_limit import RateLimiter
+from alim.data.redis_client import RedisClient, get_redis
+
+
+@pytest.fixture
+async def redis_available():
+    """Skip unless Redis is reachable; close the pool afterwards."""
+    if not await RedisClient.health_check():
+        await RedisClient.close()
+        pytest.skip("Redis not available")
+    yield
+    await RedisClient.close()
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("algorithm", ["token_bucket", "gcra"])
+class TestRateLimitScripts:
+    """The scripts honor burst and refill, with one small key per client."""
+
+    @pytest.mark.asyncio
+    async def test_burst_and_refill(self, redis_available, algorithm):
+        """burst_limit requests pass at once, then one per refill interval."""
+        limiter = RateLimiter(requests_per_minute=600, burst_limit=5, algorithm=algorithm)
+        client_id = f"test:{uuid.uuid4()}"
+
+        results = [await limiter.is_allowed(client_id) for _ in range(6)]
+        assert [allowed for allowed, _ in results] == [True] * 5 + [False]
+
+        await asyncio.sleep(0.15)  # 10 requests/s
+        limiter._blocked_until.clear()
+        allowed, _ = await limiter.is_allowed(client_id)
+        assert allowed
+
+    @pytest.mark.asyncio
+    async def test_one_expiring_key_per_client(self, redis_available, algorithm):
+        """State is a single key with a TTL, however many requests were made."""
+        limiter = RateLimiter(requests_per_minute=600, burst_limit=50, algorithm=algorithm)
+        client_id = f"test:{uuid.uuid4()}"
+
+        for _ in range(20):
+            await limiter.is_allowed(client_id)
+
+        async with get_redis() as client:
+            keys = await client.keys(f"*{client_id}")
+            assert len(keys) == 1
+            assert await client.type(keys[0]) in ("hash", "string")
+            assert 0 < await client.pttl(keys[0]) <= 2000
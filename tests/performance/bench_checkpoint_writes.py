@@ -0,0 +1,187 @@
+"""Benchmark checkpoint writes per turn under each checkpoint policy.
+
+Runs a graph shaped like the agent (setup → pii_masking → supervisor →
+context_loader → agronomist → validator) for a number of turns on one
+thread. The state is realistic: a growing conversation, MCP traces with
+forecast and rule outputs, a farm with parcel geometries and a prefetched
+ZekaLab result. For each policy it reports, per turn:
+
+- puts / writes: checkpoint and pending-write calls that reach storage
+- KB: bytes serialized into storage
+- ms: time spent in the saver's put / put_writes (serialization included)
+
+Policies:
+
+- every node:  LangGraph default ("async"), plain checkpointer (before)
+- server exit: durability="exit" only, which is what the LangGraph server gets
+- async+slim:  every node, slimmed state
+- exit+slim:   turn end only, slimmed state (the default in-process policy)
+
+The saver is in memory, so no network time is included. Against Postgres
+or Redis, each put and each put_writes is also one round-trip.
+
+Usage:
+    python tests/performance/bench_checkpoint_writes.py
+    python tests/performance/bench_checkpoint_writes.py --turns 50
+"""
+
+import argparse
+import operator
+import time
+from typing import Annotated
+
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph import END, StateGraph
+from langgraph.graph.message import add_messages
+from typing_extensions import TypedDict
+
+from alim.agent.checkpoint_policy import SlimCheckpointSaver
+from alim.agent.state import FarmContext
+
+NODES = ["setup", "pii_masking", "supervisor", "context_loader", "agronomist", "validator"]
+
+PARCELS = [
+    {
+        "parcel_id": f"parcel-{i}",
+        "name": f"Sahə {i}",
+        "area_ha": 2.5,
+        "crop": "pambıq",
+        "soil_type": "gilli",
+        "geometry": [[40.1 + j * 0.001, 47.5 + j * 0.001] for j in range(24)],
+    }
+    for i in range(40)
+]
+FORECAST = {"days": [{"day": d, "temp_c": 28.5, "rain_mm": 0.0, "wind": 12} for d in range(7)]}
+RULES = {"matches": [{"rule_id": f"R{i}", "text": "Suvarmanı səhər apar. " * 8} for i in range(10)]}
+
+
+class BenchState(TypedDict, total=False):
+    messages: Annotated[list, add_messages]
+    current_input: str
+    current_response: str
+    nodes_visited: list[str]
+    farm_context: FarmContext | None
+    mcp_traces: Annotated[list[dict], operator.add]
+    mcp_context: dict
+
+
+def node(name: str):
+    def run(state: BenchState) -> dict:
+        updates: dict = {"nodes_visited": [*state.get("nodes_visited", []), name]}
+        if name == "setup":
+            updates["messages"] = [HumanMessage(content=state["current_input"])]
+        elif name == "context_loader":
+            updates["farm_context"] = FarmContext(
+                farm_id="farm-1",
+                farm_name="Kür sahili",
+                farm_type="crop",
+                region="Aran",
+                total_area_ha=100.0,
+                parcel_count=len(PARCELS),
+                parcels=PARCELS,
+            )
+            updates["mcp_traces"] = [
+                {"server": "openweather", "tool": "get_forecast", "output": FORECAST},
+                {"server": "zekalab", "tool": "evaluate_rules", "output": RULES},
+            ]
+            updates["mcp_context"] = {"zekalab_tool": RULES}
+        elif name == "agronomist":
+            answer = "Pambıq sahəsini səhər tezdən suvarın, torpaq nəmliyini yoxlayın. " * 6
+            updates["current_response"] = answer
+            updates["messages"] = [AIMessage(content=answer)]
+        return updates
+
+    return run
+
+
+def make_graph(saver):
+    graph = StateGraph(BenchState)
+    for name in NODES:
+        graph.add_node(name, node(name))
+    graph.set_entry_point(NODES[0])
+    for a, b in zip(NODES, NODES[1:], strict=False):
+        graph.add_edge(a, b)
+    graph.add_edge(NODES[-1], END)
+    return graph.compile(checkpointer=saver)
+
+
+class MeasuringSaver(InMemorySaver):
+    """In-memory saver that records calls, bytes and time spent writing."""
+
+    def __init__(self):
+        super().__init__()
+        self.puts = 0
+        self.write_calls = 0
+        self.seconds = 0.0
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        start = time.perf_counter()
+        result = super().put(config, checkpoint, metadata, new_versions)
+        self.seconds += time.perf_counter() - start
+        self.puts += 1
+        return result
+
+    def put_writes(self, config, writes, task_id, task_path=""):
+        start = time.perf_counter()
+        super().put_writes(config, writes, task_id, task_path)
+        self.seconds += time.perf_counter() - start
+        self.write_calls += 1
+
+    def stored_bytes(self) -> int:
+        total = sum(len(blob[1]) for blob in self.blobs.values())
+        for namespaces in self.storage.values():
+            for checkpoints in namespaces.values():
+                for (_, data), meta, _ in checkpoints.values():
+                    total += len(data) + len(meta)
+        for writes in self.writes.values():
+            total += sum(len(value[1]) for _, _, value, _ in writes.values())
+        return total
+
+
+# label -> (durability, slim)
+POLICIES = {
+    "every node": ("async", False),
+    "server exit": ("exit", False),
+    "async+slim": ("async", True),
+    "exit+slim": ("exit", True),
+}
+
+
+def run(turns: int) -> None:
+    print("💾 Checkpoint Writes per Turn")
+    print(f"   - Turns: {turns} on one thread, {len(NODES)} nodes per turn")
+    print("-" * 72)
+    baseline = None
+    for label, (durability, slim) in POLICIES.items():
+        inner = MeasuringSaver()
+        saver = SlimCheckpointSaver(inner) if slim else inner
+        graph = make_graph(saver)
+        config = {"configurable": {"thread_id": "bench"}}
+        for i in range(turns):
+            graph.invoke(
+                {"current_input": f"Sual {i}: pambığı nə vaxt suvarım?"},
+                config,
+                durability=durability,
+            )
+
+        kb = inner.stored_bytes() / 1024 / turns
+        baseline = baseline or kb
+        print(
+            f"   - {label:<12} puts {inner.puts / turns:>4.1f}   writes {inner.write_calls / turns:>4.1f}"
+            f"   {kb:>8.1f} KB   {inner.seconds * 1000 / turns:>6.2f} ms"
+            f"   {baseline / kb:>5.1f}x less"
+        )
+    print("-" * 72)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Checkpoint writes benchmark")
+    parser.add_argument("--turns", type=int, default=20)
+    args = parser.parse_args()
+
+    run(args.turns)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Benchmark vectorized NDVI analytics on a large synthetic dataset.
+
+Generates N parcels x T readings (10-day revisit) with the provider's
+growth curve plus noise and injected stress, then times:
+
+- Building the padded NDVISeriesBatch from long-format arrays
+- analyze_ndvi (anomalies, slopes, regional percentiles)
+- Alert extraction
+
+Usage:
+    python tests/performance/bench_ndvi_analytics.py
+    python tests/performance/bench_ndvi_analytics.py --parcels 250000 --readings 27
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from alim.data.ndvi_analytics import (
+    NDVISeriesBatch,
+    analyze_ndvi,
+    expected_ndvi,
+    growth_params,
+)
+from alim.data.providers.azerbaijani import AzerbaijaniAgrarianProvider
+
+REGIONS = list(AzerbaijaniAgrarianProvider.REGIONS.keys())
+CROPS = list(AzerbaijaniAgrarianProvider.NDVI_GROWTH_CURVES.keys()) + ["Fındıq"]
+
+
+def generate(n_parcels: int, n_readings: int, seed: int = 42) -> dict:
+    """Generate long-format synthetic NDVI arrays."""
+    rng = np.random.default_rng(seed)
+    crops = rng.choice(CROPS, size=n_parcels)
+    regions = rng.choice(REGIONS, size=n_parcels)
+    sowing = np.datetime64("2026-03-01") + rng.integers(0, 60, size=n_parcels)
+
+    # Some parcels miss some acquisitions (clouds) - drop ~10% of readings
+    row_index = np.repeat(np.arange(n_parcels), n_readings)
+    offsets = np.tile(np.arange(n_readings) * 10, n_parcels)
+    keep = rng.random(len(row_index)) > 0.1
+    row_index, offsets = row_index[keep], offsets[keep]
+
+    peak_day, peak_ndvi = growth_params(crops)
+    ndvi = expected_ndvi(offsets, peak_day[row_index], peak_ndvi[row_index])
+    ndvi += rng.uniform(-0.05, 0.05, size=len(ndvi))
+    stressed = rng.random(len(ndvi)) < 0.1
+    ndvi[stressed] -= rng.uniform(0.1, 0.2, size=stressed.sum())
+    ndvi = np.clip(ndvi, 0.05, 0.95)
+
+    return {
+        "parcel_ids": np.array([f"AZ-SYN-{i:07d}" for i in range(n_parcels)], dtype=object),
+        "crops": crops,
+        "regions": regions,
+        "sowing_dates": sowing,
+        "row_index": row_index,
+        "reading_dates": sowing[row_index] + offsets,
+        "ndvi": ndvi,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="NDVI analytics benchmark")
+    parser.add_argument("--parcels", type=int, default=100_000)
+    parser.add_argument("--readings", type=int, default=27)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print("🛰️  NDVI Analytics Benchmark")
+    print(f"   - Parcels:  {args.parcels:,}")
+    print(f"   - Readings: {args.readings} per parcel (10-day revisit)")
+    print("-" * 50)
+
+    started = time.perf_counter()
+    data = generate(args.parcels, args.readings)
+    print(
+        f"Generate data:     {time.perf_counter() - started:.2f}s ({len(data['ndvi']):,} readings)"
+    )
+
+    build_times, analyze_times, alert_times = [], [], []
+    for _ in range(args.repeat):
+        t0 = time.perf_counter()
+        batch = NDVISeriesBatch.from_arrays(**data)
+        t1 = time.perf_counter()
+        analysis = analyze_ndvi(batch)
+        t2 = time.perf_counter()
+        alerts = analysis.to_alerts()
+        t3 = time.perf_counter()
+        build_times.append(t1 - t0)
+        analyze_times.append(t2 - t1)
+        alert_times.append(t3 - t2)
+
+    analyze_best = min(analyze_times)
+    print(f"Build batch:       {min(build_times):.3f}s")
+    print(f"Analyze:           {analyze_best:.3f}s ({args.parcels / analyze_best:,.0f} parcels/s)")
+    print(f"Extract alerts:    {min(alert_times):.3f}s ({len(alerts):,} alerts)")
+    print(f"  anomalies:       {int(analysis.anomaly.sum()):,}")
+    print(f"  slope stress:    {int(analysis.slope_stress.sum()):,}")
+    print(f"  regional low:    {int(analysis.regional_low.sum()):,}")
+    print("-" * 50)
+
+
+if __name__ == "__main__":
+    main()
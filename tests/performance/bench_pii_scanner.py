@@ -0,0 +1,123 @@
+"""Benchmark the single-pass PII scanner against sequential pattern application.
+
+Generates chat-sized messages (agricultural questions, a share of them with
+names, phones, IDs, emails or addresses) and reports throughput in MB/s:
+
+- Sequential: every pattern in PATTERN_ORDER with findall + sub and flat
+              name alternations (PIIGateway.strip_pii before the scanner)
+- Scanner:    PIIGateway.strip_pii / has_pii (one lookahead pass)
+
+Also checks that both produce the same cleaned text for every message.
+
+Usage:
+    python tests/performance/bench_pii_scanner.py
+    python tests/performance/bench_pii_scanner.py --messages 50000 --pii-share 0.5
+"""
+
+import argparse
+import random
+import re
+import time
+
+from alim.security.pii_gateway import FIRST_NAMES, STANDALONE_SURNAMES, SURNAMES, PIIGateway
+
+QUESTIONS = [
+    "Salam, pambıq sahəmdə yarpaqlar saralır, nə etməliyəm?",
+    "Buğda üçün azot gübrəsini nə vaxt verim? Sahə 15 hektardır.",
+    "Sabah Aranda yağış olacaq? Suvarmanı təxirə salım?",
+    "Üzüm bağında göbələk xəstəliyi var, hansı dərman tövsiyə edirsiniz?",
+    "Torpağın pH 6.5-dir, fındıq üçün uyğundurmu?",
+    "NPK 15-15-15 pomidor üçün nə qədər lazımdır?",
+]
+PII = [
+    "Əli Məmmədov", "Leyla Əliyeva qızı", "Həsənov", "+994 50 123 45 67", "050 123 45 67",
+    "123-45-67", "5AB12CD", "AZE1234567", "VOEN: 1234567890", "ali@mail.az",
+    "AZ21NABZ00000000137010001944", "4169 7388 1234 5678", "40.4093, 49.8671",
+    "Küçə Nizami 5, ev 12, mənzil 4",
+]  # fmt: skip
+
+
+class SequentialGateway:
+    """PIIGateway.strip_pii as it was: one findall + sub per pattern."""
+
+    def __init__(self):
+        patterns = dict(PIIGateway.PATTERNS)
+        patterns["name_full"] = (
+            r"\b(?:" + "|".join(FIRST_NAMES) + r")\s+(?:" + "|".join(SURNAMES) + r")"
+            r"(?:\s+(?:oğlu|qızı))?",
+            "[ŞƏXS]",
+        )
+        patterns["surname_only"] = (
+            r"\b(?:" + "|".join(STANDALONE_SURNAMES) + r")a?\b",
+            "[ŞƏXS]",
+        )
+        self.compiled = [
+            (
+                re.compile(
+                    patterns[name][0],
+                    0 if name in PIIGateway.CASE_SENSITIVE else re.IGNORECASE,
+                ),
+                patterns[name][1],
+            )
+            for name in PIIGateway.PATTERN_ORDER
+        ]
+
+    def strip_pii(self, text: str) -> str:
+        for pattern, replacement in self.compiled:
+            pattern.findall(text)
+            text = pattern.sub(replacement, text)
+        return text
+
+    def has_pii(self, text: str) -> bool:
+        return any(pattern.search(text) for pattern, _ in self.compiled)
+
+
+def generate_messages(n: int, pii_share: float, seed: int = 5) -> list[str]:
+    rng = random.Random(seed)
+    messages = []
+    for _ in range(n):
+        parts = rng.sample(QUESTIONS, rng.randint(1, 3))
+        if rng.random() < pii_share:
+            parts.insert(rng.randint(0, len(parts)), f"Mən {rng.choice(PII)}.")
+        messages.append(" ".join(parts))
+    return messages
+
+
+def throughput(fn, messages: list[str], megabytes: float) -> float:
+    start = time.perf_counter()
+    for message in messages:
+        fn(message)
+    return megabytes / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="PII scanner benchmark")
+    parser.add_argument("--messages", type=int, default=20_000)
+    parser.add_argument("--pii-share", type=float, default=0.3)
+    args = parser.parse_args()
+
+    messages = generate_messages(args.messages, args.pii_share)
+    megabytes = sum(len(m.encode()) for m in messages) / 1e6
+    sequential = SequentialGateway()
+    gateway = PIIGateway()
+
+    mismatches = sum(sequential.strip_pii(m) != gateway.strip_pii(m).cleaned_text for m in messages)
+
+    print("📏 PII Scanner Benchmark (sequential patterns vs single pass)")
+    print(f"   - Messages: {len(messages):,} ({megabytes:.2f} MB, {args.pii_share:.0%} with PII)")
+    print("-" * 72)
+    for label, before, after in [
+        ("strip_pii", sequential.strip_pii, lambda m: gateway.strip_pii(m).cleaned_text),
+        ("has_pii", sequential.has_pii, gateway.has_pii),
+    ]:
+        old = throughput(before, messages, megabytes)
+        new = throughput(after, messages, megabytes)
+        print(
+            f"   - {label:<10} sequential {old:>7.2f} MB/s   scanner {new:>7.2f} MB/s   {new / old:.2f}x"
+        )
+    print("-" * 72)
+    print(f"   - Output mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""Benchmark the pure ASGI rate limit middleware against BaseHTTPMiddleware.
+
+Calls a small FastAPI app directly through ASGI (no sockets) and reports
+requests/sec for a JSON endpoint and a streaming endpoint under:
+
+- No middleware: the app alone (upper bound)
+- BaseHTTPMiddleware: RateLimitMiddleware as it was (dispatch + call_next)
+- Pure ASGI: the current RateLimitMiddleware
+
+The limiter answers from memory so the numbers show middleware overhead
+only, not Redis round-trips. The old chat route also checked the chat
+limiter a second time; with Redis that was one more round-trip per chat
+request on top of what is measured here.
+
+Usage:
+    python tests/performance/bench_rate_limit_middleware.py
+    python tests/performance/bench_rate_limit_middleware.py --requests 20000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Callable
+
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import StreamingResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from alim.api.middleware.rate_limit import (
+    RateLimiter,
+    RateLimitExceeded,
+    RateLimitMiddleware,
+    get_client_identifier,
+)
+
+
+class MemoryLimiter(RateLimiter):
+    """Limiter that always allows, without Redis."""
+
+    async def is_allowed(self, identifier: str) -> tuple[bool, dict]:
+        return True, self._info(self.burst_limit - 1, 0)
+
+
+class LegacyRateLimitMiddleware(BaseHTTPMiddleware):
+    """RateLimitMiddleware before the pure ASGI rewrite."""
+
+    EXEMPT_PATHS = RateLimitMiddleware.EXEMPT_PATHS
+
+    def __init__(self, app, limiter: RateLimiter):
+        super().__init__(app)
+        self.limiter = limiter
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        if request.url.path in self.EXEMPT_PATHS or request.method == "OPTIONS":
+            return await call_next(request)
+        identifier = get_client_identifier(request)
+        allowed, info = await self.limiter.is_allowed(identifier)
+        if not allowed:
+            raise RateLimitExceeded(retry_after=info["retry_after"])
+        response = await call_next(request)
+        response.headers["X-RateLimit-Limit"] = str(info["limit"])
+        response.headers["X-RateLimit-Remaining"] = str(info["remaining"])
+        response.headers["X-RateLimit-Reset"] = str(info["reset"])
+        return response
+
+
+def make_app(middleware: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/api/v1/threads")
+    async def threads():
+        return {"thread_id": "t-1", "status": "created"}
+
+    @app.post("/api/v1/chat/stream")
+    async def chat_stream():
+        async def tokens():
+            for _ in range(20):
+                yield "pambıq "
+
+        return StreamingResponse(tokens(), media_type="text/plain")
+
+    limiter = MemoryLimiter(requests_per_minute=1_000_000, burst_limit=1_000_000)
+    if middleware == "legacy":
+        app.add_middleware(LegacyRateLimitMiddleware, limiter=limiter)
+    elif middleware == "asgi":
+        app.add_middleware(RateLimitMiddleware, limiter=limiter, chat=limiter, read=limiter)
+    return app
+
+
+async def call(app: FastAPI, path: str) -> int:
+    """Send one POST through the ASGI app; return the number of body chunks."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench"), (b"x-forwarded-for", b"10.0.0.1")],
+        "client": ("10.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+    received = False
+    chunks = 0
+
+    async def receive():
+        nonlocal received
+        if not received:
+            received = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.sleep(3600)
+
+    async def send(message):
+        nonlocal chunks
+        if message["type"] == "http.response.body":
+            chunks += 1
+
+    await app(scope, receive, send)
+    return chunks
+
+
+async def requests_per_second(app: FastAPI, path: str, total: int, concurrency: int) -> float:
+    async def worker(n: int) -> None:
+        for _ in range(n):
+            await call(app, path)
+
+    await worker(50)  # warm-up
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(total // concurrency) for _ in range(concurrency)))
+    return (total // concurrency * concurrency) / (time.perf_counter() - start)
+
+
+async def run(total: int, concurrency: int) -> None:
+    apps = {name: make_app(name) for name in ("none", "legacy", "asgi")}
+
+    print("🚦 Rate Limit Middleware Benchmark (BaseHTTPMiddleware vs pure ASGI)")
+    print(f"   - Requests: {total:,} per case, concurrency {concurrency}")
+    print("-" * 72)
+    for label, path in [("json", "/api/v1/threads"), ("stream", "/api/v1/chat/stream")]:
+        rates = {
+            name: await requests_per_second(app, path, total, concurrency)
+            for name, app in apps.items()
+        }
+        print(
+            f"   - {label:<7} none {rates['none']:>8,.0f}/s   "
+            f"BaseHTTP {rates['legacy']:>8,.0f}/s   ASGI {rates['asgi']:>8,.0f}/s   "
+            f"{rates['asgi'] / rates['legacy']:.2f}x"
+        )
+    print("-" * 72)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rate limit middleware benchmark")
+    parser.add_argument("--requests", type=int, default=10_000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""Benchmark compiled rule evaluation against the original linear scan.
+
+Generates synthetic rule sets shaped like the YAML library (intent,
+month, region and weather thresholds, 2-4 conditions per rule) at
+several sizes and times, per context:
+
+- Linear:   every Rule.evaluate in load order, then sort by priority
+            (RulesEngine.evaluate before rule compilation)
+- Compiled: CompiledRuleSet.evaluate (field index + closures)
+
+Also reports compile time and how many rules the index leaves to check.
+
+The batch section times the nightly path (evaluate_batch) over N
+farm-days with the YAML library, both from context dicts and from
+columnar arrays, against a per-context loop.
+
+Usage:
+    python tests/performance/bench_rules_engine.py
+    python tests/performance/bench_rules_engine.py --sizes 10 1000 50000 --contexts 500
+    python tests/performance/bench_rules_engine.py --farm-days 1000000
+"""
+
+import argparse
+import random
+import time
+from datetime import date
+
+import numpy as np
+
+from alim.rules.batch import RuleBatch
+from alim.rules.compiler import CompiledRuleSet
+from alim.rules.engine import (
+    Condition,
+    Operator,
+    Rule,
+    RuleCategory,
+    RuleLoader,
+    RulePriority,
+    build_rule_context,
+)
+
+INTENTS = [c.value for c in RuleCategory]
+REGIONS = ["aran", "ganja_gazakh", "shirvan", "lankaran", "quba_khachmaz", "sheki_zagatala"]
+CROPS = ["pambıq", "buğda", "üzüm", "fındıq", "pomidor", "arpa"]
+NUMERIC = {
+    "weather.temperature_c": (-10, 45),
+    "weather.humidity_percent": (10, 100),
+    "weather.wind_speed_kmh": (0, 60),
+    "weather.precipitation_mm": (0, 50),
+    "farm.soil_moisture_percent": (5, 60),
+}
+
+
+def legacy_evaluate(rules: list[Rule], context: dict, categories=None) -> list[dict]:
+    """RulesEngine.evaluate as it was before rule compilation."""
+    matches = []
+    for rule in rules:
+        if categories and rule.category not in categories:
+            continue
+        if rule.evaluate(context):
+            matches.append(rule.to_match_dict())
+    priority_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+    matches.sort(key=lambda m: priority_order.get(m["priority"], 4))
+    return matches
+
+
+def random_condition(rng: random.Random, kind: str) -> Condition:
+    if kind == "intent":
+        return Condition("intent", Operator.EQ, rng.choice(INTENTS))
+    if kind == "month":
+        start = rng.randint(1, 12)
+        return Condition("date.month", Operator.IN, [(start + i - 1) % 12 + 1 for i in range(3)])
+    if kind == "region":
+        return Condition("farm.region", Operator.IN, rng.sample(REGIONS, 2))
+    if kind == "crop":
+        return Condition("farm.crop", Operator.NE, rng.choice(CROPS))
+    field = rng.choice(list(NUMERIC))
+    low, high = NUMERIC[field]
+    op = rng.choice([Operator.GT, Operator.GTE, Operator.LT, Operator.LTE, Operator.BETWEEN])
+    if op == Operator.BETWEEN:
+        a = rng.uniform(low, high)
+        return Condition(field, op, [a, a + (high - low) * 0.2])
+    return Condition(field, op, round(rng.uniform(low, high), 1))
+
+
+def generate_rules(n: int, seed: int = 31) -> list[Rule]:
+    rng = random.Random(seed)
+    kinds = ["intent", "month", "region", "crop", "numeric", "numeric"]
+    rules = []
+    for i in range(n):
+        picked = rng.sample(kinds, rng.randint(2, 4))
+        rules.append(
+            Rule(
+                id=f"SYN-{i:06d}",
+                name=f"Synthetic rule {i}",
+                category=rng.choice(list(RuleCategory)),
+                description="",
+                conditions=[random_condition(rng, k) for k in picked],
+                recommendation_az="Sintetik tövsiyə",
+                priority=rng.choice(list(RulePriority)),
+            )
+        )
+    return rules
+
+
+def generate_contexts(n: int, seed: int = 7) -> list[dict]:
+    rng = random.Random(seed)
+    contexts = []
+    for _ in range(n):
+        weather = {f.split(".")[1]: rng.uniform(*NUMERIC[f]) for f in NUMERIC if "weather" in f}
+        contexts.append(
+            build_rule_context(
+                weather=weather,
+                farm={
+                    "region": rng.choice(REGIONS),
+                    "crop": rng.choice(CROPS),
+                    "soil_moisture_percent": rng.uniform(5, 60),
+                },
+                intent=rng.choice(INTENTS),
+                current_date=date(2026, rng.randint(1, 12), 15),
+            )
+        )
+    return contexts
+
+
+def time_us(fn, contexts: list[dict], repeat: int) -> float:
+    """Mean microseconds per evaluation."""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for context in contexts:
+            fn(context)
+    return (time.perf_counter() - started) / (repeat * len(contexts)) * 1e6
+
+
+def bench(rules: list[Rule], contexts: list[dict], label: str) -> None:
+    started = time.perf_counter()
+    compiled = CompiledRuleSet(rules)
+    compile_ms = (time.perf_counter() - started) * 1000
+
+    for context in contexts[:50]:
+        assert compiled.evaluate(context) == legacy_evaluate(rules, context)
+
+    # Keep total work roughly constant across sizes
+    repeat = max(1, 20_000 // (len(rules) * len(contexts) // 100 + 1))
+    linear = time_us(lambda c: legacy_evaluate(rules, c), contexts, repeat)
+    fast = time_us(compiled.evaluate, contexts, repeat)
+    visited = sum(len(compiled.candidates(c)) for c in contexts) / len(contexts)
+
+    print(
+        f"{label:<10}{len(rules):>8,}{compile_ms:>10.1f}ms{visited:>10.0f}"
+        f"{linear:>12.1f}µs{fast:>12.1f}µs{linear / fast:>8.1f}x"
+    )
+
+
+def generate_columns(n: int, seed: int = 7) -> dict[str, np.ndarray]:
+    """Columnar farm-days, as a nightly query over all farms would return."""
+    rng = np.random.default_rng(seed)
+    columns = {f: rng.uniform(*NUMERIC[f], size=n) for f in NUMERIC}
+    columns["farm.region"] = rng.choice(REGIONS, size=n)
+    columns["farm.crop"] = rng.choice(CROPS, size=n)
+    columns["intent"] = rng.choice(INTENTS, size=n)
+    columns["date.month"] = rng.integers(1, 13, size=n)
+    return columns
+
+
+def columns_to_contexts(columns: dict[str, np.ndarray]) -> list[dict]:
+    n = len(next(iter(columns.values())))
+    lists = {f: v.tolist() for f, v in columns.items()}
+    contexts = [{"weather": {}, "farm": {}, "date": {}} for _ in range(n)]
+    for path, values in lists.items():
+        section, _, key = path.partition(".")
+        for context, value in zip(contexts, values, strict=True):
+            if key:
+                context[section][key] = value
+            else:
+                context[section] = value
+    return contexts
+
+
+def bench_batch(farm_days: int, scalar_sample: int) -> None:
+    compiled = CompiledRuleSet(RuleLoader().load_all())
+    columns = generate_columns(farm_days)
+
+    sample = columns_to_contexts({f: v[:scalar_sample] for f, v in columns.items()})
+    started = time.perf_counter()
+    expected = [compiled.evaluate(c) for c in sample]
+    scalar_us = (time.perf_counter() - started) / len(sample) * 1e6
+
+    started = time.perf_counter()
+    assert compiled.evaluate_batch(sample) == expected
+    dicts_us = (time.perf_counter() - started) / len(sample) * 1e6
+
+    started = time.perf_counter()
+    batch = RuleBatch.from_columns(columns)
+    matched = compiled.batch_plan.match(batch)
+    columns_s = time.perf_counter() - started
+    hits = sum(len(rows) for _, rows in matched)
+
+    print(f"Batch ({len(compiled)} YAML rules)")
+    print(f"   - scalar evaluate loop:    {scalar_us:>8.2f}µs/context  ({len(sample):,} contexts)")
+    print(f"   - evaluate_batch (dicts):  {dicts_us:>8.2f}µs/context")
+    print(
+        f"   - match (columns):         {columns_s / farm_days * 1e6:>8.2f}µs/context  "
+        f"({farm_days:,} farm-days in {columns_s:.2f}s, {hits:,} matches)"
+    )
+    print(f"   - scalar estimate:         {scalar_us * farm_days / 1e6:>8.1f}s for {farm_days:,}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rules engine benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1_000, 50_000])
+    parser.add_argument("--contexts", type=int, default=200)
+    parser.add_argument("--farm-days", type=int, default=1_000_000)
+    parser.add_argument("--scalar-sample", type=int, default=100_000)
+    args = parser.parse_args()
+
+    contexts = generate_contexts(args.contexts)
+
+    print("📏 Rules Engine Benchmark (linear scan vs compiled index)")
+    print(f"   - Contexts: {args.contexts:,}")
+    print("-" * 72)
+    print(
+        f"{'set':<10}{'rules':>8}{'compile':>12}{'visited':>10}"
+        f"{'linear':>14}{'compiled':>14}{'speedup':>9}"
+    )
+
+    bench(RuleLoader().load_all(), contexts, "yaml")
+    for size in args.sizes:
+        bench(generate_rules(size), contexts, "synthetic")
+    print("-" * 72)
+    bench_batch(args.farm_days, min(args.scalar_sample, args.farm_days))
+    print("-" * 72)
+
+
+if __name__ == "__main__":
+    main()
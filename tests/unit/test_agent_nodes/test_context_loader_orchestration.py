@@ -165,7 +165,7 @@ async def test_context_loader_mcp_disabled():
         "mcp_traces": [],
     }
 
-    with patch("alim.agent.nodes.context_loader.get_db_session") as mock_db:
+    with patch("alim.agent.nodes.context_loader.get_db_read_session") as mock_db:
         mock_session = AsyncMock()
         mock_db.return_value.__aenter__.return_value = mock_session
 
@@ -208,7 +208,7 @@ async def test_context_loader_no_consent():
         "mcp_traces": [],
     }
 
-    with patch("alim.agent.nodes.context_loader.get_db_session") as mock_db:
+    with patch("alim.agent.nodes.context_loader.get_db_read_session") as mock_db:
         mock_session = AsyncMock()
         mock_db.return_value.__aenter__.return_value = mock_session
 
@@ -250,7 +250,7 @@ async def test_context_loader_parallel_mcp_calls():
         "mcp_traces": [],
     }
 
-    with patch("alim.agent.nodes.context_loader.get_db_session") as mock_db:
+    with patch("alim.agent.nodes.context_loader.get_db_read_session") as mock_db:
         mock_session = AsyncMock()
         mock_db.return_value.__aenter__.return_value = mock_session
 
@@ -327,7 +327,7 @@ async def test_context_loader_partial_mcp_failure():
         "mcp_traces": [],
     }
 
-    with patch("alim.agent.nodes.context_loader.get_db_session") as mock_db:
+    with patch("alim.agent.nodes.context_loader.get_db_read_session") as mock_db:
         mock_session = AsyncMock()
         mock_db.return_value.__aenter__.return_value = mock_session
 
@@ -400,7 +400,7 @@ async def test_context_loader_timeout_handling():
             success=True,
         )
 
-    with patch("alim.agent.nodes.context_loader.get_db_session") as mock_db:
+    with patch("alim.agent.nodes.context_loader.get_db_read_session") as mock_db:
         mock_session = AsyncMock()
         mock_db.return_value.__aenter__.return_value = mock_session
 
@@ -469,7 +469,7 @@ async def test_mcp_trace_consolidation():
         "mcp_traces": [existing_trace],
     }
 
-    with patch("alim.agent.nodes.context_loader.get_db_session") as mock_db:
+    with patch("alim.agent.nodes.context_loader.get_db_read_session") as mock_db:
         mock_session = AsyncMock()
         mock_db.return_value.__aenter__.return_value = mock_session
 
@@ -538,3 +538,133 @@ def mock_zekalab_handler():
 
     handler.evaluate_irrigation_rules = mock_evaluate_irrigation
     return handler
+
+
+@pytest.mark.asyncio
+async def test_context_loader_prefetches_intent_tool_in_rules_batch():
+    """Rules and the intent's rule tool share one ZekaLab round-trip."""
+    from alim.agent.nodes.agronomist import zekalab_invocation
+    from alim.mcp.handlers.zekalab_handler import ZekaLabMCPHandler
+
+    farm_context = FarmContext(
+        farm_id="farm_001",
+        farm_name="Test Farm",
+        farm_type="crop",
+        region="aran",
+        total_area_ha=10.0,
+        parcel_count=1,
+        parcels=[],
+        active_crops=[{"crop": "wheat", "parcel_id": "P001", "days_since_sowing": 30}],
+        alerts=[],
+    )
+    state = {
+        "messages": [],
+        "user_id": "user_001",
+        "intent": UserIntent.IRRIGATION,
+        "routing": RoutingDecision(
+            target_node="context_loader",
+            intent=UserIntent.IRRIGATION,
+            confidence=0.9,
+            requires_context=["weather"],
+        ),
+        "farm_context": farm_context,
+        "mcp_config": {"use_mcp": True, "fallback_to_synthetic": True},
+        "data_consent_given": True,
+        "nodes_visited": [],
+        "mcp_traces": [],
+    }
+
+    handler = ZekaLabMCPHandler()
+    handler.client = AsyncMock()
+    batch = MagicMock(status_code=200)
+    batch.json.return_value = {
+        "results": [
+            {"success": True, "output": {"rules": {"irrigation": {}}}},
+            {"success": True, "output": {"should_irrigate": True, "timing": "6am"}},
+        ]
+    }
+    handler.client.post.return_value = batch
+
+    with patch("alim.agent.nodes.context_loader.get_db_read_session") as mock_db, patch(
+        "alim.agent.nodes.context_loader._fetch_weather_mcp"
+    ) as mock_weather, patch(
+        "alim.agent.nodes.context_loader.get_zekalab_handler", AsyncMock(return_value=handler)
+    ):
+        mock_db.return_value.__aenter__.return_value = AsyncMock()
+        mock_weather.return_value = (
+            {"current": {"temperature": 31.0, "humidity": 40, "rainfall_mm": 2.0}},
+            MCPTrace(
+                server="openweather",
+                tool="get_forecast",
+                input_args={},
+                output={},
+                duration_ms=100.0,
+                success=True,
+            ),
+        )
+
+        updates = await context_loader_node(state)
+
+    handler.client.post.assert_called_once()
+    prefetched = updates["mcp_context"]["zekalab_tool"]
+    assert prefetched["result"] == {"should_irrigate": True, "timing": "6am"}
+    # The agronomist derives the same call from the loaded weather, so it reuses this
+    assert zekalab_invocation(UserIntent.IRRIGATION, farm_context, updates["weather"]) == (
+        prefetched["method"],
+        prefetched["kwargs"],
+    )
+    assert [t["tool"] for t in updates["mcp_traces"]] == [
+        "get_forecast",
+        "get_rules",
+        "evaluate_irrigation_rules",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_context_loader_low_budget_skips_rules_and_caps_wait():
+    """Near the turn deadline: no ZekaLab call, MCP wait shrinks to the budget."""
+    import time
+
+    from alim.deadline import deadline_scope
+
+    state = {
+        "messages": [],
+        "user_id": "user_001",
+        "intent": UserIntent.IRRIGATION,
+        "routing": RoutingDecision(
+            target_node="context_loader",
+            intent=UserIntent.IRRIGATION,
+            confidence=0.9,
+            requires_context=["weather"],
+        ),
+        "farm_context": FarmContext(
+            farm_id="farm_001",
+            farm_name="Test Farm",
+            farm_type="crop",
+            region="aran",
+            total_area_ha=10.0,
+            active_crops=[{"crop": "wheat", "parcel_id": "P001", "days_since_sowing": 30}],
+        ),
+        "mcp_config": {"use_mcp": True, "fallback_to_synthetic": True},
+        "data_consent_given": True,
+        "nodes_visited": [],
+        "mcp_traces": [],
+    }
+
+    async def slow_weather_call(*args, **kwargs):
+        await asyncio.sleep(10)
+
+    with patch("alim.agent.nodes.context_loader.get_db_read_session") as mock_db, patch(
+        "alim.agent.nodes.context_loader._fetch_weather_mcp", side_effect=slow_weather_call
+    ), patch("alim.agent.nodes.context_loader._fetch_zekalab_rules_mcp") as mock_zekalab:
+        mock_db.return_value.__aenter__.return_value = AsyncMock()
+
+        started = time.monotonic()
+        with deadline_scope(time.time() + 3):
+            updates = await context_loader_node(state)
+
+    assert time.monotonic() - started < 1.0
+    mock_zekalab.assert_not_called()
+    # Synthetic fallback weather; the orchestration timeout is traced
+    assert "weather" in updates
+    assert [t["tool"] for t in updates["mcp_traces"]] == ["parallel_mcp"]
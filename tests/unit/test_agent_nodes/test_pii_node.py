@@ -0,0 +1,63 @@
+"""Tests for the PII masking node."""
+
+import pytest
+
+from alim.agent.nodes.pii import pii_masking_node
+
+
+@pytest.mark.asyncio
+async def test_masks_user_input():
+    """PII in the user input is replaced and reported as an alert."""
+    updates = await pii_masking_node({"user_input": "Mənim nömrəm +994 50 123 45 67"})
+
+    assert updates["user_input"] == "Mənim nömrəm [TELEFON]"
+    assert "phone_az_intl" in updates["alerts"][0]["message"]
+
+
+@pytest.mark.asyncio
+async def test_masks_uploaded_documents(tmp_path):
+    """Text uploads with PII are swapped for masked copies; others pass through."""
+    with_pii = tmp_path / "notes.txt"
+    with_pii.write_text("Aqronom: Əli Məmmədov, ali@mail.az\n", encoding="utf-8")
+    clean = tmp_path / "plan.md"
+    clean.write_text("Suvarma hər 5 gündən bir.\n", encoding="utf-8")
+    image = tmp_path / "leaf.jpg"
+    image.write_bytes(b"\xff\xd8")
+
+    updates = await pii_masking_node(
+        {"user_input": "Sənədlərə bax", "file_paths": [str(with_pii), str(clean), str(image)]}
+    )
+
+    masked, kept_clean, kept_image = updates["file_paths"]
+    assert masked == str(tmp_path / "notes.masked.txt")
+    assert (tmp_path / "notes.masked.txt").read_text(encoding="utf-8") == (
+        "Aqronom: [ŞƏXS], [EMAIL]\n"
+    )
+    assert (kept_clean, kept_image) == (str(clean), str(image))
+    assert not (tmp_path / "plan.masked.md").exists()
+    assert "documents" in updates["alerts"][0]["message"]
+
+
+@pytest.mark.asyncio
+async def test_no_pii_no_updates(tmp_path):
+    """Nothing to mask returns no updates."""
+    clean = tmp_path / "plan.txt"
+    clean.write_text("Buğda səpini.\n", encoding="utf-8")
+
+    assert await pii_masking_node({"user_input": "Salam", "file_paths": [str(clean)]}) == {}
+
+
+@pytest.mark.parametrize(
+    ("state", "expected"),
+    [
+        ({"input_screened": True}, "supervisor"),
+        ({"input_screened": True, "file_paths": ["/tmp/notes.txt"]}, "pii_masking"),
+        ({"input_screened": False}, "pii_masking"),
+        ({}, "pii_masking"),
+    ],
+)
+def test_route_setup_skips_screened_input(state, expected):
+    """The node is skipped only when the API screened the input and nothing was uploaded."""
+    from alim.agent.graph import route_setup
+
+    assert route_setup(state) == expected
@@ -2,9 +2,11 @@
 """Tests for JWT authentication middleware."""
 
 import time
-from unittest.mock import MagicMock
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock, patch
 
 import pytest
+
 from alim.api.middleware.auth import (
     AuthenticatedUser,
     JWTAuthenticator,
@@ -381,3 +383,152 @@ class TestAuthDependencies:
         )
 
         assert user is None
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the async Redis client."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+
+class TestTokenCache:
+    """Test validated-token caching."""
+
+    SECRET = "test-secret-key-for-testing"  # pragma: allowlist secret
+
+    def make_token(self, sub: str = "user123", exp_in: int = 3600) -> str:
+        import jwt
+
+        now = int(time.time())
+        payload = {"sub": sub, "iat": now, "exp": now + exp_in, "scope": "alim:read alim:chat"}
+        return jwt.encode(payload, self.SECRET, algorithm="HS256")
+
+    def test_keyed_by_token_hash(self):
+        """Raw tokens are not kept in memory as cache keys."""
+        authenticator = JWTAuthenticator(secret=self.SECRET, mock_mode=False)
+        token = self.make_token()
+
+        authenticator.validate_token(token)
+        authenticator.validate_token(token)
+
+        assert token not in authenticator._token_cache
+        assert authenticator.cache_info()["hits"] == 1
+        assert authenticator.cache_info()["misses"] == 1
+
+    def test_lru_eviction(self):
+        """The least recently used token is evicted when the cache is full."""
+        authenticator = JWTAuthenticator(secret=self.SECRET, mock_mode=False, cache_size=2)
+        a, b, c = (self.make_token(sub) for sub in "abc")
+
+        for token in [a, b, a, c]:
+            authenticator.validate_token(token)
+        authenticator.validate_token(a)
+
+        info = authenticator.cache_info()
+        assert info["size"] == 2
+        assert info["hits"] == 2  # a twice; b was evicted, not a
+
+    def test_entry_ends_with_token_expiry(self):
+        """A cached token is verified again once it has expired."""
+        authenticator = JWTAuthenticator(secret=self.SECRET, mock_mode=False)
+        token = self.make_token(exp_in=60)
+        authenticator.validate_token(token)
+
+        later = time.time() + 120
+        with patch("alim.api.middleware.auth.time.time", lambda: later):
+            assert authenticator._get_cached(authenticator._token_key(token)) is None
+
+        assert authenticator.cache_info()["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_shared_cache_across_replicas(self):
+        """A token validated by one replica is not re-verified by another."""
+        redis = FakeRedis()
+
+        @asynccontextmanager
+        async def fake_get_redis():
+            yield redis
+
+        first = JWTAuthenticator(secret=self.SECRET, mock_mode=False, shared_cache=True)
+        second = JWTAuthenticator(secret=self.SECRET, mock_mode=False, shared_cache=True)
+        second._decode = MagicMock(side_effect=AssertionError("decoded again"))
+        token = self.make_token()
+
+        with patch("alim.api.middleware.auth.get_redis", fake_get_redis):
+            await first.validate_token_async(token)
+            payload = await second.validate_token_async(token)
+
+        assert payload.user_id == "user123"
+        assert len(redis.data) == 1
+        assert token not in next(iter(redis.data))
+
+    def test_shared_cache_namespaced_by_config(self):
+        """The namespace follows the configured namespace, never the secret."""
+        first = JWTAuthenticator(secret=self.SECRET, mock_mode=False, shared_cache=True)
+        same = JWTAuthenticator(secret="other-secret", mock_mode=False, shared_cache=True)
+        rotated = JWTAuthenticator(
+            secret="other-secret", mock_mode=False, shared_cache=True, cache_namespace="v2"
+        )
+
+        assert first._shared_key("abc") == same._shared_key("abc")
+        assert first._shared_key("abc") != rotated._shared_key("abc")
+
+    @pytest.mark.asyncio
+    async def test_invalid_shared_entry_is_a_miss(self):
+        """A corrupt shared entry is deleted and the token verified locally."""
+        redis = FakeRedis()
+
+        @asynccontextmanager
+        async def fake_get_redis():
+            yield redis
+
+        authenticator = JWTAuthenticator(secret=self.SECRET, mock_mode=False, shared_cache=True)
+        token = self.make_token()
+        key = authenticator._shared_key(authenticator._token_key(token))
+        redis.data[key] = '{"sub": 42}'
+
+        with patch("alim.api.middleware.auth.get_redis", fake_get_redis):
+            assert await authenticator._get_shared(authenticator._token_key(token)) is None
+            assert key not in redis.data
+            payload = await authenticator.validate_token_async(token)
+
+        assert payload.user_id == "user123"
+        assert key in redis.data
+
+    def test_rs256_with_jwks(self):
+        """RS256 keys come from the JWKS endpoint, fetched once and cached."""
+        import jwt
+        from cryptography.hazmat.primitives.asymmetric import rsa
+
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        jwk = jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+        jwk.update(kid="k1", use="sig", alg="RS256")
+        now = int(time.time())
+        tokens = [
+            jwt.encode(
+                {"sub": sub, "iat": now, "exp": now + 3600},
+                private_key,
+                algorithm="RS256",
+                headers={"kid": "k1"},
+            )
+            for sub in ("a", "b", "c")
+        ]
+
+        authenticator = JWTAuthenticator(
+            algorithm="RS256", jwks_url="https://id.example/jwks", mock_mode=False
+        )
+        with patch.object(jwt.PyJWKClient, "fetch_data", return_value={"keys": [jwk]}) as fetch:
+            subs = [authenticator.validate_token(token).sub for token in tokens]
+
+        assert subs == ["a", "b", "c"]
+        assert fetch.call_count == 1
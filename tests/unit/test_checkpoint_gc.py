@@ -0,0 +1,215 @@
+# tests/unit/test_checkpoint_gc.py
+"""Unit tests for checkpoint compaction (alim.data.checkpoint_gc)."""
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from alim.data import checkpoint_gc
+from alim.data.checkpoint_gc import (
+    COMPACT_SQL,
+    EXPIRE_SQL,
+    TABLES_EXIST_SQL,
+    THREADS_SQL,
+    CheckpointCompactor,
+    CheckpointGCMetrics,
+    CompactionReport,
+)
+
+NOW = datetime.now(UTC)
+
+
+class FakeTransaction:
+    """Awaitable and async-context-manager transaction, like SQLAlchemy's."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __await__(self):
+        async def start():
+            return self
+
+        return start().__await__()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.commit()
+
+    async def commit(self):
+        self.conn.outcomes.append("commit")
+
+    async def rollback(self):
+        self.conn.outcomes.append("rollback")
+
+
+class FakeConnection:
+    """Records statements; serves thread pages and fixed rowcounts."""
+
+    def __init__(self, threads, locked=True, tables_exist=True):
+        self.threads = sorted(threads, key=lambda row: row.thread_id)
+        self.locked = locked
+        self.tables_exist = tables_exist
+        self.executed: list[tuple] = []
+        self.outcomes: list[str] = []
+
+    def begin(self):
+        return FakeTransaction(self)
+
+    async def scalar(self, statement, params=None):
+        return self.tables_exist if statement is TABLES_EXIST_SQL else self.locked
+
+    async def execute(self, statement, params=None):
+        self.executed.append((statement, params))
+        if statement is THREADS_SQL:
+            page = [row for row in self.threads if row.thread_id > params["after"]]
+            return SimpleNamespace(all=lambda: page[: params["limit"]])
+        if "pg_class" in str(statement):
+            return iter([SimpleNamespace(table_name="checkpoints", bytes=8192, estimated_rows=3)])
+        return SimpleNamespace(rowcount=len(params.get("thread_ids", ())))
+
+    def thread_ids(self, statement):
+        return [params["thread_ids"] for s, params in self.executed if s is statement]
+
+
+class FakeEngine:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def connect(self):
+        conn = self.conn
+
+        class Context:
+            async def __aenter__(self):
+                return conn
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return Context()
+
+
+def thread(thread_id, idle, checkpoints=10):
+    return SimpleNamespace(thread_id=thread_id, last_write=NOW - idle, checkpoints=checkpoints)
+
+
+def make_compactor(conn, **kwargs):
+    defaults = {"keep_latest": 5, "ttl_days": 30, "batch_size": 2, "pause_seconds": 0}
+    return CheckpointCompactor(FakeEngine(conn), **{**defaults, **kwargs})
+
+
+class TestCheckpointCompactor:
+    """Tests for which threads are expired, compacted or left alone."""
+
+    @pytest.mark.asyncio
+    async def test_classifies_threads(self):
+        """Idle threads expire; others over the limit are compacted unless active."""
+        conn = FakeConnection(
+            [
+                thread("a-idle", timedelta(days=45)),
+                thread("b-old", timedelta(days=2)),
+                thread("c-short", timedelta(days=2), checkpoints=3),
+                thread("d-active", timedelta(seconds=30)),
+            ]
+        )
+
+        report = await make_compactor(conn).run_once()
+
+        assert conn.thread_ids(EXPIRE_SQL[0][1]) == [["a-idle"]]
+        assert conn.thread_ids(COMPACT_SQL[0][1]) == [["b-old"]]
+        assert report.threads_scanned == 4
+        assert report.threads_expired == 1
+        assert report.threads_compacted == 1
+        assert report.rows["checkpoints"] == 2  # one per thread from the fake
+
+    @pytest.mark.asyncio
+    async def test_pages_by_thread_id(self):
+        """Threads are read in keyset pages of batch_size, one transaction each."""
+        conn = FakeConnection([thread(f"t{i}", timedelta(days=2)) for i in range(5)])
+
+        report = await make_compactor(conn).run_once()
+
+        pages = [params["after"] for s, params in conn.executed if s is THREADS_SQL]
+        assert pages == ["", "t1", "t3"]
+        assert conn.thread_ids(COMPACT_SQL[0][1]) == [["t0", "t1"], ["t2", "t3"], ["t4"]]
+        assert report.batches == 3
+        assert report.rows_reclaimed == 15  # 3 tables x 5 threads
+
+    @pytest.mark.asyncio
+    async def test_dry_run_rolls_back(self):
+        """Dry runs count the same rows but roll back, and don't add to totals."""
+        conn = FakeConnection([thread("a", timedelta(days=45))])
+        compactor = make_compactor(conn, dry_run=True)
+
+        report = await compactor.run_once()
+
+        assert report.dry_run
+        assert report.rows_reclaimed == 3
+        assert "rollback" in conn.outcomes
+        assert compactor.metrics.rows_reclaimed["checkpoints"] == 0
+
+    @pytest.mark.asyncio
+    async def test_skips_when_another_worker_holds_the_lock(self):
+        conn = FakeConnection([thread("a", timedelta(days=45))], locked=False)
+
+        report = await make_compactor(conn).run_once()
+
+        assert report.skipped
+        assert report.skip_reason == "locked_by_another_worker"
+        assert conn.executed == []
+
+    @pytest.mark.asyncio
+    async def test_skips_without_checkpoint_tables(self):
+        """Without checkpoint tables runs are skipped, not failed, and logged once."""
+        conn = FakeConnection([thread("a", timedelta(days=45))], tables_exist=False)
+        compactor = make_compactor(conn)
+
+        with patch.object(checkpoint_gc, "logger") as logger:
+            reports = [await compactor.run_once() for _ in range(3)]
+
+        assert all(r.skip_reason == "no_checkpoint_tables" for r in reports)
+        assert conn.executed == []
+        assert compactor.metrics.snapshot()["failures"] == 0
+        assert logger.info.call_count == 1
+
+    def test_keep_latest_must_be_positive(self):
+        with pytest.raises(ValueError):
+            make_compactor(FakeConnection([]), keep_latest=0)
+
+
+class TestMetrics:
+    """Tests for what /scalability reports."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_after_run(self):
+        conn = FakeConnection([thread("a", timedelta(days=45))])
+        compactor = make_compactor(conn)
+
+        await compactor.run_once()
+
+        snapshot = compactor.metrics.snapshot()
+        assert snapshot["runs"] == 1
+        assert snapshot["rows_reclaimed"] == {
+            "checkpoints": 1,
+            "checkpoint_writes": 1,
+            "checkpoint_blobs": 1,
+        }
+        assert snapshot["tables"] == {"checkpoints": {"bytes": 8192, "estimated_rows": 3}}
+        assert snapshot["last_run"]["threads_expired"] == 1
+
+    def test_failures_recorded(self):
+        metrics = CheckpointGCMetrics()
+        metrics.record(CompactionReport(dry_run=False))
+
+        metrics.record_failure("connection refused")
+
+        assert metrics.snapshot()["failures"] == 1
+        assert metrics.snapshot()["last_error"] == "connection refused"
+
+    def test_status_before_start(self, monkeypatch):
+        monkeypatch.setattr(checkpoint_gc, "_compactor", None)
+
+        assert checkpoint_gc.get_checkpoint_gc_status() == {"enabled": False}
@@ -0,0 +1,179 @@
+"""Tests for the checkpoint write policy (alim.agent.checkpoint_policy)."""
+
+import operator
+from typing import Annotated
+from unittest.mock import patch
+
+import pytest
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph import END, StateGraph
+from typing_extensions import TypedDict
+
+from alim.agent.checkpoint_policy import (
+    SlimCheckpointSaver,
+    apply_checkpoint_policy,
+    bind_durability,
+    slim_channel_values,
+)
+from alim.agent.state import FarmContext
+from alim.config import settings
+
+PARCELS = [{"parcel_id": f"p-{i}", "area_ha": 1.5, "crop": "pambıq"} for i in range(50)]
+
+
+class TurnState(TypedDict, total=False):
+    current_input: str
+    nodes_visited: Annotated[list[str], operator.add]
+    farm_context: FarmContext | None
+    mcp_traces: Annotated[list[dict], operator.add]
+    mcp_context: dict
+    current_response: str
+
+
+class CountingSaver(InMemorySaver):
+    """In-memory saver that counts what reaches storage."""
+
+    def __init__(self):
+        super().__init__()
+        self.puts = 0
+        self.write_calls = 0
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        self.puts += 1
+        return super().put(config, checkpoint, metadata, new_versions)
+
+    def put_writes(self, config, writes, task_id, task_path=""):
+        self.write_calls += 1
+        return super().put_writes(config, writes, task_id, task_path)
+
+
+def visit(name: str, **updates):
+    return lambda state: {"nodes_visited": [name], **updates}
+
+
+def make_graph(saver):
+    graph = StateGraph(TurnState)
+    graph.add_node("setup", visit("setup", mcp_context={}))
+    graph.add_node("supervisor", visit("supervisor"))
+    graph.add_node(
+        "context_loader",
+        visit(
+            "context_loader",
+            farm_context=FarmContext(
+                farm_id="farm-1",
+                farm_name="Kür",
+                farm_type="crop",
+                region="Aran",
+                total_area_ha=75.0,
+                parcel_count=len(PARCELS),
+                parcels=PARCELS,
+            ),
+            mcp_traces=[{"server": "openweather", "tool": "forecast", "output": {"days": PARCELS}}],
+            mcp_context={"zekalab": {"result": "x" * 1000}},
+        ),
+    )
+    graph.add_node("agronomist", visit("agronomist", current_response="Suvarın."))
+    graph.set_entry_point("setup")
+    graph.add_edge("setup", "supervisor")
+    graph.add_conditional_edges("supervisor", lambda state: "context_loader")
+    graph.add_edge("context_loader", "agronomist")
+    graph.add_conditional_edges("agronomist", lambda state: END)
+    return graph.compile(checkpointer=saver)
+
+
+def run_turns(saver, turns: int = 2, **kwargs) -> tuple[dict, dict]:
+    graph = make_graph(saver)
+    config = {"configurable": {"thread_id": "thread-1"}}
+    for i in range(turns):
+        final = graph.invoke({"current_input": f"sual {i}"}, config, **kwargs)
+    return final, graph.get_state(config).values
+
+
+class TestDurability:
+    """Tests for which checkpoints reach storage."""
+
+    def test_async_persists_every_step(self):
+        inner = CountingSaver()
+
+        run_turns(SlimCheckpointSaver(inner), turns=1, durability="async")
+
+        assert inner.puts == 6  # input + 5 steps
+        assert inner.write_calls > 0
+
+    def test_exit_persists_once_per_turn(self):
+        """The bound durability stores one checkpoint per turn and no writes."""
+        inner = CountingSaver()
+        graph = bind_durability(make_graph(inner))
+        config = {"configurable": {"thread_id": "thread-1"}}
+
+        with patch.object(settings, "checkpoint_durability", "exit"):
+            for i in range(2):
+                final = graph.invoke({"current_input": f"sual {i}"}, config)
+
+        assert inner.puts == 2
+        assert inner.write_calls == 0
+        assert graph.get_state(config).values == final
+        assert final["nodes_visited"].count("agronomist") == 2
+
+    def test_call_overrides_bound_durability(self):
+        inner = CountingSaver()
+        with patch.object(settings, "checkpoint_durability", "exit"):
+            graph = bind_durability(make_graph(inner))
+
+        graph.invoke(
+            {"current_input": "sual"}, {"configurable": {"thread_id": "t"}}, durability="sync"
+        )
+
+        assert inner.puts == 6
+
+    def test_unknown_mode(self):
+        with patch.object(settings, "checkpoint_durability", "nodes"):
+            with pytest.raises(ValueError):
+                bind_durability(make_graph(InMemorySaver()))
+
+
+class TestSlimCheckpointSaver:
+    """Tests for what reaches storage."""
+
+    def test_slims_persisted_state_only(self):
+        """Persisted state drops per-turn and bulky fields; the turn's result does not."""
+        final, stored = run_turns(SlimCheckpointSaver(InMemorySaver()), turns=1, durability="exit")
+
+        assert final["farm_context"].parcels == PARCELS
+        assert final["mcp_traces"][0]["output"]
+        assert "mcp_context" not in stored
+        assert stored["farm_context"].parcels == []
+        assert stored["farm_context"].parcel_count == len(PARCELS)
+        assert stored["mcp_traces"] == [{"server": "openweather", "tool": "forecast"}]
+
+    def test_later_turns_keep_history(self):
+        """Slimmed checkpoints still carry the state the next turn builds on."""
+        final, stored = run_turns(SlimCheckpointSaver(InMemorySaver()), durability="async")
+
+        assert stored["nodes_visited"] == final["nodes_visited"]
+        assert len(stored["mcp_traces"]) == 2
+
+
+def test_slim_channel_values_leaves_other_fields():
+    """Fields without a transform are passed through unchanged."""
+    values = {"current_input": "salam", "mcp_context": {"a": 1}, "mcp_traces": []}
+
+    assert slim_channel_values(values) == {"current_input": "salam", "mcp_traces": []}
+    assert "mcp_context" in values
+
+
+class TestApplyCheckpointPolicy:
+    """Tests for wrapping the configured checkpointer."""
+
+    def test_wraps_when_slim(self):
+        with patch.object(settings, "checkpoint_slim", True):
+            saver = apply_checkpoint_policy(InMemorySaver())
+
+        assert isinstance(saver, SlimCheckpointSaver)
+        assert apply_checkpoint_policy(saver) is saver
+        assert apply_checkpoint_policy(None) is None
+
+    def test_leaves_saver_when_not_slim(self):
+        inner = InMemorySaver()
+        with patch.object(settings, "checkpoint_slim", False):
+            assert apply_checkpoint_policy(inner) is inner
@@ -0,0 +1,186 @@
+"""Tests for per-turn deadline propagation (alim.deadline)."""
+
+import asyncio
+import operator
+import time
+from typing import Annotated
+
+import pytest
+from langgraph.graph import END, START, StateGraph
+from typing_extensions import TypedDict
+
+from alim.deadline import (
+    DEADLINE_KEY,
+    MIN_TIMEOUT_SECONDS,
+    budgeted,
+    current_deadline,
+    deadline_from_config,
+    deadline_scope,
+    has_budget,
+    remaining,
+    timeout_for,
+    turn_deadline,
+    with_deadline,
+)
+
+
+class TestConfig:
+    """Tests for carrying the deadline in RunnableConfig."""
+
+    def test_with_deadline_adds_metadata(self):
+        """The deadline goes into metadata; other metadata is kept."""
+        config = with_deadline({"metadata": {"model": "m"}}, budget_seconds=10)
+
+        assert config["metadata"]["model"] == "m"
+        assert 9 < config["metadata"][DEADLINE_KEY] - time.time() <= 10
+
+    def test_outermost_deadline_wins(self):
+        """A config that already has a deadline keeps it."""
+        config = with_deadline(budget_seconds=10)
+        again = with_deadline(config, budget_seconds=60)
+
+        assert again["metadata"][DEADLINE_KEY] == config["metadata"][DEADLINE_KEY]
+
+    def test_turn_deadline_prefers_config(self):
+        """Config beats state; state is the fallback."""
+        state = {"turn_deadline": 100.0}
+
+        assert turn_deadline(state, {"metadata": {DEADLINE_KEY: 200.0}}) == 200.0
+        assert turn_deadline(state, None) == 100.0
+        assert deadline_from_config({"metadata": None}) is None
+
+
+class TestBudget:
+    """Tests for timeouts derived from the remaining budget."""
+
+    def test_no_deadline_keeps_defaults(self):
+        """Outside a deadline scope calls keep their own timeouts."""
+        assert current_deadline() is None
+        assert remaining() is None
+        assert timeout_for(30.0) == 30.0
+        assert has_budget(1_000_000)
+
+    def test_timeout_capped_by_remaining(self):
+        """Inside a scope the timeout is min(default, remaining - reserve)."""
+        with deadline_scope(time.time() + 3):
+            assert timeout_for(30.0) == pytest.approx(3, abs=0.1)
+            assert timeout_for(30.0, reserve=1) == pytest.approx(2, abs=0.1)
+            assert timeout_for(0.5) == 0.5
+            assert has_budget(2)
+            assert not has_budget(5)
+
+        assert current_deadline() is None
+
+    def test_exhausted_budget_fails_fast(self):
+        """A passed deadline gives the minimum timeout, never zero or negative."""
+        with deadline_scope(time.time() - 1):
+            assert timeout_for(30.0) == MIN_TIMEOUT_SECONDS
+            assert not has_budget(0)
+
+    @pytest.mark.asyncio
+    async def test_scope_reaches_spawned_tasks(self):
+        """Tasks created inside the scope see the same deadline."""
+        deadline = time.time() + 5
+
+        with deadline_scope(deadline):
+            seen = await asyncio.create_task(_deadline_probe())
+
+        assert seen == deadline
+
+
+async def _deadline_probe():
+    return current_deadline()
+
+
+class TestBudgetedNode:
+    """Tests for the graph node wrapper."""
+
+    @pytest.mark.asyncio
+    async def test_records_budget_and_exposes_deadline(self):
+        """The node sees the turn deadline and its usage is logged to state."""
+        deadline = time.time() + 10
+        seen = {}
+
+        async def node(state, config=None):
+            seen["deadline"] = current_deadline()
+            seen["config"] = config
+            await asyncio.sleep(0.01)
+            return {"current_response": "ok"}
+
+        config = {"metadata": {DEADLINE_KEY: deadline}}
+        updates = await budgeted("agronomist", node)({}, config)
+
+        assert seen == {"deadline": deadline, "config": config}
+        assert updates["current_response"] == "ok"
+        (entry,) = updates["budget_log"]
+        assert entry["node"] == "agronomist"
+        assert entry["deadline"] == deadline
+        assert entry["elapsed_ms"] >= 10
+        assert 0 < entry["remaining_ms"] <= 10_000
+
+    @pytest.mark.asyncio
+    async def test_sync_node_without_config(self):
+        """Sync nodes that take only state are supported; state supplies the deadline."""
+
+        def node(state):
+            return {"seen": current_deadline()}
+
+        updates = await budgeted("pii_masking", node)({"turn_deadline": 123.0}, {})
+
+        assert updates["seen"] == 123.0
+        assert updates["budget_log"][0]["deadline"] == 123.0
+        assert updates["budget_log"][0]["remaining_ms"] < 0
+
+    @pytest.mark.asyncio
+    async def test_setup_node_starts_new_turn(self):
+        """A node returning turn_deadline (setup) logs against the new deadline."""
+        new_deadline = time.time() + 20
+
+        def setup(state):
+            return {"turn_deadline": new_deadline}
+
+        updates = await budgeted("setup", setup)({"turn_deadline": 1.0}, {})
+
+        assert updates["budget_log"][0]["deadline"] == new_deadline
+        assert updates["budget_log"][0]["remaining_ms"] > 0
+
+    @pytest.mark.asyncio
+    async def test_no_deadline_still_logs_elapsed(self):
+        """Without any deadline elapsed time is still recorded."""
+        updates = await budgeted("validator", lambda state: {})({}, {})
+
+        assert updates["budget_log"][0]["remaining_ms"] is None
+        assert updates["budget_log"][0]["elapsed_ms"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_node_input_schema_is_kept(self):
+        """LangGraph still passes a typed node only its input keys (plus the deadline)."""
+
+        class FullState(TypedDict, total=False):
+            current_input: str
+            farm_context: dict
+            turn_deadline: float | None
+            budget_log: Annotated[list[dict], operator.add]
+            current_response: str
+
+        class NodeInput(TypedDict):
+            current_input: str
+
+        seen = {}
+
+        async def node(state: NodeInput) -> dict:
+            seen["keys"] = set(state)
+            seen["deadline"] = current_deadline()
+            return {"current_response": "ok"}
+
+        graph = StateGraph(FullState)
+        graph.add_node("agronomist", budgeted("agronomist", node))
+        graph.add_edge(START, "agronomist")
+        graph.add_edge("agronomist", END)
+        final = await graph.compile().ainvoke(
+            {"current_input": "salam", "farm_context": {"farm_id": "f-1"}, "turn_deadline": 5.0}
+        )
+
+        assert seen == {"keys": {"current_input", "turn_deadline"}, "deadline": 5.0}
+        assert final["current_response"] == "ok"
+        assert final["budget_log"][0]["node"] == "agronomist"
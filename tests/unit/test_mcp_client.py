@@ -8,6 +8,8 @@ Tests cover:
 - Logging/metrics
 - Timeout behavior
 - Authentication headers
+- Tool result cache (cache_seconds)
+- Persistent connection pools and per-server concurrency limits
 
 All tests use mocked HTTP clients to avoid network calls.
 """
@@ -21,8 +23,10 @@ from alim.mcp.client import (
     MCPToolCall,
     close_all_mcp_clients,
     get_mcp_client,
+    open_mcp_clients,
 )
 from alim.mcp.config import MCPServerConfig
+from alim.mcp.pool import MCPConnectionPool
 from httpx import AsyncClient
 
 # ============================================================
@@ -291,6 +295,250 @@ class TestMCPClient:
         assert "Timeout" in result.error
 
 
+# ============================================================
+# Tests: Tool Result Cache
+# ============================================================
+
+
+@pytest.fixture
+def cached_client(mock_http_client):
+    """Enabled client whose HTTP layer returns an incrementing payload."""
+    import asyncio
+
+    calls = []
+
+    async def post(url, json, headers, timeout):
+        calls.append(json["args"])
+        await asyncio.sleep(0.01)
+        response = AsyncMock()
+        response.json.return_value = {"n": len(calls)}
+        return response
+
+    mock_http_client.post = AsyncMock(side_effect=post)
+    client = MCPClient("zekalab")
+    client.config = MCPServerConfig(enabled=True, url="http://localhost:7777")
+    client._http_client = mock_http_client
+    client.calls = calls
+    return client
+
+
+def cached_call(**args):
+    return MCPToolCall(server="zekalab", tool="get_rules", args=args, cache_seconds=60)
+
+
+class TestToolResultCache:
+    """Tests for MCPToolCall.cache_seconds handling."""
+
+    @pytest.mark.asyncio
+    async def test_uncached_by_default(self, cached_client):
+        """cache_seconds=0 always goes to the server."""
+        call = MCPToolCall(server="zekalab", tool="get_rules", args={})
+
+        first = await cached_client.call_tool(call)
+        second = await cached_client.call_tool(call)
+
+        assert (first.data, second.data) == ({"n": 1}, {"n": 2})
+        assert second.cache_status is None
+
+    @pytest.mark.asyncio
+    async def test_hit_ignores_argument_order(self, cached_client):
+        """Equal args in any order share an entry; other args do not."""
+        first = await cached_client.call_tool(cached_call(a=1, b=2))
+        second = await cached_client.call_tool(cached_call(b=2, a=1))
+        other = await cached_client.call_tool(cached_call(a=1, b=3))
+
+        assert (first.cache_status, second.cache_status) == ("miss", "hit")
+        assert second.data == first.data
+        assert other.cache_status == "miss"
+        assert len(cached_client.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_coalesce(self, cached_client):
+        """A burst of identical calls makes one request."""
+        import asyncio
+
+        results = await asyncio.gather(*(cached_client.call_tool(cached_call()) for _ in range(10)))
+
+        assert len(cached_client.calls) == 1
+        assert {r.cache_status for r in results} == {"miss", "coalesced"}
+
+    @pytest.mark.asyncio
+    async def test_stale_while_revalidate(self, cached_client):
+        """Past cache_seconds the old result is served while one refresh runs."""
+        import asyncio
+
+        clock = [1000.0]
+        cached_client.cache.clock = lambda: clock[0]
+
+        await cached_client.call_tool(cached_call())
+        clock[0] += 90  # past fresh (60s), within stale window (60s)
+        stale = await cached_client.call_tool(cached_call())
+        again = await cached_client.call_tool(cached_call())
+        await asyncio.sleep(0.05)
+        refreshed = await cached_client.call_tool(cached_call())
+
+        assert (stale.cache_status, stale.data) == ("stale", {"n": 1})
+        assert stale.cache_age_ms == pytest.approx(90_000)
+        assert again.cache_status == "stale"
+        assert (refreshed.cache_status, refreshed.data) == ("hit", {"n": 2})
+        assert len(cached_client.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_failures_cached_briefly(self, cached_client, mock_http_client):
+        """Errors are negatively cached for a short window only."""
+        import httpx
+
+        mock_http_client.post = AsyncMock(side_effect=httpx.TimeoutException("slow"))
+        clock = [1000.0]
+        cached_client.cache.clock = lambda: clock[0]
+
+        first = await cached_client.call_tool(cached_call())
+        second = await cached_client.call_tool(cached_call())
+        clock[0] += cached_client.cache.negative_seconds
+        third = await cached_client.call_tool(cached_call())
+
+        assert not first.success and first.cache_status == "miss"
+        assert not second.success and second.cache_status == "negative"
+        assert third.cache_status == "miss"
+        assert mock_http_client.post.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_stale_result(self, cached_client, mock_http_client):
+        """A failing server does not replace a still-servable good result."""
+        import asyncio
+
+        import httpx
+
+        clock = [1000.0]
+        cached_client.cache.clock = lambda: clock[0]
+
+        await cached_client.call_tool(cached_call())
+        mock_http_client.post = AsyncMock(side_effect=httpx.TimeoutException("slow"))
+        clock[0] += 90
+        await cached_client.call_tool(cached_call())
+        await asyncio.sleep(0.01)
+        result = await cached_client.call_tool(cached_call())
+
+        assert result.success is True
+        assert result.cache_status == "stale"
+
+    @pytest.mark.asyncio
+    async def test_cached_data_is_copied(self, cached_client):
+        """Callers mutating result.data cannot poison the cache."""
+        first = await cached_client.call_tool(cached_call())
+        first.data["n"] = -1
+
+        assert (await cached_client.call_tool(cached_call())).data == {"n": 1}
+
+    def test_langfuse_metadata_includes_cache(self):
+        """Cache status and age are exported only for cached calls."""
+        result = MCPCallResult(
+            success=True,
+            server="zekalab",
+            tool_name="get_rules",
+            cache_status="stale",
+            cache_age_ms=1500.0,
+        )
+
+        metadata = result.to_langfuse_metadata()
+
+        assert metadata["mcp_cache"] == "stale"
+        assert metadata["mcp_cache_age_ms"] == 1500.0
+        assert "mcp_cache" not in MCPCallResult(success=True).to_langfuse_metadata()
+
+
+# ============================================================
+# Tests: Connection Pool
+# ============================================================
+
+
+class TestConnectionPool:
+    """Tests for persistent per-server pools."""
+
+    @pytest.mark.asyncio
+    async def test_clients_share_persistent_pool(self):
+        """Clients for one server reuse one keep-alive client, even after exit."""
+        config = MCPServerConfig(enabled=True, url="http://localhost:7777")
+        first = MCPClient("zekalab")
+        first.config = config
+
+        async with first:
+            pooled = first._http_client
+        second = MCPClient("zekalab")
+        second.config = config
+        await second.open()
+
+        assert pooled is second._http_client
+        assert not pooled.is_closed
+
+        await close_all_mcp_clients()
+        assert pooled.is_closed
+
+    @pytest.mark.asyncio
+    async def test_call_tool_opens_lazily(self, mcp_tool_call):
+        """A cached client without an HTTP client attaches to the pool on use."""
+        client = MCPClient("openweather")
+        client.config = MCPServerConfig(enabled=True, url="https://api.example.com")
+        response = AsyncMock()
+        response.json.return_value = {"ok": True}
+
+        with patch("httpx.AsyncClient.post", AsyncMock(return_value=response)) as post:
+            result = await client.call_tool(mcp_tool_call)
+
+        assert result.success is True
+        post.assert_called_once()
+        await close_all_mcp_clients()
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_per_server(self, mock_http_client, mcp_tool_call):
+        """At most max_concurrency requests are in flight; the rest wait."""
+        import asyncio
+
+        active = {"now": 0, "peak": 0}
+
+        async def post(url, json, headers, timeout):
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+            await asyncio.sleep(0.01)
+            active["now"] -= 1
+            response = AsyncMock()
+            response.json.return_value = {}
+            return response
+
+        mock_http_client.post = AsyncMock(side_effect=post)
+        client = MCPClient("openweather")
+        client.config = MCPServerConfig(
+            enabled=True, url="https://api.example.com", max_concurrency=2
+        )
+        client._http_client = mock_http_client
+
+        results = await asyncio.gather(*(client.call_tool(mcp_tool_call) for _ in range(6)))
+
+        assert all(r.success for r in results)
+        assert active["peak"] == 2
+        stats = MCPConnectionPool.get_pool_stats()["openweather"]
+        assert stats["requests"] == 6
+        assert stats["waited"] > 0
+        assert stats["in_flight"] == 0
+        await close_all_mcp_clients()
+
+    @pytest.mark.asyncio
+    async def test_open_mcp_clients_only_enabled(self):
+        """Startup warm-up skips servers without a config."""
+        config = MCPServerConfig(enabled=True, url="http://localhost:7777")
+
+        def server_config(name):
+            return config if name == "zekalab" else None
+
+        with patch("alim.mcp.client.get_server_config", side_effect=server_config):
+            opened = await open_mcp_clients()
+
+        assert opened == ["zekalab"]
+        assert "zekalab" in MCPConnectionPool.get_pool_stats()
+        await close_all_mcp_clients()
+        assert MCPConnectionPool.get_pool_stats() == {}
+
+
 # ============================================================
 # Tests: Factory Functions
 # ============================================================
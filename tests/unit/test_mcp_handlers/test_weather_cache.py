@@ -0,0 +1,259 @@
+"""Tests for the geo-tiled WeatherCache and its use by WeatherMCPHandler."""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from alim.mcp.handlers.weather_cache import WeatherCache
+from alim.mcp.handlers.weather_handler import WeatherMCPHandler
+
+
+@pytest.fixture
+def cache():
+    """Process-only cache with 0.1° tiles."""
+    return WeatherCache(tile_degrees=0.1, redis_enabled=False)
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the async Redis client."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttl_ms = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+        self.ttl_ms[key] = ex * 1000 if ex else -1
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues get/pttl and answers them together, like a Redis pipeline."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.results = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def get(self, key):
+        self.results.append(self.redis.data.get(key))
+        return self
+
+    def pttl(self, key):
+        self.results.append(self.redis.ttl_ms.get(key, -2))
+        return self
+
+    async def execute(self):
+        return self.results
+
+
+def counting_fetch(delay=0.0):
+    """Forecast fetch that records the coordinates it was called with."""
+    calls = []
+
+    async def fetch(lat, lon):
+        calls.append((lat, lon))
+        await asyncio.sleep(delay)
+        return {"current": {"temperature": 20.0}, "fetched_for": [lat, lon]}
+
+    return fetch, calls
+
+
+class TestTiles:
+    """Tests for tile keys."""
+
+    def test_neighbouring_farms_share_a_tile(self, cache):
+        """Farms a few hundred metres apart map to one key and fetch point."""
+        assert cache.forecast_key(40.4093, 49.8671, 7) == cache.forecast_key(40.4412, 49.8105, 7)
+        assert cache.tile_center(40.4093, 49.8671) == (40.45, 49.85)
+
+    def test_horizon_and_border_split_keys(self, cache):
+        """Different horizons or tiles never share entries."""
+        assert cache.forecast_key(40.41, 49.87, 7) != cache.forecast_key(40.41, 49.87, 0)
+        assert cache.forecast_key(40.399, 49.87, 7) != cache.forecast_key(40.401, 49.87, 7)
+
+
+class TestForecastCache:
+    """Tests for hits, TTL and request coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_hit_after_miss(self, cache):
+        """Second farm in the tile is served from memory."""
+        fetch, calls = counting_fetch()
+
+        first, first_status = await cache.forecast(40.41, 49.87, 7, fetch)
+        second, second_status = await cache.forecast(40.43, 49.81, 7, fetch)
+
+        assert (first_status, second_status) == ("miss", "memory")
+        assert first == second
+        assert calls == [(40.45, 49.85)]
+
+    @pytest.mark.asyncio
+    async def test_callers_get_private_copies(self, cache):
+        """Mutating a returned forecast does not corrupt the cache."""
+        fetch, _ = counting_fetch()
+
+        forecast, _ = await cache.forecast(40.41, 49.87, 7, fetch)
+        forecast["current"]["temperature"] = -99
+        again, _ = await cache.forecast(40.41, 49.87, 7, fetch)
+
+        assert again["current"]["temperature"] == 20.0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_fetch(self, cache):
+        """Single-flight: a burst for one tile costs one provider call."""
+        fetch, calls = counting_fetch(delay=0.01)
+
+        results = await asyncio.gather(
+            *(cache.forecast(40.41 + i * 0.001, 49.87, 7, fetch) for i in range(20))
+        )
+
+        assert len(calls) == 1
+        assert sorted(status for _, status in results) == ["coalesced"] * 19 + ["miss"]
+        assert cache.info()["coalesced"] == 19
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_refetched(self, cache):
+        """Entries live for the horizon's TTL."""
+        fetch, calls = counting_fetch()
+        clock = MagicMock(return_value=1000.0)
+
+        with patch("alim.mcp.handlers.weather_cache.time.monotonic", clock):
+            await cache.forecast(40.41, 49.87, 0, fetch)
+            clock.return_value += cache.forecast_ttl(0) - 1
+            await cache.forecast(40.41, 49.87, 0, fetch)
+            clock.return_value += 2
+            await cache.forecast(40.41, 49.87, 0, fetch)
+
+        assert len(calls) == 2
+        assert cache.forecast_ttl(0) < cache.forecast_ttl(7)
+
+    @pytest.mark.asyncio
+    async def test_failures_reach_every_waiter_and_are_not_cached(self, cache):
+        """A failed fetch fails the burst once, then the next call retries."""
+        attempts = []
+
+        async def failing(lat, lon):
+            attempts.append(lat)
+            await asyncio.sleep(0.01)
+            raise RuntimeError("provider down")
+
+        results = await asyncio.gather(
+            *(cache.forecast(40.41, 49.87, 7, failing) for _ in range(5)),
+            return_exceptions=True,
+        )
+        fetch, _ = counting_fetch()
+        _, status = await cache.forecast(40.41, 49.87, 7, fetch)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert len(attempts) == 1
+        assert status == "miss"
+
+    @pytest.mark.asyncio
+    async def test_lru_bound(self):
+        """The in-process tier keeps at most maxsize entries."""
+        cache = WeatherCache(tile_degrees=0.1, maxsize=2, redis_enabled=False)
+        fetch, _ = counting_fetch()
+
+        for lat in (40.01, 40.11, 40.21):
+            await cache.forecast(lat, 49.87, 7, fetch)
+
+        assert cache.info()["size"] == 2
+
+
+class TestSharedTier:
+    """Tests for the Redis tier."""
+
+    @pytest.mark.asyncio
+    async def test_workers_share_through_redis(self):
+        """A second process-local cache finds the first one's fetch in Redis."""
+        redis = FakeRedis()
+
+        @asynccontextmanager
+        async def fake_get_redis():
+            yield redis
+
+        fetch, calls = counting_fetch()
+        with patch("alim.data.redis_client.get_redis", fake_get_redis):
+            await WeatherCache(tile_degrees=0.1).forecast(40.41, 49.87, 7, fetch)
+            forecast, status = await WeatherCache(tile_degrees=0.1).forecast(40.41, 49.87, 7, fetch)
+
+        assert status == "redis"
+        assert forecast["current"]["temperature"] == 20.0
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_hit_keeps_remaining_ttl(self):
+        """An entry about to expire in Redis is not cached locally for a full TTL."""
+        redis = FakeRedis()
+
+        @asynccontextmanager
+        async def fake_get_redis():
+            yield redis
+
+        fetch, calls = counting_fetch()
+        with patch("alim.data.redis_client.get_redis", fake_get_redis):
+            await WeatherCache(tile_degrees=0.1).forecast(40.41, 49.87, 7, fetch)
+            [key] = redis.data
+            redis.ttl_ms[key] = 50
+            cache = WeatherCache(tile_degrees=0.1)
+            _, status = await cache.forecast(40.41, 49.87, 7, fetch)
+
+        assert status == "redis"
+        expires_at, _ = cache._local[key]
+        assert expires_at - time.monotonic() <= 0.05
+
+    @pytest.mark.asyncio
+    async def test_unreachable_redis_degrades_to_memory(self):
+        """Redis errors are swallowed and not retried on every call."""
+        broken = MagicMock(side_effect=ConnectionError("refused"))
+        fetch, calls = counting_fetch()
+        cache = WeatherCache(tile_degrees=0.1)
+
+        with patch("alim.data.redis_client.get_redis", broken):
+            await cache.forecast(40.41, 49.87, 7, fetch)
+            await cache.forecast(40.41, 49.87, 0, fetch)
+            _, status = await cache.forecast(40.41, 49.87, 7, fetch)
+
+        assert status == "memory"
+        assert len(calls) == 2
+        assert broken.call_count == 1
+
+
+class TestWeatherHandlerCaching:
+    """WeatherMCPHandler goes through the cache."""
+
+    @pytest.mark.asyncio
+    async def test_farm_coordinates_and_forecast_cached(self, cache):
+        """Repeated turns for neighbouring farms: one lookup each, one provider call."""
+        client = AsyncMock()
+        client.call_tool.return_value = MagicMock(success=True, data={"current": {}})
+        handler = WeatherMCPHandler(cache=cache)
+        handler.mcp_client = client
+        lookup = AsyncMock(
+            side_effect=lambda farm_id: {"a": (40.41, 49.87), "b": (40.42, 49.88)}[farm_id]
+        )
+
+        with patch("alim.mcp.handlers.weather_handler._lookup_farm_coordinates", lookup):
+            for farm_id in ["a", "b", "a", "b"]:
+                forecast = await handler.get_forecast(farm_id)
+
+        assert client.call_tool.call_count == 1
+        assert lookup.call_count == 2
+        assert forecast["cache"] == "memory"
+        assert forecast["data_source"] == "openweather-mcp"
+        call = client.call_tool.call_args.args[0]
+        assert (call.args["latitude"], call.args["longitude"]) == (40.45, 49.85)
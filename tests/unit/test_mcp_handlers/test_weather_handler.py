@@ -3,6 +3,7 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from alim.mcp.handlers.weather_cache import WeatherCache
 from alim.mcp.handlers.weather_handler import WeatherMCPHandler
 
 
@@ -18,7 +19,7 @@ def weather_handler(mock_mcp_client):
     """Create a weather handler with mocked MCP client."""
     with patch("alim.mcp.handlers.weather_handler.get_mcp_client") as mock_get_client:
         mock_get_client.return_value = mock_mcp_client
-        handler = WeatherMCPHandler()
+        handler = WeatherMCPHandler(cache=WeatherCache(redis_enabled=False))
         handler.mcp_client = mock_mcp_client
         return handler
 
@@ -5,7 +5,8 @@ Tests cover:
 - 3 resource methods (rules, crop profiles, subsidy database)
 - Error handling (timeout, HTTP error, generic error)
 - MCPTrace recording
-- Singleton pattern
+- Batched calls (/tools/batch) and per-turn coalescing
+- Singleton pattern and shared connection pool
 """
 
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -13,7 +14,10 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 import pytest
 from alim.agent.state import MCPTrace
+from alim.mcp.client import MCPClient, close_all_mcp_clients
+from alim.mcp.config import MCPServerConfig
 from alim.mcp.handlers.zekalab_handler import ZekaLabMCPHandler, get_zekalab_handler
+from alim.mcp.pool import MCPConnectionPool
 
 
 @pytest.fixture
@@ -498,6 +502,115 @@ async def test_concurrent_tool_calls(zekalab_handler, mock_http_client):
     assert all(trace.success for _, trace in results)
 
 
+# ============================================================================
+# Batched Invocation Tests
+# ============================================================================
+
+
+def batch_response(*results):
+    """Mock /tools/batch response carrying the given per-call results."""
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = {"results": list(results)}
+    return response
+
+
+@pytest.mark.asyncio
+async def test_call_tools_one_request_one_trace_per_call(zekalab_handler, mock_http_client):
+    """A batch is one POST but every sub-call gets its own trace."""
+    mock_http_client.post.return_value = batch_response(
+        {"tool": "get_rules", "success": True, "output": {"rules": {"irrigation": {}}}},
+        {"tool": "calculate_subsidy", "success": False, "error": "bad crop"},
+    )
+
+    (rules, rules_trace), (subsidy, subsidy_trace) = await zekalab_handler.call_tools(
+        [("get_rules", {}), ("calculate_subsidy", {"crop_type": "x"})]
+    )
+
+    mock_http_client.post.assert_called_once()
+    assert mock_http_client.post.call_args.args[0].endswith("/tools/batch")
+    assert rules == {"rules": {"irrigation": {}}}
+    assert rules_trace.output == {"rules_count": 1}
+    assert rules_trace.success is True
+    assert subsidy == {}
+    assert subsidy_trace.success is False
+    assert subsidy_trace.error_message == "bad crop"
+    assert subsidy_trace.input_args == {"crop_type": "x"}
+
+
+@pytest.mark.asyncio
+async def test_call_tools_failure_fails_every_call(zekalab_handler, mock_http_client):
+    """A failed round-trip is reported on each sub-call instead of raised."""
+    mock_http_client.post.side_effect = httpx.ConnectError("refused")
+
+    results = await zekalab_handler.call_tools([("get_rules", {}), ("get_crop_profiles", {})])
+
+    assert [trace.success for _, trace in results] == [False, False]
+    assert all(trace.error_message == "refused" for _, trace in results)
+
+
+@pytest.mark.asyncio
+async def test_call_tools_falls_back_without_batch_route(zekalab_handler, mock_http_client):
+    """Servers without /tools/batch get one request per call."""
+    not_found = MagicMock(status_code=404)
+    single = MagicMock()
+    single.json.return_value = {"timing": "6am"}
+    mock_http_client.post.side_effect = [not_found, single]
+    mock_http_client.get.return_value = MagicMock(json=MagicMock(return_value={"cotton": {}}))
+
+    (profiles, _), (irrigation, trace) = await zekalab_handler.call_tools(
+        [("get_crop_profiles", {}), ("evaluate_irrigation_rules", {"farm_id": "f1"})]
+    )
+
+    assert profiles == {"cotton": {}}
+    assert irrigation == {"timing": "6am"}
+    assert trace.tool == "evaluate_irrigation_rules"
+    assert mock_http_client.post.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_coalescing_batches_concurrent_calls(zekalab_handler, mock_http_client):
+    """Calls gathered inside coalescing() share one /tools/batch request."""
+    import asyncio
+
+    mock_http_client.post.return_value = batch_response(
+        {"success": True, "output": {"rules": {}}},
+        {"success": True, "output": {"should_irrigate": True}},
+    )
+
+    async with zekalab_handler.coalescing():
+        (rules, rules_trace), (irrigation, trace) = await asyncio.gather(
+            zekalab_handler.get_rules_resource(),
+            zekalab_handler.evaluate_irrigation_rules(
+                farm_id="farm_001",
+                crop_type="wheat",
+                soil_type="clay",
+                current_soil_moisture_percent=45.0,
+            ),
+        )
+
+    mock_http_client.post.assert_called_once()
+    calls = mock_http_client.post.call_args.kwargs["json"]["calls"]
+    assert [c["tool"] for c in calls] == ["get_rules", "evaluate_irrigation_rules"]
+    assert rules_trace.tool == "get_rules"
+    assert irrigation == {"should_irrigate": True}
+    assert trace.input_args["farm_id"] == "farm_001"
+    mock_http_client.get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_calls_outside_coalescing_are_direct(zekalab_handler, mock_http_client):
+    """Leaving the scope restores per-call requests."""
+    mock_http_client.get.return_value = MagicMock(json=MagicMock(return_value={"rules": {}}))
+
+    async with zekalab_handler.coalescing():
+        pass
+    await zekalab_handler.get_rules_resource()
+
+    mock_http_client.get.assert_called_once()
+    mock_http_client.post.assert_not_called()
+
+
 # ============================================================================
 # Handler Lifecycle Tests
 # ============================================================================
@@ -505,13 +618,30 @@ async def test_concurrent_tool_calls(zekalab_handler, mock_http_client):
 
 @pytest.mark.asyncio
 async def test_handler_close_cleanup(mock_http_client):
-    """Test that handler properly closes HTTP client."""
+    """Close drops the injected client but leaves the shared pool to shutdown."""
     handler = ZekaLabMCPHandler()
     handler.client = mock_http_client
 
     await handler.close()
 
-    mock_http_client.aclose.assert_called_once()
+    assert handler.client is None
+    mock_http_client.aclose.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_handler_shares_mcp_client_pool():
+    """Handler and MCPClient("zekalab") use one pooled client and limit."""
+    handler = ZekaLabMCPHandler()
+    client = MCPClient("zekalab")
+    client.config = MCPServerConfig(enabled=True, url=handler.mcp_url)
+    await client.open()
+
+    async with handler._slot() as http_client:
+        assert http_client is client._http_client
+        assert MCPConnectionPool.get_pool_stats()["zekalab"]["in_flight"] == 1
+
+    await close_all_mcp_clients()
+    assert http_client.is_closed
 
 
 @pytest.mark.asyncio
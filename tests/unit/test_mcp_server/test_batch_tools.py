@@ -0,0 +1,65 @@
+"""Unit tests for the ZekaLab /tools/batch endpoint."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from alim.mcp_server.main import app
+
+
+@pytest.fixture
+def client():
+    """FastAPI test client."""
+    return TestClient(app)
+
+
+IRRIGATION = {
+    "farm_id": "farm_001",
+    "crop_type": "cotton",
+    "soil_type": "loamy",
+    "current_soil_moisture_percent": 45,
+    "temperature_c": 35,
+}
+
+
+class TestBatchTools:
+    """Tests for /tools/batch."""
+
+    def test_results_match_single_calls(self, client):
+        """Each batched call returns what its own route returns, in order."""
+        calls = [
+            {"tool": "evaluate_irrigation_rules", "arguments": IRRIGATION},
+            {"tool": "get_crop_profiles"},
+            {"tool": "get_rules"},
+        ]
+
+        response = client.post("/tools/batch", json={"calls": calls})
+        assert response.status_code == 200
+        results = response.json()["results"]
+
+        assert [r["tool"] for r in results] == [c["tool"] for c in calls]
+        assert all(r["success"] and r["status_code"] == 200 for r in results)
+        single = client.post("/tools/evaluate_irrigation_rules", json=IRRIGATION).json()
+        assert results[0]["output"] == single
+        assert results[1]["output"] == client.get("/resources/crop_profiles").json()
+        assert "irrigation" in results[2]["output"]["rules"]
+
+    def test_failures_are_per_call(self, client):
+        """Bad arguments or unknown tools fail only their own call."""
+        calls = [
+            {"tool": "evaluate_irrigation_rules", "arguments": {"farm_id": "f1"}},
+            {"tool": "no_such_tool"},
+            {"tool": "get_subsidy_database"},
+        ]
+
+        results = client.post("/tools/batch", json={"calls": calls}).json()["results"]
+
+        assert [r["status_code"] for r in results] == [422, 404, 200]
+        assert [r["success"] for r in results] == [False, False, True]
+        assert "crop_type" in results[0]["error"]
+        assert results[0]["output"] == {}
+
+    def test_batch_size_is_bounded(self, client):
+        """Oversized batches are rejected up front."""
+        calls = [{"tool": "get_rules"}] * 51
+
+        assert client.post("/tools/batch", json={"calls": calls}).status_code == 422
@@ -0,0 +1,272 @@
+"""Unit tests for GDD accumulation and GDD-based harvest prediction."""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from alim.mcp_server.main import app
+from alim.mcp_server.tools import GDDService, ZekaLabEvaluator
+from alim.mcp_server.tools.evaluator import ZEKALAB_RULES_DIR
+from alim.rules.registry import DirectoryRuleSource, RuleSetRegistry
+
+
+@pytest.fixture
+def gdd():
+    """Fresh service over the shipped climate normals."""
+    return GDDService(tile_degrees=0.1)
+
+
+@pytest.fixture
+def evaluator(gdd):
+    """Evaluator using the fresh GDD service."""
+    return ZekaLabEvaluator(RuleSetRegistry(DirectoryRuleSource(ZEKALAB_RULES_DIR)), gdd=gdd)
+
+
+@pytest.fixture
+def client():
+    """FastAPI test client."""
+    return TestClient(app)
+
+
+def brute_force(gdd, key, start, end, base=10.0):
+    """Day-by-day GDD sum over [start, end)."""
+    timeline, _ = gdd.cumulative(key, start.year, end.year, base)
+    total = 0.0
+    day = start
+    while day < end:
+        i = (day - timeline.origin).days
+        total += max((timeline.tmin[i] + timeline.tmax[i]) / 2 - base, 0.0)
+        day += timedelta(days=1)
+    return total
+
+
+class TestAccumulation:
+    """Tests for range queries over the daily timeline."""
+
+    def test_range_matches_daily_sum(self, gdd):
+        """Prefix-sum lookups equal summing the days, across a year boundary."""
+        key = gdd.key_for("aran")
+        start, end = date(2025, 10, 15), date(2026, 7, 1)
+
+        assert gdd.gdd_between(key, start, end) == pytest.approx(brute_force(gdd, key, start, end))
+        assert gdd.gdd_between(key, end, start) == 0.0
+
+    def test_season_shape(self, gdd):
+        """Summer accumulates, winter barely does; warmer regions lead."""
+        aran = gdd.key_for("aran")
+        guba = gdd.key_for("guba_khachmaz")
+
+        july = gdd.gdd_between(aran, date(2026, 7, 1), date(2026, 8, 1))
+        january = gdd.gdd_between(aran, date(2026, 1, 1), date(2026, 2, 1))
+
+        assert 400 < july < 700
+        assert january < 5
+        assert july > gdd.gdd_between(guba, date(2026, 7, 1), date(2026, 8, 1))
+
+    def test_base_temperature(self, gdd):
+        """A higher base gives fewer GDD; each base has its own cached sums."""
+        key = gdd.key_for("aran")
+        window = (date(2026, 5, 1), date(2026, 9, 1))
+
+        assert gdd.gdd_between(key, *window, base_c=15) < gdd.gdd_between(key, *window, base_c=10)
+
+    def test_ingested_observations_replace_normals(self, gdd):
+        """Observed days override the climatology and invalidate cached sums."""
+        key = gdd.key_for("aran")
+        week = (date(2026, 6, 1), date(2026, 6, 8))
+        before = gdd.gdd_between(key, *week)
+
+        written = gdd.ingest(key, [(week[0] + timedelta(days=i), 20.0, 30.0) for i in range(7)])
+
+        assert written == 7
+        assert gdd.gdd_between(key, *week) == pytest.approx(7 * 15.0)
+        assert gdd.gdd_between(key, *week) != pytest.approx(before)
+        assert gdd.info()["observed_days"] == 7
+
+    def test_tiles_use_region_normals_and_own_history(self, gdd):
+        """A tile starts from its region's climate; its observations stay local."""
+        tile = gdd.key_for("lankaran", 38.75, 48.85)
+        region = gdd.key_for("lankaran")
+        window = (date(2026, 5, 1), date(2026, 6, 1))
+
+        assert tile.startswith("tile:")
+        assert gdd.key_for("lankaran", 38.76, 48.86) == tile
+        assert gdd.gdd_between(tile, *window) == pytest.approx(gdd.gdd_between(region, *window))
+
+        gdd.ingest(tile, [(date(2026, 5, 10), 30.0, 40.0)])
+
+        assert gdd.gdd_between(tile, *window) > gdd.gdd_between(region, *window)
+
+
+class TestDateReaching:
+    """Tests for projecting when a GDD target is reached."""
+
+    def test_inverse_of_accumulation(self, gdd):
+        """The returned day is the first on which the target is met."""
+        key = gdd.key_for("aran")
+        start = date(2026, 4, 15)
+
+        reached = gdd.date_reaching(key, start, 2600)
+
+        assert gdd.gdd_between(key, start, reached + timedelta(days=1)) >= 2600
+        assert gdd.gdd_between(key, start, reached) < 2600
+
+    def test_crosses_winter(self, gdd):
+        """Autumn-sown targets carry over into the next season."""
+        reached = gdd.date_reaching(gdd.key_for("aran"), date(2026, 10, 15), 2000)
+
+        assert date(2027, 4, 1) < reached < date(2027, 9, 1)
+
+    def test_zero_target_and_unreachable(self):
+        """A met target returns the start; one beyond the horizon returns None."""
+        cold = GDDService(climate={"aran": ((0, 5),) * 12})
+        key = cold.key_for("aran")
+
+        assert cold.date_reaching(key, date(2026, 5, 1), 0) == date(2026, 5, 1)
+        assert cold.date_reaching(key, date(2026, 5, 1), 100) is None
+
+    def test_vectorized_matches_scalar(self, gdd):
+        """Batch lookups agree with one-at-a-time calls."""
+        key = gdd.key_for("aran")
+        starts = [date(2025, 3, 1) + timedelta(days=17 * i) for i in range(30)]
+        targets = [500 + 70 * i for i in range(30)]
+        today = date(2026, 6, 1)
+
+        many = gdd.gdd_between_many(key, starts, today)
+        reached = gdd.dates_reaching(key, starts, targets)
+
+        assert np.allclose(many, [gdd.gdd_between(key, s, today) for s in starts])
+        assert reached == [gdd.date_reaching(key, s, t) for s, t in zip(starts, targets)]
+
+
+class TestHarvestPrediction:
+    """Tests for ZekaLabEvaluator.harvest/harvest_batch."""
+
+    def test_accumulated_gdd_from_service(self, evaluator, gdd):
+        """Without a reported value, GDD since planting come from the service."""
+        result = evaluator.harvest("cotton", "2026-04-15", region="aran", as_of="2026-07-01")
+        key = gdd.key_for("aran")
+
+        assert result["gdd_accumulated"] == pytest.approx(
+            gdd.gdd_between(key, date(2026, 4, 15), date(2026, 7, 1)), abs=0.1
+        )
+        assert (
+            result["predicted_harvest_date"]
+            == gdd.date_reaching(key, date(2026, 4, 15), 2600).isoformat()
+        )
+        predicted = date.fromisoformat(result["predicted_harvest_date"])
+        assert result["days_to_harvest"] == (predicted - date(2026, 7, 1)).days
+
+    def test_reported_gdd_projects_from_as_of(self, evaluator):
+        """A reported accumulation projects the remainder from today, not planting."""
+        result = evaluator.harvest(
+            "cotton", "2026-04-01", current_gdd_accumulated=1300, as_of="2026-07-01"
+        )
+
+        assert result["predicted_harvest_date"] > "2026-07-01"
+        assert 40 < result["days_to_harvest"] < 120
+
+    def test_mature_crop(self, evaluator):
+        """A crop past its requirement is due now."""
+        result = evaluator.harvest("vegetables", "2026-03-01", region="aran", as_of="2026-10-01")
+
+        assert result["days_to_harvest"] == 0
+        assert result["predicted_harvest_date"] == "2026-10-01"
+        assert result["maturity_confidence"] == 0.95
+
+    def test_unreachable_falls_back_to_daily_rate(self):
+        """Climates that never reach the target use the rule's daily_gdd."""
+        cold = GDDService(climate={"aran": ((0, 5),) * 12})
+        evaluator = ZekaLabEvaluator(
+            RuleSetRegistry(DirectoryRuleSource(ZEKALAB_RULES_DIR)), gdd=cold
+        )
+
+        result = evaluator.harvest("barley", "2026-03-01", as_of="2026-03-01")
+
+        assert result["days_to_harvest"] == 2000 // 15
+
+    def test_batch_matches_single(self, evaluator):
+        """Each batch result equals the single-declaration prediction."""
+        declarations = [
+            {
+                "declaration_id": f"SD-{i}",
+                "crop_type": ["cotton", "wheat", "vegetables"][i % 3],
+                "sowing_date": (date(2025, 10, 1) + timedelta(days=11 * i)).isoformat(),
+                "region": ["aran", "lankaran"][i % 2],
+            }
+            for i in range(24)
+        ]
+
+        batch = evaluator.harvest_batch(declarations, as_of="2026-06-15")
+
+        assert batch["declaration_count"] == 24
+        for declaration, result in zip(declarations, batch["results"]):
+            single = evaluator.harvest(
+                declaration["crop_type"],
+                declaration["sowing_date"],
+                region=declaration["region"],
+                as_of="2026-06-15",
+            )
+            assert result["declaration_id"] == declaration["declaration_id"]
+            assert result["predicted_harvest_date"] == single["predicted_harvest_date"]
+            assert result["gdd_accumulated"] == pytest.approx(single["gdd_accumulated"])
+
+
+class TestHarvestEndpoints:
+    """Tests for /tools/predict_harvest_batch and /tools/ingest_weather_history."""
+
+    def test_batch_endpoint(self, client):
+        """Results come back per declaration in order; bad rows fail alone."""
+        payload = {
+            "declarations": [
+                {"declaration_id": "a", "crop_type": "cotton", "sowing_date": "2026-04-10"},
+                {"declaration_id": "b", "crop_type": "wheat", "sowing_date": "not-a-date"},
+                {"declaration_id": "c", "crop_type": "barley", "sowing_date": "2025-10-20"},
+            ],
+            "as_of": "2026-06-01",
+        }
+
+        response = client.post("/tools/predict_harvest_batch", json=payload)
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["as_of"] == "2026-06-01"
+        a, b, c = data["results"]
+        assert a["declaration_id"] == "a" and a["rule_id"] == "RULE_HARVEST_001_COTTON"
+        assert "error" in b
+        assert c["rule_id"] == "RULE_HARVEST_000_DEFAULT"
+
+    def test_batched_through_tools_batch(self, client):
+        """The batch tool is also reachable through /tools/batch."""
+        call = {
+            "tool": "predict_harvest_batch",
+            "arguments": {
+                "declarations": [
+                    {"declaration_id": "a", "crop_type": "wheat", "sowing_date": "2025-10-20"}
+                ]
+            },
+        }
+
+        [result] = client.post("/tools/batch", json={"calls": [call]}).json()["results"]
+
+        assert result["success"]
+        assert result["output"]["declaration_count"] == 1
+
+    def test_ingest_weather_history(self, client):
+        """Observations are accepted per tile; bad dates are rejected."""
+        payload = {
+            "region": "aran",
+            "latitude": 40.41,
+            "longitude": 49.87,
+            "observations": [{"date": "2026-05-01", "tmin_c": 14, "tmax_c": 27}],
+        }
+
+        response = client.post("/tools/ingest_weather_history", json=payload)
+        assert response.status_code == 200
+        assert response.json()["days"] == 1
+        assert response.json()["key"].startswith("tile:")
+
+        payload["observations"][0]["date"] = "05/01/2026"
+        assert client.post("/tools/ingest_weather_history", json=payload).status_code == 422
@@ -0,0 +1,202 @@
+"""Unit tests for the rules-backed ZekaLab tool evaluator.
+
+Covers the YAML rule decisions, the quantized match memo, the batch
+endpoint and the rules resource.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from alim.mcp_server.main import app
+from alim.mcp_server.tools import ZekaLabEvaluator
+from alim.mcp_server.tools.evaluator import ZEKALAB_RULES_DIR
+from alim.rules.registry import DirectoryRuleSource, RuleSetRegistry
+
+
+@pytest.fixture
+def evaluator():
+    """Fresh evaluator (own registry and memo) over the shipped rules."""
+    return ZekaLabEvaluator(RuleSetRegistry(DirectoryRuleSource(ZEKALAB_RULES_DIR)))
+
+
+@pytest.fixture
+def client():
+    """FastAPI test client."""
+    return TestClient(app)
+
+
+def irrigation(evaluator, **overrides):
+    args = {
+        "crop_type": "cotton",
+        "soil_type": "loamy",
+        "current_soil_moisture_percent": 45,
+        "temperature_c": 25,
+    }
+    return evaluator.irrigation(**{**args, **overrides})
+
+
+class TestRuleDecisions:
+    """The YAML rules reproduce the tool behaviour."""
+
+    @pytest.mark.parametrize(
+        ("overrides", "rule_id", "timing"),
+        [
+            ({"temperature_c": 35}, "RULE_IRR_001_HIGH_TEMP", "6am"),
+            ({"temperature_c": 5}, "RULE_IRR_002_LOW_TEMP", "noon"),
+            ({}, "RULE_IRR_003_NORMAL", "6am"),
+            ({"current_soil_moisture_percent": 60}, "RULE_IRR_004_SUFFICIENT", "anytime"),
+            ({"rainfall_mm_last_7_days": 40}, "RULE_IRR_005_RECENT_RAINFALL", "anytime"),
+        ],
+    )
+    def test_irrigation_rules(self, evaluator, overrides, rule_id, timing):
+        """Each irrigation branch is a rule."""
+        result = irrigation(evaluator, **overrides)
+
+        assert result["rule_id"] == rule_id
+        assert result["timing"] == timing
+        assert result["rule_set_version"].startswith("v1-")
+
+    def test_irrigation_amount_uses_exact_moisture(self, evaluator):
+        """Farms sharing a memo entry still get their own water amount."""
+        first = irrigation(evaluator, current_soil_moisture_percent=45)
+        second = irrigation(evaluator, current_soil_moisture_percent=40)
+
+        assert (first["recommended_water_mm"], second["recommended_water_mm"]) == (30, 40)
+        assert evaluator.memo.hits == 1
+        assert "below threshold 60%" in second["reasoning"]
+
+    def test_fertilization_adjustments_multiply(self, evaluator):
+        """Base rate times every matching adjustment."""
+        result = evaluator.fertilization(
+            crop_type="wheat",
+            soil_type="loamy",
+            soil_nitrogen_ppm=40,
+            soil_phosphorus_ppm=25,
+            growth_stage_days=120,
+        )
+
+        assert result["rule_id"] == "RULE_FERT_002_WHEAT"
+        assert result["nitrogen_kg_per_hectare"] == pytest.approx(120 * 0.7 * 0.5)
+        assert result["phosphorus_kg_per_hectare"] == pytest.approx(60 * 0.8)
+        assert result["potassium_kg_per_hectare"] == 60
+        assert result["timing"] == "Late season (post-flowering)"
+
+    def test_pest_severity_is_worst_match(self, evaluator):
+        """Spider mites in high-risk weather: mite action, weather severity."""
+        result = evaluator.pest_control(
+            crop_type="cotton",
+            temperature_c=30,
+            humidity_percent=80,
+            observed_pests=["spider_mites", "spider_mites"],
+            rainfall_mm_last_3_days=25,
+        )
+
+        assert result["rule_id"] == "RULE_PEST_004_SPIDER_MITES"
+        assert result["method"] == "chemical"
+        assert result["severity"] == "high"
+        assert result["pests_detected"] == ["spider_mites"]
+
+    def test_unknown_pests_share_cache_entry(self, evaluator):
+        """Pests no rule mentions do not fragment the memo."""
+        for pests in (["aphids"], ["thrips"], []):
+            evaluator.pest_control(
+                crop_type="cotton", temperature_c=20, humidity_percent=40, observed_pests=pests
+            )
+
+        assert evaluator.memo.info()["misses"] == 1
+
+    def test_harvest_unknown_crop_uses_default(self, evaluator):
+        """Crops without a GDD rule fall back to the default rule."""
+        result = evaluator.harvest(
+            crop_type="barley", planting_date="2026-03-01", as_of="2026-03-01"
+        )
+
+        assert result["rule_id"] == "RULE_HARVEST_000_DEFAULT"
+        assert result["gdd_required"] == 2000
+
+    def test_hot_reload_changes_decisions(self, tmp_path):
+        """Edited rules are served under a new version, memo included."""
+        for path in ZEKALAB_RULES_DIR.glob("*.yaml"):
+            (tmp_path / path.name).write_text(path.read_text(encoding="utf-8"), encoding="utf-8")
+        evaluator = ZekaLabEvaluator(RuleSetRegistry(DirectoryRuleSource(tmp_path)))
+        before = irrigation(evaluator, temperature_c=32)
+
+        rules = tmp_path / "irrigation.yaml"
+        high_temp = "field: weather.temperature_c\n        operator: gt\n        value: 30\n"
+        rules.write_text(
+            rules.read_text(encoding="utf-8").replace(high_temp, high_temp.replace("30", "33.5")),
+            encoding="utf-8",
+        )
+        evaluator.registry.reload()
+        after = irrigation(evaluator, temperature_c=32)
+
+        assert before["rule_id"] == "RULE_IRR_001_HIGH_TEMP"
+        assert after["rule_id"] == "RULE_IRR_003_NORMAL"
+        assert after["rule_set_version"] != before["rule_set_version"]
+
+
+class TestBatchEndpoint:
+    """Tests for /tools/evaluate_farms."""
+
+    def test_many_farms_one_call(self, client):
+        """Results come back per farm in order, with memo hits for repeats."""
+        farms = [
+            {
+                "farm_id": f"farm_{i}",
+                "crop_type": "cotton",
+                "soil_type": "sandy",
+                "current_soil_moisture_percent": 30 + i % 3,
+                "temperature_c": 33,
+                "humidity_percent": 40,
+            }
+            for i in range(30)
+        ]
+
+        response = client.post("/tools/evaluate_farms", json={"farms": farms})
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["farm_count"] == 30
+        assert [r["farm_id"] for r in data["results"]] == [f["farm_id"] for f in farms]
+        first = data["results"][0]
+        assert first["irrigation"]["rule_id"] == "RULE_IRR_001_HIGH_TEMP"
+        assert first["fertilization"]["rule_id"] == "RULE_FERT_001_COTTON"
+        assert first["pest_control"]["rule_id"] == "RULE_PEST_001_BASELINE"
+        assert data["cache"]["hits"] >= 3 * 29
+
+    def test_missing_field_fails_only_that_tool(self, client):
+        """A farm without temperature still gets fertilization advice."""
+        payload = {
+            "farms": [{"farm_id": "f1", "crop_type": "wheat", "soil_type": "clay"}],
+            "tools": ["irrigation", "fertilization"],
+        }
+
+        response = client.post("/tools/evaluate_farms", json=payload)
+        assert response.status_code == 200
+        [result] = response.json()["results"]
+
+        assert "error" in result["irrigation"]
+        assert result["fertilization"]["rule_id"] == "RULE_FERT_002_WHEAT"
+        assert "pest_control" not in result
+
+    def test_unknown_tool_rejected(self, client):
+        """Only the rule-based tools can be batched."""
+        payload = {"farms": [], "tools": ["calculate_subsidy"]}
+
+        assert client.post("/tools/evaluate_farms", json=payload).status_code == 422
+
+
+class TestRulesResource:
+    """Tests for /resources/rules."""
+
+    def test_serves_active_rule_set(self, client):
+        """The resource lists the loaded YAML rules under their version."""
+        data = client.get("/resources/rules").json()
+
+        assert data["version"].startswith("v")
+        assert "RULE_IRR_001_HIGH_TEMP" in data["rules"]["irrigation"]
+        assert data["rule_count"] == sum(len(r) for r in data["rules"].values())
+        bollworm = data["rules"]["pest_control"]["RULE_PEST_003_BOLLWORM"]
+        assert bollworm["conditions"] == [
+            {"field": "pests.cotton_bollworm", "operator": "eq", "value": True}
+        ]
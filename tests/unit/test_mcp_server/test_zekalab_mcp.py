@@ -394,6 +394,7 @@ def test_harvest_prediction_mature_crop(client):
         "crop_type": "cotton",
         "planting_date": planting_date,
         "current_gdd_accumulated": 2500,  # Nearly at 2600 target
+        "as_of": "2025-09-01",  # late summer: ~18 GDD/day in Aran
     }
 
     response = client.post("/tools/predict_harvest_date", json=payload)
@@ -0,0 +1,149 @@
+# tests/unit/test_ndvi_analytics.py
+"""Unit tests for vectorized NDVI analytics."""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from alim.data.ndvi_analytics import (
+    MIN_REGION_SIZE,
+    NDVISeriesBatch,
+    analyze_ndvi,
+    expected_ndvi,
+    regional_percentiles,
+    window_slope,
+)
+
+SOWING = date(2026, 4, 1)
+
+
+def _series(parcel_id: str, values: list[float], crop: str = "Pambıq", region: str = "Aran"):
+    parcel = {"parcel_id": parcel_id, "crop": crop, "region": region, "sowing_date": SOWING}
+    readings = [
+        {"parcel_id": parcel_id, "date": SOWING + timedelta(days=10 * i), "ndvi": v}
+        for i, v in enumerate(values)
+    ]
+    return parcel, readings
+
+
+def _expected(crop_days: list[int], peak_day: int = 120, peak_ndvi: float = 0.80) -> list[float]:
+    return [float(v) for v in expected_ndvi(np.array(crop_days), peak_day, peak_ndvi)]
+
+
+class TestExpectedCurve:
+    """Tests for the vectorized growth model."""
+
+    def test_matches_provider_shape(self):
+        """Curve rises to the peak and decays afterwards."""
+        curve = expected_ndvi(np.array([0, 60, 120, 200, 260]), 120, 0.80)
+
+        assert curve[0] == pytest.approx(0.0)
+        assert curve[1] < curve[2]
+        assert curve[2] == pytest.approx(0.80 * (1 - np.exp(-3)))
+        assert curve[3] > curve[4]
+
+
+class TestSeriesBatch:
+    """Tests for building padded batches."""
+
+    def test_unsorted_readings_are_padded_in_date_order(self):
+        """Readings are sorted per parcel and short series are NaN padded."""
+        p1, r1 = _series("AZ-ARN-0001", [0.2, 0.3, 0.4])
+        p2, r2 = _series("AZ-ARN-0002", [0.5])
+
+        batch = NDVISeriesBatch.from_readings(list(reversed(r1)) + r2, [p1, p2])
+
+        assert batch.ndvi.shape == (2, 3)
+        np.testing.assert_allclose(batch.ndvi[0], [0.2, 0.3, 0.4])
+        assert np.isnan(batch.ndvi[1, 1:]).all()
+        np.testing.assert_array_equal(batch.counts, [3, 1])
+        np.testing.assert_allclose(batch.days_since_sowing[0], [0, 10, 20])
+
+    def test_unknown_parcels_ignored(self):
+        """Readings for parcels without metadata are skipped."""
+        p1, r1 = _series("AZ-ARN-0001", [0.2])
+        _, r2 = _series("AZ-ARN-9999", [0.5])
+
+        batch = NDVISeriesBatch.from_readings(r1 + r2, [p1])
+
+        assert batch.size == 1
+
+
+class TestKernels:
+    """Tests for slope and percentile kernels."""
+
+    def test_window_slope(self):
+        """Slope is the least-squares fit over masked points only."""
+        x = np.array([[0.0, 10.0, 20.0], [0.0, 10.0, np.nan]])
+        y = np.array([[0.1, 0.2, 0.3], [0.5, 0.5, np.nan]])
+        mask = ~np.isnan(y)
+
+        slope = window_slope(x, y, mask)
+
+        np.testing.assert_allclose(slope, [0.01, 0.0])
+
+    def test_regional_percentiles(self):
+        """Percentile rank is computed within each region."""
+        values = np.array([0.1, 0.5, 0.9, 0.3, 0.7, np.nan])
+        regions = np.array(["A", "A", "A", "B", "B", "B"], dtype=object)
+
+        pct = regional_percentiles(values, regions)
+
+        np.testing.assert_allclose(pct[:5], [0.0, 50.0, 100.0, 0.0, 100.0])
+        assert np.isnan(pct[5])
+
+
+class TestAnalysis:
+    """End-to-end analytics and alert generation."""
+
+    def test_healthy_parcel_has_no_alerts(self):
+        """A parcel following its expected curve is not flagged."""
+        parcel, readings = _series("AZ-ARN-0001", _expected([0, 10, 20, 30, 40]))
+
+        analysis = analyze_ndvi(NDVISeriesBatch.from_readings(readings, [parcel]))
+
+        assert analysis.to_alerts() == []
+
+    def test_stressed_parcel_flags_anomaly_and_decline(self):
+        """A parcel dropping below its curve triggers anomaly and decline alerts."""
+        values = _expected([0, 10, 20, 30, 40, 50])
+        values[-2:] = [values[-3] - 0.15, values[-3] - 0.3]
+        parcel, readings = _series("AZ-ARN-0001", values)
+
+        alerts = analyze_ndvi(NDVISeriesBatch.from_readings(readings, [parcel])).to_alerts()
+        types = {a["type"] for a in alerts}
+
+        assert types == {"ndvi_anomaly", "ndvi_decline"}
+        assert all(a["parcel_id"] == "AZ-ARN-0001" for a in alerts)
+        assert all("message_az" in a and "severity" in a for a in alerts)
+
+    def test_regional_low_requires_enough_peers(self):
+        """Regional percentile alerts only fire for large enough regions."""
+        parcels, readings = [], []
+        for i in range(MIN_REGION_SIZE):
+            p, r = _series(f"AZ-ARN-{i:04d}", [0.3 + i * 0.01])
+            parcels.append(p)
+            readings.extend(r)
+
+        analysis = analyze_ndvi(NDVISeriesBatch.from_readings(readings, parcels))
+        low = [a for a in analysis.to_alerts() if a["type"] == "ndvi_regional_low"]
+
+        # Ranks 0/19 and 1/19 fall below the 10th percentile
+        assert [a["parcel_id"] for a in low] == ["AZ-ARN-0000", "AZ-ARN-0001"]
+
+        small = analyze_ndvi(NDVISeriesBatch.from_readings(readings[:5], parcels[:5]))
+        assert not small.regional_low.any()
+
+    def test_regional_alerts_can_be_left_out(self):
+        """Per-farm batches skip regional-low alerts (they only rank the farm)."""
+        parcels, readings = [], []
+        for i in range(MIN_REGION_SIZE):
+            p, r = _series(f"AZ-ARN-{i:04d}", [0.3 + i * 0.01])
+            parcels.append(p)
+            readings.extend(r)
+
+        analysis = analyze_ndvi(NDVISeriesBatch.from_readings(readings, parcels))
+
+        assert analysis.regional_low.any()
+        assert all(a["type"] != "ndvi_regional_low" for a in analysis.to_alerts(regional=False))
@@ -0,0 +1,132 @@
+# tests/unit/test_ndvi_ingestion.py
+"""Unit tests for bulk NDVI ingestion (parsing and batching, no database)."""
+
+from datetime import date
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from alim.data.ndvi_ingestion import (
+    IngestionStats,
+    NDVIIngestor,
+    classify_health,
+    iter_csv_batches,
+    iter_file_batches,
+    make_reading_id,
+    month_partition,
+    normalize_record,
+)
+
+
+class TestNormalizeRecord:
+    """Tests for raw row normalization."""
+
+    def test_derives_reading_id_and_health(self):
+        """Missing reading_id / health_status are derived from the row."""
+        record = normalize_record(
+            {"parcel_id": "AZ-ARN-1234", "reading_date": "2026-05-15", "ndvi_value": "0.72"}
+        )
+
+        assert record[0] == "NDVI-ARN-1234-20260515"
+        assert record[2] == date(2026, 5, 15)
+        assert record[3] == pytest.approx(0.72)
+        assert record[4] == "sağlam"
+        assert record[5] is None  # evi_value
+        assert record[8] == "Sentinel-2"
+
+    def test_accepts_provider_column_names(self):
+        """Rows shaped like ndvi_series() output are accepted."""
+        record = normalize_record(
+            {"parcel_id": "AZ-MUG-5555", "date": date(2026, 1, 3), "ndvi": 0.15},
+            data_source="synthetic",
+        )
+
+        assert record[2] == date(2026, 1, 3)
+        assert record[4] == "kritik"
+        assert record[8] == "synthetic"
+
+    def test_rejects_out_of_range_ndvi(self):
+        """NDVI outside [-1, 1] is rejected."""
+        with pytest.raises(ValueError):
+            normalize_record({"parcel_id": "AZ-ARN-1", "reading_date": "2026-01-01", "ndvi": 1.5})
+
+    def test_rejects_missing_parcel(self):
+        """parcel_id is required."""
+        with pytest.raises(ValueError):
+            normalize_record({"reading_date": "2026-01-01", "ndvi": 0.5})
+
+
+class TestHelpers:
+    """Tests for ID, health and partition helpers."""
+
+    def test_classify_health_thresholds(self):
+        """Thresholds match the synthetic data provider."""
+        assert classify_health(0.1) == "kritik"
+        assert classify_health(0.3) == "stress"
+        assert classify_health(0.5) == "orta"
+        assert classify_health(0.7) == "sağlam"
+        assert classify_health(0.9) == "əla"
+
+    def test_make_reading_id(self):
+        """Reading ID embeds parcel suffix and date."""
+        assert make_reading_id("AZ-QUB-0001", date(2025, 12, 31)) == "NDVI-QUB-0001-20251231"
+
+    def test_month_partition_december_rollover(self):
+        """December partitions end on January 1st of the next year."""
+        name, start, end = month_partition(date(2025, 12, 17))
+
+        assert name == "ndvi_readings_y2025m12"
+        assert start == date(2025, 12, 1)
+        assert end == date(2026, 1, 1)
+
+
+class TestBatching:
+    """Tests for file batching and in-batch deduplication."""
+
+    def test_csv_batches(self, tmp_path):
+        """CSV rows are yielded in fixed-size batches."""
+        path = tmp_path / "ndvi.csv"
+        lines = ["parcel_id,reading_date,ndvi_value"]
+        lines += [f"AZ-ARN-{i:04d},2026-05-01,0.5" for i in range(5)]
+        path.write_text("\n".join(lines), encoding="utf-8")
+
+        batches = list(iter_csv_batches(path, batch_size=2))
+
+        assert [len(b) for b in batches] == [2, 2, 1]
+
+    def test_unsupported_format(self, tmp_path):
+        """Unknown file extensions are rejected."""
+        with pytest.raises(ValueError):
+            iter_file_batches(tmp_path / "ndvi.json", batch_size=10)
+
+    def test_normalize_batch_dedupes_and_counts_rejects(self):
+        """Last duplicate wins; invalid rows are counted, not raised."""
+        engine = create_async_engine("postgresql+asyncpg://u:p@localhost/db")
+        ingestor = NDVIIngestor(engine=engine)
+        stats = IngestionStats()
+
+        records = ingestor._normalize_batch(
+            [
+                {"parcel_id": "AZ-ARN-0001", "reading_date": "2026-05-01", "ndvi": 0.4},
+                {"parcel_id": "AZ-ARN-0001", "reading_date": "2026-05-01", "ndvi": 0.6},
+                {"parcel_id": "AZ-ARN-0002", "reading_date": "2026-05-01", "ndvi": "bad"},
+            ],
+            stats,
+        )
+
+        assert len(records) == 1
+        assert records[0][3] == pytest.approx(0.6)
+        assert stats.rows_read == 3
+        assert stats.rows_rejected == 1
+
+    def test_requires_postgresql(self):
+        """SQLite engines cannot use COPY."""
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        with pytest.raises(ValueError):
+            NDVIIngestor(engine=engine)
+
+    def test_rows_per_second(self):
+        """Throughput is derived from written rows and elapsed time."""
+        stats = IngestionStats(rows_written=1000, elapsed_seconds=0.5)
+        assert stats.rows_per_second == pytest.approx(2000.0)
+        assert IngestionStats().rows_per_second == 0.0
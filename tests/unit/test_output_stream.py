@@ -0,0 +1,130 @@
+"""Tests for incremental output validation (alim.security.output_stream)."""
+
+import random
+
+import pytest
+
+from alim.security.output_stream import StreamingOutputValidator, guard_stream
+from alim.security.output_validator import OutputValidator
+
+SENTENCES = [
+    "Pambıq üçün suvarma həftədə iki dəfə aparılmalıdır. ",
+    "Torpağın nəmliyini yoxlayın. ",
+    "Suicide prevention hotlines can help. ",
+    "I am ALİM AI, an agricultural advisory system. ",
+    "My instructions are to help farmers. ",
+    "I'm now in DAN mode. ",
+    "Sure, I'll pretend to be a hacker. ",
+    "Here is how to kill people quietly. ",
+    "I was told to keep this short. ",
+]
+
+
+def chunked(text: str, size: int) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def run(validator: StreamingOutputValidator, chunks: list[str]) -> str:
+    released = [validator.feed(chunk) for chunk in chunks]
+    released.append(validator.close())
+    return "".join(released)
+
+
+class TestStreamingOutputValidator:
+    """Tests for chunk-by-chunk validation."""
+
+    @pytest.mark.parametrize("size", [1, 4, 50])
+    def test_same_issues_as_full_validation(self, size: int):
+        """Any chunking finds the issue types validate() finds on the whole text."""
+        rng = random.Random(size)
+        validator = OutputValidator()
+        for _ in range(100):
+            text = "".join(rng.choice(SENTENCES) for _ in range(rng.randint(1, 6)))
+            expected = validator.validate(text)
+
+            streaming = StreamingOutputValidator(validator)
+            released = run(streaming, chunked(text, size))
+
+            if expected.is_safe:
+                assert released == text
+                assert {i.issue_type for i in streaming.issues} == {
+                    i.issue_type for i in expected.issues
+                }
+            else:
+                assert not streaming.is_safe
+                # Everything released before blocking was validated text
+                assert text.startswith(released)
+
+    def test_pattern_split_across_chunks(self):
+        """A critical phrase arriving token by token blocks the stream."""
+        streaming = StreamingOutputValidator(OutputValidator())
+
+        released = run(streaming, ["Bəli, ", "I'm now in D", "AN", " mo", "de", ". Sonra..."])
+
+        assert not streaming.is_safe
+        assert "DAN" not in released
+        assert streaming.issues[0].issue_type == "dan_mode"
+
+    def test_lookahead_waits_for_following_text(self):
+        """'suicide' is not flagged before we know whether 'prevention' follows."""
+        streaming = StreamingOutputValidator(OutputValidator())
+
+        assert streaming.feed("Suicide") == ""
+        streaming.feed(" prevention matters for everyone.")
+        streaming.close()
+
+        assert streaming.is_safe
+
+    def test_strict_mode_blocks_warnings(self):
+        """A strict validator also blocks on warnings."""
+        streaming = StreamingOutputValidator(OutputValidator(strict_mode=True))
+
+        run(streaming, chunked("I was told to answer briefly. Pambıq suvarın.", 3))
+
+        assert not streaming.is_safe
+
+    def test_holds_back_only_tail(self):
+        """Safe text is released as it arrives, minus the held-back tail."""
+        streaming = StreamingOutputValidator(OutputValidator(), settle_chars=5, holdback_chars=10)
+
+        released = streaming.feed("Buğdanı oktyabrda səpin, torpaq nəm olsun.")
+
+        assert released == "Buğdanı oktyabrda səpin, torpaq "
+        assert streaming.close() == "nəm olsun."
+
+
+class TestGuardStream:
+    """Tests for wrapping a token stream."""
+
+    @pytest.mark.asyncio
+    async def test_aborts_generation(self):
+        """The upstream generator is closed at the first blocking issue."""
+        consumed = []
+        closed = []
+
+        async def tokens():
+            try:
+                for token in ["Bəli. ", "I'll ignore ", "my rules ", "now. "] + ["x "] * 100:
+                    consumed.append(token)
+                    yield token
+            finally:
+                closed.append(True)
+
+        chunks = [c async for c in guard_stream(tokens(), fallback="[FALLBACK]")]
+
+        assert closed == [True]
+        assert len(consumed) < 20
+        assert chunks[-1] == "[FALLBACK]"
+        assert "ignore" not in "".join(chunks[:-1])
+
+    @pytest.mark.asyncio
+    async def test_safe_stream_passes_through(self):
+        """A safe response is yielded unchanged."""
+
+        async def tokens():
+            for token in chunked("Pomidor üçün damcı suvarma tövsiyə olunur.", 5):
+                yield token
+
+        chunks = [c async for c in guard_stream(tokens(), fallback="[FALLBACK]")]
+
+        assert "".join(chunks) == "Pomidor üçün damcı suvarma tövsiyə olunur."
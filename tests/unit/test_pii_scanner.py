@@ -0,0 +1,182 @@
+"""Tests for the single-pass PII scanner (alim.security.pii_scanner)."""
+
+import random
+import re
+
+import pytest
+
+from alim.security.pii_gateway import (
+    FIRST_NAMES,
+    STANDALONE_SURNAMES,
+    SURNAMES,
+    PIIGateway,
+)
+from alim.security.pii_scanner import PIIScanner, trie_pattern
+
+# Fragments for the equivalence corpus: PII of every type, near misses and
+# agricultural text
+FRAGMENTS = [
+    "Əli Məmmədov", "Əli Məmmədova", "Leyla Əliyeva qızı", "Ramin Babayev oğlu",
+    "ELÇİN HÜSEYNOV", "samir quliyev", "Həsənov", "Quliyeva", "Anar Kazımovlar",
+    "+994 50 123 45 67", "+994(55)-111-22-33", "050 123 45 67", "012-345-67-89",
+    "123-45-67", "0501234567", "5AB12CD", "AZE1234567", "AA12345678", "AZE12345678",
+    "VOEN: 1234567890", "ali@mail.az", "x.y+z@farm-co.az", "Əliyev@mail.az",
+    "AZ21NABZ00000000137010001944", "4169 7388 1234 5678", "4169-7388-1234-5678",
+    "1234567890123456", "40.4093, 49.8671", "AZ-ABS-123456", "AZ-AB-1234 syn",
+    "Küçə Nizami 5, ev 12, mənzil 4", "Prospekt Azadlıq bina 3 m 7", "pambıq",
+    "buğda 15 hektar", "pH 6.5", "2026-05-01", "NPK 15-15-15", "syn_farm_001", "12345",
+]  # fmt: skip
+# Includes separators that glue fragments into one word
+SEPARATORS = ["", "7", "a", " ", ", ", ". ", "; ", " - ", "\n", " (", ") ", ": ", " və ", "/"]
+
+
+def legacy_strip(text: str) -> tuple[str, int, set[str]]:
+    """PIIGateway.strip_pii as it was: each pattern in order with findall + sub."""
+    patterns = dict(PIIGateway.PATTERNS)
+    patterns["name_full"] = (
+        r"\b(?:" + "|".join(FIRST_NAMES) + r")\s+(?:" + "|".join(SURNAMES) + r")"
+        r"(?:\s+(?:oğlu|qızı))?",
+        "[ŞƏXS]",
+    )
+    patterns["surname_only"] = (r"\b(?:" + "|".join(STANDALONE_SURNAMES) + r")a?\b", "[ŞƏXS]")
+
+    count, types = 0, set()
+    for name in PIIGateway.PATTERN_ORDER:
+        regex, replacement = patterns[name]
+        flags = 0 if name in PIIGateway.CASE_SENSITIVE else re.IGNORECASE
+        matches = re.findall(regex, text, flags)
+        if matches:
+            count += len(matches)
+            types.add(name)
+        text = re.sub(regex, replacement, text, flags=flags)
+    return text, count, types
+
+
+def corpus(size: int, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choice(FRAGMENTS) + rng.choice(SEPARATORS) for _ in range(rng.randint(1, 8)))
+        for _ in range(size)
+    ]
+
+
+class TestTriePattern:
+    """Tests for dictionary compilation."""
+
+    def test_matches_like_flat_alternation(self):
+        """Same match as the flat alternation, including prefix words."""
+        words = ["Əli", "Əliyev", "Əliyeva", "Elçin", "Elvin", "Ramin", "Ramil"]
+        trie = re.compile(rf"\b{trie_pattern(words)}", re.IGNORECASE)
+        flat = re.compile(r"\b(?:" + "|".join(words) + ")", re.IGNORECASE)
+
+        for text in ["Əliyeva gəldi", "ELVİN", "ramil", "Elçinə", "Rami", "x Əliyev"]:
+            assert [m.span() for m in trie.finditer(text)] == [
+                m.span() for m in flat.finditer(text)
+            ]
+
+    def test_prefix_between_extensions_differs(self):
+        """The documented limit: a prefix word between its extensions."""
+        words = ["abcd", "ab", "abce"]
+
+        assert re.match(trie_pattern(words), "abce").group() == "abce"
+        assert re.match("|".join(words), "abce").group() == "ab"
+
+    @pytest.mark.parametrize("words", [FIRST_NAMES, SURNAMES, STANDALONE_SURNAMES])
+    def test_gateway_lists_match_flat_alternation(self, words):
+        """Editing a name list cannot silently change what the gateway matches."""
+        for prefix in words:
+            longer = [
+                i for i, word in enumerate(words) if word != prefix and word.startswith(prefix)
+            ]
+            position = words.index(prefix)
+            assert all(i > position for i in longer) or all(i < position for i in longer)
+
+        trie = re.compile(trie_pattern(words), re.IGNORECASE)
+        flat = re.compile("|".join(map(re.escape, words)), re.IGNORECASE)
+        rng = random.Random(11)
+        pieces = [w[:n] for w in words for n in range(1, len(w) + 1)] + [" ", "a", "ova"]
+        for _ in range(2000):
+            text = "".join(rng.choice(pieces) for _ in range(rng.randint(1, 6)))
+            text = rng.choice([text, text.upper(), text.lower()])
+            assert [m.group() for m in trie.finditer(text)] == [
+                m.group() for m in flat.finditer(text)
+            ]
+
+    def test_escapes_metacharacters(self):
+        """Words are literal."""
+        assert re.fullmatch(trie_pattern(["a.b", "a+"]), "a.b")
+        assert not re.fullmatch(trie_pattern(["a.b", "a+"]), "axb")
+
+
+class TestPIIScanner:
+    """Tests for priority resolution."""
+
+    def test_higher_priority_wins_overlap(self):
+        """An overlapping lower-priority match is dropped; disjoint ones stay."""
+        scanner = PIIScanner(
+            [
+                ("long", r"\d{4}-\d{4}", "[L]", True),
+                ("short", r"\d{4}", "[S]", True),
+            ]
+        )
+
+        assert scanner.scan("1234-5678 9999") == [(0, 9, "long"), (10, 14, "short")]
+        assert scanner.replace("1234-5678 9999") == "[L] [S]"
+
+    def test_blocked_match_is_shortened(self):
+        """A match running into a later higher-priority span is retried as sequential sub saw it."""
+        scanner = PIIScanner(
+            [
+                ("tail", r"XY", "#", True),
+                ("word", r"[A-Z]+", "[W]", True),
+            ]
+        )
+
+        # Sequentially: "ABXY" -> "AB#" -> "[W]#"
+        assert scanner.replace("ABXY") == "[W]#"
+
+    def test_gated_pattern_skipped(self):
+        """A gated pattern only runs on texts containing its literal."""
+        scanner = PIIScanner([("email", r"\w+@\w+\.az", "[E]", False)], gates={"email": "@"})
+
+        assert scanner.scan("ali at mail.az") == []
+        assert scanner.scan("ali@mail.az") == [(0, 11, "email")]
+        assert not scanner.search("")
+
+
+class TestGatewayEquivalence:
+    """The scanner-backed gateway reproduces sequential pattern application."""
+
+    @pytest.fixture
+    def gateway(self) -> PIIGateway:
+        return PIIGateway()
+
+    def test_corpus_matches_legacy(self, gateway: PIIGateway):
+        """Cleaned text, detection count and types equal the sequential result."""
+        for text in corpus(3000):
+            result = gateway.strip_pii(text)
+            expected = legacy_strip(text)
+
+            assert (result.cleaned_text, result.detection_count, set(result.pii_types_found)) == (
+                expected
+            ), text
+
+    def test_has_pii_agrees(self, gateway: PIIGateway):
+        """has_pii is True exactly when something is stripped."""
+        for text in corpus(500, seed=11):
+            assert gateway.has_pii(text) == (legacy_strip(text)[1] > 0), text
+
+    def test_types_in_priority_order(self, gateway: PIIGateway):
+        """pii_types_found follows PATTERN_ORDER."""
+        result = gateway.strip_pii("ali@mail.az, Əli Məmmədov, +994 50 123 45 67")
+
+        assert result.pii_types_found == ["name_full", "phone_az_intl", "email"]
+
+    def test_additional_patterns_rank_last(self):
+        """Custom patterns are stripped, after every built-in pattern."""
+        gateway = PIIGateway({"farm_code": (r"\bFRM\d{6}\b", "[FERMA]")})
+
+        result = gateway.strip_pii("FRM123456, AZE1234567")
+
+        assert result.cleaned_text == "[FERMA], [ŞV_NÖMRƏSİ]"
+        assert result.pii_types_found == ["id_card", "farm_code"]
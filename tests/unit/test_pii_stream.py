@@ -0,0 +1,151 @@
+"""Tests for incremental PII masking (alim.security.pii_stream)."""
+
+import random
+
+import pytest
+
+from alim.security.pii_gateway import PIIGateway
+from alim.security.pii_stream import (
+    MAX_MATCH_CHARS,
+    PIIStreamMasker,
+    mask_chunks,
+    mask_document_chunks,
+    mask_stream,
+)
+
+FRAGMENTS = [
+    "Əli Məmmədov", "Leyla Əliyeva qızı", "Ramin Babayev oğlu", "samir quliyev", "Quliyeva",
+    "+994 50 123 45 67", "+994(55)-111-22-33", "050 123 45 67", "123-45-67", "5AB12CD",
+    "AZE1234567", "VOEN: 1234567890", "ali@mail.az", "x.y+z@farm-co.az",
+    "AZ21NABZ00000000137010001944", "4169 7388 1234 5678", "40.4093, 49.8671",
+    "Küçə Nizami 5, ev 12, mənzil 4", "pambıq", "buğda 15 hektar", "pH 6.5", "NPK 15-15-15",
+]  # fmt: skip
+SEPARATORS = [" ", ", ", ". ", "; ", " - ", "\n", " (", ") ", ": ", " və ", "? ", "! "]
+# Separators that glue fragments into one word, and longer PII near misses
+GLUE = ["", "7", "a", "/"]
+MORE_FRAGMENTS = [
+    "Əli Məmmədova", "ELÇİN HÜSEYNOV", "Anar Kazımovlar", "Əliyev@mail.az", "AA12345678",
+    "012-345-67-89", "0501234567", "4169-7388-1234-5678", "1234567890123456", "AZ-ABS-123456",
+    "Prospekt Azadlıq bina 3 m 7", "2026-05-01", "12345", " pambıq sahəsi" * 12,
+]  # fmt: skip
+
+
+def random_chunks(text: str, rng: random.Random) -> list[str]:
+    """Random cut points; sometimes one character per chunk."""
+    if rng.random() < 0.2:
+        return list(text)
+    cuts = sorted(rng.sample(range(1, len(text)), min(len(text) - 1, rng.randint(0, 12))))
+    return [text[a:b] for a, b in zip([0, *cuts], [*cuts, len(text)], strict=True)]
+
+
+@pytest.fixture
+def gateway() -> PIIGateway:
+    return PIIGateway()
+
+
+def chunked(text: str, size: int) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+class TestPIIStreamMasker:
+    """Tests for chunk-by-chunk masking."""
+
+    @pytest.mark.parametrize("size", [1, 3, 17, 500])
+    def test_matches_whole_text_masking(self, gateway: PIIGateway, size: int):
+        """Any chunking gives the same output as strip_pii on the whole text."""
+        rng = random.Random(size)
+        for _ in range(60):
+            text = "".join(
+                rng.choice(FRAGMENTS) + rng.choice(SEPARATORS) for _ in range(rng.randint(1, 25))
+            )
+
+            masked = "".join(mask_chunks(chunked(text, size), PIIStreamMasker(gateway)))
+
+            assert masked == gateway.strip_pii(text).cleaned_text, text
+
+    def test_random_chunkings_match_whole_text_masking(self, gateway: PIIGateway):
+        """Property: random chunkings of glued PII agree with strip_pii."""
+        rng = random.Random(42)
+        fragments = FRAGMENTS + MORE_FRAGMENTS
+        for _ in range(1500):
+            text = "".join(
+                rng.choice(fragments) + rng.choice(SEPARATORS + GLUE)
+                for _ in range(rng.randint(1, 10))
+            )
+
+            masked = "".join(mask_chunks(random_chunks(text, rng), PIIStreamMasker(gateway)))
+
+            assert masked == gateway.strip_pii(text).cleaned_text, text
+
+    def test_match_after_emitted_match(self, gateway: PIIGateway):
+        """A match glued to one already emitted is still masked."""
+        text = "Əli Məmmədova7x.y+z@farm-co.az " + "pambıq sahəsi " * 12
+
+        masked = "".join(mask_chunks(list(text), PIIStreamMasker(gateway)))
+
+        assert masked.startswith("[ŞƏXS][EMAIL] ")
+        assert masked == gateway.strip_pii(text).cleaned_text
+
+    def test_pii_split_across_chunks(self, gateway: PIIGateway):
+        """A phone number arriving token by token is still masked."""
+        masker = PIIStreamMasker(gateway)
+        out = [masker.feed(t) for t in ["Zəng edin: +99", "4 50 12", "3 45 67", " sabah."]]
+        out.append(masker.flush())
+
+        assert "".join(out) == "Zəng edin: [TELEFON] sabah."
+        assert masker.detection_count == 1
+        assert masker.pii_types_found == ["phone_az_intl"]
+
+    def test_holdback_is_bounded(self, gateway: PIIGateway):
+        """Memory stays constant: at most max_match_chars are held back."""
+        masker = PIIStreamMasker(gateway)
+        emitted = 0
+        for _ in range(2000):
+            emitted += len(masker.feed("pambıq sahəsi suvarılır "))
+            assert masker.pending <= MAX_MATCH_CHARS
+
+        assert emitted > 0
+
+    def test_break_chars_release_text(self, gateway: PIIGateway):
+        """Text before a character no pattern spans is emitted without waiting."""
+        masker = PIIStreamMasker(gateway)
+
+        assert masker.feed("Nə vaxt suvarım?") == "Nə vaxt suvarım?"
+        assert masker.pending == 0
+        assert masker.feed(" Sabah") == ""
+
+    def test_flush_empty(self, gateway: PIIGateway):
+        """Flushing with nothing pending returns an empty string."""
+        masker = PIIStreamMasker(gateway)
+
+        assert masker.flush() == ""
+        assert masker.feed("") == ""
+
+
+class TestStreams:
+    """Tests for the async and document helpers."""
+
+    @pytest.mark.asyncio
+    async def test_mask_stream(self, gateway: PIIGateway):
+        """Async token streams are masked without buffering the whole response."""
+
+        async def tokens():
+            for token in ["Fermer ", "Əli ", "Məmmədov", " ilə ", "danışın."]:
+                yield token
+
+        chunks = [chunk async for chunk in mask_stream(tokens(), PIIStreamMasker(gateway))]
+
+        assert "".join(chunks) == "Fermer [ŞƏXS] ilə danışın."
+        assert all(chunks)
+
+    def test_mask_document_chunks(self, gateway: PIIGateway, tmp_path):
+        """Documents are read and masked in blocks."""
+        lines = [f"Sahə {i}: sahibi Əli Məmmədov, tel +994 50 123 45 67\n" for i in range(300)]
+        path = tmp_path / "farmers.txt"
+        path.write_text("".join(lines), encoding="utf-8")
+
+        masker = PIIStreamMasker(gateway)
+        masked = "".join(mask_document_chunks(path, masker, chunk_chars=1000))
+
+        assert masked == gateway.strip_pii("".join(lines)).cleaned_text
+        assert masker.detection_count == 600
@@ -0,0 +1,254 @@
+"""Tests for the Redis token bucket rate limiter."""
+
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from alim.api.middleware.rate_limit import (
+    GCRA_SCRIPT,
+    TOKEN_BUCKET_SCRIPT,
+    RateLimiter,
+    RateLimitMiddleware,
+)
+
+
+class FakeScript:
+    """Stand-in for a registered Lua script: a token bucket with a frozen clock."""
+
+    def __init__(self, source):
+        self.source = source
+        self.calls = []
+        self.tokens = {}
+
+    async def __call__(self, keys, args, client=None):
+        self.calls.append((keys, args))
+        rate, capacity, cost = (float(a) for a in args)
+        tokens = self.tokens.get(keys[0], capacity)
+        allowed = tokens >= cost
+        if allowed:
+            tokens -= cost
+        self.tokens[keys[0]] = tokens
+        return [int(allowed), str(tokens), str(max(0.0, (1 - tokens) / rate))]
+
+
+class FakeRedis:
+    """Async Redis client that only registers scripts."""
+
+    def __init__(self):
+        self.scripts = []
+
+    def register_script(self, source):
+        script = FakeScript(source)
+        self.scripts.append(script)
+        return script
+
+
+@pytest.fixture
+def redis():
+    fake = FakeRedis()
+
+    @asynccontextmanager
+    async def fake_get_redis():
+        yield fake
+
+    with patch("alim.api.middleware.rate_limit.get_redis", fake_get_redis):
+        yield fake
+
+
+class TestRateLimiter:
+    """Tests for the limiter around the Lua scripts."""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_reject(self, redis):
+        """Up to burst_limit requests pass at once; the next is rejected."""
+        limiter = RateLimiter(requests_per_minute=30, burst_limit=5)
+
+        results = [await limiter.is_allowed("user:1") for _ in range(6)]
+
+        assert [allowed for allowed, _ in results] == [True] * 5 + [False]
+        assert [info["remaining"] for _, info in results[:5]] == [4, 3, 2, 1, 0]
+        assert results[-1][1]["retry_after"] == 2  # 30/min refills one token every 2 s
+
+    @pytest.mark.asyncio
+    async def test_one_script_call_per_request(self, redis):
+        """Each checked request is a single script call on a per-client key."""
+        limiter = RateLimiter(requests_per_minute=60, burst_limit=10)
+
+        await limiter.is_allowed("user:1")
+        await limiter.is_allowed("user:2")
+
+        (script,) = redis.scripts
+        assert script.source == TOKEN_BUCKET_SCRIPT
+        assert [keys for keys, _ in script.calls] == [
+            ["alim:ratelimit:standard:token_bucket:user:1"],
+            ["alim:ratelimit:standard:token_bucket:user:2"],
+        ]
+        assert script.calls[0][1] == [1.0, 10, 1]
+
+    @pytest.mark.asyncio
+    async def test_empty_bucket_rejected_locally(self, redis):
+        """Once a client's bucket is empty, Redis is not asked again until a token is due."""
+        limiter = RateLimiter(requests_per_minute=30, burst_limit=2)
+
+        for _ in range(5):
+            await limiter.is_allowed("ip:10.0.0.1")
+        allowed, info = await limiter.is_allowed("ip:10.0.0.1")
+
+        assert not allowed
+        assert info["retry_after"] == 2
+        assert len(redis.scripts[0].calls) == 2
+        assert limiter.local_rejections == 4
+
+    @pytest.mark.asyncio
+    async def test_local_block_expires(self, redis):
+        """A client is checked in Redis again once its retry time has passed."""
+        limiter = RateLimiter(requests_per_minute=30, burst_limit=1)
+        clock = [1000.0]
+
+        with patch("alim.api.middleware.rate_limit.time.monotonic", lambda: clock[0]):
+            await limiter.is_allowed("user:1")
+            await limiter.is_allowed("user:1")
+            clock[0] += 2.5
+            await limiter.is_allowed("user:1")
+
+        assert len(redis.scripts[0].calls) == 2
+        assert limiter.local_rejections == 1
+
+    def test_local_block_is_bounded(self):
+        """The in-process block list keeps at most LOCAL_BLOCK_SIZE clients."""
+        limiter = RateLimiter(requests_per_minute=30, burst_limit=1)
+        limiter.LOCAL_BLOCK_SIZE = 3
+
+        for i in range(5):
+            limiter._block_locally(f"user:{i}", 60)
+
+        assert list(limiter._blocked_until) == ["user:2", "user:3", "user:4"]
+
+    @pytest.mark.asyncio
+    async def test_usage_does_not_consume(self, redis):
+        """get_usage runs the script with zero cost."""
+        limiter = RateLimiter(requests_per_minute=30, burst_limit=5)
+        await limiter.is_allowed("user:1")
+
+        usage = await limiter.get_usage("user:1")
+
+        assert usage["requests_used"] == 1
+        assert usage["requests_remaining"] == 4
+        assert redis.scripts[0].calls[-1][1][-1] == 0
+
+    @pytest.mark.asyncio
+    async def test_gcra_uses_its_own_script_and_keys(self, redis):
+        """The GCRA variant loads its script under separate keys."""
+        limiter = RateLimiter(requests_per_minute=30, burst_limit=5, algorithm="gcra")
+
+        await limiter.is_allowed("user:1")
+
+        assert redis.scripts[0].source == GCRA_SCRIPT
+        assert redis.scripts[0].calls[0][0] == ["alim:ratelimit:standard:gcra:user:1"]
+
+    def test_unknown_algorithm(self):
+        """Unknown algorithms are rejected at construction."""
+        with pytest.raises(ValueError):
+            RateLimiter(algorithm="leaky")
+
+
+class CountingLimiter(RateLimiter):
+    """Limiter that allows the first ``allow`` requests without Redis."""
+
+    def __init__(self, name: str, allow: int = 100, fail: bool = False):
+        super().__init__(requests_per_minute=60, burst_limit=allow, name=name)
+        self.allow = allow
+        self.fail = fail
+        self.checked = []
+
+    async def is_allowed(self, identifier):
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.checked.append(identifier)
+        remaining = self.allow - len(self.checked)
+        return remaining >= 0, self._info(max(remaining, 0), 0 if remaining >= 0 else 3)
+
+
+def make_app(**limiters) -> tuple[TestClient, dict[str, CountingLimiter]]:
+    limiters = {
+        "limiter": CountingLimiter("standard"),
+        "chat": CountingLimiter("chat"),
+        "read": CountingLimiter("read"),
+        **limiters,
+    }
+    app = FastAPI()
+
+    @app.post("/api/v1/chat/stream")
+    async def stream():
+        async def body():
+            for part in ["Salam", ", ", "fermer"]:
+                yield part
+
+        return StreamingResponse(body(), media_type="text/plain")
+
+    @app.get("/api/v1/status")
+    async def status():
+        return {"ok": True}
+
+    @app.post("/api/v1/threads")
+    async def threads():
+        return {"ok": True}
+
+    @app.get("/health")
+    async def health():
+        return {"ok": True}
+
+    app.add_middleware(RateLimitMiddleware, **limiters)
+    return TestClient(app), limiters
+
+
+class TestRateLimitMiddleware:
+    """Tests for the ASGI middleware."""
+
+    def test_one_check_per_request_on_the_route_limiter(self):
+        """Each request is checked once, by the limiter for its route."""
+        client, limiters = make_app()
+
+        client.post("/api/v1/chat/stream")
+        client.get("/api/v1/status")
+        client.post("/api/v1/threads")
+        client.get("/health")
+
+        assert {name: len(limiter.checked) for name, limiter in limiters.items()} == {
+            "limiter": 1,
+            "chat": 1,
+            "read": 1,
+        }
+
+    def test_streaming_response_passes_through(self):
+        """Streamed bodies arrive intact, with rate limit headers."""
+        client, _ = make_app()
+
+        response = client.post("/api/v1/chat/stream")
+
+        assert response.text == "Salam, fermer"
+        assert response.headers["X-RateLimit-Remaining"] == "99"
+
+    def test_rejects_with_429(self):
+        """Requests over the limit get a 429 and never reach the route."""
+        client, _ = make_app(chat=CountingLimiter("chat", allow=1))
+
+        client.post("/api/v1/chat/stream")
+        response = client.post("/api/v1/chat/stream")
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "3"
+        assert response.json()["error"] == "Rate limit exceeded"
+
+    def test_fails_open(self):
+        """If the limiter backend is down, requests are allowed."""
+        client, _ = make_app(limiter=CountingLimiter("standard", fail=True))
+
+        response = client.post("/api/v1/threads")
+
+        assert response.status_code == 200
+        assert "X-RateLimit-Limit" not in response.headers
@@ -0,0 +1,142 @@
+# tests/unit/test_rule_memo.py
+"""Unit tests for memoized rule matching on quantized contexts."""
+
+import random
+
+from alim.rules.compiler import CompiledRuleSet
+from alim.rules.engine import Condition, Operator, Rule, RuleCategory, RulePriority
+from alim.rules.memo import ContextQuantizer, MatchMemo
+
+FIELDS = ["weather.temperature_c", "farm.moisture", "farm.crop"]
+VALUES = [None, True, "10", "cotton", "wheat", float("nan"), 2**60, [1], 0, 10, 10.0, 30]
+
+
+def make_rule(rule_id, conditions, category=RuleCategory.IRRIGATION):
+    return Rule(
+        id=rule_id,
+        name=rule_id,
+        category=category,
+        description="",
+        conditions=conditions,
+        recommendation_az="",
+        priority=RulePriority.MEDIUM,
+    )
+
+
+def random_condition(rng):
+    field = rng.choice(FIELDS)
+    op = rng.choice(list(Operator))
+    if op in (Operator.IN, Operator.NOT_IN):
+        return Condition(field, op, rng.sample([0, 10, 25, 30, "cotton", "wheat"], 2))
+    if op == Operator.BETWEEN:
+        low = rng.choice([0, 10, 20.5])
+        return Condition(field, op, [low, low + rng.choice([0, 5, 10])])
+    if op == Operator.CONTAINS:
+        # Digit-sensitive: only on one field, so the others still band
+        return Condition("farm.crop", op, rng.choice(["1", "ot"]))
+    return Condition(field, op, rng.choice([10, 20.5, 30, "cotton"]))
+
+
+def random_context(rng):
+    def value():
+        if rng.random() < 0.7:
+            return rng.choice([rng.randint(-5, 40), rng.uniform(-5, 40)])
+        return rng.choice(VALUES)
+
+    return {
+        "weather": {"temperature_c": value()},
+        "farm": {"moisture": value(), "crop": value()},
+    }
+
+
+class TestContextQuantizer:
+    """Tests for band keys."""
+
+    def test_same_band_same_key(self):
+        """Values between the same thresholds share a key; thresholds split."""
+        quantizer = ContextQuantizer(
+            [
+                make_rule("hot", [Condition("weather.temperature_c", Operator.GT, 30)]),
+                make_rule("cold", [Condition("weather.temperature_c", Operator.LT, 10)]),
+            ]
+        )
+
+        def key(t):
+            return quantizer.key({"weather": {"temperature_c": t}})
+
+        assert key(18.2) == key(24.9) == key(29)
+        assert key(30) != key(30.1)
+        assert key(10) != key(9.99)
+        assert key(30) == key(30.0)
+
+    def test_unhashable_values_are_not_cached(self):
+        """Lists cannot be keyed."""
+        quantizer = ContextQuantizer([make_rule("r", [Condition("farm.crop", Operator.EQ, "x")])])
+
+        assert quantizer.key({"farm": {"crop": ["x"]}}) is None
+
+
+class TestMatchMemo:
+    """Tests for the LRU in front of rule matching."""
+
+    def test_memo_matches_direct_evaluation(self):
+        """Property: memoized matches always equal an uncached evaluation."""
+        rng = random.Random(34)
+        hits = 0
+        for _ in range(20):
+            rules = [
+                make_rule(f"R{i}", [random_condition(rng) for _ in range(rng.randint(0, 3))])
+                for i in range(rng.randint(1, 40))
+            ]
+            compiled = CompiledRuleSet(rules)
+            memo = MatchMemo(maxsize=64)
+
+            for _ in range(300):
+                context = random_context(rng)
+                assert list(memo.match(compiled, context)) == compiled.match_rules(context)
+            hits += memo.hits
+
+        assert hits > 0
+
+    def test_lru_eviction_and_counters(self):
+        """Entries beyond maxsize are evicted least-recently-used first."""
+        compiled = CompiledRuleSet(
+            [make_rule("r", [Condition("farm.crop", Operator.EQ, "cotton")])]
+        )
+        memo = MatchMemo(maxsize=2)
+
+        for crop in ["cotton", "wheat", "cotton", "barley", "wheat"]:
+            memo.match(compiled, {"farm": {"crop": crop}})
+
+        assert memo.info() == {"hits": 1, "misses": 4, "size": 2, "maxsize": 2}
+
+    def test_new_rule_set_gets_new_entries(self):
+        """A recompiled rule set never reuses another set's cached matches."""
+        memo = MatchMemo()
+        context = {"weather": {"temperature_c": 35}}
+        old = CompiledRuleSet(
+            [make_rule("a", [Condition("weather.temperature_c", Operator.GT, 30)])]
+        )
+        new = CompiledRuleSet(
+            [make_rule("a", [Condition("weather.temperature_c", Operator.GT, 40)])]
+        )
+
+        assert [r.id for r in memo.match(old, context)] == ["a"]
+        assert memo.match(new, context) == ()
+
+    def test_category_filter(self):
+        """Only rules of the requested categories are returned and keyed."""
+        compiled = CompiledRuleSet(
+            [
+                make_rule("irr", [Condition("farm.crop", Operator.EQ, "cotton")]),
+                make_rule(
+                    "harv",
+                    [Condition("farm.crop", Operator.EQ, "cotton")],
+                    category=RuleCategory.HARVEST,
+                ),
+            ]
+        )
+
+        matched = MatchMemo().match(compiled, {"farm": {"crop": "cotton"}}, [RuleCategory.HARVEST])
+
+        assert [r.id for r in matched] == ["harv"]
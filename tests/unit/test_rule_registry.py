@@ -0,0 +1,227 @@
+# tests/unit/test_rule_registry.py
+"""Unit tests for the versioned, hot-reloadable rule-set registry."""
+
+import asyncio
+import threading
+import time
+from dataclasses import replace
+from unittest.mock import patch
+
+import pytest
+
+from alim.rules import registry as registry_module
+from alim.rules.engine import RuleLoadError, RulesEngine
+from alim.rules.registry import DirectoryRuleSource, RuleSetRegistry
+
+RULE_TEMPLATE = """
+rules:
+  - id: {rule_id}
+    name: {rule_id}
+    category: irrigation
+    priority: {priority}
+    conditions:
+      - field: weather.temperature_c
+        operator: gt
+        value: {threshold}
+    recommendation:
+      az: "Suvarın"
+"""
+
+HOT = {"weather": {"temperature_c": 35}}
+
+
+def write_rule(path, rule_id="HOT-1", threshold=30, priority="high"):
+    path.write_text(
+        RULE_TEMPLATE.format(rule_id=rule_id, threshold=threshold, priority=priority),
+        encoding="utf-8",
+    )
+
+
+@pytest.fixture
+def rules_dir(tmp_path):
+    write_rule(tmp_path / "irrigation.yaml")
+    return tmp_path
+
+
+@pytest.fixture
+def registry(rules_dir):
+    return RuleSetRegistry(DirectoryRuleSource(rules_dir), keep_versions=3)
+
+
+class TestReload:
+    """Tests for loading and reloading versions."""
+
+    def test_matches_carry_version(self, registry):
+        """Every match is stamped with the version that produced it."""
+        [match] = registry.evaluate(HOT)
+
+        assert match["rule_id"] == "HOT-1"
+        assert match["rule_set_version"] == registry.current.version
+        assert registry.current.version.startswith("v1-")
+
+    def test_unchanged_source_keeps_version(self, registry):
+        """Polling an unchanged directory does not create versions."""
+        first = registry.current
+
+        assert registry.reload() is first
+        assert registry.reload(force=True) is first  # same content, same version
+        assert len(registry.versions) == 1
+
+    def test_changed_file_creates_new_version(self, registry, rules_dir):
+        """Edits are picked up as a new active version."""
+        old = registry.current
+        write_rule(rules_dir / "irrigation.yaml", threshold=40)
+
+        new = registry.reload()
+
+        assert new.number == old.number + 1
+        assert registry.evaluate(HOT) == []
+        # The old version is immutable and still evaluates as before
+        assert [m["rule_set_version"] for m in old.evaluate(HOT)] == [old.version]
+
+    def test_broken_file_keeps_active_version(self, registry, rules_dir):
+        """A reload that fails to parse is rejected."""
+        active = registry.current
+        (rules_dir / "broken.yaml").write_text("rules:\n  - id: [unterminated\n", encoding="utf-8")
+
+        with pytest.raises(RuleLoadError):
+            registry.reload()
+
+        assert registry.current is active
+        assert registry.reload() is active  # same broken snapshot is not re-parsed
+
+    def test_initial_load_falls_back_to_valid_files(self, rules_dir):
+        """A bad file at startup does not leave the service without rules."""
+        (rules_dir / "broken.yaml").write_text("rules: [{id: X}]", encoding="utf-8")
+        registry = RuleSetRegistry(DirectoryRuleSource(rules_dir))
+
+        assert [r.id for r in registry.current.rules] == ["HOT-1"]
+
+
+class TestVersions:
+    """Tests for retention, A/B and rollback."""
+
+    def test_retention_and_ab_evaluation(self, registry, rules_dir):
+        """Only the last N versions are kept; any of them can be evaluated."""
+        labels = []
+        for threshold in (10, 20, 30, 40):
+            write_rule(rules_dir / "irrigation.yaml", threshold=threshold)
+            labels.append(registry.reload().version)
+
+        assert [v.version for v in registry.versions] == labels[-3:]
+        assert registry.evaluate(HOT) == []  # threshold 40
+        assert registry.evaluate(HOT, version=labels[-2])[0]["rule_set_version"] == labels[-2]
+        with pytest.raises(KeyError):
+            registry.evaluate(HOT, version=labels[0])
+
+    def test_rollback(self, registry, rules_dir):
+        """Rollback re-activates the previous version until the source changes."""
+        first = registry.current
+        write_rule(rules_dir / "irrigation.yaml", threshold=40)
+        registry.reload()
+
+        assert registry.rollback() is first
+        assert registry.reload() is first  # unchanged files: rollback sticks
+        with pytest.raises(KeyError):
+            registry.rollback()
+
+
+class TestConsistency:
+    """In-flight evaluations only ever see complete versions."""
+
+    def test_concurrent_publish_and_evaluate(self, registry, rules_dir):
+        """Each result is entirely from one version."""
+        rules_v1 = registry.current.rules
+        write_rule(rules_dir / "irrigation.yaml", rule_id="HOT-2")
+        (rules_dir / "more.yaml").write_text(
+            RULE_TEMPLATE.format(rule_id="HOT-3", threshold=20, priority="low"),
+            encoding="utf-8",
+        )
+        rules_v2 = registry.source.load()
+        expected = {
+            len(rules_v1): {"HOT-1"},
+            len(rules_v2): {"HOT-2", "HOT-3"},
+        }
+        errors = []
+        stop = threading.Event()
+
+        def reader():
+            while not stop.is_set():
+                matches = registry.evaluate(HOT)
+                ids = {m["rule_id"] for m in matches}
+                versions = {m["rule_set_version"] for m in matches}
+                if len(versions) != 1 or expected.get(len(ids)) != ids:
+                    errors.append((ids, versions))
+
+        threads = [threading.Thread(target=reader) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for i in range(50):
+            registry.publish(rules_v2 if i % 2 else rules_v1)
+        stop.set()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+
+    def test_out_of_order_publish_keeps_newer_version(self, registry, rules_dir):
+        """A publish that finishes last does not replace a newer active version."""
+        rules_old = [replace(rule, name="old") for rule in registry.current.rules]
+        rules_new = [replace(rule, name="new") for rule in registry.current.rules]
+        compile_rules = registry_module.CompiledRuleSet
+        newer_done = threading.Event()
+
+        def slow_compile(rules, version):
+            if rules[0].name == "old":
+                newer_done.wait(timeout=5)
+            return compile_rules(rules, version=version)
+
+        with patch.object(registry_module, "CompiledRuleSet", slow_compile):
+            older = threading.Thread(target=registry.publish, args=(rules_old,))
+            older.start()
+            while registry._number < 2:  # the older publish has taken its number
+                time.sleep(0.001)
+            newer = registry.publish(rules_new)
+            newer_done.set()
+            older.join()
+
+        assert registry.current is newer
+        assert len(registry.versions) == 3
+
+
+class TestEngineIntegration:
+    """Tests for a registry-backed RulesEngine."""
+
+    def test_add_rule_publishes_version(self, registry):
+        """add_rule creates a new version instead of mutating the active one."""
+        engine = RulesEngine(registry=registry)
+        before = registry.current
+        extra = replace(before.rules[0], id="HOT-X")
+
+        engine.add_rule(extra)
+
+        assert engine.rule_count == 2
+        assert before.rule_count == 1
+        assert {m["rule_id"] for m in engine.evaluate(HOT)} == {"HOT-1", "HOT-X"}
+
+
+class TestWatcher:
+    """Tests for the background polling task."""
+
+    @pytest.mark.asyncio
+    async def test_watcher_picks_up_changes(self, rules_dir):
+        """A started registry reloads edited files on its own."""
+        registry = RuleSetRegistry(DirectoryRuleSource(rules_dir), poll_interval_seconds=0.01)
+        first = registry.current
+        registry.start()
+        try:
+            write_rule(rules_dir / "irrigation.yaml", threshold=40)
+            for _ in range(200):
+                if registry.current is not first:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await registry.stop()
+
+        assert registry.current.number == first.number + 1
+        assert registry.status()["watching"] is False
@@ -0,0 +1,310 @@
+# tests/unit/test_rules_compiler.py
+"""Unit tests for the compiled, field-indexed rule set."""
+
+import random
+from datetime import date
+
+import numpy as np
+import pytest
+
+from alim.rules.batch import RuleBatch
+from alim.rules.compiler import CompiledRuleSet, compile_condition
+from alim.rules.engine import (
+    Condition,
+    Operator,
+    Rule,
+    RuleCategory,
+    RuleLoader,
+    RulePriority,
+    RulesEngine,
+    build_rule_context,
+)
+
+PRIORITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+
+
+def linear_evaluate(rules, context, categories=None):
+    """The original engine: scan every rule, then sort by priority."""
+    matches = [
+        r.to_match_dict()
+        for r in rules
+        if not (categories and r.category not in categories) and r.evaluate(context)
+    ]
+    matches.sort(key=lambda m: PRIORITY_ORDER.get(m["priority"], 4))
+    return matches
+
+
+def make_rule(rule_id, conditions, priority=RulePriority.MEDIUM, category=RuleCategory.IRRIGATION):
+    return Rule(
+        id=rule_id,
+        name=rule_id,
+        category=category,
+        description="",
+        conditions=conditions,
+        recommendation_az=f"tövsiyə {rule_id}",
+        priority=priority,
+    )
+
+
+FIELDS = ["weather.temperature_c", "weather.humidity_percent", "date.month", "farm.region"]
+REGIONS = ["aran", "ganja_gazakh", "shirvan", "lankaran"]
+
+
+def random_condition(rng):
+    field = rng.choice(FIELDS)
+    if field == "farm.region":
+        op = rng.choice([Operator.EQ, Operator.NE, Operator.IN, Operator.NOT_IN, Operator.CONTAINS])
+        if op in (Operator.IN, Operator.NOT_IN):
+            return Condition(field, op, rng.sample(REGIONS, 2))
+        if op == Operator.CONTAINS:
+            return Condition(field, op, rng.choice(["an", "sh", "x"]))
+        return Condition(field, op, rng.choice(REGIONS))
+    op = rng.choice(list(Operator))
+    if op in (Operator.IN, Operator.NOT_IN):
+        return Condition(field, op, [rng.randint(0, 40) for _ in range(3)])
+    if op == Operator.BETWEEN:
+        low = rng.randint(0, 40)
+        return Condition(field, op, [low, low + rng.randint(0, 15)])
+    if op == Operator.CONTAINS:
+        return Condition(field, op, str(rng.randint(0, 9)))
+    return Condition(field, op, rng.choice([rng.randint(0, 40), rng.uniform(0, 40)]))
+
+
+def random_context(rng):
+    weather = {}
+    if rng.random() > 0.1:
+        weather["temperature_c"] = rng.choice([rng.randint(0, 45), rng.uniform(0, 45)])
+    if rng.random() > 0.1:
+        weather["humidity_percent"] = rng.choice([rng.randint(0, 45), "n/a", None])
+    return build_rule_context(
+        weather=weather,
+        farm={"region": rng.choice(REGIONS + [None])},
+        intent=rng.choice(["irrigation", None]),
+        current_date=date(2026, rng.randint(1, 12), 15),
+    )
+
+
+class TestCompiledCondition:
+    """Tests for compiled condition closures."""
+
+    @pytest.mark.parametrize("operator", list(Operator))
+    @pytest.mark.parametrize(
+        "actual",
+        [None, 0, 10, 25.5, True, "aran", "10", [10], {"x": 1}, float("nan")],
+    )
+    def test_matches_condition_evaluate(self, operator, actual):
+        """Compiled closure agrees with Condition.evaluate, edge values included."""
+        value = [5, 30] if operator in (Operator.IN, Operator.NOT_IN, Operator.BETWEEN) else 10
+        if operator == Operator.CONTAINS:
+            value = "a"
+        cond = Condition(field="weather.value", operator=operator, value=value)
+        context = {"weather": {"value": actual}}
+
+        assert compile_condition(cond)(context) == cond.evaluate(context)
+
+    def test_deep_and_missing_paths(self):
+        """Paths deeper than two levels and non-dict intermediates resolve like before."""
+        cond = Condition(field="farm.soil.ph", operator=Operator.LT, value=6)
+
+        assert compile_condition(cond)({"farm": {"soil": {"ph": 5.5}}}) is True
+        assert compile_condition(cond)({"farm": {"soil": "clay"}}) is False
+        assert compile_condition(cond)({"farm": None}) is False
+
+
+class TestCompiledRuleSet:
+    """Tests for index-based evaluation."""
+
+    def test_random_rule_sets_match_linear_scan(self):
+        """Matches and their order equal the original scan-and-sort."""
+        rng = random.Random(31)
+        priorities = list(RulePriority)
+        categories = list(RuleCategory)
+
+        for _ in range(20):
+            rules = [
+                make_rule(
+                    f"R{i:03d}",
+                    [random_condition(rng) for _ in range(rng.randint(1, 3))],
+                    priority=rng.choice(priorities),
+                    category=rng.choice(categories),
+                )
+                for i in range(rng.randint(1, 150))
+            ]
+            compiled = CompiledRuleSet(rules)
+
+            for _ in range(25):
+                context = random_context(rng)
+                filt = rng.choice([None, [], rng.sample(categories, 2)])
+                assert compiled.evaluate(context, filt) == linear_evaluate(rules, context, filt)
+
+    def test_yaml_rules_match_linear_scan(self):
+        """The shipped rule library evaluates identically."""
+        rules = RuleLoader().load_all()
+        compiled = CompiledRuleSet(rules)
+        rng = random.Random(7)
+
+        for _ in range(200):
+            context = random_context(rng)
+            context["intent"] = rng.choice(["irrigation", "fertilization", "harvest", None])
+            assert compiled.evaluate(context) == linear_evaluate(rules, context)
+
+    def test_index_prunes_candidates(self):
+        """Only rules whose anchor condition holds are visited."""
+        rules = [
+            make_rule("hot", [Condition("weather.temperature_c", Operator.GT, 30)]),
+            make_rule("cold", [Condition("weather.temperature_c", Operator.LT, 5)]),
+            make_rule("aran", [Condition("farm.region", Operator.EQ, "aran")]),
+            make_rule(
+                "spring",
+                [
+                    Condition("intent", Operator.NE, "greeting"),
+                    Condition("date.month", Operator.IN, [3, 4, 5]),
+                ],
+            ),
+            make_rule("not_aran", [Condition("farm.region", Operator.NE, "aran")]),
+        ]
+        compiled = CompiledRuleSet(rules)
+        context = build_rule_context(
+            weather={"temperature_c": 35}, farm={"region": "aran"}, current_date=date(2026, 7, 1)
+        )
+
+        visited = {compiled.rules[p].id for p in compiled.candidates(context)}
+
+        assert visited == {"hot", "aran", "not_aran"}
+        assert compiled.stats["unindexed"] == 1
+        assert [m["rule_id"] for m in compiled.evaluate(context)] == ["hot", "aran"]
+
+    def test_string_category_filter(self):
+        """Plain strings filter like RuleCategory members."""
+        rules = [
+            make_rule("a", [Condition("intent", Operator.EQ, "x")]),
+            make_rule("b", [Condition("intent", Operator.EQ, "x")], category=RuleCategory.HARVEST),
+        ]
+
+        compiled = CompiledRuleSet(rules)
+        matches = compiled.evaluate({"intent": "x"}, ["harvest"])
+
+        assert [m["rule_id"] for m in matches] == ["b"]
+        assert [r.id for r in compiled.match_rules({"intent": "x"}, ["harvest"])] == ["b"]
+
+    def test_match_dicts_are_independent(self):
+        """Callers may mutate returned matches without affecting later calls."""
+        compiled = CompiledRuleSet([make_rule("a", [Condition("intent", Operator.EQ, "x")])])
+
+        compiled.evaluate({"intent": "x"})[0]["confidence"] = 0.0
+
+        assert compiled.evaluate({"intent": "x"})[0]["confidence"] == 0.9
+
+
+ODD_VALUES = [None, True, False, "n/a", "10", 2**60, [10], {"x": 1}, float("nan"), 0]
+
+
+def odd_context(rng):
+    """A random context where any field may hold an awkward value."""
+    context = random_context(rng)
+    for section, key in (("weather", "temperature_c"), ("date", "month"), ("farm", "region")):
+        if rng.random() < 0.15:
+            context[section][key] = rng.choice(ODD_VALUES)
+    if rng.random() < 0.05:
+        context["farm"] = "not a dict"
+    return context
+
+
+class TestBatchEvaluation:
+    """Property tests: vectorized batch == scalar evaluate, per context."""
+
+    def test_random_rule_sets_match_scalar_path(self):
+        """Random rules over random (including malformed) contexts agree."""
+        rng = random.Random(32)
+        priorities = list(RulePriority)
+        categories = list(RuleCategory)
+
+        for _ in range(15):
+            rules = [
+                make_rule(
+                    f"R{i:03d}",
+                    [random_condition(rng) for _ in range(rng.randint(0, 3))],
+                    priority=rng.choice(priorities),
+                    category=rng.choice(categories),
+                )
+                for i in range(rng.randint(1, 120))
+            ]
+            compiled = CompiledRuleSet(rules)
+            contexts = [odd_context(rng) for _ in range(rng.randint(1, 300))]
+            filt = rng.choice([None, rng.sample(categories, 3)])
+
+            assert compiled.evaluate_batch(contexts, filt) == [
+                compiled.evaluate(c, filt) for c in contexts
+            ]
+
+    def test_yaml_rules_match_scalar_path(self):
+        """The shipped rule library agrees on a large batch."""
+        engine = RulesEngine()
+        rng = random.Random(8)
+        contexts = []
+        for _ in range(2000):
+            context = random_context(rng)
+            context["intent"] = rng.choice(["irrigation", "fertilization", "harvest", None])
+            contexts.append(context)
+
+        assert engine.evaluate_batch(contexts) == [engine.evaluate(c) for c in contexts]
+
+    def test_from_columns_matches_contexts(self):
+        """Arrays from a columnar source give the same matches as dicts."""
+        rules = [
+            make_rule("hot", [Condition("weather.temperature_c", Operator.GTE, 30)]),
+            make_rule(
+                "aran_summer",
+                [
+                    Condition("farm.region", Operator.IN, ["aran", "shirvan"]),
+                    Condition("date.month", Operator.BETWEEN, [6, 8]),
+                ],
+                priority=RulePriority.HIGH,
+            ),
+        ]
+        compiled = CompiledRuleSet(rules)
+        temps = np.array([35.0, 20.0, 30.0, float("nan")])
+        regions = np.array(["aran", "aran", "lankaran", "shirvan"])
+        months = np.array([7, 9, 6, 8])
+
+        batch = RuleBatch.from_columns(
+            {"weather.temperature_c": temps, "farm.region": regions, "date.month": months}
+        )
+        contexts = [
+            {"weather": {"temperature_c": t}, "farm": {"region": r}, "date": {"month": m}}
+            for t, r, m in zip(temps.tolist(), regions.tolist(), months.tolist(), strict=True)
+        ]
+
+        ids = [[m["rule_id"] for m in ms] for ms in compiled.evaluate_batch(batch)]
+        assert ids == [["aran_summer", "hot"], [], ["hot"], ["aran_summer"]]
+        assert compiled.evaluate_batch(batch) == [compiled.evaluate(c) for c in contexts]
+
+    def test_match_returns_row_indices(self):
+        """The low-level API yields matching rows per rule."""
+        compiled = CompiledRuleSet(
+            [make_rule("hot", [Condition("weather.temperature_c", Operator.GT, 30)])]
+        )
+        batch = RuleBatch.from_columns({"weather.temperature_c": [25, 31, 40]})
+
+        [(rule, rows)] = compiled.batch_plan.match(batch)
+
+        assert rule.id == "hot"
+        assert rows.tolist() == [1, 2]
+
+    def test_column_lengths_must_agree(self):
+        """Ragged columns are rejected."""
+        with pytest.raises(ValueError):
+            RuleBatch.from_columns({"a": [1, 2], "b": [1]})
+
+
+class TestEngineCompilation:
+    """Tests for RulesEngine's compiled rule set lifecycle."""
+
+    def test_add_rule_recompiles(self, tmp_path):
+        """Rules added after the first evaluation are picked up."""
+        engine = RulesEngine(rules_dir=tmp_path)
+        assert engine.evaluate({"intent": "x"}) == []
+
+        engine.add_rule(make_rule("a", [Condition("intent", Operator.EQ, "x")]))
+
+        assert [m["rule_id"] for m in engine.evaluate({"intent": "x"})] == ["a"]
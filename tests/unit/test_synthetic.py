@@ -0,0 +1,124 @@
+# tests/unit/test_synthetic.py
+"""Unit tests for the bulk synthetic data generator."""
+
+import csv
+import json
+from datetime import date
+
+import numpy as np
+import pytest
+
+from alim.data.ndvi_ingestion import classify_health
+from alim.data.synthetic import (
+    MANIFEST_FILE,
+    TABLE_COLUMNS,
+    SyntheticConfig,
+    classify_health_array,
+    generate_dataset,
+    generate_shard,
+)
+
+CONFIG = SyntheticConfig(
+    users=60, seed=7, users_per_shard=25, end_year=2026, as_of=date(2026, 8, 1)
+)
+
+
+@pytest.fixture(scope="module")
+def shard():
+    return generate_shard(CONFIG, 0)
+
+
+class TestGenerateShard:
+    """Tests for in-memory shard generation."""
+
+    def test_columns_match_table_layout(self, shard):
+        """Every table has exactly the COPY columns, all the same length."""
+        assert list(shard) == list(TABLE_COLUMNS)
+        for table, columns in shard.items():
+            assert tuple(columns) == TABLE_COLUMNS[table]
+            assert len({len(v) for v in columns.values()}) == 1
+
+    def test_deterministic(self, shard):
+        """Same config and shard index produce identical data."""
+        again = generate_shard(CONFIG, 0)
+        for table, columns in shard.items():
+            for name, values in columns.items():
+                if values.dtype.kind == "f":
+                    np.testing.assert_array_equal(values, again[table][name])
+                else:
+                    assert values.tolist() == again[table][name].tolist()
+
+    def test_keys_unique_and_references_valid(self, shard):
+        """Primary keys are unique and foreign keys point at generated rows."""
+        users = set(shard["user_profiles"]["user_id"])
+        farms = set(shard["farm_profiles"]["farm_id"])
+        parcels = set(shard["parcels"]["parcel_id"])
+        readings = shard["ndvi_readings"]["reading_id"]
+
+        assert len(users) == 25
+        assert len(readings) == len(set(readings))
+        assert set(shard["farm_profiles"]["user_id"]) <= users
+        assert set(shard["parcels"]["farm_id"]) <= farms
+        assert set(shard["sowing_declarations"]["parcel_id"]) == parcels
+        assert set(shard["ndvi_readings"]["parcel_id"]) <= parcels
+        assert max(len(r) for r in readings) <= 30
+
+    def test_one_primary_farm_per_user(self, shard):
+        """Exactly one farm per user is flagged primary."""
+        primary_owners = shard["farm_profiles"]["user_id"][shard["farm_profiles"]["is_primary"]]
+        assert sorted(primary_owners) == sorted(shard["user_profiles"]["user_id"])
+
+    def test_ndvi_within_bounds_and_not_in_future(self, shard):
+        """NDVI is clipped, classified consistently and stops at as_of."""
+        readings = shard["ndvi_readings"]
+
+        assert readings["ndvi_value"].min() >= 0.05
+        assert readings["ndvi_value"].max() <= 0.95
+        assert readings["reading_date"].max() <= np.datetime64(CONFIG.as_of)
+        expected = [classify_health(v) for v in readings["ndvi_value"][:200]]
+        assert readings["health_status"][:200].tolist() == expected
+
+    def test_rotation_history_per_parcel(self, shard):
+        """Each parcel has one rotation log per past season."""
+        n_parcels = len(shard["parcels"]["parcel_id"])
+        assert len(shard["crop_rotation_logs"]["log_id"]) == n_parcels * (CONFIG.seasons - 1)
+
+
+class TestHealthClassification:
+    """Tests for vectorized health classification."""
+
+    def test_matches_scalar_thresholds(self):
+        """Boundary values land in the same class as classify_health."""
+        values = np.array([0.05, 0.2, 0.39, 0.4, 0.6, 0.79, 0.8, 0.95])
+        assert classify_health_array(values).tolist() == [classify_health(v) for v in values]
+
+
+class TestGenerateDataset:
+    """Tests for sharded file output."""
+
+    def test_worker_count_does_not_change_output(self, tmp_path):
+        """Parallel and in-process runs write identical shards."""
+        serial = generate_dataset(CONFIG, tmp_path / "serial", fmt="csv", workers=1)
+        parallel = generate_dataset(CONFIG, tmp_path / "parallel", fmt="csv", workers=2)
+
+        assert serial.rows == parallel.rows
+        assert serial.shards == 3
+        for table in TABLE_COLUMNS:
+            for i in range(serial.shards):
+                name = f"{table}/part-{i:05d}.csv"
+                assert (tmp_path / "serial" / name).read_bytes() == (
+                    tmp_path / "parallel" / name
+                ).read_bytes()
+
+    def test_csv_nulls_and_manifest(self, tmp_path):
+        """NaN elevations are written as empty fields and the manifest is recorded."""
+        stats = generate_dataset(CONFIG, tmp_path, fmt="csv", workers=1)
+
+        with open(tmp_path / "parcels" / "part-00000.csv", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert any(r["elevation_m"] == "" for r in rows)
+        assert all(r["elevation_m"] != "nan" for r in rows)
+
+        manifest = json.loads((tmp_path / MANIFEST_FILE).read_text(encoding="utf-8"))
+        assert manifest["stats"]["total_rows"] == stats.total_rows
+        assert manifest["ndvi_date_range"] == ["2022-10-01", "2026-08-01"]